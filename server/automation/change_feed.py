@@ -0,0 +1,156 @@
+import asyncio
+import json
+import secrets
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from utils import metrics
+
+
+change_events = metrics.counter("hanyang_change_events_total", "Change events published to dashboard subscribers", labelnames=("type",))
+change_subscribers = metrics.gauge("hanyang_change_subscribers", "Open dashboard change streams")
+change_overflows = metrics.counter("hanyang_change_overflow_total", "Change streams reset because the subscriber fell behind")
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pending: int):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max_pending)
+        self.overflowed = False
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        # 이벤트 루프 스레드에서만 불린다.
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            change_overflows.inc()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "reset"})
+
+
+class ChangeFeed:
+    """관리자 대시보드로 보낼 작은 변경 이벤트(delta)를 모아 SSE로 흘려보냅니다.
+
+    자동 수강 스레드 어디서든 publish할 수 있고, 최근 이벤트는 링 버퍼에 남겨서
+    재연결한 클라이언트가 Last-Event-ID 이후 것만 다시 받게 한다.
+    이벤트 id는 `<epoch>:<seq>`이고, 서버가 다시 뜨면 epoch가 바뀌어 reset을 보낸다.
+    """
+
+    def __init__(self, max_events: int = 1000, max_pending: int = 256):
+        self.epoch = secrets.token_hex(4)
+        self.max_pending = max(1, max_pending)
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max(1, max_events))
+        self._subscribers: List[_Subscriber] = []
+        self._user_status: Dict[str, str] = {}
+
+    @property
+    def seq(self) -> int:
+        with self._lock:
+            return self._seq
+
+    def publish(self, event_type: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            # 같은 상태를 다시 저장하는 경우는 전이가 아니므로 보내지 않는다.
+            if event_type == "user_status":
+                user_id = str(fields.get("userId", "")).lower()
+                if self._user_status.get(user_id) == fields.get("status"):
+                    return None
+                self._user_status[user_id] = fields.get("status")
+            elif event_type == "user_deleted":
+                self._user_status.pop(str(fields.get("userId", "")).lower(), None)
+            self._seq += 1
+            event = {"type": event_type, "seq": self._seq, "ts": round(time.time(), 3), **fields}
+            self._events.append(event)
+            subscribers = list(self._subscribers)
+        change_events.inc(type=event_type)
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.deliver, event)
+            except RuntimeError:
+                # 루프가 이미 닫혔다.
+                pass
+        return event
+
+    def on_db_change(self, change_type: str, fields: Dict[str, Any]) -> None:
+        """utils.database 변경 리스너로 등록해서 쓴다."""
+        self.publish(change_type, **fields)
+
+    def _parse_last_event_id(self, last_event_id: Optional[str]) -> Optional[int]:
+        if not last_event_id:
+            return None
+        epoch, _, seq = last_event_id.partition(":")
+        if epoch != self.epoch or not seq.isdigit():
+            return -1
+        return int(seq)
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Tuple[_Subscriber, List[Dict[str, Any]]]:
+        """구독을 등록하고, 재연결이면 놓친 이벤트(또는 reset)를 함께 돌려줍니다."""
+        subscriber = _Subscriber(asyncio.get_running_loop(), self.max_pending)
+        after = self._parse_last_event_id(last_event_id)
+        with self._lock:
+            self._subscribers.append(subscriber)
+            oldest = self._events[0]["seq"] if self._events else self._seq + 1
+            if after is None:
+                backlog: List[Dict[str, Any]] = [{"type": "ready", "seq": self._seq}]
+            elif after < 0 or after > self._seq or after + 1 < oldest:
+                backlog = [{"type": "ready", "seq": self._seq}, {"type": "reset"}]
+            else:
+                # ready의 id는 이어 받는 지점이어야 replay 중에 끊겨도 다시 이어진다.
+                backlog = [{"type": "ready", "seq": after}]
+                backlog.extend(event for event in self._events if event["seq"] > after)
+        change_subscribers.inc()
+        return subscriber, backlog
+
+    def unsubscribe(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+                change_subscribers.dec()
+
+    def format_event(self, event: Dict[str, Any]) -> str:
+        lines = []
+        # ready에도 id를 붙여야 이벤트 없이 끊긴 연결도 그 지점부터 이어 받는다.
+        if "seq" in event and event["type"] != "reset":
+            lines.append(f"id: {self.epoch}:{event['seq']}")
+        lines.append(f"data: {json.dumps(event, ensure_ascii=False, separators=(',', ':'))}")
+        return "\n".join(lines) + "\n\n"
+
+    async def stream(
+        self,
+        last_event_id: Optional[str] = None,
+        heartbeat_sec: float = 15,
+        max_duration_sec: float = 300,
+    ) -> AsyncIterator[str]:
+        """SSE 본문. max_duration_sec가 지나면 끝내서 클라이언트가 Last-Event-ID로 다시 붙게 한다.
+
+        연결이 끝없이 열려 있으면 서버 종료가 그 연결을 기다리며 멈춘다.
+        """
+        subscriber, backlog = self.subscribe(last_event_id)
+        deadline = time.monotonic() + max_duration_sec
+        try:
+            yield "retry: 3000\n\n"
+            for event in backlog:
+                yield self.format_event(event)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), min(heartbeat_sec, remaining))
+                except asyncio.TimeoutError:
+                    # 프록시가 유휴 연결을 끊지 않도록 주석 줄을 보낸다.
+                    yield ": keep-alive\n\n"
+                    continue
+                yield self.format_event(event)
+                if event["type"] == "reset":
+                    subscriber.overflowed = False
+        finally:
+            self.unsubscribe(subscriber)
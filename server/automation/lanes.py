@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from utils import metrics
+
+
+lane_queue_wait = metrics.histogram(
+    "hanyang_lane_queue_wait_seconds",
+    "Time a task waited in a lane before a worker picked it up",
+    labelnames=("lane",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900, 1800, 3600, 7200),
+)
+lane_run_duration = metrics.histogram(
+    "hanyang_lane_run_seconds",
+    "Time a task spent running on a lane worker",
+    labelnames=("lane",),
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 300, 900, 1800, 3600, 7200, 14400),
+)
+lane_queued = metrics.gauge("hanyang_lane_queued", "Tasks waiting for a lane worker", labelnames=("lane",))
+lane_running = metrics.gauge("hanyang_lane_running", "Tasks currently running on a lane", labelnames=("lane",))
+lane_workers = metrics.gauge("hanyang_lane_workers", "Worker threads configured for a lane", labelnames=("lane",))
+lane_rejected = metrics.counter("hanyang_lane_rejected_total", "Tasks rejected because the lane queue was full", labelnames=("lane",))
+lane_target_missed = metrics.counter(
+    "hanyang_lane_latency_target_missed_total",
+    "Tasks whose queue wait exceeded the lane latency target",
+    labelnames=("lane",),
+)
+
+
+class LaneFullError(RuntimeError):
+    def __init__(self, lane: str, queue_limit: int):
+        super().__init__(f"{lane} lane queue is full ({queue_limit} waiting)")
+        self.lane = lane
+        self.queue_limit = queue_limit
+
+
+class WorkLane:
+    """크기, 대기열 한도, 대기 시간 목표를 따로 가지는 작업 풀.
+
+    짧은 로그인 확인이 몇 시간짜리 자동 수강 뒤에 줄 서지 않도록
+    용도별로 lane을 나눠 쓴다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        queue_limit: int,
+        latency_target_sec: float,
+        on_change: Optional[Callable[[str, int, int], None]] = None,
+    ):
+        self.name = name
+        # 대기/실행 수가 바뀔 때마다 (lane, queued, running)으로 불린다.
+        self.on_change = on_change
+        self.max_workers = max(1, max_workers)
+        self.queue_limit = max(0, queue_limit)
+        self.latency_target_sec = latency_target_sec
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"lane-{name}")
+        # running / workers가 lane 점유율이다.
+        lane_workers.set(self.max_workers, lane=name)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            # 쉬는 worker가 없을 때만 대기열 한도를 적용한다.
+            if self.queue_limit and self._running >= self.max_workers and self._queued >= self.queue_limit:
+                lane_rejected.inc(lane=self.name)
+                raise LaneFullError(self.name, self.queue_limit)
+            self._queued += 1
+            lane_queued.set(self._queued, lane=self.name)
+            counts = (self._queued, self._running)
+        self._notify(*counts)
+        enqueued_at = time.monotonic()
+
+        def run():
+            started_at = time.monotonic()
+            waited = started_at - enqueued_at
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                lane_queued.set(self._queued, lane=self.name)
+                lane_running.set(self._running, lane=self.name)
+                counts = (self._queued, self._running)
+            self._notify(*counts)
+            lane_queue_wait.observe(waited, lane=self.name)
+            if self.latency_target_sec and waited > self.latency_target_sec:
+                lane_target_missed.inc(lane=self.name)
+            try:
+                return func(*args)
+            finally:
+                lane_run_duration.observe(time.monotonic() - started_at, lane=self.name)
+                with self._lock:
+                    self._running -= 1
+                    lane_running.set(self._running, lane=self.name)
+                    counts = (self._queued, self._running)
+                self._notify(*counts)
+
+        try:
+            return self._executor.submit(run)
+        except Exception:
+            with self._lock:
+                self._queued -= 1
+                lane_queued.set(self._queued, lane=self.name)
+                counts = (self._queued, self._running)
+            self._notify(*counts)
+            raise
+
+    def _notify(self, queued: int, running: int) -> None:
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(self.name, queued, running)
+        except Exception:
+            pass
+
+    def has_idle_worker(self) -> bool:
+        """지금 넣으면 기다리지 않고 바로 시작하는지."""
+        with self._lock:
+            return self._running + self._queued < self.max_workers
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.wrap_future(self.submit(func, *args))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            queued, running = self._queued, self._running
+        return {
+            "lane": self.name,
+            "max_workers": self.max_workers,
+            "queue_limit": self.queue_limit,
+            "latency_target_sec": self.latency_target_sec,
+            "queued": queued,
+            "running": running,
+            "queue_wait_count": lane_queue_wait.count(lane=self.name),
+            "queue_wait_total_sec": round(lane_queue_wait.total(lane=self.name), 3),
+            "latency_target_missed": int(lane_target_missed.value(lane=self.name)),
+            "rejected": int(lane_rejected.value(lane=self.name)),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
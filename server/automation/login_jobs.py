@@ -0,0 +1,111 @@
+import asyncio
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from utils import metrics
+
+
+VERIFYING = "verifying"
+REGISTERING = "registering"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+ERROR = "error"
+TERMINAL_STATES = frozenset({SUCCEEDED, FAILED, ERROR})
+
+login_job_duration = metrics.histogram(
+    "hanyang_login_job_seconds",
+    "Time from login submission to a final verification result",
+    labelnames=("outcome",),
+    buckets=(1, 2.5, 5, 10, 20, 30, 60, 120, 300),
+)
+
+
+class LoginJob:
+    def __init__(self, job_id: str, user_id: str):
+        self.job_id = job_id
+        self.user_id = user_id
+        self.state = VERIFYING
+        self.message = ""
+        self.automation: Optional[str] = None
+        self.version = 0
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self._changed = asyncio.Event()
+
+    @property
+    def done(self) -> bool:
+        return self.state in TERMINAL_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "jobId": self.job_id,
+            "userId": self.user_id,
+            "status": self.state,
+            "message": self.message,
+            "automation": self.automation,
+            "version": self.version,
+            "done": self.done,
+        }
+
+
+class LoginJobStore:
+    """로그인 확인 작업 상태를 짧게 보관하고, 상태가 바뀔 때까지 기다릴 수 있게 합니다.
+
+    이벤트 루프 스레드에서만 접근한다.
+    """
+
+    def __init__(self, ttl_sec: float = 600, max_jobs: int = 10000):
+        self.ttl_sec = ttl_sec
+        self.max_jobs = max(1, max_jobs)
+        self._jobs: "OrderedDict[str, LoginJob]" = OrderedDict()
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.ttl_sec
+        while self._jobs:
+            job = next(iter(self._jobs.values()))
+            if job.created_at >= cutoff and len(self._jobs) < self.max_jobs:
+                break
+            self._jobs.popitem(last=False)
+
+    def create(self, user_id: str) -> LoginJob:
+        self._prune()
+        job = LoginJob(secrets.token_urlsafe(24), user_id)
+        self._jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[LoginJob]:
+        job = self._jobs.get(job_id)
+        if job and job.created_at < time.time() - self.ttl_sec:
+            self._jobs.pop(job_id, None)
+            return None
+        return job
+
+    def update(self, job: LoginJob, state: str, message: Optional[str] = None, **fields: Any) -> None:
+        job.state = state
+        if message is not None:
+            job.message = message
+        for key, value in fields.items():
+            setattr(job, key, value)
+        job.version += 1
+        job.updated_at = time.time()
+        if job.done:
+            login_job_duration.observe(job.updated_at - job.created_at, outcome=state)
+        # 기다리던 요청을 모두 깨우고 다음 변경을 위해 새 이벤트로 바꾼다.
+        job._changed.set()
+        job._changed = asyncio.Event()
+
+    async def wait(self, job_id: str, after_version: int, timeout: float) -> Optional[LoginJob]:
+        """after_version보다 새 상태가 되거나 timeout이 지날 때까지 기다립니다 (long-poll)."""
+        job = self.get(job_id)
+        if job is None or job.done or job.version > after_version or timeout <= 0:
+            return job
+        try:
+            await asyncio.wait_for(job._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return job
+
+    def __len__(self) -> int:
+        return len(self._jobs)
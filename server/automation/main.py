@@ -2,32 +2,54 @@ import asyncio
 import hmac
 import os
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import Future, InvalidStateError
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+from apscheduler.triggers.interval import IntervalTrigger
+from fastapi import Depends, FastAPI, HTTPException, Path, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 from zoneinfo import ZoneInfo
 
-from .playwright_automation import run_user_automation, verify_user_login
+from . import login_jobs, sweeps
+from .change_feed import ChangeFeed
+from .lanes import LaneFullError, WorkLane
+from .progress import ProgressTracker
+from .session_leases import SessionLeaseStore
+from .verification import VerificationCoordinator
+from .playwright_automation import run_user_automation, set_instrumentation, set_playback_verbose, verify_user_login
 from utils.database import (
+    add_change_listener,
     add_learned_lecture,
+    add_lecture_attempt,
+    add_user,
+    clear_progress,
     decrypt_password,
+    delete_progress,
+    find_users,
+    finish_run,
     get_all_users,
+    get_backend,
     get_learned_lectures,
+    get_learned_lectures_for,
     get_user_by_id,
+    start_run,
+    update_user_pwd,
     update_user_status,
+    upsert_progress,
 )
-from utils.logger import HanyangLogger
+from utils import db_maintenance, log_retention, metrics
+from utils.logger import KST, HanyangLogger, get_logger
 from utils.security import SlidingWindowRateLimiter, get_client_ip, mask_sensitive_text
 
 
 server_logger = HanyangLogger("server", user_id="receive_server")
-executor = ThreadPoolExecutor(max_workers=5)
 scheduler = AsyncIOScheduler(timezone=ZoneInfo("Asia/Seoul"))
 verify_login_limiter = SlidingWindowRateLimiter()
 running_users_lock = threading.Lock()
@@ -41,6 +63,72 @@ AUTOMATION_CORS_ALLOW_ORIGINS = os.getenv("AUTOMATION_CORS_ALLOW_ORIGINS", "").s
 AUTO_RESUME_USERS_ON_STARTUP = os.getenv("AUTO_RESUME_USERS_ON_STARTUP", "true").lower() not in {"0", "false", "no"}
 AUTOMATION_SCHEDULE_DELAY_SEC = int(os.getenv("AUTOMATION_SCHEDULE_DELAY_SEC", "15"))
 STARTUP_AUTOMATION_DELAY_SEC = int(os.getenv("STARTUP_AUTOMATION_DELAY_SEC", "5"))
+AUTOMATION_LANE_WORKERS = int(os.getenv("AUTOMATION_LANE_WORKERS", "5"))
+AUTOMATION_LANE_QUEUE_LIMIT = int(os.getenv("AUTOMATION_LANE_QUEUE_LIMIT", "1000"))
+AUTOMATION_LANE_LATENCY_TARGET_SEC = float(os.getenv("AUTOMATION_LANE_LATENCY_TARGET_SEC", "7200"))
+VERIFY_LANE_WORKERS = int(os.getenv("VERIFY_LANE_WORKERS", "2"))
+VERIFY_LANE_QUEUE_LIMIT = int(os.getenv("VERIFY_LANE_QUEUE_LIMIT", "20"))
+VERIFY_LANE_LATENCY_TARGET_SEC = float(os.getenv("VERIFY_LANE_LATENCY_TARGET_SEC", "5"))
+VERIFY_CACHE_TTL_SEC = float(os.getenv("VERIFY_CACHE_TTL_SEC", "60"))
+SESSION_LEASE_TTL_SEC = float(os.getenv("SESSION_LEASE_TTL_SEC", "300"))
+# 로그인 확인이 아직 세션을 잡는 중이면 자동 수강이 시작할 때 이만큼 기다려 본다.
+SESSION_HANDOFF_WAIT_SEC = float(os.getenv("SESSION_HANDOFF_WAIT_SEC", "10"))
+LOGIN_JOB_TTL_SEC = int(os.getenv("LOGIN_JOB_TTL_SEC", "600"))
+LOGIN_JOB_POLL_MAX_WAIT_SEC = int(os.getenv("LOGIN_JOB_POLL_MAX_WAIT_SEC", "25"))
+RERUN_MAX_USERS = int(os.getenv("RERUN_MAX_USERS", "500"))
+CHANGE_STREAM_HEARTBEAT_SEC = float(os.getenv("CHANGE_STREAM_HEARTBEAT_SEC", "15"))
+CHANGE_STREAM_MAX_SEC = float(os.getenv("CHANGE_STREAM_MAX_SEC", "300"))
+PROGRESS_FLUSH_INTERVAL_SEC = float(os.getenv("PROGRESS_FLUSH_INTERVAL_SEC", "5"))
+
+automation_running_users = metrics.gauge("hanyang_automation_running_users", "Users with an automation run in progress")
+automation_in_flight = metrics.gauge("hanyang_automation_in_flight", "Browsers and lectures currently open", labelnames=("kind",))
+automation_phase_duration = metrics.histogram(
+    "hanyang_automation_phase_seconds",
+    "Duration of automation phases (browser launch, login, discovery, playback start, lecture, run)",
+    labelnames=("phase", "outcome"),
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600, 7200, 14400),
+)
+for kind in ("browsers", "lectures"):
+    automation_in_flight.set(0, kind=kind)
+set_instrumentation(
+    on_phase=lambda phase, seconds, outcome: automation_phase_duration.observe(seconds, phase=phase, outcome=outcome),
+    on_in_flight=lambda kind, delta: automation_in_flight.inc(delta, kind=kind),
+)
+
+# 관리자 대시보드는 유저 목록을 다시 읽지 않고 이 피드의 변경분만 받는다.
+change_feed = ChangeFeed()
+add_change_listener(change_feed.on_db_change)
+
+# 자동 수강(배치)과 로그인 확인(대화형)은 서로 다른 lane에서 돌려서 확인 요청이 굶지 않게 한다.
+automation_lane = WorkLane(
+    "automation",
+    AUTOMATION_LANE_WORKERS,
+    AUTOMATION_LANE_QUEUE_LIMIT,
+    AUTOMATION_LANE_LATENCY_TARGET_SEC,
+    on_change=lambda lane, queued, running: change_feed.publish("lane", lane=lane, queued=queued, running=running),
+)
+# 재생 진행 상황은 유저당 최신 값만 모아 두었다가 주기적으로 한 번에 쓴다.
+progress_tracker = ProgressTracker(
+    upsert_progress,
+    delete_progress,
+    PROGRESS_FLUSH_INTERVAL_SEC,
+    on_flush=lambda updates, cleared: change_feed.publish("progress", updates=updates, cleared=cleared),
+)
+verify_lane = WorkLane(
+    "verify",
+    VERIFY_LANE_WORKERS,
+    VERIFY_LANE_QUEUE_LIMIT,
+    VERIFY_LANE_LATENCY_TARGET_SEC,
+)
+
+# 로그인 확인은 요청을 붙잡지 않고 작업 id로 진행 상황을 알려준다.
+login_job_store = login_jobs.LoginJobStore(ttl_sec=LOGIN_JOB_TTL_SEC)
+# 더블 클릭이나 재시도가 브라우저를 여러 번 띄우지 않도록 계정별로 확인을 합친다.
+verification_coordinator = VerificationCoordinator(ttl_sec=VERIFY_CACHE_TTL_SEC)
+# 확인에 성공한 세션은 잠깐 맡아 뒀다가 같은 유저의 다음 실행이 넘겨받는다.
+session_leases = SessionLeaseStore(ttl_sec=SESSION_LEASE_TTL_SEC)
+background_tasks: set[asyncio.Task] = set()
+sweep_manager = sweeps.SweepManager()
 
 if not INTERNAL_API_TOKEN:
     raise ValueError("INTERNAL_API_TOKEN must be set.")
@@ -48,9 +136,46 @@ if not INTERNAL_API_TOKEN:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 로그인 작업이 유저를 직접 저장하므로 back보다 먼저 떠도 테이블이 있어야 한다.
+    get_backend().init_schema()
+    # 이전 프로세스가 남긴 진행 행은 더 이상 갱신되지 않는다.
+    clear_progress()
+    progress_tracker.start()
     scheduler.start()
     scheduler.add_job(run_daily_automation, CronTrigger(hour=7, minute=0), id="daily_automation")
     server_logger.info("server", "Scheduler started with daily automation at 7:00 AM KST")
+    if db_maintenance.DB_MAINTENANCE_INTERVAL_MIN > 0:
+        scheduler.add_job(
+            run_db_maintenance,
+            IntervalTrigger(minutes=db_maintenance.DB_MAINTENANCE_INTERVAL_MIN),
+            id="db_maintenance",
+            max_instances=1,
+            coalesce=True,
+        )
+    if db_maintenance.DB_BACKUP_KEEP > 0:
+        scheduler.add_job(
+            run_db_backup,
+            CronTrigger(hour=db_maintenance.DB_BACKUP_HOUR, minute=30),
+            id="db_backup",
+            max_instances=1,
+            coalesce=True,
+        )
+    if db_maintenance.RUN_HISTORY_KEEP_DAYS > 0:
+        scheduler.add_job(
+            run_history_prune,
+            CronTrigger(hour=db_maintenance.DB_BACKUP_HOUR, minute=10),
+            id="run_history_prune",
+            max_instances=1,
+            coalesce=True,
+        )
+    if log_retention.LOG_RETENTION_INTERVAL_MIN > 0:
+        scheduler.add_job(
+            run_log_retention,
+            IntervalTrigger(minutes=log_retention.LOG_RETENTION_INTERVAL_MIN),
+            id="log_retention",
+            max_instances=1,
+            coalesce=True,
+        )
     startup_resume_task = None
     if AUTO_RESUME_USERS_ON_STARTUP:
         startup_resume_task = asyncio.create_task(run_startup_automation())
@@ -60,9 +185,13 @@ async def lifespan(app: FastAPI):
     finally:
         if startup_resume_task and not startup_resume_task.done():
             startup_resume_task.cancel()
+        for task in list(background_tasks):
+            task.cancel()
         server_logger.info("server", "Server is shutting down. Waiting for all running jobs to complete.")
         scheduler.shutdown(wait=True)
-        executor.shutdown(wait=True)
+        verify_lane.shutdown(wait=True)
+        automation_lane.shutdown(wait=True)
+        progress_tracker.stop()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -125,9 +254,17 @@ def _reset_verify_login_account_rate_limit(user_id: str) -> None:
     verify_login_limiter.reset(f"verify:account:{user_id.lower()}")
 
 
-def automation_task_wrapper(user_id: str, encrypted_pwd: str, user_num: int, learned_lectures: list):
+def _record_run(user_logger: HanyangLogger, func, *args, **kwargs) -> None:
+    # 실행 기록은 통계용이라 실패해도 자동 수강은 계속한다.
+    try:
+        func(*args, **kwargs)
+    except Exception as exc:
+        user_logger.error("automation", f"Run history write failed: {mask_sensitive_text(exc)}", event="run_history_write_failed")
+
+
+def automation_task_wrapper(user_id: str, encrypted_pwd: str, user_num: int, learned_lectures: list, sweep_id: str = None):
     run_id = HanyangLogger.new_run_id("automation")
-    user_logger = HanyangLogger("user", user_id=str(user_id), default_fields={"run_id": run_id})
+    user_logger = get_logger("user", user_id=str(user_id)).with_context(run_id=run_id)
     with running_users_lock:
         if user_id in running_users:
             user_logger.event(
@@ -137,90 +274,389 @@ def automation_task_wrapper(user_id: str, encrypted_pwd: str, user_num: int, lea
                 user_num=user_num,
                 outcome="duplicate_user_run",
             )
-            return
+            return {"success": False, "skipped": True, "msg": "duplicate_user_run"}
         running_users.add(user_id)
+        automation_running_users.set(len(running_users))
 
     user_logger.event("automation", "automation_task_enqueued", "automation task started", user_num=user_num)
+    started_at = time.time()
+    result = {"success": False, "msg": "automation_task_unexpected_error", "outcome": "exception"}
+    _record_run(user_logger, start_run, run_id, user_num, user_id, sweep_id, started_at)
 
     try:
-        plain_pwd = decrypt_password(encrypted_pwd)
-    except Exception as exc:
-        user_logger.error("automation", f"Password decryption failed: {mask_sensitive_text(exc)}", event="password_decryption_failed", user_num=user_num)
-        update_user_status(user_id, "error")
-        return
+        try:
+            plain_pwd = decrypt_password(encrypted_pwd)
+        except Exception as exc:
+            user_logger.error("automation", f"Password decryption failed: {mask_sensitive_text(exc)}", event="password_decryption_failed", user_num=user_num)
+            update_user_status(user_id, "error")
+            result = {"success": False, "msg": "password_decryption_failed", "outcome": "password_decryption_failed"}
+            return result
 
-    try:
         def db_add_learned_callback(_user_id_from_automation, lecture_id):
             add_learned_lecture(user_num, lecture_id)
 
-        run_user_automation(
+        def record_lecture_attempt(lecture, attempt, outcome, elapsed_sec):
+            add_lecture_attempt(run_id, user_num, lecture.course_id, lecture.key, lecture.title, attempt, outcome, elapsed_sec)
+
+        def report_progress(lecture, progress):
+            progress_tracker.update(user_id, run_id, lecture.course_id, lecture.key, lecture.title, progress)
+
+        result = run_user_automation(
             user_id=user_id,
             pwd=plain_pwd,
             learned_lectures=learned_lectures,
             db_add_learned=db_add_learned_callback,
             run_id=run_id,
+            storage_state=session_leases.take(user_id, wait_sec=SESSION_HANDOFF_WAIT_SEC),
+            on_lecture_attempt=record_lecture_attempt,
+            on_progress=report_progress,
         )
+        return result
     except Exception as exc:
         user_logger.error("automation", f"Unexpected automation error: {mask_sensitive_text(exc)}", event="automation_task_unexpected_error", user_num=user_num)
         try:
             update_user_status(user_id, "error")
         except Exception as db_exc:
             user_logger.error("automation", f"Failed to update status to error: {mask_sensitive_text(db_exc)}", event="automation_status_update_failed", user_num=user_num)
+        return result
     finally:
+        progress_tracker.clear(user_id)
+        # 끝난 run의 verbose override는 다시 쓰이지 않는다.
+        set_playback_verbose(run_id, False)
+        outcome = result.get("outcome") or ("completed" if result.get("success") else "failed")
+        automation_phase_duration.observe(time.time() - started_at, phase="run", outcome=outcome)
+        _record_run(
+            user_logger,
+            finish_run,
+            run_id,
+            outcome,
+            round(time.time() - started_at, 3),
+            len(result.get("learned") or []),
+            None if result.get("success") else mask_sensitive_text(result.get("msg", ""))[:500],
+        )
         with running_users_lock:
             running_users.discard(user_id)
+            automation_running_users.set(len(running_users))
+
+
+def sweep_task_wrapper(sweep: sweeps.Sweep, user_id: str, encrypted_pwd: str, user_num: int, learned_lectures: list):
+    # 대기열에 있는 동안 취소된 sweep이면 브라우저를 띄우지 않는다.
+    if sweep.cancel_requested:
+        sweep.set_user_state(user_id, sweeps.CANCELLED)
+        return
+    sweep.set_user_state(user_id, sweeps.RUNNING)
+    result = None
+    try:
+        result = automation_task_wrapper(user_id, encrypted_pwd, user_num, learned_lectures, sweep.sweep_id)
+    finally:
+        if result and result.get("skipped"):
+            sweep.set_user_state(user_id, sweeps.SKIPPED)
+        elif result and result.get("success"):
+            sweep.set_user_state(user_id, sweeps.DONE)
+        else:
+            sweep.set_user_state(user_id, sweeps.FAILED)
 
 
-def schedule_user_from_db(user_row):
+def schedule_user_from_db(user_row, sweep: sweeps.Sweep = None, learned: list = None):
     user_num, user_id, enc_pwd = user_row[0], user_row[1], user_row[2]
-    learned = get_learned_lectures(user_num)
-    loop = asyncio.get_running_loop()
-    loop.run_in_executor(
-        executor,
-        automation_task_wrapper,
-        user_id,
-        enc_pwd,
-        user_num,
-        learned,
-    )
+    if learned is None:
+        learned = get_learned_lectures(user_num)
+    if sweep is None:
+        automation_lane.submit(automation_task_wrapper, user_id, enc_pwd, user_num, learned)
+        return
+    automation_lane.submit(sweep_task_wrapper, sweep, user_id, enc_pwd, user_num, learned)
 
 
-async def schedule_all_users(reason: str):
-    loop = asyncio.get_running_loop()
-    users = await loop.run_in_executor(None, get_all_users)
-    server_logger.info("scheduler", f"Found {len(users)} users for {reason} automation")
+async def run_sweep(sweep: sweeps.Sweep):
+    error = None
+    first = True
+    try:
+        while not sweep.cancel_requested:
+            if not first:
+                await sweep.pause(AUTOMATION_SCHEDULE_DELAY_SEC)
+                if sweep.cancel_requested:
+                    break
+            user = sweep.next_pending()
+            if user is None:
+                break
+            first = False
+            # 작업이 바로 시작될 수 있으므로 상태를 먼저 바꾸고 넣는다.
+            sweep.set_user_state(user[1], sweeps.SCHEDULED)
+            try:
+                schedule_user_from_db(user, sweep)
+                server_logger.info("scheduler", f"Scheduled sweep {sweep.sweep_id} automation for user: {user[1]}")
+            except Exception as exc:
+                sweep.set_user_state(user[1], sweeps.FAILED)
+                server_logger.error("scheduler", f"Failed to schedule sweep {sweep.sweep_id} automation for user {user[1]}: {mask_sensitive_text(exc)}")
+    except asyncio.CancelledError:
+        sweep.request_cancel()
+        raise
+    except Exception as exc:
+        error = mask_sensitive_text(exc)
+        server_logger.error("scheduler", f"Sweep {sweep.sweep_id} failed: {error}")
+    finally:
+        sweep.finish_submitting(error)
+        server_logger.event("scheduler", "sweep_submitted", "sweep scheduling finished", sweep_id=sweep.sweep_id, **sweep.counts())
 
-    for index, user in enumerate(users):
-        try:
-            schedule_user_from_db(user)
-            server_logger.info("scheduler", f"Scheduled {reason} automation for user: {user[1]}")
-            if (index + 1) < len(users):
-                await asyncio.sleep(AUTOMATION_SCHEDULE_DELAY_SEC)
-        except Exception as exc:
-            server_logger.error("scheduler", f"Failed to schedule {reason} automation for user {user[1]}: {mask_sensitive_text(exc)}")
 
-    server_logger.info("scheduler", f"{reason.capitalize()} automation scheduling completed")
+async def start_sweep(reason: str):
+    """전체 유저 sweep을 시작하거나, 유저를 넣고 있는 sweep이 있으면 거기에 합칩니다."""
+    loop = asyncio.get_running_loop()
+    users = await loop.run_in_executor(None, get_all_users)
+    # begin과 add_users 사이에 await가 없어야 합친 유저가 누락되지 않는다.
+    sweep, merged = sweep_manager.begin(reason)
+    added = sweep.add_users(users)
+    if merged:
+        server_logger.info("scheduler", f"{reason} sweep merged into {sweep.sweep_id} (+{added} users)")
+    else:
+        server_logger.info("scheduler", f"Found {len(users)} users for {reason} sweep {sweep.sweep_id}")
+        task = asyncio.create_task(run_sweep(sweep))
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+    return sweep, merged
 
 
 async def run_startup_automation():
     if STARTUP_AUTOMATION_DELAY_SEC > 0:
         await asyncio.sleep(STARTUP_AUTOMATION_DELAY_SEC)
     server_logger.info("scheduler", "Starting startup automation recovery for all users")
-    await schedule_all_users("startup")
+    await start_sweep("startup")
 
 
 async def run_daily_automation():
     server_logger.info("scheduler", "Starting daily automation for all users")
-    await schedule_all_users("daily")
+    await start_sweep("daily")
+
+
+async def run_db_maintenance():
+    loop = asyncio.get_running_loop()
+    try:
+        report = await loop.run_in_executor(None, db_maintenance.run_maintenance)
+    except Exception as exc:
+        server_logger.error("maintenance", f"DB maintenance failed: {mask_sensitive_text(exc)}", event="db_maintenance_failed")
+        return
+    if report.get("skipped"):
+        server_logger.event("maintenance", "db_maintenance_skipped", "DB maintenance skipped", reason=report.get("reason"))
+        return
+    before, after = report.get("before", {}), report.get("after", {})
+    server_logger.event(
+        "maintenance",
+        "db_maintenance_completed",
+        "DB maintenance completed",
+        level="WARN" if report.get("errors") else "INFO",
+        db_bytes=after.get("db_bytes"),
+        wal_bytes_before=before.get("wal_bytes"),
+        wal_bytes_after=after.get("wal_bytes"),
+        freed_pages=(report.get("vacuum") or {}).get("freed_pages"),
+        auto_vacuum=(report.get("vacuum") or {}).get("auto_vacuum"),
+        durations=[f"{task}:{elapsed}" for task, elapsed in report.get("durations_sec", {}).items()],
+        errors=list(report.get("errors", {}).keys()) or None,
+    )
+
+
+async def run_db_backup():
+    loop = asyncio.get_running_loop()
+    try:
+        report = await loop.run_in_executor(None, db_maintenance.backup_database)
+    except Exception as exc:
+        server_logger.error("maintenance", f"DB backup failed: {mask_sensitive_text(exc)}", event="db_backup_failed")
+        return
+    if report.get("skipped"):
+        server_logger.event("maintenance", "db_backup_skipped", "DB backup skipped", reason=report.get("reason"))
+        return
+    if report.get("errors"):
+        server_logger.event(
+            "maintenance",
+            "db_backup_failed",
+            "DB backup failed",
+            level="ERROR",
+            reason=mask_sensitive_text(report["errors"].get("backup")),
+        )
+        return
+    server_logger.event(
+        "maintenance",
+        "db_backup_completed",
+        "DB backup completed",
+        path=report.get("path"),
+        backup_bytes=report.get("backup_bytes"),
+        duration_sec=report.get("durations_sec", {}).get("backup"),
+        pruned=len(report.get("pruned", [])),
+    )
+
+
+async def run_history_prune():
+    loop = asyncio.get_running_loop()
+    report = await loop.run_in_executor(None, db_maintenance.prune_run_history)
+    server_logger.event(
+        "maintenance",
+        "run_history_pruned",
+        "run history pruned",
+        level="WARN" if report.get("errors") else "INFO",
+        keep_days=report.get("keep_days"),
+        pruned_runs=report.get("pruned_runs"),
+        errors=list(report.get("errors", {}).keys()) or None,
+    )
+
+
+async def run_log_retention():
+    loop = asyncio.get_running_loop()
+    try:
+        report = await loop.run_in_executor(None, log_retention.run_retention)
+    except Exception as exc:
+        server_logger.error("maintenance", f"Log retention failed: {mask_sensitive_text(exc)}", event="log_retention_failed")
+        return
+    if report.get("skipped"):
+        server_logger.event("maintenance", "log_retention_skipped", "log retention skipped", reason=report.get("reason"))
+        return
+    server_logger.event(
+        "maintenance",
+        "log_retention_completed",
+        "log retention completed",
+        disk_bytes=report.get("disk_bytes"),
+        days=report.get("days"),
+        compressed_files=report.get("compressed_files"),
+        saved_bytes=report.get("saved_bytes"),
+        removed=[f"{reason}:{size}" for reason, size in report.get("removed", {}).items()] or None,
+        duration_sec=report.get("duration_sec"),
+    )
+
+
+def _settle(result: Future, value=None, error: Optional[BaseException] = None) -> None:
+    # 확인 결과(on_result)와 lane 작업 종료 중 먼저 온 쪽으로 한 번만 정한다.
+    try:
+        if error is not None:
+            result.set_exception(error)
+        else:
+            result.set_result(value)
+    except InvalidStateError:
+        pass
+
+
+def submit_verification(user_id: str, password: str):
+    def start() -> Future:
+        # 자동 수강 worker가 다 차 있으면 실행이 SESSION_LEASE_TTL_SEC 안에 시작하지 못할 가능성이 커서
+        # 세션을 잡지 않고 확인만 한다.
+        if not automation_lane.has_idle_worker():
+            return verify_lane.submit(verify_user_login, user_id, password)
+
+        # 확인 결과는 세션을 잡기 전에 돌려주고, 자동 수강은 take(wait_sec=...)로 잡기가 끝나길 잠깐 기다린다.
+        result: Future = Future()
+        session_leases.expect(user_id)
+        try:
+            lane_future = verify_lane.submit(
+                verify_user_login,
+                user_id,
+                password,
+                lambda storage_state: session_leases.put(user_id, storage_state),
+                lambda value: _settle(result, value),
+            )
+        except Exception:
+            session_leases.release(user_id)
+            raise
+
+        def finished(done: Future) -> None:
+            session_leases.release(user_id)
+            if done.cancelled():
+                result.cancel()
+            elif done.exception() is not None:
+                _settle(result, error=done.exception())
+            else:
+                _settle(result, done.result())
+
+        lane_future.add_done_callback(finished)
+        return result
+
+    return verification_coordinator.submit(user_id, password, start)
+
+
+def register_verified_user(user_id: str, password: str) -> str:
+    """확인된 계정을 저장하고 자동 수강을 automation lane에 넣습니다."""
+    user_logger = get_logger("user", user_id=user_id)
+    if get_user_by_id(user_id):
+        update_user_pwd(user_id, password)
+        server_logger.info("user", f"Existing user password updated: {user_id}")
+        user_logger.info("user", "기존 유저 비밀번호 업데이트")
+    else:
+        add_user(user_id, password)
+        server_logger.info("user", f"New user registered: {user_id}")
+        user_logger.info("user", "신규 유저 등록")
+
+    try:
+        schedule_user_from_db(get_user_by_id(user_id))
+    except LaneFullError:
+        server_logger.warn("request", f"Automation lane full, login accepted without run: {user_id}")
+        return "queue_full"
+    server_logger.info("request", f"Automation scheduled after login: {user_id}")
+    return "scheduled"
+
+
+async def complete_login_job(job: login_jobs.LoginJob, verification, password: str):
+    loop = asyncio.get_running_loop()
+    try:
+        result = await asyncio.wrap_future(verification)
+    except Exception as exc:
+        server_logger.error("request", f"Login verification failed for {job.user_id}: {mask_sensitive_text(exc)}")
+        login_job_store.update(job, login_jobs.ERROR, "계정 확인 중 오류가 발생했습니다.")
+        return
+
+    if not result.get("success"):
+        server_logger.info("request", f"Credential verification failed: {job.user_id}")
+        login_job_store.update(job, login_jobs.FAILED, result.get("message") or "아이디 또는 비밀번호가 올바르지 않습니다.")
+        return
+
+    _reset_verify_login_account_rate_limit(job.user_id)
+    login_job_store.update(job, login_jobs.REGISTERING, result.get("message") or "")
+    try:
+        automation = await loop.run_in_executor(None, register_verified_user, job.user_id, password)
+    except Exception as exc:
+        server_logger.error("request", f"Failed to register verified user {job.user_id}: {mask_sensitive_text(exc)}")
+        login_job_store.update(job, login_jobs.ERROR, "계정 저장 중 오류가 발생했습니다.")
+        return
+    login_job_store.update(job, login_jobs.SUCCEEDED, "로그인 확인 완료", automation=automation)
+
+
+@app.post("/login-jobs", status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(require_internal_request)])
+async def create_login_job(req: CredentialVerificationRequest, request: Request):
+    retry_after = _check_verify_login_rate_limit(request, req.userId)
+    if retry_after:
+        server_logger.warn("request", f"verify-login rate limit exceeded for user: {req.userId}")
+        return _rate_limit_response(retry_after)
+
+    try:
+        verification = submit_verification(req.userId, req.password)
+    except LaneFullError:
+        server_logger.warn("request", f"Verification lane full, rejected user: {req.userId}", **verify_lane.stats())
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"message": "계정 확인 요청이 많습니다. 잠시 후 다시 시도해주세요."},
+            headers={"Retry-After": str(max(1, int(VERIFY_LANE_LATENCY_TARGET_SEC)))},
+        )
+
+    job = login_job_store.create(req.userId)
+    server_logger.info("request", f"Login verification job created for: {req.userId}")
+    task = asyncio.create_task(complete_login_job(job, verification, req.password))
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return job.to_dict()
+
+
+@app.get("/login-jobs/{job_id}", dependencies=[Depends(require_internal_request)])
+async def get_login_job(
+    job_id: str = Path(..., min_length=16, max_length=64, pattern=r"^[A-Za-z0-9_-]+$"),
+    version: int = Query(-1),
+    wait: float = Query(0, ge=0),
+):
+    job = await login_job_store.wait(job_id, version, min(wait, LOGIN_JOB_POLL_MAX_WAIT_SEC))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Login job not found")
+    return job.to_dict()
 
 
 @app.post("/start-automation", dependencies=[Depends(require_internal_request)])
 async def start_automation(req: AutomationRequest):
     try:
         server_logger.info("request", f"Automation request received for user: {req.userId}")
-        loop = asyncio.get_running_loop()
-        loop.run_in_executor(
-            executor,
+        automation_lane.submit(
             automation_task_wrapper,
             req.userId,
             req.password,
@@ -228,6 +664,9 @@ async def start_automation(req: AutomationRequest):
             req.learnedLectures,
         )
         return {"status": "accepted", "message": f"Automation for user {req.userId} has been scheduled."}
+    except LaneFullError as exc:
+        server_logger.warn("request", f"Automation lane full, rejected user: {req.userId}")
+        raise HTTPException(status_code=503, detail="Automation queue is full") from exc
     except Exception as exc:
         server_logger.error("request", f"Failed to schedule automation for user {req.userId}: {mask_sensitive_text(exc)}")
         raise HTTPException(status_code=500, detail=f"Failed to schedule automation for user {req.userId}") from exc
@@ -248,6 +687,9 @@ async def on_user_registered(req: UserRegistered):
         return {"status": "accepted", "message": f"Automation scheduled for user {req.userId}"}
     except HTTPException:
         raise
+    except LaneFullError as exc:
+        server_logger.warn("request", f"Automation lane full, rejected newly registered user: {req.userId}")
+        raise HTTPException(status_code=503, detail="Automation queue is full") from exc
     except Exception as exc:
         server_logger.error(
             "request",
@@ -265,23 +707,198 @@ async def verify_login(req: CredentialVerificationRequest, request: Request):
 
     try:
         server_logger.info("request", f"Login verification requested for: {req.userId}")
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(executor, verify_user_login, req.userId, req.password)
+        result = await asyncio.wrap_future(submit_verification(req.userId, req.password))
         status_code = 200 if result.get("success") else 401
         if result.get("success"):
             _reset_verify_login_account_rate_limit(req.userId)
         return JSONResponse(status_code=status_code, content=result)
+    except LaneFullError:
+        server_logger.warn("request", f"Verification lane full, rejected user: {req.userId}", **verify_lane.stats())
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"message": "계정 확인 요청이 많습니다. 잠시 후 다시 시도해주세요."},
+            headers={"Retry-After": str(max(1, int(VERIFY_LANE_LATENCY_TARGET_SEC)))},
+        )
     except Exception as exc:
         server_logger.error("request", f"Login verification failed for {req.userId}: {mask_sensitive_text(exc)}")
         raise HTTPException(status_code=500, detail="Login verification failed") from exc
 
 
+class SweepRequest(BaseModel):
+    reason: str = Field("manual", min_length=1, max_length=32, pattern=r"^[a-z_]+$")
+
+
+@app.post("/sweeps", status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(require_internal_request)])
+async def create_sweep(req: SweepRequest):
+    try:
+        sweep, merged = await start_sweep(req.reason)
+    except Exception as exc:
+        server_logger.error("request", f"Failed to start sweep: {mask_sensitive_text(exc)}")
+        raise HTTPException(status_code=500, detail="Failed to start sweep") from exc
+    return {**sweep.to_dict(), "merged": merged}
+
+
+@app.get("/sweeps", dependencies=[Depends(require_internal_request)])
+async def list_sweeps():
+    return {"sweeps": [sweep.to_dict() for sweep in sweep_manager.list()]}
+
+
+@app.get("/sweeps/{sweep_id}", dependencies=[Depends(require_internal_request)])
+async def get_sweep(sweep_id: str = Path(..., min_length=1, max_length=32)):
+    sweep = sweep_manager.get(sweep_id)
+    if sweep is None:
+        raise HTTPException(status_code=404, detail="Sweep not found")
+    return sweep.to_dict()
+
+
+@app.post("/sweeps/{sweep_id}/cancel", dependencies=[Depends(require_internal_request)])
+async def cancel_sweep(sweep_id: str = Path(..., min_length=1, max_length=32)):
+    sweep = sweep_manager.get(sweep_id)
+    if sweep is None:
+        raise HTTPException(status_code=404, detail="Sweep not found")
+    sweep.request_cancel()
+    server_logger.info("request", f"Sweep {sweep_id} cancellation requested")
+    return sweep.to_dict()
+
+
+class RerunRequest(BaseModel):
+    userNums: Optional[List[int]] = Field(None, min_length=1, max_length=RERUN_MAX_USERS)
+    status: Optional[str] = Field(None, min_length=1, max_length=32)
+    createdSince: Optional[datetime] = None
+    limit: int = Field(RERUN_MAX_USERS, ge=1, le=RERUN_MAX_USERS)
+
+
+def _as_utc_naive(value: datetime) -> datetime:
+    # 시간대가 없으면 관리자 기준(KST)으로 보고, DB의 CURRENT_TIMESTAMP(UTC)와 맞춘다.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=KST)
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def load_rerun_targets(req: RerunRequest):
+    """대상 유저와 수강 기록을 쿼리 두 번으로 읽습니다 (유저별 조회 없음)."""
+    rows = find_users(
+        nums=req.userNums,
+        status=req.status,
+        created_since=_as_utc_naive(req.createdSince) if req.createdSince else None,
+        limit=req.limit,
+    )
+    return rows, get_learned_lectures_for([row[0] for row in rows])
+
+
+def rerun_users(rows, learned_by_num, requested_nums=None):
+    results = []
+    for row in rows:
+        user_num, user_id = row[0], row[1]
+        with running_users_lock:
+            running = user_id in running_users
+        if running:
+            outcome = "already_running"
+        else:
+            try:
+                schedule_user_from_db(row, learned=learned_by_num.get(user_num, []))
+                outcome = "queued"
+            except LaneFullError:
+                outcome = "queue_full"
+            except Exception as exc:
+                server_logger.error("scheduler", f"Failed to schedule rerun for user {user_id}: {mask_sensitive_text(exc)}")
+                outcome = "error"
+        results.append({"userNum": user_num, "userId": user_id, "result": outcome})
+
+    found = {row[0] for row in rows}
+    for user_num in dict.fromkeys(requested_nums or []):
+        if user_num not in found:
+            results.append({"userNum": user_num, "userId": None, "result": "not_found"})
+    return results
+
+
+@app.post("/reruns", status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(require_internal_request)])
+async def create_rerun(req: RerunRequest):
+    if req.userNums is None and req.status is None and req.createdSince is None:
+        raise HTTPException(status_code=400, detail="userNums, status, createdSince 중 하나는 지정해야 합니다.")
+    loop = asyncio.get_running_loop()
+    try:
+        rows, learned_by_num = await loop.run_in_executor(None, load_rerun_targets, req)
+    except Exception as exc:
+        server_logger.error("request", f"Failed to load rerun targets: {mask_sensitive_text(exc)}")
+        raise HTTPException(status_code=500, detail="Failed to load rerun targets") from exc
+
+    results = rerun_users(rows, learned_by_num, req.userNums)
+    counts = {}
+    for item in results:
+        counts[item["result"]] = counts.get(item["result"], 0) + 1
+    server_logger.event(
+        "scheduler",
+        "rerun_requested",
+        "targeted automation rerun",
+        matched=len(rows),
+        status_filter=req.status,
+        **counts,
+    )
+    return {"matched": len(rows), "counts": counts, "results": results}
+
+
+class PlaybackVerboseRequest(BaseModel):
+    enabled: bool = True
+
+
+@app.post("/runs/{run_id}/verbose", dependencies=[Depends(require_internal_request)])
+async def set_run_verbose(req: PlaybackVerboseRequest, run_id: str = Path(..., min_length=1, max_length=64, pattern=r"^[A-Za-z0-9_.-]+$")):
+    """디버깅할 실행 하나만 재생 이벤트를 샘플링 없이 모두 남기게 합니다."""
+    set_playback_verbose(run_id, req.enabled)
+    server_logger.event("request", "playback_verbose_changed", "playback verbose logging changed", target_run_id=run_id, enabled=req.enabled)
+    return {"runId": run_id, "verbose": req.enabled}
+
+
+# 다른 프로세스(백엔드)가 DB에 쓴 변경을 받을 때 허용하는 이벤트와 필드
+RELAYED_CHANGE_FIELDS = {
+    "user_added": ("userId", "status"),
+    "user_status": ("userId", "status"),
+    "user_deleted": ("userId", "userNum"),
+    "lecture_learned": ("userNum", "lectureId"),
+}
+
+
+class ChangeEventRequest(BaseModel):
+    type: str = Field(..., min_length=1, max_length=32)
+    fields: Dict[str, Any] = Field(default_factory=dict)
+
+
+@app.post("/changes", dependencies=[Depends(require_internal_request)])
+async def publish_change(req: ChangeEventRequest):
+    """백엔드 프로세스의 DB 쓰기(관리자 유저 삭제 등)를 이 서버의 변경 피드에 넣습니다.
+
+    utils.database 변경 리스너는 프로세스 안에서만 불리므로 백엔드가 자기 쓰기를 여기로 보낸다.
+    """
+    allowed = RELAYED_CHANGE_FIELDS.get(req.type)
+    if allowed is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="unknown change type")
+    change_feed.publish(req.type, **{key: req.fields[key] for key in allowed if key in req.fields})
+    return {"success": True}
+
+
+@app.get("/changes", dependencies=[Depends(require_internal_request)])
+async def stream_changes(request: Request):
+    """유저 상태 전이, 강의 완료, 대기열 변화를 SSE로 보냅니다."""
+    return StreamingResponse(
+        change_feed.stream(request.headers.get("last-event-id"), CHANGE_STREAM_HEARTBEAT_SEC, CHANGE_STREAM_MAX_SEC),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/metrics", dependencies=[Depends(require_internal_request)])
+async def get_metrics():
+    """Prometheus 텍스트 형식의 메트릭. 스크래퍼도 X-Internal-Token 헤더를 보내야 한다."""
+    return Response(content=metrics.render_text(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.post("/trigger-daily", dependencies=[Depends(require_internal_request)])
 async def trigger_daily():
     try:
         server_logger.info("request", "Manual daily automation trigger received")
-        await run_daily_automation()
-        return {"status": "accepted", "message": "Daily automation triggered for all users"}
+        sweep, merged = await start_sweep("manual")
+        return {"status": "accepted", "message": "Daily automation triggered for all users", "sweepId": sweep.sweep_id, "merged": merged}
     except Exception as exc:
         server_logger.error("request", f"Failed to trigger daily automation: {mask_sensitive_text(exc)}")
         raise HTTPException(status_code=500, detail="Failed to trigger daily automation") from exc
@@ -5,8 +5,9 @@ import os
 import re
 import time
 from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from playwright.sync_api import Dialog, Frame, Page, TimeoutError as PlaywrightTimeoutError, sync_playwright
 
@@ -32,6 +33,27 @@ PLAYBACK_VERIFY_POLL_SEC = 0.5
 DEFAULT_DURATION_SEC = 60 * 60
 MAX_LECTURE_RUNTIME_SEC = 3 * 60 * 60
 NO_PLAYER_SKIP_THRESHOLD_SEC = 90
+SESSION_WAIT_SEC = 10
+# 로그인 확인 결과를 돌려준 뒤 세션을 잡는 데 쓰는 최대 시간. 그동안 verify lane의 브라우저를 붙잡고 있다.
+SESSION_CAPTURE_WAIT_SEC = float(os.getenv("SESSION_CAPTURE_WAIT_SEC", "5"))
+SESSION_CHECK_API = "/api/v1/users/self"
+# 재생 루프 이벤트 샘플링: 같은 종류의 이벤트는 최소 간격마다 한 번만 남기고, 창마다 요약 한 줄을 남긴다.
+PLAYBACK_SUMMARY_WINDOW_SEC = float(os.getenv("PLAYBACK_SUMMARY_WINDOW_SEC", "60"))
+PLAYBACK_EVENT_MIN_INTERVAL_SEC = {
+    "playback_progressing": float(os.getenv("PLAYBACK_PROGRESS_LOG_INTERVAL_SEC", "300")),
+    "playback_stalled": float(os.getenv("PLAYBACK_STALL_LOG_INTERVAL_SEC", "60")),
+    "playback_initial_state": float(os.getenv("PLAYBACK_INITIAL_STATE_LOG_INTERVAL_SEC", "300")),
+    "playback_snapshot_before": float(os.getenv("PLAYBACK_SNAPSHOT_LOG_INTERVAL_SEC", "300")),
+    "playback_already_running": float(os.getenv("PLAYBACK_SNAPSHOT_LOG_INTERVAL_SEC", "300")),
+}
+# 재생 상태를 나타내는 이벤트. 상태가 바뀐 틱은 간격과 상관없이 남긴다.
+PLAYBACK_STATE_EVENTS = frozenset({"playback_progressing", "playback_stalled", "playback_initial_state"})
+# 쉼표로 구분한 run_id는 샘플링 없이 모든 이벤트를 남긴다. "*"이면 전부.
+_verbose_run_ids: Set[str] = {value.strip() for value in os.getenv("PLAYBACK_VERBOSE_RUN_IDS", "").split(",") if value.strip()}
+# 계측 콜백. automation/main.py가 메트릭으로 연결하고, 없으면 아무것도 하지 않는다.
+# 재생 틱마다 부르지 않고 단계가 끝날 때만 부른다.
+_phase_observer: Optional[Callable[[str, float, str], None]] = None
+_in_flight_observer: Optional[Callable[[str, int], None]] = None
 
 
 @dataclass(frozen=True)
@@ -122,6 +144,152 @@ def _log_playback_event(
     logger.event("playback", event, message or event, **payload)
 
 
+def set_playback_verbose(run_id: str, enabled: bool = True) -> None:
+    if enabled:
+        _verbose_run_ids.add(run_id)
+    else:
+        _verbose_run_ids.discard(run_id)
+
+
+def is_playback_verbose(run_id: Optional[str]) -> bool:
+    return "*" in _verbose_run_ids or (run_id is not None and run_id in _verbose_run_ids)
+
+
+def set_instrumentation(
+    on_phase: Optional[Callable[[str, float, str], None]] = None,
+    on_in_flight: Optional[Callable[[str, int], None]] = None,
+) -> None:
+    """on_phase(단계, 걸린 초, 결과)와 on_in_flight(종류, +1/-1)를 등록합니다."""
+    global _phase_observer, _in_flight_observer
+    _phase_observer = on_phase
+    _in_flight_observer = on_in_flight
+
+
+def _observe_phase(phase: str, started_at: float, outcome: str) -> None:
+    if _phase_observer is not None:
+        _phase_observer(phase, time.time() - started_at, outcome)
+
+
+def _count_in_flight(kind: str, delta: int) -> None:
+    if _in_flight_observer is not None:
+        _in_flight_observer(kind, delta)
+
+
+@contextmanager
+def _in_flight(kind: str) -> Iterator[None]:
+    _count_in_flight(kind, 1)
+    try:
+        yield
+    finally:
+        _count_in_flight(kind, -1)
+
+
+class PlaybackEventSampler:
+    """재생 루프가 몇 초마다 내는 이벤트를 종류별로 솎아 내고, 창 단위 요약으로 합칩니다.
+
+    재생 상태가 바뀐 틱(진행 중 → 멈춤 등)은 바로 남기고, 같은 상태가 이어지면 종류별 최소 간격마다 한 번만
+    남긴다. 무거운 media 배열은 상태가 바뀐 틱에만 붙인다. 그 밖의 틱은 window_sec마다 남기는
+    playback_summary(최소/최대 초, 멈춤 횟수, 진행 속도, 생략한 이벤트 수)로만 보인다.
+    verbose면 예전처럼 모든 이벤트를 그대로 남긴다. verbose를 넘기지 않으면 틱마다 run_id의 override를 다시 봐서
+    재생 중에 켜고 끈 것도 바로 반영한다.
+    """
+
+    def __init__(
+        self,
+        logger: HanyangLogger,
+        lecture: Optional[LectureItem],
+        window_sec: float = PLAYBACK_SUMMARY_WINDOW_SEC,
+        min_interval_sec: Optional[Dict[str, float]] = None,
+        verbose: Optional[bool] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.logger = logger
+        self.lecture = lecture
+        self.window_sec = window_sec
+        self.min_interval_sec = PLAYBACK_EVENT_MIN_INTERVAL_SEC if min_interval_sec is None else min_interval_sec
+        self.run_id = (getattr(logger, "default_fields", None) or {}).get("run_id")
+        self._verbose = verbose
+        self._clock = clock
+        self._last_emitted: Dict[str, float] = {}
+        self._last_state: Optional[str] = None
+        self._reset(clock())
+
+    @property
+    def verbose(self) -> bool:
+        return is_playback_verbose(self.run_id) if self._verbose is None else self._verbose
+
+    def _reset(self, now: float) -> None:
+        self._window_started = now
+        self._ticks = 0
+        self._counts: Dict[str, int] = {}
+        self._suppressed = 0
+        self._stalls = 0
+        self._min_second: Optional[float] = None
+        self._max_second: Optional[float] = None
+        self._first_second: Optional[float] = None
+        self._last_second: Optional[float] = None
+
+    def observe(self, event: str, message: str, second: Optional[float] = None, **fields: Any) -> bool:
+        """이벤트 하나를 받아 요약에 더하고, 실제로 로그를 남겼으면 True."""
+        now = self._clock()
+        self._ticks += 1
+        self._counts[event] = self._counts.get(event, 0) + 1
+        changed = event in PLAYBACK_STATE_EVENTS and event != self._last_state
+        if changed:
+            self._last_state = event
+            if event == "playback_stalled":
+                self._stalls += 1
+        if second is not None:
+            self._min_second = second if self._min_second is None else min(self._min_second, second)
+            self._max_second = second if self._max_second is None else max(self._max_second, second)
+            if self._first_second is None:
+                self._first_second = second
+            self._last_second = second
+
+        due = now - self._last_emitted.get(event, float("-inf")) >= self.min_interval_sec.get(event, 0.0)
+        verbose = self.verbose
+        emitted = verbose or changed or due
+        if emitted:
+            if not (verbose or changed):
+                fields.pop("media", None)
+            if second is not None:
+                fields["second"] = second
+            _log_playback_event(self.logger, event, self.lecture, message, **fields)
+            self._last_emitted[event] = now
+        else:
+            self._suppressed += 1
+
+        if now - self._window_started >= self.window_sec:
+            self.flush(now)
+        return emitted
+
+    def flush(self, now: Optional[float] = None) -> None:
+        """지금 창의 요약을 남기고 새 창을 시작합니다. 재생이 끝날 때도 부른다."""
+        now = self._clock() if now is None else now
+        if self._ticks:
+            elapsed = max(now - self._window_started, 0.001)
+            advanced = (
+                self._last_second - self._first_second
+                if self._first_second is not None and self._last_second is not None
+                else None
+            )
+            _log_playback_event(
+                self.logger,
+                "playback_summary",
+                self.lecture,
+                "playback summary",
+                window_sec=round(elapsed, 1),
+                ticks=self._ticks,
+                min_second=None if self._min_second is None else round(self._min_second, 1),
+                max_second=None if self._max_second is None else round(self._max_second, 1),
+                stalls=self._stalls,
+                rate=None if advanced is None else round(advanced / elapsed, 2),
+                suppressed=self._suppressed,
+                events=[f"{event}:{count}" for event, count in sorted(self._counts.items())],
+            )
+        self._reset(now)
+
+
 def _strip_query(url: str) -> str:
     return url.split("?", 1)[0]
 
@@ -789,29 +957,36 @@ def _wait_for_playback_confirmation(
     baseline: Dict[str, Any],
     wait_ms: int = PLAYBACK_VERIFY_WAIT_MS,
 ) -> tuple[bool, Dict[str, Any], str]:
-    deadline = time.time() + (wait_ms / 1000)
+    started_at = time.time()
+    deadline = started_at + (wait_ms / 1000)
     last_snapshot = baseline
     while time.time() < deadline:
         time.sleep(PLAYBACK_VERIFY_POLL_SEC)
         last_snapshot = _read_hycms_snapshot(page, attendance_frame)
         transition = _classify_playback_transition(baseline, last_snapshot)
         if transition in {"progressing", "running", "restarted_after_end", "ended_near_completion"}:
+            _observe_phase("playback_start", started_at, "confirmed")
             logger.event(
                 "playback",
                 "playback_confirmed",
                 f"playback confirmed after {stage}",
                 stage=stage,
+                strategy=stage.split(":", 1)[0],
+                wait_sec=round(time.time() - started_at, 2),
                 transition=transition,
                 player_time=last_snapshot.get("timeText") or "-",
                 media=last_snapshot.get("mediaStates"),
             )
             return (True, last_snapshot, transition)
+    _observe_phase("playback_start", started_at, "not_confirmed")
     failure_reason = f"{stage}_still_{_classify_playback_transition(baseline, last_snapshot)}"
     logger.event(
         "playback",
         "playback_not_confirmed",
         "playback attempt did not progress",
         stage=stage,
+        strategy=stage.split(":", 1)[0],
+        wait_sec=round(time.time() - started_at, 2),
         reason=failure_reason,
         player_time=last_snapshot.get("timeText") or "-",
         media=last_snapshot.get("mediaStates"),
@@ -819,7 +994,7 @@ def _wait_for_playback_confirmation(
     return (False, last_snapshot, failure_reason)
 
 
-def _ensure_playing(page: Page, logger: HanyangLogger) -> bool:
+def _ensure_playing(page: Page, logger: HanyangLogger, sampler: Optional[PlaybackEventSampler] = None) -> bool:
     attendance_frame = _find_attendance_frame(page)
     hycms = _wait_for_hycms_frame(page, attendance_frame, 10_000)
     if not hycms:
@@ -828,8 +1003,9 @@ def _ensure_playing(page: Page, logger: HanyangLogger) -> bool:
         return False
 
     before = _read_hycms_snapshot(page, attendance_frame)
-    logger.event(
-        "playback",
+    # 재생 루프는 틱마다 이 함수를 부르므로 샘플러가 있으면 그쪽으로 보낸다.
+    emit = sampler.observe if sampler else (lambda event, message, **fields: logger.event("playback", event, message, **fields))
+    emit(
         "playback_snapshot_before",
         "snapshot before play",
         player_time=before.get("timeText") or "-",
@@ -839,7 +1015,7 @@ def _ensure_playing(page: Page, logger: HanyangLogger) -> bool:
     )
 
     if _classify_playback_transition(before, before) in {"progressing", "running"}:
-        logger.event("playback", "playback_already_running", "player already progressing", player_time=before.get("timeText") or "-", media=before.get("mediaStates"))
+        emit("playback_already_running", "player already progressing", player_time=before.get("timeText") or "-", media=before.get("mediaStates"))
         return True
 
     last_snapshot = before
@@ -1022,6 +1198,24 @@ def _collect_failure_context(page: Page, lecture: LectureItem, logger: HanyangLo
     _log_lecture_event(logger, "lecture_failure_context", lecture, "captured failure page state", **fields)
 
 
+def _record_lecture_attempt(
+    on_lecture_attempt: Optional[Callable[[LectureItem, int, str, float], None]],
+    logger: HanyangLogger,
+    lecture: LectureItem,
+    attempt: int,
+    outcome: str,
+    started_at: float,
+) -> None:
+    _observe_phase("lecture", started_at, outcome)
+    if on_lecture_attempt is None:
+        return
+    try:
+        on_lecture_attempt(lecture, attempt, outcome, time.time() - started_at)
+    except Exception as exc:
+        # 기록 실패로 수강을 멈추지 않는다.
+        logger.error("automation", f"lecture attempt record failed: {mask_sensitive_text(exc)}")
+
+
 def _run_pending_lectures(
     page: Page,
     pending: List[LectureItem],
@@ -1031,12 +1225,28 @@ def _run_pending_lectures(
     learned_set: Set[str],
     db_add_learned: Callable[[str, str], None],
     run_started_at: float,
+    on_lecture_attempt: Optional[Callable[[LectureItem, int, str, float], None]] = None,
+    on_progress: Optional[Callable[[LectureItem, Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
     queue: Deque[Tuple[LectureItem, int]] = deque((lecture, 1) for lecture in pending)
 
     while queue:
         lecture, attempt = queue.popleft()
-        result = _play_until_complete(page, lecture, user_logger)
+        attempt_started_at = time.time()
+        try:
+            with _in_flight("lectures"):
+                result = _play_until_complete(page, lecture, user_logger, on_progress)
+        except Exception:
+            _record_lecture_attempt(on_lecture_attempt, user_logger, lecture, attempt, "error", attempt_started_at)
+            raise
+        _record_lecture_attempt(
+            on_lecture_attempt,
+            user_logger,
+            lecture,
+            attempt,
+            result.get("outcome") or ("completed" if result.get("learn") else "failed"),
+            attempt_started_at,
+        )
         if not result.get("learn"):
             failure_message = result.get("msg", "")
             _collect_failure_context(page, lecture, user_logger, attempt, failure_message)
@@ -1080,6 +1290,7 @@ def _run_pending_lectures(
                 "success": False,
                 "msg": f"강의 처리 실패: {lecture.title} ({failure_message})",
                 "learned": learned,
+                "outcome": "lecture_failed",
             }
 
         if result.get("mark_processed", True):
@@ -1095,7 +1306,7 @@ def _run_pending_lectures(
         learned_count=len(learned),
         pending_lectures=len(pending),
     )
-    return {"success": True, "msg": f"{len(learned)}개 강의 처리 완료", "learned": learned}
+    return {"success": True, "msg": f"{len(learned)}개 강의 처리 완료", "learned": learned, "outcome": "completed"}
 
 
 def _wait_for_attendance_frame(page: Page) -> Frame:
@@ -1136,6 +1347,44 @@ def _login(page: Page, user_id: str, password: str, logger: HanyangLogger) -> Di
     return {"login": False, "msg": f"로그인 후 LMS 이동 실패: {mask_sensitive_url(page.url)}"}
 
 
+def _wait_for_lms_session(page: Page, logger: HanyangLogger, timeout_sec: float = SESSION_WAIT_SEC) -> bool:
+    end_time = time.time() + timeout_sec
+    try:
+        page.goto(LMS_ORIGIN, wait_until="domcontentloaded", timeout=timeout_sec * 1000)
+    except Exception as exc:
+        logger.info("login", f"LMS navigation for session check raised: {mask_sensitive_text(exc)}")
+
+    while time.time() < end_time:
+        current_url = page.url
+        if current_url.startswith(LMS_ORIGIN) and "oauth/login" not in current_url:
+            try:
+                _fetch_json(page, SESSION_CHECK_API)
+                return True
+            except Exception:
+                pass
+        time.sleep(0.5)
+    return False
+
+
+def _capture_lms_session(page: Page, logger: HanyangLogger, timeout_sec: float = SESSION_CAPTURE_WAIT_SEC) -> Optional[Dict[str, Any]]:
+    # 로그인 확인 직후 LMS까지 들어가 두면 다음 자동 수강이 OAuth 로그인을 건너뛸 수 있다.
+    # 넘기는 것은 storage_state(쿠키/스토리지)뿐이라 자동 수강은 브라우저를 여전히 새로 띄운다.
+    if not _wait_for_lms_session(page, logger, timeout_sec):
+        logger.event("verification", "session_capture_skipped", "LMS session not ready for handoff")
+        return None
+    logger.event("verification", "session_captured", "LMS session captured for handoff")
+    return page.context.storage_state()
+
+
+def _adopt_lms_session(page: Page, logger: HanyangLogger, timeout_sec: float = SESSION_WAIT_SEC) -> bool:
+    if _wait_for_lms_session(page, logger, timeout_sec):
+        logger.event("login", "session_adopted", "reused verified LMS session", current_url=mask_sensitive_url(page.url))
+        return True
+    logger.event("login", "session_adoption_failed", "handed-off session rejected, falling back to login")
+    page.context.clear_cookies()
+    return False
+
+
 def _discover_courses(page: Page, logger: HanyangLogger) -> List[Dict[str, str]]:
     cards = _fetch_json(page, DASHBOARD_API)
     courses: List[Dict[str, str]] = []
@@ -1217,7 +1466,44 @@ def _mark_processed(
         db_add_learned(user_id, lecture.key)
 
 
-def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger) -> Dict[str, Any]:
+def _report_progress(
+    on_progress: Optional[Callable[[LectureItem, Dict[str, Any]], None]],
+    logger: HanyangLogger,
+    lecture: LectureItem,
+    media_second: Optional[float],
+    duration_sec: float,
+    deadline: float,
+) -> None:
+    if on_progress is None:
+        return
+    now = time.time()
+    percent = None
+    eta_sec = None
+    if media_second is not None and duration_sec > 0:
+        percent = round(min(media_second / duration_sec, 1.0) * 100, 1)
+        eta_sec = round(max(duration_sec - media_second, 0.0), 1)
+    try:
+        on_progress(
+            lecture,
+            {
+                "media_second": round(media_second, 1) if media_second is not None else None,
+                "duration_sec": round(duration_sec, 1),
+                "percent": percent,
+                "eta_sec": eta_sec,
+                "deadline_at": round(deadline, 1),
+                "heartbeat_at": now,
+            },
+        )
+    except Exception as exc:
+        logger.error("automation", f"progress report failed: {mask_sensitive_text(exc)}")
+
+
+def _play_until_complete(
+    page: Page,
+    lecture: LectureItem,
+    logger: HanyangLogger,
+    on_progress: Optional[Callable[[LectureItem, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
     lecture_started_at = time.time()
     page.goto(lecture.html_url, wait_until="domcontentloaded")
     attendance_frame = _wait_for_attendance_frame(page)
@@ -1245,7 +1531,7 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
             source=availability_source or "-",
             marker=availability_marker or "-",
         )
-        return {"learn": True, "mark_processed": False, "msg": "scheduled lecture"}
+        return {"learn": True, "mark_processed": False, "msg": "scheduled lecture", "outcome": "scheduled"}
     if availability_state == "expired":
         _log_lecture_event(
             logger,
@@ -1257,7 +1543,7 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
             source=availability_source or "-",
             marker=availability_marker or "-",
         )
-        return {"learn": True, "msg": "expired lecture"}
+        return {"learn": True, "msg": "expired lecture", "outcome": "expired"}
     if non_required:
         _log_lecture_event(
             logger,
@@ -1268,10 +1554,10 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
             attendance_status=initial["statusParts"] or ["(empty)"],
             marker=non_required_marker or "-",
         )
-        return {"learn": True, "msg": "non-required recording"}
+        return {"learn": True, "msg": "non-required recording", "outcome": "non_required_recording"}
     if initial["completed"]:
         _log_lecture_event(logger, "lecture_already_completed", lecture, "already completed", outcome="already_completed")
-        return {"learn": True, "msg": "already completed"}
+        return {"learn": True, "msg": "already completed", "outcome": "already_completed"}
 
     # Many already-finished lectures briefly look incomplete until the
     # attendance page synchronizes server state. Try several quick syncs before
@@ -1295,7 +1581,7 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
                     source=availability_source or "-",
                     marker=availability_marker or "-",
                 )
-                return {"learn": True, "mark_processed": False, "msg": "scheduled lecture"}
+                return {"learn": True, "mark_processed": False, "msg": "scheduled lecture", "outcome": "scheduled"}
             if availability_state == "expired":
                 _log_lecture_event(
                     logger,
@@ -1308,7 +1594,7 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
                     source=availability_source or "-",
                     marker=availability_marker or "-",
                 )
-                return {"learn": True, "msg": "expired lecture"}
+                return {"learn": True, "msg": "expired lecture", "outcome": "expired"}
             if non_required:
                 _log_lecture_event(
                     logger,
@@ -1320,10 +1606,10 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
                     attendance_status=initial["statusParts"] or ["(empty)"],
                     marker=non_required_marker or "-",
                 )
-                return {"learn": True, "msg": "non-required recording"}
+                return {"learn": True, "msg": "non-required recording", "outcome": "non_required_recording"}
             if initial["completed"]:
                 _log_lecture_event(logger, "lecture_already_completed", lecture, "already completed after sync", outcome="already_completed", phase="initial_sync")
-                return {"learn": True, "msg": "already completed after sync"}
+                return {"learn": True, "msg": "already completed after sync", "outcome": "already_completed"}
             if attempt + 1 < INITIAL_STATUS_SYNC_ATTEMPTS:
                 time.sleep(INITIAL_STATUS_SYNC_WAIT_SEC)
 
@@ -1338,10 +1624,6 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
         MAX_LECTURE_RUNTIME_SEC,
     )
     deadline = time.time() + min(int(duration_sec * 1.2) + 180, MAX_LECTURE_RUNTIME_SEC)
-    last_refresh = 0.0
-    last_media_second: Optional[float] = None
-    last_media_snapshot: Optional[Dict[str, Any]] = None
-    no_player_started_at: Optional[float] = None
 
     _log_lecture_event(
         logger,
@@ -1352,6 +1634,31 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
         deadline_sec=max(int(deadline - time.time()), 0),
     )
 
+    _report_progress(on_progress, logger, lecture, None, duration_sec, deadline)
+
+    # 재생 루프가 어떤 경로로 끝나든 아직 남기지 않은 요약을 남긴다.
+    sampler = PlaybackEventSampler(logger, lecture)
+    try:
+        return _watch_playback(page, lecture, logger, sampler, on_progress, duration_sec, deadline, lecture_started_at)
+    finally:
+        sampler.flush()
+
+
+def _watch_playback(
+    page: Page,
+    lecture: LectureItem,
+    logger: HanyangLogger,
+    sampler: PlaybackEventSampler,
+    on_progress: Optional[Callable[[LectureItem, Dict[str, Any]], None]],
+    duration_sec: int,
+    deadline: float,
+    lecture_started_at: float,
+) -> Dict[str, Any]:
+    last_refresh = 0.0
+    last_media_second: Optional[float] = None
+    last_media_snapshot: Optional[Dict[str, Any]] = None
+    no_player_started_at: Optional[float] = None
+
     while time.time() < deadline:
         attendance_frame = _wait_for_attendance_frame(page)
         snapshot = _read_attendance_snapshot(attendance_frame)
@@ -1369,7 +1676,7 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
                 source=availability_source or "-",
                 marker=availability_marker or "-",
             )
-            return {"learn": True, "mark_processed": False, "msg": "scheduled lecture"}
+            return {"learn": True, "mark_processed": False, "msg": "scheduled lecture", "outcome": "scheduled"}
         if availability_state == "expired":
             _log_lecture_event(
                 logger,
@@ -1382,7 +1689,7 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
                 source=availability_source or "-",
                 marker=availability_marker or "-",
             )
-            return {"learn": True, "msg": "expired lecture"}
+            return {"learn": True, "msg": "expired lecture", "outcome": "expired"}
         if non_required:
             _log_lecture_event(
                 logger,
@@ -1394,7 +1701,7 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
                 attendance_status=snapshot["statusParts"] or ["(empty)"],
                 marker=non_required_marker or "-",
             )
-            return {"learn": True, "msg": "non-required recording"}
+            return {"learn": True, "msg": "non-required recording", "outcome": "non_required_recording"}
         if snapshot["completed"]:
             _log_lecture_event(
                 logger,
@@ -1404,7 +1711,7 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
                 elapsed_sec=int(time.time() - lecture_started_at),
                 attendance_status=snapshot["statusParts"] or ["(empty)"],
             )
-            return {"learn": True, "msg": "completed"}
+            return {"learn": True, "msg": "completed", "outcome": "completed"}
 
         if _is_static_pending_without_player(snapshot):
             if no_player_started_at is None:
@@ -1427,20 +1734,18 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
                     attendance_status=snapshot["statusParts"] or ["(empty)"],
                     no_player_elapsed_sec=int(time.time() - no_player_started_at),
                 )
-                return {"learn": True, "msg": "non-playable attendance item"}
+                return {"learn": True, "msg": "non-playable attendance item", "outcome": "non_playable_attendance_item"}
         else:
             no_player_started_at = None
 
         if snapshot["hasInnerFrame"]:
-            _ensure_playing(page, logger)
+            _ensure_playing(page, logger, sampler)
             media_snapshot = _read_hycms_snapshot(page, attendance_frame)
             current_media_second = _snapshot_max_media_second(media_snapshot)
             if current_media_second is not None:
                 if last_media_second is not None and current_media_second > last_media_second + 0.5:
-                    _log_playback_event(
-                        logger,
+                    sampler.observe(
                         "playback_progressing",
-                        lecture,
                         "playback progressing",
                         second=round(current_media_second, 1),
                         player_time=media_snapshot.get("timeText") or "-",
@@ -1461,20 +1766,16 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
                         media=media_snapshot.get("mediaStates"),
                     )
                 elif last_media_second is not None and current_media_second <= last_media_second + 0.1:
-                    _log_playback_event(
-                        logger,
+                    sampler.observe(
                         "playback_stalled",
-                        lecture,
                         "playback stalled",
                         second=round(current_media_second, 1),
                         player_time=media_snapshot.get("timeText") or "-",
                         media=media_snapshot.get("mediaStates"),
                     )
                 else:
-                    _log_playback_event(
-                        logger,
+                    sampler.observe(
                         "playback_initial_state",
-                        lecture,
                         "playback initial media state",
                         second=round(current_media_second, 1),
                         player_time=media_snapshot.get("timeText") or "-",
@@ -1496,30 +1797,24 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
             current_media_second = _snapshot_max_media_second(media_snapshot)
             if current_media_second is not None:
                 if last_media_second is not None and current_media_second > last_media_second + 0.5:
-                    _log_playback_event(
-                        logger,
+                    sampler.observe(
                         "playback_progressing",
-                        lecture,
                         "direct media playback progressing",
                         second=round(current_media_second, 1),
                         player_time="-",
                         media=media_snapshot.get("mediaStates"),
                     )
                 elif last_media_second is not None and current_media_second <= last_media_second + 0.1:
-                    _log_playback_event(
-                        logger,
+                    sampler.observe(
                         "playback_stalled",
-                        lecture,
                         "direct media playback stalled",
                         second=round(current_media_second, 1),
                         player_time="-",
                         media=media_snapshot.get("mediaStates"),
                     )
                 else:
-                    _log_playback_event(
-                        logger,
+                    sampler.observe(
                         "playback_initial_state",
-                        lecture,
                         "direct media initial state",
                         second=round(current_media_second, 1),
                         player_time="-",
@@ -1530,12 +1825,15 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
                 last_media_snapshot = media_snapshot
         elif snapshot["nonVideoHints"]:
             _log_lecture_event(logger, "lecture_non_video_processed", lecture, "non-video item treated as processed", outcome="non_video_item")
-            return {"learn": True, "msg": "non-video attendance item"}
+            return {"learn": True, "msg": "non-video attendance item", "outcome": "non_video_item"}
 
         if time.time() - last_refresh >= STATUS_REFRESH_INTERVAL_SEC and snapshot["hasRefreshButton"]:
             _refresh_status(attendance_frame, logger)
             last_refresh = time.time()
 
+        # 플레이어가 알려주는 전체 길이가 있으면 상태 문구에서 추정한 길이보다 우선한다.
+        media_duration = _snapshot_total_duration(last_media_snapshot) if last_media_snapshot else 0.0
+        _report_progress(on_progress, logger, lecture, last_media_second, media_duration or duration_sec, deadline)
         time.sleep(STATUS_POLL_INTERVAL_SEC)
 
     attendance_frame = _wait_for_attendance_frame(page)
@@ -1548,7 +1846,7 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
             elapsed_sec=int(time.time() - lecture_started_at),
             phase="final_refresh",
         )
-        return {"learn": True, "msg": "completed after final refresh"}
+        return {"learn": True, "msg": "completed after final refresh", "outcome": "completed"}
     _log_lecture_event(
         logger,
         "lecture_timeout",
@@ -1556,10 +1854,19 @@ def _play_until_complete(page: Page, lecture: LectureItem, logger: HanyangLogger
         "timeout waiting for completion",
         elapsed_sec=int(time.time() - lecture_started_at),
     )
-    return {"learn": False, "msg": f"timeout waiting for completion: {lecture.title}"}
+    return {"learn": False, "msg": f"timeout waiting for completion: {lecture.title}", "outcome": "timeout"}
 
 
-def run_user_automation(user_id: str, pwd: str, learned_lectures: List[str], db_add_learned, run_id: Optional[str] = None) -> Dict[str, Any]:
+def run_user_automation(
+    user_id: str,
+    pwd: str,
+    learned_lectures: List[str],
+    db_add_learned,
+    run_id: Optional[str] = None,
+    storage_state: Optional[Dict[str, Any]] = None,
+    on_lecture_attempt: Optional[Callable[[LectureItem, int, str, float], None]] = None,
+    on_progress: Optional[Callable[[LectureItem, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
     resolved_run_id = run_id or HanyangLogger.new_run_id("automation")
     user_logger = HanyangLogger("user", user_id=str(user_id), default_fields={"run_id": resolved_run_id})
     learned_set = {value for item in learned_lectures for value in ([item] if item else [])}
@@ -1581,16 +1888,25 @@ def run_user_automation(user_id: str, pwd: str, learned_lectures: List[str], db_
             "automation run started",
             previously_learned=len(learned_lectures),
         )
+        launch_started_at = time.time()
         playwright = sync_playwright().start()
         browser = playwright.chromium.launch(
             headless=os.getenv("PLAYWRIGHT_HEADLESS", "true").lower() != "false",
             args=["--disable-dev-shm-usage"],
         )
-        context = browser.new_context(ignore_https_errors=True)
+        _count_in_flight("browsers", 1)
+        _observe_phase("browser_launch", launch_started_at, "ok")
+        context = browser.new_context(ignore_https_errors=True, storage_state=storage_state)
         page = context.new_page()
         page.on("dialog", lambda dialog: _handle_dialog(user_logger, dialog))
 
-        login_result = _login(page, user_id, pwd, user_logger)
+        login_started_at = time.time()
+        if storage_state and _adopt_lms_session(page, user_logger):
+            login_result = {"login": True, "msg": "세션 인계"}
+            _observe_phase("login", login_started_at, "session_adopted")
+        else:
+            login_result = _login(page, user_id, pwd, user_logger)
+            _observe_phase("login", login_started_at, "ok" if login_result.get("login") else "failed")
         if not login_result.get("login"):
             update_user_status(user_id, "error")
             user_logger.event(
@@ -1602,10 +1918,12 @@ def run_user_automation(user_id: str, pwd: str, learned_lectures: List[str], db_
                 reason=login_result.get("msg", "로그인 실패"),
                 level="ERROR",
             )
-            return {"success": False, "msg": login_result.get("msg", "로그인 실패"), "learned": []}
+            return {"success": False, "msg": login_result.get("msg", "로그인 실패"), "learned": [], "outcome": "login_failed"}
 
+        discovery_started_at = time.time()
         courses = _discover_courses(page, user_logger)
         if not courses:
+            _observe_phase("discovery", discovery_started_at, "no_courses")
             update_user_status(user_id, "completed")
             user_logger.event(
                 "automation",
@@ -1614,10 +1932,11 @@ def run_user_automation(user_id: str, pwd: str, learned_lectures: List[str], db_
                 outcome="no_courses",
                 elapsed_sec=int(time.time() - run_started_at),
             )
-            return {"success": True, "msg": "과목 없음", "learned": []}
+            return {"success": True, "msg": "과목 없음", "learned": [], "outcome": "no_courses"}
 
         lectures = _discover_lecture_items(page, courses, user_logger)
         pending = [lecture for lecture in lectures if not _is_learned(lecture, learned_set)]
+        _observe_phase("discovery", discovery_started_at, "ok")
         user_logger.event(
             "automation",
             "automation_pending_lectures",
@@ -1628,7 +1947,18 @@ def run_user_automation(user_id: str, pwd: str, learned_lectures: List[str], db_
             previously_learned_filtered=len(lectures) - len(pending),
         )
 
-        return _run_pending_lectures(page, pending, user_logger, user_id, learned, learned_set, db_add_learned, run_started_at)
+        return _run_pending_lectures(
+            page,
+            pending,
+            user_logger,
+            user_id,
+            learned,
+            learned_set,
+            db_add_learned,
+            run_started_at,
+            on_lecture_attempt,
+            on_progress,
+        )
     except Exception as exc:
         user_logger.error("automation", f"playwright automation error: {mask_sensitive_text(exc)}")
         try:
@@ -1644,31 +1974,55 @@ def run_user_automation(user_id: str, pwd: str, learned_lectures: List[str], db_
             reason=mask_sensitive_text(exc),
             level="ERROR",
         )
-        return {"success": False, "msg": "자동화 오류가 발생했습니다.", "learned": learned}
+        return {"success": False, "msg": "자동화 오류가 발생했습니다.", "learned": learned, "outcome": "exception"}
     finally:
         if browser:
+            _count_in_flight("browsers", -1)
             browser.close()
         if playwright:
             playwright.stop()
 
 
-def verify_user_login(user_id: str, pwd: str) -> Dict[str, Any]:
+def verify_user_login(
+    user_id: str,
+    pwd: str,
+    on_session: Optional[Callable[[Dict[str, Any]], None]] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """한양 LMS 로그인을 확인합니다.
+
+    on_session이 있으면 성공한 뒤 LMS 세션(storage_state)을 잡아 넘긴다. 이때 on_result로 확인 결과를
+    먼저 넘겨서, 세션을 잡는 시간(최대 SESSION_CAPTURE_WAIT_SEC)이 로그인 응답을 늦추지 않게 한다.
+    """
     logger = HanyangLogger("user", user_id=str(user_id))
     browser = None
     playwright = None
 
     try:
+        launch_started_at = time.time()
         playwright = sync_playwright().start()
         browser = playwright.chromium.launch(
             headless=os.getenv("PLAYWRIGHT_HEADLESS", "true").lower() != "false",
             args=["--disable-dev-shm-usage"],
         )
+        _count_in_flight("browsers", 1)
+        _observe_phase("browser_launch", launch_started_at, "ok")
         context = browser.new_context(ignore_https_errors=True)
         page = context.new_page()
         page.on("dialog", lambda dialog: _handle_dialog(logger, dialog))
         submit_result = _submit_login_form(page, user_id, pwd, logger)
         if submit_result["code"] in {"200", "504"}:
-            return {"success": True, "message": "한양 LMS 로그인 확인 완료"}
+            result = {"success": True, "message": "한양 LMS 로그인 확인 완료"}
+            if on_session:
+                if on_result:
+                    on_result(result)
+                try:
+                    storage_state = _capture_lms_session(page, logger)
+                    if storage_state:
+                        on_session(storage_state)
+                except Exception as exc:
+                    logger.info("verification", f"session capture failed: {mask_sensitive_text(exc)}")
+            return result
         return {
             "success": False,
             "message": submit_result["msg"] or "아이디 또는 비밀번호가 올바르지 않습니다.",
@@ -1679,6 +2033,7 @@ def verify_user_login(user_id: str, pwd: str) -> Dict[str, Any]:
         return {"success": False, "message": "계정 확인 중 오류가 발생했습니다."}
     finally:
         if browser:
+            _count_in_flight("browsers", -1)
             browser.close()
         if playwright:
             playwright.stop()
@@ -0,0 +1,134 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+from utils import metrics
+
+
+progress_tracked_users = metrics.gauge("hanyang_progress_tracked_users", "Users with a live lecture progress row")
+progress_rows_written = metrics.counter("hanyang_progress_rows_written_total", "Progress rows written to the DB", labelnames=("op",))
+progress_write_failures = metrics.counter("hanyang_progress_write_failures_total", "Progress batches that failed to write")
+
+# Lecture_Progress 컬럼 순서와 같다.
+PROGRESS_FIELDS = (
+    "userId", "runId", "courseId", "lectureId", "title", "mediaSecond",
+    "durationSec", "percent", "etaSec", "deadlineAt", "heartbeatAt",
+)
+
+
+class ProgressTracker:
+    """재생 루프가 보내는 강의 진행 상황을 유저당 최신 값 하나로 합쳐 두었다가 주기적으로 한 번에 씁니다.
+
+    재생 루프는 몇 초마다 update를 부르지만 DB에는 flush_interval_sec마다 바뀐 유저만 쓴다.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Sequence[Any]]], None],
+        delete: Callable[[List[str]], None],
+        flush_interval_sec: float = 5.0,
+        on_flush: Optional[Callable[[List[Dict[str, Any]], List[str]], None]] = None,
+    ):
+        self._write = write
+        self._delete = delete
+        self.flush_interval_sec = max(0.1, flush_interval_sec)
+        self._on_flush = on_flush
+        self._lock = threading.Lock()
+        self._rows: Dict[str, tuple] = {}
+        self._dirty: Set[str] = set()
+        self._cleared: Set[str] = set()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def update(self, user_id: str, run_id: str, course_id: str, lecture_id: str, title: str, progress: Dict[str, Any]) -> None:
+        row = (
+            user_id,
+            run_id,
+            course_id,
+            lecture_id,
+            title,
+            progress.get("media_second"),
+            progress.get("duration_sec"),
+            progress.get("percent"),
+            progress.get("eta_sec"),
+            progress.get("deadline_at"),
+            progress.get("heartbeat_at") or time.time(),
+        )
+        with self._lock:
+            self._rows[user_id] = row
+            self._dirty.add(user_id)
+            self._cleared.discard(user_id)
+            progress_tracked_users.set(len(self._rows))
+
+    def clear(self, user_id: str) -> None:
+        with self._lock:
+            if self._rows.pop(user_id, None) is None:
+                return
+            self._dirty.discard(user_id)
+            self._cleared.add(user_id)
+            progress_tracked_users.set(len(self._rows))
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._rows.get(user_id)
+        return dict(zip(PROGRESS_FIELDS, row)) if row else None
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = list(self._rows.values())
+        return [dict(zip(PROGRESS_FIELDS, row)) for row in rows]
+
+    def flush(self) -> int:
+        """바뀐 행을 한 번에 쓰고 쓴 행 수를 돌려줍니다. 실패하면 다음 주기에 다시 쓴다."""
+        with self._lock:
+            rows = [self._rows[user_id] for user_id in self._dirty if user_id in self._rows]
+            cleared = list(self._cleared)
+            self._dirty.clear()
+            self._cleared.clear()
+        if not rows and not cleared:
+            return 0
+        try:
+            if rows:
+                self._write(rows)
+            if cleared:
+                self._delete(cleared)
+        except Exception:
+            progress_write_failures.inc()
+            with self._lock:
+                # 그 사이 새 값이 들어온 유저는 새 값으로 쓰면 된다.
+                for row in rows:
+                    if row[0] in self._rows:
+                        self._dirty.add(row[0])
+                for user_id in cleared:
+                    if user_id not in self._rows:
+                        self._cleared.add(user_id)
+            raise
+        progress_rows_written.inc(len(rows), op="upsert")
+        progress_rows_written.inc(len(cleared), op="delete")
+        if self._on_flush:
+            self._on_flush([dict(zip(PROGRESS_FIELDS, row)) for row in rows], cleared)
+        return len(rows) + len(cleared)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval_sec):
+            try:
+                self.flush()
+            except Exception:
+                pass
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.flush_interval_sec + 5)
+            self._thread = None
+        try:
+            self.flush()
+        except Exception:
+            pass
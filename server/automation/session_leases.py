@@ -0,0 +1,73 @@
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from utils import metrics
+
+
+session_handoffs = metrics.counter(
+    "hanyang_session_handoff_total",
+    "Verified browser sessions offered to and adopted by automation runs",
+    labelnames=("outcome",),
+)
+
+
+class SessionLeaseStore:
+    """로그인 확인에서 얻은 LMS 세션(storage_state)을 유저별로 잠깐 맡아 둡니다.
+
+    Playwright sync 객체는 만든 스레드 밖에서 쓸 수 없어서 브라우저 컨텍스트 대신
+    쿠키/스토리지 상태만 넘긴다. 그래서 넘겨받는 실행도 브라우저는 매번 새로 띄우고, 아끼는 것은
+    OAuth 로그인뿐이다. 한 번 꺼내면 사라지고, 시간이 지나도 사라진다.
+
+    로그인 확인은 결과를 먼저 돌려준 뒤 세션을 잡으므로, expect()로 잡는 중이라고 표시해 두면
+    take(wait_sec=...)가 그동안 잠깐 기다린다. release()는 잡기가 끝났을 때(성공 여부와 상관없이) 부른다.
+    """
+
+    def __init__(self, ttl_sec: float = 300):
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._leases: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._pending: Dict[str, threading.Event] = {}
+
+    def expect(self, user_id: str) -> None:
+        if self.ttl_sec <= 0:
+            return
+        with self._lock:
+            self._pending.setdefault(user_id.lower(), threading.Event())
+
+    def release(self, user_id: str) -> None:
+        with self._lock:
+            pending = self._pending.pop(user_id.lower(), None)
+        if pending is not None:
+            pending.set()
+
+    def put(self, user_id: str, storage_state: Dict[str, Any]) -> None:
+        if self.ttl_sec <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            for key in [key for key, (expires, _) in self._leases.items() if expires < now]:
+                self._leases.pop(key, None)
+                session_handoffs.inc(outcome="expired")
+            self._leases[user_id.lower()] = (now + self.ttl_sec, storage_state)
+        session_handoffs.inc(outcome="stored")
+        self.release(user_id)
+
+    def take(self, user_id: str, wait_sec: float = 0) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            pending = self._pending.get(user_id.lower())
+        if pending is not None and wait_sec > 0:
+            pending.wait(wait_sec)
+        with self._lock:
+            lease = self._leases.pop(user_id.lower(), None)
+        if lease is None:
+            return None
+        if lease[0] < time.monotonic():
+            session_handoffs.inc(outcome="expired")
+            return None
+        session_handoffs.inc(outcome="taken")
+        return lease[1]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._leases)
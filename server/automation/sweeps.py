@@ -0,0 +1,189 @@
+import asyncio
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from utils import metrics
+
+
+PENDING = "pending"
+SCHEDULED = "scheduled"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+CANCELLED = "cancelled"
+USER_STATES = (PENDING, SCHEDULED, RUNNING, DONE, FAILED, SKIPPED, CANCELLED)
+OPEN_USER_STATES = frozenset({PENDING, SCHEDULED, RUNNING})
+
+SWEEP_RUNNING = "running"
+SWEEP_COMPLETED = "completed"
+SWEEP_CANCELLED = "cancelled"
+SWEEP_FAILED = "failed"
+
+sweeps_started = metrics.counter("hanyang_sweeps_started_total", "Automation sweeps started", labelnames=("reason",))
+sweeps_merged = metrics.counter("hanyang_sweeps_merged_total", "Sweep requests merged into an already running sweep")
+sweep_duration = metrics.histogram(
+    "hanyang_sweep_seconds",
+    "Time from sweep start until every user run finished",
+    labelnames=("state",),
+    buckets=(60, 300, 900, 1800, 3600, 7200, 14400, 28800, 57600, 86400),
+)
+
+
+class Sweep:
+    """전체 유저 자동 수강 한 번. 유저별 상태를 세어 진행률을 보여준다.
+
+    이벤트 루프와 lane 스레드 양쪽에서 상태를 바꾸므로 잠금으로 보호한다.
+    """
+
+    def __init__(self, sweep_id: str, reason: str):
+        self.sweep_id = sweep_id
+        self.reasons: List[str] = [reason]
+        self.state = SWEEP_RUNNING
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.submitting = True
+        self.cancel_requested = False
+        self._wake = asyncio.Event()
+        self._lock = threading.Lock()
+        self._rows: "OrderedDict[str, Sequence[Any]]" = OrderedDict()
+        self._states: Dict[str, str] = {}
+
+    def add_users(self, rows: Iterable[Sequence[Any]]) -> int:
+        added = 0
+        with self._lock:
+            for row in rows:
+                user_id = row[1]
+                if user_id in self._rows:
+                    continue
+                self._rows[user_id] = row
+                self._states[user_id] = PENDING
+                added += 1
+        if added:
+            self._wake.set()
+        return added
+
+    def next_pending(self) -> Optional[Sequence[Any]]:
+        with self._lock:
+            for user_id, row in self._rows.items():
+                if self._states[user_id] == PENDING:
+                    return row
+        return None
+
+    def set_user_state(self, user_id: str, state: str) -> None:
+        with self._lock:
+            if user_id not in self._states:
+                return
+            self._states[user_id] = state
+        self._maybe_finish()
+
+    def user_state(self, user_id: str) -> Optional[str]:
+        with self._lock:
+            return self._states.get(user_id)
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            states = list(self._states.values())
+        counts = {state: 0 for state in USER_STATES}
+        for state in states:
+            counts[state] += 1
+        counts["total"] = len(states)
+        return counts
+
+    def request_cancel(self) -> None:
+        self.cancel_requested = True
+        self._wake.set()
+
+    async def pause(self, seconds: float) -> None:
+        """유저 사이 간격만큼 쉬되, 취소되면 바로 깨어난다."""
+        self._wake.clear()
+        if self.cancel_requested:
+            return
+        try:
+            await asyncio.wait_for(self._wake.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    def finish_submitting(self, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.submitting = False
+            if self.cancel_requested:
+                for user_id, state in self._states.items():
+                    if state == PENDING:
+                        self._states[user_id] = CANCELLED
+            if error:
+                self.error = error
+        self._maybe_finish()
+
+    def _maybe_finish(self) -> None:
+        with self._lock:
+            if self.state != SWEEP_RUNNING or self.submitting:
+                return
+            if any(state in OPEN_USER_STATES for state in self._states.values()):
+                return
+            if self.error:
+                self.state = SWEEP_FAILED
+            elif self.cancel_requested:
+                self.state = SWEEP_CANCELLED
+            else:
+                self.state = SWEEP_COMPLETED
+            self.finished_at = time.time()
+            state = self.state
+        sweep_duration.observe(self.finished_at - self.created_at, state=state)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sweepId": self.sweep_id,
+            "reasons": list(self.reasons),
+            "state": self.state,
+            "submitting": self.submitting,
+            "cancelRequested": self.cancel_requested,
+            "createdAt": self.created_at,
+            "finishedAt": self.finished_at,
+            "error": self.error,
+            "progress": self.counts(),
+        }
+
+
+class SweepManager:
+    """진행 중인 sweep은 하나만 두고, 겹치는 요청은 그 sweep에 합칩니다."""
+
+    def __init__(self, max_history: int = 20):
+        self.max_history = max(1, max_history)
+        self._sweeps: "OrderedDict[str, Sweep]" = OrderedDict()
+        self._active: Optional[Sweep] = None
+
+    @property
+    def active(self) -> Optional[Sweep]:
+        # 유저 목록을 아직 넣고 있는 sweep만 합칠 수 있다.
+        if self._active and self._active.submitting and not self._active.cancel_requested:
+            return self._active
+        return None
+
+    def begin(self, reason: str) -> Tuple[Sweep, bool]:
+        active = self.active
+        if active is not None:
+            active.reasons.append(reason)
+            sweeps_merged.inc()
+            return active, True
+
+        sweep = Sweep(secrets.token_hex(8), reason)
+        self._sweeps[sweep.sweep_id] = sweep
+        self._active = sweep
+        sweeps_started.inc(reason=reason)
+        while len(self._sweeps) > self.max_history:
+            oldest = next(iter(self._sweeps.values()))
+            if oldest.state == SWEEP_RUNNING:
+                break
+            self._sweeps.popitem(last=False)
+        return sweep, False
+
+    def get(self, sweep_id: str) -> Optional[Sweep]:
+        return self._sweeps.get(sweep_id)
+
+    def list(self) -> List[Sweep]:
+        return list(reversed(self._sweeps.values()))
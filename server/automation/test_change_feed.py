@@ -0,0 +1,115 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import unittest
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from automation.change_feed import ChangeFeed
+
+
+def parse(chunk):
+    fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines() if not line.startswith(":"))
+    return fields.get("id"), json.loads(fields["data"]) if "data" in fields else None
+
+
+async def collect(stream, count):
+    events = []
+    async for chunk in stream:
+        event_id, data = parse(chunk)
+        if data is not None:
+            events.append((event_id, data))
+        if len(events) >= count:
+            break
+    await stream.aclose()
+    return events
+
+
+class ChangeFeedTests(unittest.TestCase):
+    def test_events_from_worker_threads_reach_subscribers(self):
+        feed = ChangeFeed()
+
+        async def scenario():
+            stream = feed.stream(heartbeat_sec=0.05)
+            task = asyncio.create_task(collect(stream, 3))
+            await asyncio.sleep(0.01)
+            worker = threading.Thread(
+                target=lambda: (
+                    feed.publish("user_status", userId="a", status="active"),
+                    feed.publish("user_status", userId="a", status="active"),
+                    feed.publish("lecture_learned", userNum=1, lectureId="L1"),
+                )
+            )
+            worker.start()
+            worker.join()
+            return await asyncio.wait_for(task, 1)
+
+        events = asyncio.run(scenario())
+        self.assertEqual([data["type"] for _, data in events], ["ready", "user_status", "lecture_learned"])
+        self.assertEqual(events[2][0], f"{feed.epoch}:2")
+
+    def test_reconnect_replays_missed_events_or_resets(self):
+        feed = ChangeFeed(max_events=2)
+        for status in ("active", "error", "completed"):
+            feed.publish("user_status", userId="a", status=status)
+
+        async def scenario(last_event_id, count):
+            return await collect(feed.stream(last_event_id, heartbeat_sec=0.05), count)
+
+        replayed = asyncio.run(scenario(f"{feed.epoch}:2", 2))
+        self.assertEqual(replayed[1][1]["status"], "completed")
+        # 버퍼에서 밀려난 지점이나 다른 프로세스의 id면 목록을 다시 읽게 한다.
+        self.assertEqual(asyncio.run(scenario(f"{feed.epoch}:0", 2))[1][1]["type"], "reset")
+        self.assertEqual(asyncio.run(scenario("old:3", 2))[1][1]["type"], "reset")
+
+    def test_slow_subscriber_gets_reset_instead_of_unbounded_queue(self):
+        feed = ChangeFeed(max_pending=2)
+
+        async def scenario():
+            subscriber, _ = feed.subscribe()
+            for index in range(5):
+                feed.publish("lecture_learned", userNum=1, lectureId=f"L{index}")
+            await asyncio.sleep(0)
+            items = [subscriber.queue.get_nowait() for _ in range(subscriber.queue.qsize())]
+            feed.unsubscribe(subscriber)
+            return items
+
+        self.assertEqual([item["type"] for item in asyncio.run(scenario())], ["reset"])
+
+    def test_stream_ends_after_max_duration(self):
+        feed = ChangeFeed()
+
+        async def scenario():
+            chunks = [chunk async for chunk in feed.stream(heartbeat_sec=0.01, max_duration_sec=0.05)]
+            return chunks
+
+        chunks = asyncio.run(asyncio.wait_for(scenario(), 1))
+        self.assertTrue(any(chunk.startswith(": keep-alive") for chunk in chunks))
+
+
+class ChangeRelayEndpointTests(unittest.TestCase):
+    def test_backend_writes_are_published_with_allowed_fields_only(self):
+        from fastapi.testclient import TestClient
+
+        from automation import main as automation_main
+
+        client = TestClient(automation_main.app)
+        headers = {"X-Internal-Token": automation_main.INTERNAL_API_TOKEN}
+        event = {"type": "user_deleted", "fields": {"userNum": 7, "seq": 0, "type": "user_added"}}
+        self.assertEqual(client.post("/changes", json=event).status_code, 403)
+        self.assertEqual(client.post("/changes", json={"type": "lane", "fields": {}}, headers=headers).status_code, 400)
+
+        before = automation_main.change_feed.seq
+        self.assertEqual(client.post("/changes", json=event, headers=headers).status_code, 200)
+        published = automation_main.change_feed._events[-1]
+        self.assertEqual(published["seq"], before + 1)
+        self.assertEqual(published["type"], "user_deleted")
+        self.assertEqual(published["userNum"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from automation.lanes import LaneFullError, WorkLane, lane_queue_wait
+
+
+class WorkLaneTests(unittest.TestCase):
+    def test_full_queue_rejects_and_wait_is_recorded(self):
+        lane = WorkLane("test-full", max_workers=1, queue_limit=1, latency_target_sec=0.001)
+        release = threading.Event()
+        try:
+            self.assertTrue(lane.has_idle_worker())
+            first = lane.submit(release.wait, 5)
+            self.assertFalse(lane.has_idle_worker())
+            second = lane.submit(lambda: "queued")
+            with self.assertRaises(LaneFullError):
+                lane.submit(lambda: "rejected")
+            self.assertEqual(lane.stats()["queued"], 1)
+            time.sleep(0.05)
+            release.set()
+            self.assertTrue(first.result(timeout=5))
+            self.assertEqual(second.result(timeout=5), "queued")
+        finally:
+            release.set()
+            lane.shutdown(wait=True)
+
+        stats = lane.stats()
+        self.assertEqual(stats["rejected"], 1)
+        self.assertEqual(stats["queued"], 0)
+        self.assertEqual(stats["running"], 0)
+        self.assertEqual(lane_queue_wait.count(lane="test-full"), 2)
+        self.assertGreaterEqual(stats["latency_target_missed"], 1)
+
+    def test_on_change_reports_queue_transitions(self):
+        changes = []
+        lane = WorkLane("test-notify", max_workers=1, queue_limit=10, latency_target_sec=60, on_change=lambda *args: changes.append(args))
+        try:
+            lane.submit(lambda: None).result(timeout=5)
+        finally:
+            lane.shutdown(wait=True)
+        self.assertEqual(changes, [("test-notify", 1, 0), ("test-notify", 0, 1), ("test-notify", 0, 0)])
+
+    def test_busy_lane_does_not_delay_other_lane(self):
+        batch = WorkLane("test-batch", max_workers=1, queue_limit=10, latency_target_sec=60)
+        interactive = WorkLane("test-interactive", max_workers=1, queue_limit=10, latency_target_sec=1)
+        release = threading.Event()
+        try:
+            batch.submit(release.wait, 5)
+            batch.submit(release.wait, 5)
+            self.assertEqual(interactive.submit(lambda: "verified").result(timeout=1), "verified")
+        finally:
+            release.set()
+            batch.shutdown(wait=True)
+            interactive.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
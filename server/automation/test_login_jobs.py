@@ -0,0 +1,85 @@
+import asyncio
+import os
+import sys
+import unittest
+from concurrent.futures import Future
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+os.environ.setdefault("INTERNAL_API_TOKEN", "test-token")
+
+from automation import login_jobs
+from automation import main as automation_main
+
+
+def _resolved(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class LoginJobStoreTests(unittest.TestCase):
+    def test_wait_returns_on_update_or_timeout(self):
+        async def scenario():
+            store = login_jobs.LoginJobStore(ttl_sec=60)
+            job = store.create("student")
+
+            timed_out = await store.wait(job.job_id, job.version, timeout=0.01)
+            self.assertEqual(timed_out.state, login_jobs.VERIFYING)
+
+            waiter = asyncio.create_task(store.wait(job.job_id, job.version, timeout=5))
+            await asyncio.sleep(0)
+            store.update(job, login_jobs.FAILED, "bad password")
+            woken = await asyncio.wait_for(waiter, 1)
+            self.assertTrue(woken.done)
+            self.assertEqual(woken.to_dict()["message"], "bad password")
+            self.assertIsNone(await store.wait("missing-job-id-000", -1, timeout=0))
+
+        asyncio.run(scenario())
+
+    def test_expired_jobs_are_dropped(self):
+        async def scenario():
+            store = login_jobs.LoginJobStore(ttl_sec=60, max_jobs=2)
+            first = store.create("a")
+            store.create("b")
+            store.create("c")
+            self.assertIsNone(store.get(first.job_id))
+            self.assertEqual(len(store), 2)
+
+        asyncio.run(scenario())
+
+
+class CompleteLoginJobTests(unittest.TestCase):
+    def setUp(self):
+        self.registered = []
+        self.orig_register = automation_main.register_verified_user
+        automation_main.register_verified_user = lambda user_id, password: self.registered.append((user_id, password)) or "scheduled"
+
+    def tearDown(self):
+        automation_main.register_verified_user = self.orig_register
+
+    def _run(self, verification):
+        async def scenario():
+            job = automation_main.login_job_store.create("student")
+            await automation_main.complete_login_job(job, verification, "pw")
+            return job
+
+        return asyncio.run(scenario())
+
+    def test_success_registers_user_and_schedules_automation(self):
+        job = self._run(_resolved({"success": True, "message": "ok"}))
+        self.assertEqual(job.state, login_jobs.SUCCEEDED)
+        self.assertEqual(job.automation, "scheduled")
+        self.assertEqual(self.registered, [("student", "pw")])
+
+    def test_rejected_credentials_do_not_register(self):
+        job = self._run(_resolved({"success": False, "message": "아이디 또는 비밀번호가 올바르지 않습니다."}))
+        self.assertEqual(job.state, login_jobs.FAILED)
+        self.assertEqual(job.message, "아이디 또는 비밀번호가 올바르지 않습니다.")
+        self.assertEqual(self.registered, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+os.environ.setdefault("INTERNAL_API_TOKEN", "test-token")
+
+from fastapi.testclient import TestClient
+
+from utils.metrics import CONTENT_TYPE
+
+
+class MetricsEndpointTests(unittest.TestCase):
+    def test_metrics_requires_internal_token(self):
+        from automation import main as automation_main
+
+        client = TestClient(automation_main.app)
+        self.assertEqual(client.get("/metrics").status_code, 403)
+
+        response = client.get("/metrics", headers={"X-Internal-Token": automation_main.INTERNAL_API_TOKEN})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], CONTENT_TYPE)
+        self.assertIn("hanyang_automation_running_users 0.0", response.text)
+        self.assertIn('hanyang_automation_in_flight{kind="browsers"} 0.0', response.text)
+        self.assertIn('hanyang_lane_workers{lane="automation"}', response.text)
+
+
+class RunVerboseTests(unittest.TestCase):
+    def test_override_is_dropped_when_the_run_finishes(self):
+        from automation import main as automation_main
+        from automation import playwright_automation
+
+        client = TestClient(automation_main.app)
+        response = client.post(
+            "/runs/run-verbose-test/verbose",
+            json={"enabled": True},
+            headers={"X-Internal-Token": automation_main.INTERNAL_API_TOKEN},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(playwright_automation.is_playback_verbose("run-verbose-test"))
+
+        with mock.patch.object(automation_main.HanyangLogger, "new_run_id", return_value="run-verbose-test"), \
+                mock.patch.object(automation_main, "decrypt_password", side_effect=ValueError("bad key")), \
+                mock.patch.object(automation_main, "update_user_status"), \
+                mock.patch.object(automation_main, "_record_run"):
+            result = automation_main.automation_task_wrapper("verbose-user", "enc", 1, [])
+        self.assertEqual(result["msg"], "password_decryption_failed")
+        self.assertFalse(playwright_automation.is_playback_verbose("run-verbose-test"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -45,17 +45,26 @@ database_module.update_user_status = lambda *args, **kwargs: None
 security_module.mask_sensitive_text = lambda value: value
 security_module.mask_sensitive_url = lambda value: value
 
+# 모듈을 읽는 동안만 stub을 끼우고 되돌린다. 뒤에 수집되는 테스트는 실제 utils를 써야 한다.
+STUBBED_MODULES = {"utils": utils_pkg, "utils.logger": logger_module, "utils.database": database_module, "utils.security": security_module}
+ORIGINAL_MODULES = {name: sys.modules.get(name) for name in STUBBED_MODULES}
 sys.modules.setdefault("utils", utils_pkg)
-sys.modules["utils.logger"] = logger_module
-sys.modules["utils.database"] = database_module
-sys.modules["utils.security"] = security_module
+for name in ("utils.logger", "utils.database", "utils.security"):
+    sys.modules[name] = STUBBED_MODULES[name]
 
 MODULE_PATH = os.path.join(os.path.dirname(__file__), "playwright_automation.py")
 SPEC = importlib.util.spec_from_file_location("testable_playwright_automation", MODULE_PATH)
 MODULE = importlib.util.module_from_spec(SPEC)
 assert SPEC and SPEC.loader
 sys.modules[SPEC.name] = MODULE
-SPEC.loader.exec_module(MODULE)
+try:
+    SPEC.loader.exec_module(MODULE)
+finally:
+    for name, original in ORIGINAL_MODULES.items():
+        if original is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = original
 
 LectureItem = MODULE.LectureItem
 _classify_playback_transition = MODULE._classify_playback_transition
@@ -67,6 +76,8 @@ _dump_failure_artifacts = MODULE._dump_failure_artifacts
 _run_pending_lectures = MODULE._run_pending_lectures
 _resolve_expected_duration_seconds = MODULE._resolve_expected_duration_seconds
 _snapshot_from_direct_media = MODULE._snapshot_from_direct_media
+_adopt_lms_session = MODULE._adopt_lms_session
+PlaybackEventSampler = MODULE.PlaybackEventSampler
 
 
 def make_snapshot(
@@ -270,6 +281,7 @@ class RetryQueueTests(unittest.TestCase):
         MODULE._collect_failure_context = self.orig_collect_failure_context
         MODULE._mark_processed = self.orig_mark_processed
         MODULE.update_user_status = self.orig_update_user_status
+        MODULE.set_instrumentation()
 
     def test_failed_lecture_is_requeued_once_then_succeeds(self):
         lecture_a = LectureItem("1", "m", "a", "A", "https://a", "https://a", None)
@@ -283,7 +295,7 @@ class RetryQueueTests(unittest.TestCase):
         statuses = []
         contexts = []
 
-        def fake_play(page, lecture, logger):
+        def fake_play(page, lecture, logger, on_progress=None):
             calls.append(lecture.key)
             return sequence[lecture.key].pop(0)
 
@@ -291,6 +303,12 @@ class RetryQueueTests(unittest.TestCase):
         MODULE._collect_failure_context = lambda *args, **kwargs: contexts.append(args[1].key)
         MODULE._mark_processed = lambda lecture, *args, **kwargs: processed.append(lecture.key)
         MODULE.update_user_status = lambda user_id, status: statuses.append(status)
+        phases = []
+        in_flight = []
+        MODULE.set_instrumentation(
+            on_phase=lambda phase, seconds, outcome: phases.append((phase, outcome)),
+            on_in_flight=lambda kind, delta: in_flight.append((kind, delta)),
+        )
 
         result = _run_pending_lectures(FakePage(), [lecture_a, lecture_b], DummyLogger(), "user", [], set(), lambda *_: None, time.time())
 
@@ -299,6 +317,8 @@ class RetryQueueTests(unittest.TestCase):
         self.assertEqual(contexts, ["https://a"])
         self.assertEqual(processed, ["https://b", "https://a"])
         self.assertEqual(statuses[-1], "completed")
+        self.assertEqual(phases, [("lecture", "failed"), ("lecture", "completed"), ("lecture", "completed")])
+        self.assertEqual(in_flight, [("lectures", 1), ("lectures", -1)] * 3)
 
     def test_second_failure_stops_automation(self):
         lecture_a = LectureItem("1", "m", "a", "A", "https://a", "https://a", None)
@@ -311,7 +331,7 @@ class RetryQueueTests(unittest.TestCase):
         statuses = []
         contexts = []
 
-        def fake_play(page, lecture, logger):
+        def fake_play(page, lecture, logger, on_progress=None):
             calls.append(lecture.key)
             return sequence[lecture.key].pop(0)
 
@@ -320,12 +340,54 @@ class RetryQueueTests(unittest.TestCase):
         MODULE._mark_processed = lambda *args, **kwargs: None
         MODULE.update_user_status = lambda user_id, status: statuses.append(status)
 
-        result = _run_pending_lectures(FakePage(), [lecture_a, lecture_b], DummyLogger(), "user", [], set(), lambda *_: None, time.time())
+        attempts = []
+        result = _run_pending_lectures(
+            FakePage(),
+            [lecture_a, lecture_b],
+            DummyLogger(),
+            "user",
+            [],
+            set(),
+            lambda *_: None,
+            time.time(),
+            lambda lecture, attempt, outcome, elapsed: attempts.append((lecture.key, attempt, outcome)),
+        )
 
         self.assertFalse(result["success"])
+        self.assertEqual(result["outcome"], "lecture_failed")
         self.assertEqual(calls, ["https://a", "https://b", "https://a"])
         self.assertEqual(contexts, ["https://a", "https://a"])
         self.assertEqual(statuses[-1], "error")
+        self.assertEqual(attempts, [("https://a", 1, "failed"), ("https://b", 1, "completed"), ("https://a", 2, "failed")])
+
+
+class SessionPage:
+    def __init__(self, api_status):
+        self.url = "about:blank"
+        self.api_status = api_status
+        self.cookies_cleared = False
+        self.context = self
+
+    def goto(self, url, **kwargs):
+        self.url = url if self.api_status < 400 else "https://api.hanyang.ac.kr/oauth/login?redirect=lms"
+
+    def evaluate(self, script, url):
+        return {"status": self.api_status, "text": "{}"}
+
+    def clear_cookies(self):
+        self.cookies_cleared = True
+
+
+class SessionHandoffTests(unittest.TestCase):
+    def test_valid_handed_off_session_skips_login(self):
+        page = SessionPage(200)
+        self.assertTrue(_adopt_lms_session(page, DummyLogger(), timeout_sec=1))
+        self.assertFalse(page.cookies_cleared)
+
+    def test_rejected_session_clears_cookies_for_full_login(self):
+        page = SessionPage(401)
+        self.assertFalse(_adopt_lms_session(page, DummyLogger(), timeout_sec=0.1))
+        self.assertTrue(page.cookies_cleared)
 
 
 class FailureDumpTests(unittest.TestCase):
@@ -348,5 +410,77 @@ class FailureDumpTests(unittest.TestCase):
             self.assertIn("failure_dumps", written["metadata_path"])
 
 
+
+class RecordingLogger(DummyLogger):
+    def __init__(self, run_id="run-1"):
+        self.default_fields = {"run_id": run_id}
+        self.events = []
+
+    def event(self, subject, event, message="", level="INFO", **fields):
+        self.events.append((event, fields))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class PlaybackSamplingTests(unittest.TestCase):
+    def make_sampler(self, logger, **kwargs):
+        clock = FakeClock()
+        intervals = {"playback_progressing": 30, "playback_stalled": 30, "playback_snapshot_before": 30}
+        return PlaybackEventSampler(logger, None, window_sec=60, min_interval_sec=intervals, clock=clock, **kwargs), clock
+
+    def test_repeated_ticks_are_sampled_and_summarized(self):
+        logger = RecordingLogger()
+        sampler, clock = self.make_sampler(logger)
+        for tick in range(12):
+            clock.now += 5
+            second = 100 + tick * 5 if tick < 8 else 135
+            event = "playback_progressing" if tick < 8 else "playback_stalled"
+            sampler.observe(event, event, second=second, media=[{"paused": False}])
+
+        names = [name for name, _ in logger.events]
+        # 진행 틱 8개 중 처음과 30초 뒤 한 번, 멈춤으로 바뀐 틱 한 번, 60초 창 요약 한 번
+        self.assertEqual(names, ["playback_progressing", "playback_progressing", "playback_stalled", "playback_summary"])
+        self.assertNotIn("media", logger.events[1][1])
+        self.assertIn("media", logger.events[2][1])
+        summary = logger.events[-1][1]
+        self.assertEqual((summary["ticks"], summary["min_second"], summary["max_second"]), (12, 100, 135))
+        self.assertEqual((summary["stalls"], summary["suppressed"]), (1, 9))
+        self.assertEqual(summary["rate"], round(35 / 60, 2))
+
+    def test_verbose_run_logs_every_tick(self):
+        MODULE.set_playback_verbose("run-debug")
+        self.addCleanup(MODULE.set_playback_verbose, "run-debug", False)
+        logger = RecordingLogger("run-debug")
+        sampler, clock = self.make_sampler(logger)
+        for tick in range(5):
+            clock.now += 1
+            sampler.observe("playback_progressing", "progressing", second=float(tick), media=[])
+        sampler.flush()
+
+        self.assertEqual([name for name, _ in logger.events].count("playback_progressing"), 5)
+        self.assertTrue(all("media" in fields for name, fields in logger.events if name == "playback_progressing"))
+        self.assertFalse(PlaybackEventSampler(RecordingLogger("other"), None).verbose)
+
+    def test_verbose_override_applies_to_the_running_sampler(self):
+        logger = RecordingLogger("run-live")
+        sampler, clock = self.make_sampler(logger)
+        self.addCleanup(MODULE.set_playback_verbose, "run-live", False)
+        for tick in range(6):
+            if tick == 3:
+                # 재생 중에 켜면 다음 틱부터 모두 남는다.
+                MODULE.set_playback_verbose("run-live")
+            clock.now += 1
+            sampler.observe("playback_progressing", "progressing", second=float(tick), media=[])
+
+        ticks = [fields["second"] for name, fields in logger.events if name == "playback_progressing"]
+        self.assertEqual(ticks, [0.0, 3.0, 4.0, 5.0])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from automation.progress import ProgressTracker
+
+
+def progress(media_second, heartbeat_at):
+    return {"media_second": media_second, "duration_sec": 600.0, "percent": None, "heartbeat_at": heartbeat_at}
+
+
+class ProgressTrackerTests(unittest.TestCase):
+    def setUp(self):
+        self.writes = []
+        self.deletes = []
+        self.flushed = []
+        self.tracker = ProgressTracker(
+            self.writes.append,
+            self.deletes.append,
+            on_flush=lambda updates, cleared: self.flushed.append((updates, cleared)),
+        )
+
+    def test_updates_coalesce_to_latest_row_per_user(self):
+        for second in (10.0, 20.0, 30.0):
+            self.tracker.update("u1", "run-1", "course-a", "lecture-1", "A1", progress(second, 1000 + second))
+        self.tracker.update("u2", "run-2", "course-b", "lecture-2", "B1", progress(5.0, 1000))
+
+        self.assertEqual(self.tracker.flush(), 2)
+        self.assertEqual(len(self.writes), 1)
+        rows = {row[0]: row for row in self.writes[0]}
+        self.assertEqual(rows["u1"][5], 30.0)
+        self.assertEqual(self.tracker.get("u1")["heartbeatAt"], 1030.0)
+        # 바뀐 게 없으면 쓰지 않는다.
+        self.assertEqual(self.tracker.flush(), 0)
+        self.assertEqual(len(self.writes), 1)
+
+    def test_clear_deletes_row_and_reports_it(self):
+        self.tracker.update("u1", "run-1", "course-a", "lecture-1", "A1", progress(10.0, 1000))
+        self.tracker.flush()
+        self.tracker.clear("u1")
+        self.tracker.flush()
+
+        self.assertEqual(self.deletes, [["u1"]])
+        self.assertEqual(self.flushed[-1], ([], ["u1"]))
+        self.assertEqual(self.tracker.snapshot(), [])
+
+    def test_failed_write_is_retried_on_next_flush(self):
+        def failing_write(rows):
+            raise RuntimeError("db locked")
+
+        tracker = ProgressTracker(failing_write, self.deletes.append)
+        tracker.update("u1", "run-1", "course-a", "lecture-1", "A1", progress(10.0, 1000))
+        with self.assertRaises(RuntimeError):
+            tracker.flush()
+
+        tracker._write = self.writes.append
+        self.assertEqual(tracker.flush(), 1)
+        self.assertEqual(self.writes[0][0][0], "u1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from automation.session_leases import SessionLeaseStore, session_handoffs
+
+
+class SessionLeaseStoreTests(unittest.TestCase):
+    def test_lease_is_taken_once(self):
+        store = SessionLeaseStore(ttl_sec=60)
+        taken_before = session_handoffs.value(outcome="taken")
+        store.put("Student", {"cookies": [{"name": "session"}]})
+
+        self.assertEqual(store.take("student"), {"cookies": [{"name": "session"}]})
+        self.assertIsNone(store.take("student"))
+        self.assertEqual(session_handoffs.value(outcome="taken") - taken_before, 1)
+
+    def test_expired_lease_is_not_handed_out(self):
+        store = SessionLeaseStore(ttl_sec=0.01)
+        store.put("student", {"cookies": []})
+        time.sleep(0.02)
+        self.assertIsNone(store.take("student"))
+        self.assertEqual(len(store), 0)
+
+    def test_take_waits_for_pending_capture(self):
+        store = SessionLeaseStore(ttl_sec=60)
+        store.expect("student")
+        threading.Timer(0.05, store.put, ("student", {"cookies": []})).start()
+        self.assertEqual(store.take("student", wait_sec=2), {"cookies": []})
+
+        # 잡기가 실패로 끝나면 기다리지 않고 바로 돌아온다.
+        store.expect("student")
+        store.release("student")
+        started = time.monotonic()
+        self.assertIsNone(store.take("student", wait_sec=2))
+        self.assertLess(time.monotonic() - started, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import asyncio
+import os
+import sys
+import unittest
+from datetime import datetime
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+os.environ.setdefault("INTERNAL_API_TOKEN", "test-token")
+
+from automation import main as automation_main
+from automation import sweeps
+
+
+def rows(*user_ids):
+    return [(index + 1, user_id, "enc") for index, user_id in enumerate(user_ids)]
+
+
+class SweepManagerTests(unittest.TestCase):
+    def test_overlapping_requests_merge_while_submitting(self):
+        async def scenario():
+            manager = sweeps.SweepManager()
+            first, merged = manager.begin("daily")
+            self.assertFalse(merged)
+            first.add_users(rows("a", "b"))
+
+            second, merged = manager.begin("admin")
+            self.assertTrue(merged)
+            self.assertIs(second, first)
+            self.assertEqual(second.add_users(rows("b", "c")), 1)
+            self.assertEqual(first.reasons, ["daily", "admin"])
+
+            first.finish_submitting()
+            third, merged = manager.begin("admin")
+            self.assertFalse(merged)
+            self.assertIsNot(third, first)
+
+        asyncio.run(scenario())
+
+
+class RunSweepTests(unittest.TestCase):
+    def setUp(self):
+        self.orig_schedule = automation_main.schedule_user_from_db
+        self.orig_delay = automation_main.AUTOMATION_SCHEDULE_DELAY_SEC
+        self.outcomes = {"a": {"success": True}, "b": {"success": False}, "c": {"success": False, "skipped": True}}
+
+        def fake_schedule(user_row, sweep=None):
+            user_id = user_row[1]
+            sweep.set_user_state(user_id, sweeps.RUNNING)
+            outcome = self.outcomes[user_id]
+            state = sweeps.SKIPPED if outcome.get("skipped") else sweeps.DONE if outcome["success"] else sweeps.FAILED
+            sweep.set_user_state(user_id, state)
+
+        automation_main.schedule_user_from_db = fake_schedule
+
+    def tearDown(self):
+        automation_main.schedule_user_from_db = self.orig_schedule
+        automation_main.AUTOMATION_SCHEDULE_DELAY_SEC = self.orig_delay
+
+    def test_sweep_counts_outcomes_and_completes(self):
+        automation_main.AUTOMATION_SCHEDULE_DELAY_SEC = 0
+
+        async def scenario():
+            sweep = sweeps.Sweep("s1", "admin")
+            sweep.add_users(rows("a", "b", "c"))
+            await automation_main.run_sweep(sweep)
+            return sweep
+
+        sweep = asyncio.run(scenario())
+        progress = sweep.to_dict()["progress"]
+        self.assertEqual(sweep.state, sweeps.SWEEP_COMPLETED)
+        self.assertEqual((progress["done"], progress["failed"], progress["skipped"], progress["total"]), (1, 1, 1, 3))
+
+    def test_cancel_stops_pacing_and_marks_remaining(self):
+        automation_main.AUTOMATION_SCHEDULE_DELAY_SEC = 30
+
+        async def scenario():
+            sweep = sweeps.Sweep("s2", "admin")
+            sweep.add_users(rows("a", "b", "c"))
+            task = asyncio.create_task(automation_main.run_sweep(sweep))
+            await asyncio.sleep(0.01)
+            sweep.request_cancel()
+            await asyncio.wait_for(task, 1)
+            return sweep
+
+        sweep = asyncio.run(scenario())
+        progress = sweep.counts()
+        self.assertEqual(sweep.state, sweeps.SWEEP_CANCELLED)
+        self.assertEqual((progress["done"], progress["cancelled"]), (1, 2))
+
+    def test_queued_task_of_cancelled_sweep_does_not_run(self):
+        sweep = sweeps.Sweep("s3", "admin")
+        sweep.add_users(rows("a"))
+        sweep.request_cancel()
+        automation_main.sweep_task_wrapper(sweep, "a", "enc", 1, [])
+        self.assertEqual(sweep.user_state("a"), sweeps.CANCELLED)
+
+
+class RerunTests(unittest.TestCase):
+    def setUp(self):
+        self.orig_schedule = automation_main.schedule_user_from_db
+        self.scheduled = []
+
+        def fake_schedule(user_row, sweep=None, learned=None):
+            if user_row[1] == "full":
+                raise automation_main.LaneFullError("automation", 1)
+            self.scheduled.append((user_row[1], learned))
+
+        automation_main.schedule_user_from_db = fake_schedule
+        automation_main.running_users.add("busy")
+
+    def tearDown(self):
+        automation_main.schedule_user_from_db = self.orig_schedule
+        automation_main.running_users.discard("busy")
+
+    def test_results_per_user(self):
+        results = automation_main.rerun_users(
+            rows("a", "busy", "full"),
+            {1: ["lecture-1"]},
+            requested_nums=[1, 2, 3, 9, 9],
+        )
+        self.assertEqual(
+            [(item["userNum"], item["result"]) for item in results],
+            [(1, "queued"), (2, "already_running"), (3, "queue_full"), (9, "not_found")],
+        )
+        self.assertEqual(self.scheduled, [("a", ["lecture-1"])])
+
+    def test_naive_created_since_is_kst(self):
+        converted = automation_main._as_utc_naive(datetime(2026, 10, 1))
+        self.assertEqual(converted, datetime(2026, 9, 30, 15, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import os
+import sys
+import threading
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest import mock
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from automation import verification
+from automation.verification import VerificationCoordinator
+
+
+class VerificationCoordinatorTests(unittest.TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.release = threading.Event()
+        self.calls = []
+
+    def tearDown(self):
+        self.release.set()
+        self.executor.shutdown(wait=True)
+
+    def start(self, result):
+        def run():
+            self.calls.append(result)
+            self.release.wait(5)
+            return result
+
+        return lambda: self.executor.submit(run)
+
+    def test_concurrent_attempts_for_same_account_share_one_flight(self):
+        coordinator = VerificationCoordinator(ttl_sec=60)
+        coalesced_before = verification.verify_coalesced.value()
+
+        first = coordinator.submit("Student", "pw", self.start({"success": True}))
+        second = coordinator.submit("student", "pw", self.start({"success": True}))
+        self.assertIs(first, second)
+
+        self.release.set()
+        self.assertEqual(first.result(5), {"success": True})
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(verification.verify_coalesced.value() - coalesced_before, 1)
+
+    def test_success_is_cached_by_credential_hash_only(self):
+        coordinator = VerificationCoordinator(ttl_sec=60)
+        hits_before = verification.verify_cache_hits.value()
+        self.release.set()
+        coordinator.submit("student", "pw", self.start({"success": True, "message": "ok"})).result(5)
+
+        cached = coordinator.submit("student", "pw", self.start({"success": False}))
+        self.assertEqual(cached.result(0), {"success": True, "message": "ok"})
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(verification.verify_cache_hits.value() - hits_before, 1)
+
+        # 다른 비밀번호는 캐시를 타지 않고, 평문은 어디에도 남지 않는다.
+        coordinator.submit("student", "other", self.start({"success": False})).result(5)
+        self.assertEqual(len(self.calls), 2)
+        self.assertNotIn("pw", repr(coordinator._cache))
+
+    def test_failures_are_not_cached(self):
+        coordinator = VerificationCoordinator(ttl_sec=60)
+        self.release.set()
+        coordinator.submit("student", "bad", self.start({"success": False})).result(5)
+        coordinator.submit("student", "bad", self.start({"success": False})).result(5)
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(coordinator.stats()["inflight"], 0)
+
+    def test_expired_entries_miss(self):
+        coordinator = VerificationCoordinator(ttl_sec=0.01)
+        self.release.set()
+        coordinator.submit("student", "pw", self.start({"success": True})).result(5)
+        threading.Event().wait(0.02)
+        coordinator.submit("student", "pw", self.start({"success": True})).result(5)
+        self.assertEqual(len(self.calls), 2)
+
+
+class SubmitVerificationTests(unittest.TestCase):
+    def test_result_is_returned_before_session_capture(self):
+        from automation import main as automation_main
+
+        captured = threading.Event()
+        release_capture = threading.Event()
+
+        def fake_verify(user_id, pwd, on_session=None, on_result=None):
+            result = {"success": True, "message": "ok"}
+            on_result(result)
+            release_capture.wait(5)
+            on_session({"cookies": [{"name": "session"}]})
+            captured.set()
+            return result
+
+        with mock.patch.object(automation_main, "verify_user_login", fake_verify):
+            future = automation_main.submit_verification("handoff-user", "pw-1")
+            try:
+                self.assertEqual(future.result(timeout=2), {"success": True, "message": "ok"})
+                self.assertFalse(captured.is_set())
+                # 자동 수강이 먼저 시작해도 잡는 중인 세션을 기다렸다가 넘겨받는다.
+                taker = ThreadPoolExecutor(max_workers=1)
+                lease = taker.submit(automation_main.session_leases.take, "handoff-user", 5)
+                release_capture.set()
+                self.assertEqual(lease.result(timeout=5), {"cookies": [{"name": "session"}]})
+                taker.shutdown()
+            finally:
+                release_capture.set()
+
+    def test_busy_automation_lane_skips_session_capture(self):
+        from automation import main as automation_main
+
+        calls = []
+
+        def fake_verify(user_id, pwd, on_session=None, on_result=None):
+            calls.append(on_session)
+            return {"success": True, "message": "ok"}
+
+        with mock.patch.object(automation_main, "verify_user_login", fake_verify), mock.patch.object(
+            automation_main.automation_lane, "has_idle_worker", return_value=False
+        ):
+            self.assertTrue(automation_main.submit_verification("busy-lane-user", "pw-1").result(timeout=2)["success"])
+        self.assertEqual(calls, [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
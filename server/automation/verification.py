@@ -0,0 +1,94 @@
+import hashlib
+import hmac
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils import metrics
+
+
+verify_cache_hits = metrics.counter("hanyang_verify_cache_hits_total", "Login verifications answered from the success cache")
+verify_coalesced = metrics.counter("hanyang_verify_coalesced_total", "Login verifications that joined an in-flight attempt")
+verify_attempts = metrics.counter("hanyang_verify_attempts_total", "Login verifications that started a browser attempt")
+
+
+class VerificationCoordinator:
+    """같은 계정의 로그인 확인을 하나로 합치고, 성공 결과를 잠깐 기억합니다.
+
+    캐시 키는 프로세스마다 새로 만든 salt로 계산한 HMAC이라 평문 비밀번호는 남지 않는다.
+    진행 중인 확인은 계정별로 하나만 두고, 같은 비밀번호로 들어온 요청만 그 결과를 함께 받는다.
+    """
+
+    def __init__(self, ttl_sec: float = 60, max_entries: int = 10000):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max(1, max_entries)
+        self._salt = os.urandom(32)
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._inflight: Dict[str, Tuple[str, Future]] = {}
+
+    def fingerprint(self, user_id: str, password: str) -> str:
+        message = f"{user_id.lower()}\0{password}".encode("utf-8")
+        return hmac.new(self._salt, message, hashlib.sha256).hexdigest()
+
+    def _cached(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(fingerprint)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._cache.pop(fingerprint, None)
+            return None
+        return dict(entry[1])
+
+    def submit(self, user_id: str, password: str, start: Callable[[], Future]) -> Future:
+        """start()는 실제 확인을 시작해 Future를 돌려줘야 합니다 (예: verify lane submit)."""
+        fingerprint = self.fingerprint(user_id, password)
+        account = user_id.lower()
+        with self._lock:
+            cached = self._cached(fingerprint)
+            if cached is not None:
+                verify_cache_hits.inc()
+                future: Future = Future()
+                future.set_result(cached)
+                return future
+            inflight = self._inflight.get(account)
+            if inflight and inflight[0] == fingerprint:
+                verify_coalesced.inc()
+                return inflight[1]
+            future = start()
+            verify_attempts.inc()
+            self._inflight[account] = (fingerprint, future)
+        # 이미 끝난 Future면 콜백이 바로 불리므로 잠금 밖에서 등록한다.
+        future.add_done_callback(lambda done: self._finish(account, fingerprint, done))
+        return future
+
+    def _finish(self, account: str, fingerprint: str, future: Future) -> None:
+        result = None
+        if not future.cancelled() and future.exception() is None:
+            result = future.result()
+        with self._lock:
+            inflight = self._inflight.get(account)
+            if inflight and inflight[1] is future:
+                self._inflight.pop(account, None)
+            # 실패 결과는 기억하지 않는다. 비밀번호를 고친 재시도는 항상 새로 확인한다.
+            if result and result.get("success") and self.ttl_sec > 0:
+                if len(self._cache) >= self.max_entries:
+                    now = time.monotonic()
+                    for key in [key for key, (expires, _) in self._cache.items() if expires < now]:
+                        self._cache.pop(key, None)
+                    if len(self._cache) >= self.max_entries:
+                        self._cache.pop(next(iter(self._cache)))
+                self._cache[fingerprint] = (time.monotonic() + self.ttl_sec, dict(result))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            cached, inflight = len(self._cache), len(self._inflight)
+        return {
+            "cached": cached,
+            "inflight": inflight,
+            "cache_hits": int(verify_cache_hits.value()),
+            "coalesced": int(verify_coalesced.value()),
+            "attempts": int(verify_attempts.value()),
+        }
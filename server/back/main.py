@@ -1,23 +1,53 @@
+import asyncio
 import base64
+import gzip
+import hmac
+import json
 import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path as FilePath
+from typing import List, Optional
 
 import httpx
-from fastapi import Depends, FastAPI, HTTPException, Path, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Path, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
+import utils.async_database as adb
 import utils.database as db
-from utils.logger import HanyangLogger, LOG_BASE, sanitize_filename
+from utils import log_analytics, log_catalog, log_reader, metrics
+from utils.http_clients import CircuitOpenError, UpstreamClient
+from utils.logger import KST, get_catalog, get_logger
 from utils.security import SlidingWindowRateLimiter, get_client_ip, mask_sensitive_text
 
 
-app = FastAPI()
 db.init_db()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await automation_client.start()
+    forward_change = _change_forwarder(asyncio.get_running_loop())
+    db.add_change_listener(forward_change)
+    warm_analytics = asyncio.create_task(_warm_event_analytics())
+    try:
+        yield
+    finally:
+        warm_analytics.cancel()
+        db.remove_change_listener(forward_change)
+        if _change_forwards:
+            await asyncio.wait(set(_change_forwards), timeout=5)
+        await automation_client.aclose()
+        adb.shutdown_executor(wait=True)
+
+
+app = FastAPI(lifespan=lifespan)
+
 SESSION_KEY_FILE_PATH = os.path.join(os.path.dirname(__file__), "data", "session_key.key")
 SESSION_COOKIE_SECURE = os.getenv("SESSION_COOKIE_SECURE", "true").lower() not in {"0", "false", "no"}
 SESSION_COOKIE_SAMESITE = os.getenv("SESSION_COOKIE_SAMESITE", "lax")
@@ -26,6 +56,18 @@ INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN", "").strip()
 USER_LOGIN_IP_LIMIT = int(os.getenv("USER_LOGIN_IP_LIMIT", "20"))
 USER_LOGIN_ACCOUNT_LIMIT = int(os.getenv("USER_LOGIN_ACCOUNT_LIMIT", "5"))
 USER_LOGIN_WINDOW_SEC = int(os.getenv("USER_LOGIN_WINDOW_SEC", "300"))
+LOGIN_POLL_WAIT_SEC = float(os.getenv("LOGIN_POLL_WAIT_SEC", "20"))
+ANALYTICS_CACHE_TTL_SEC = float(os.getenv("ANALYTICS_CACHE_TTL_SEC", "30"))
+PROGRESS_STALE_SEC = float(os.getenv("PROGRESS_STALE_SEC", "120"))
+# 자동화 서버가 15초마다 keep-alive를 보내므로 그보다 넉넉하게 잡는다.
+CHANGE_STREAM_READ_TIMEOUT_SEC = float(os.getenv("CHANGE_STREAM_READ_TIMEOUT_SEC", "60"))
+LOG_DEFAULT_TAIL_LINES = int(os.getenv("LOG_DEFAULT_TAIL_LINES", "1000"))
+LOG_TAIL_MAX_LINES = int(os.getenv("LOG_TAIL_MAX_LINES", "20000"))
+LOG_RANGE_MAX_BYTES = int(os.getenv("LOG_RANGE_MAX_BYTES", str(1024 * 1024)))
+LOG_GZIP_MIN_BYTES = int(os.getenv("LOG_GZIP_MIN_BYTES", "1024"))
+LOG_FOLLOW_POLL_SEC = float(os.getenv("LOG_FOLLOW_POLL_SEC", "1"))
+LOG_FOLLOW_MAX_SEC = float(os.getenv("LOG_FOLLOW_MAX_SEC", "300"))
+LOG_FOLLOW_HEARTBEAT_SEC = float(os.getenv("LOG_FOLLOW_HEARTBEAT_SEC", "15"))
 ADMIN_LOGIN_IP_LIMIT = int(os.getenv("ADMIN_LOGIN_IP_LIMIT", "10"))
 ADMIN_LOGIN_ACCOUNT_LIMIT = int(os.getenv("ADMIN_LOGIN_ACCOUNT_LIMIT", "5"))
 ADMIN_LOGIN_WINDOW_SEC = int(os.getenv("ADMIN_LOGIN_WINDOW_SEC", "900"))
@@ -102,6 +144,41 @@ def _internal_api_headers() -> dict[str, str]:
     return {"X-Internal-Token": INTERNAL_API_TOKEN}
 
 
+# 요청마다 클라이언트를 새로 만들지 않고 lifespan 동안 keep-alive 커넥션을 재사용한다.
+automation_client = UpstreamClient("automation", RECEIVE_SERVER_URL, headers=_internal_api_headers())
+
+# 변경 리스너는 프로세스 안에서만 불린다. 이 프로세스의 DB 쓰기(관리자 유저 삭제 등)는 자동화 서버
+# 변경 피드(POST /changes)로 보내서 대시보드가 /api/admin/changes로 같이 받게 한다.
+_change_forwards: set = set()
+
+
+async def _forward_change(change_type: str, fields: dict) -> None:
+    try:
+        response = await automation_client.post("/changes", json={"type": change_type, "fields": fields}, timeout=5.0)
+    except Exception as exc:
+        get_logger("system").warn("admin", f"Change forward failed: {mask_sensitive_text(exc)}", event="change_forward_failed", change_type=change_type)
+        return
+    if response.status_code != status.HTTP_200_OK:
+        get_logger("system").warn("admin", "Change forward rejected", event="change_forward_failed", change_type=change_type, status_code=response.status_code)
+
+
+def _change_forwarder(loop: asyncio.AbstractEventLoop):
+    # DB 쓰기는 전용 실행기 스레드에서 일어나므로 이벤트 루프로 넘겨서 보낸다.
+    def listener(change_type: str, fields: dict) -> None:
+        def spawn() -> None:
+            task = loop.create_task(_forward_change(change_type, fields))
+            _change_forwards.add(task)
+            task.add_done_callback(_change_forwards.discard)
+
+        try:
+            loop.call_soon_threadsafe(spawn)
+        except RuntimeError:
+            # 루프가 이미 닫혔다.
+            pass
+
+    return listener
+
+
 def _rate_limit_response(retry_after: int) -> JSONResponse:
     return JSONResponse(
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -133,35 +210,6 @@ def _reset_account_rate_limit(limiter: SlidingWindowRateLimiter, account_id: str
     limiter.reset(f"account:{account_id.lower()}")
 
 
-async def trigger_user_automation(user_id: str):
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{RECEIVE_SERVER_URL}/on-user-registered",
-                json={"userId": user_id},
-                headers=_internal_api_headers(),
-                timeout=10.0,
-            )
-            logger = HanyangLogger("system")
-            if response.status_code == 200:
-                logger.info("automation", f"Successfully triggered automation for user: {user_id}")
-            else:
-                logger.error("automation", f"Failed to trigger automation for user {user_id}: {response.status_code}")
-    except Exception as exc:
-        logger = HanyangLogger("system")
-        logger.error("automation", f"Error triggering automation for user {user_id}: {mask_sensitive_text(exc)}")
-
-
-async def verify_user_credentials(user_id: str, password: str):
-    async with httpx.AsyncClient() as client:
-        return await client.post(
-            f"{RECEIVE_SERVER_URL}/verify-login",
-            json={"userId": user_id, "password": password},
-            headers=_internal_api_headers(),
-            timeout=30.0,
-        )
-
-
 class UserLoginRequest(BaseModel):
     userId: str = Field(..., min_length=1, max_length=128)
     password: str = Field(..., min_length=1, max_length=256)
@@ -177,14 +225,37 @@ class AdminChangePasswordRequest(BaseModel):
     newPassword: str = Field(..., min_length=12, max_length=256)
 
 
+class RerunRequest(BaseModel):
+    userNums: Optional[List[int]] = Field(None, min_length=1, max_length=500)
+    status: Optional[str] = Field(None, min_length=1, max_length=32)
+    createdSince: Optional[datetime] = None
+    limit: int = Field(500, ge=1, le=500)
+
+
+class PlaybackVerboseRequest(BaseModel):
+    enabled: bool = True
+
+
 def get_current_admin(request: Request):
     if not request.session.get("admin_logged_in"):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
     return True
 
 
-@app.get("/api/admin/users", dependencies=[Depends(get_current_admin)])
-def get_admin_users():
+def require_internal_request(request: Request):
+    received_token = request.headers.get("x-internal-token", "")
+    if not received_token or not hmac.compare_digest(received_token, INTERNAL_API_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    return True
+
+
+@app.get("/metrics", dependencies=[Depends(require_internal_request)])
+async def get_metrics():
+    """Prometheus 텍스트 형식의 메트릭(업스트림 지연/결과, 서킷 상태 등). X-Internal-Token이 있어야 한다."""
+    return Response(content=metrics.render_text(), media_type=metrics.CONTENT_TYPE)
+
+
+def _list_admin_users():
     users = []
     for row in db.get_all_users():
         users.append(
@@ -199,12 +270,86 @@ def get_admin_users():
     return users
 
 
+@app.get("/api/admin/users", dependencies=[Depends(get_current_admin)])
+async def get_admin_users():
+    return await adb.run(_list_admin_users)
+
+
+_analytics_cache: dict[int, tuple[float, dict]] = {}
+
+
+@app.get("/api/admin/analytics", dependencies=[Depends(get_current_admin)])
+async def get_admin_analytics(days: int = Query(7, ge=1, le=90)):
+    """실행 기록 통계. 대시보드가 자주 불러도 DB를 매번 읽지 않도록 잠깐 캐시한다."""
+    now = time.monotonic()
+    cached = _analytics_cache.get(days)
+    if cached and cached[0] > now:
+        return cached[1]
+    summary = await adb.run(db.get_run_summary, time.time() - days * 86400)
+    summary["days"] = days
+    _analytics_cache[days] = (now + ANALYTICS_CACHE_TTL_SEC, summary)
+    return summary
+
+
+@app.get("/api/admin/runs", dependencies=[Depends(get_current_admin)])
+async def get_admin_runs(
+    userId: Optional[str] = Query(None, min_length=1, max_length=128),
+    days: int = Query(7, ge=1, le=90),
+    limit: int = Query(100, ge=1, le=500),
+):
+    rows = await adb.run(db.get_runs, time.time() - days * 86400, userId, limit)
+    return [
+        {
+            "runId": row[0],
+            "userNum": row[1],
+            "userId": row[2],
+            "sweepId": row[3],
+            "startedAt": row[4],
+            "finishedAt": row[5],
+            "elapsedSec": row[6],
+            "outcome": row[7],
+            "learnedCount": row[8],
+            "failure": row[9],
+        }
+        for row in rows
+    ]
+
+
+def _with_staleness(progress: dict, now: float) -> dict:
+    # heartbeat가 오래 멈춘 행은 재생 루프가 멈췄거나 프로세스가 죽은 것이다.
+    progress["stale"] = now - (progress.get("heartbeatAt") or 0) > PROGRESS_STALE_SEC
+    return progress
+
+
+@app.get("/api/admin/progress", dependencies=[Depends(get_current_admin)])
+async def get_admin_progress():
+    """지금 강의를 재생 중인 유저들의 진행 상황. 실행 중인 유저 수만큼만 읽는다."""
+    now = time.time()
+    return [_with_staleness(progress, now) for progress in await adb.get_all_progress()]
+
+
+@app.get("/api/admin/user/{user_id}/progress", dependencies=[Depends(get_current_admin)])
+async def get_user_progress(user_id: str):
+    progress = await adb.get_progress(user_id)
+    if progress is None:
+        return JSONResponse(status_code=404, content={"message": "진행 중인 강의 없음"})
+    return _with_staleness(progress, time.time())
+
+
+def _json_object(response: httpx.Response) -> dict:
+    try:
+        payload = response.json()
+    except ValueError:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
 @app.post("/api/user/login")
 async def user_login(req: UserLoginRequest, request: Request):
-    logger = HanyangLogger("system")
+    logger = get_logger("system")
     user_id = req.userId.strip()
     password = req.password
-    user_logger = HanyangLogger("user", user_id=user_id)
+    user_logger = get_logger("user", user_id=user_id)
 
     client_ip = get_client_ip(request)
     retry_after = _check_login_rate_limits(
@@ -219,11 +364,20 @@ async def user_login(req: UserLoginRequest, request: Request):
         logger.warn("user", f"User login rate limit exceeded: userId={user_id}, ip={client_ip}")
         return _rate_limit_response(retry_after)
 
-    import asyncio
-
-    loop = asyncio.get_running_loop()
     try:
-        verification_response = await verify_user_credentials(user_id, password)
+        # 계정 확인과 자동 수강 등록은 자동화 서버의 작업으로 넘기고 바로 작업 id를 돌려준다.
+        job_response = await automation_client.post(
+            "/login-jobs",
+            json={"userId": user_id, "password": password},
+            timeout=10.0,
+        )
+    except CircuitOpenError:
+        logger.warn("user", f"Credential verification skipped, automation circuit open: {user_id}")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"message": "계정 확인 서버가 잠시 응답하지 않습니다. 잠시 후 다시 시도해주세요."},
+            headers={"Retry-After": str(automation_client.breaker.retry_after())},
+        )
     except Exception as exc:
         safe_error = mask_sensitive_text(exc)
         logger.error("user", f"Credential verification request failed: {user_id}: {safe_error}")
@@ -233,39 +387,68 @@ async def user_login(req: UserLoginRequest, request: Request):
             content={"message": "한양 LMS 계정 확인 서버에 연결하지 못했습니다. 잠시 후 다시 시도해주세요."},
         )
 
-    verification_payload = verification_response.json()
-    if verification_response.status_code != 200:
-        message = verification_payload.get("message") or "아이디 또는 비밀번호가 올바르지 않습니다."
-        logger.info("user", f"Credential verification failed: {user_id}")
-        user_logger.info("user", f"Credential verification failed: {message}")
+    # 프록시나 automation이 만든 오류 응답은 JSON이 아닐 수 있다.
+    job_payload = _json_object(job_response)
+    if job_response.status_code in (status.HTTP_429_TOO_MANY_REQUESTS, status.HTTP_503_SERVICE_UNAVAILABLE):
+        logger.warn("user", f"Credential verification deferred ({job_response.status_code}): {user_id}")
+        return JSONResponse(
+            status_code=job_response.status_code,
+            content={"message": job_payload.get("message") or "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."},
+            headers={"Retry-After": job_response.headers.get("Retry-After", "5")},
+        )
+    if job_response.status_code != status.HTTP_202_ACCEPTED or "jobId" not in job_payload:
+        logger.error("user", f"Credential verification job rejected ({job_response.status_code}): {user_id}")
         return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"message": message},
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            content={"message": "한양 LMS 계정 확인 서버에 연결하지 못했습니다. 잠시 후 다시 시도해주세요."},
         )
 
-    logger.info("user", f"Credential verification succeeded: {user_id}")
-    user_logger.info("user", "Credential verification succeeded")
-    _reset_account_rate_limit(user_login_limiter, user_id)
+    logger.info("user", f"Credential verification job accepted: {user_id}")
+    user_logger.info("user", "계정 확인 요청 접수")
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=job_payload,
+        headers={"Location": f"/api/user/login/{job_payload['jobId']}"},
+    )
 
-    user = await loop.run_in_executor(None, db.get_user_by_id, user_id)
-    if not user:
-        await loop.run_in_executor(None, db.add_user, user_id, password)
-        logger.info("user", f"New user registered: {user_id}")
-        user_logger.info("user", "신규 유저 등록")
-    else:
-        await loop.run_in_executor(None, db.update_user_pwd, user_id, password)
-        logger.info("user", f"Existing user password updated: {user_id}")
-        user_logger.info("user", "기존 유저 비밀번호 업데이트")
 
-    logger.info("user", f"User login completed: {user_id}")
-    user_logger.info("user", "유저 로그인")
+@app.get("/api/user/login/{job_id}")
+async def user_login_status(
+    job_id: str = Path(..., min_length=16, max_length=64, pattern=r"^[A-Za-z0-9_-]+$"),
+    version: int = Query(-1),
+    wait: float = Query(LOGIN_POLL_WAIT_SEC, ge=0, le=LOGIN_POLL_WAIT_SEC),
+):
+    try:
+        response = await automation_client.get(
+            f"/login-jobs/{job_id}",
+            params={"version": version, "wait": wait},
+            timeout=wait + 10.0,
+        )
+    except Exception as exc:
+        get_logger("system").error("user", f"Login job lookup failed: {mask_sensitive_text(exc)}")
+        return JSONResponse(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            content={"message": "한양 LMS 계정 확인 서버에 연결하지 못했습니다. 잠시 후 다시 시도해주세요."},
+        )
+    if response.status_code == status.HTTP_404_NOT_FOUND:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"message": "로그인 요청이 만료되었습니다. 다시 시도해주세요."},
+        )
+    if response.status_code != status.HTTP_200_OK:
+        return JSONResponse(status_code=status.HTTP_502_BAD_GATEWAY, content={"message": "계정 확인 상태를 가져오지 못했습니다."})
 
-    await trigger_user_automation(user_id)
-    return {"success": True, "userId": user_id}
+    payload = _json_object(response)
+    if not payload.get("status"):
+        # 프록시가 만든 HTML 오류 페이지 등 JSON이 아닌 응답
+        return JSONResponse(status_code=status.HTTP_502_BAD_GATEWAY, content={"message": "계정 확인 상태를 가져오지 못했습니다."})
+    if payload.get("status") == "succeeded":
+        _reset_account_rate_limit(user_login_limiter, payload.get("userId", ""))
+    return payload
 
 
 @app.post("/api/admin/login")
-def admin_login(req: AdminLoginRequest, request: Request):
+async def admin_login(req: AdminLoginRequest, request: Request):
     admin_id = req.adminId.strip()
     client_ip = get_client_ip(request)
     retry_after = _check_login_rate_limits(
@@ -279,12 +462,12 @@ def admin_login(req: AdminLoginRequest, request: Request):
     if retry_after:
         return _rate_limit_response(retry_after)
 
-    admin = db.get_admin()
-    if not admin or admin[1] != admin_id or not db.verify_admin_password(admin[2], req.adminPassword):
+    admin = await adb.get_admin()
+    if not admin or admin[1] != admin_id or not await adb.verify_admin_password(admin[2], req.adminPassword):
         return JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED, content={"message": "로그인 실패"})
 
     if db.admin_password_needs_migration(admin[2]):
-        db.update_admin_pwd(admin[1], req.adminPassword)
+        await adb.update_admin_pwd(admin[1], req.adminPassword)
 
     _reset_account_rate_limit(admin_login_limiter, admin_id)
     request.session.clear()
@@ -300,9 +483,9 @@ def check_admin_auth(request: Request):
 
 
 @app.delete("/api/admin/user/{user_id}", dependencies=[Depends(get_current_admin)])
-def delete_user(user_id: int = Path(...)):
-    db.delete_learned_lectures(user_id)
-    db.delete_user_by_num(user_id)
+async def delete_user(user_id: int = Path(...)):
+    await adb.delete_learned_lectures(user_id)
+    await adb.delete_user_by_num(user_id)
     return {"success": True, "deleted": user_id}
 
 
@@ -313,96 +496,387 @@ def admin_logout(request: Request):
 
 
 @app.post("/api/admin/change-password", dependencies=[Depends(get_current_admin)])
-def admin_change_password(req: AdminChangePasswordRequest, request: Request):
-    admin = db.get_admin()
-    if not admin or not db.verify_admin_password(admin[2], req.currentPassword):
+async def admin_change_password(req: AdminChangePasswordRequest, request: Request):
+    admin = await adb.get_admin()
+    if not admin or not await adb.verify_admin_password(admin[2], req.currentPassword):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="현재 비밀번호가 일치하지 않습니다.",
         )
 
-    db.update_admin_pwd(admin[1], req.newPassword)
+    await adb.update_admin_pwd(admin[1], req.newPassword)
     request.session.clear()
     return {"success": True, "message": "비밀번호가 성공적으로 변경되었습니다."}
 
 
-def _get_logs_sync(user_id: str):
-    import glob
+def _log_target(user_id: str):
+    catalog = get_catalog()
+    return catalog, catalog.target_for_user(user_id)
 
-    safe_user_id = sanitize_filename(user_id)
-    user_log_dirs = (
-        sorted(
-            [
-                os.path.join(LOG_BASE, day_dir, "user", safe_user_id)
-                for day_dir in os.listdir(LOG_BASE)
-                if os.path.isdir(os.path.join(LOG_BASE, day_dir, "user", safe_user_id))
-            ],
-            reverse=True,
-        )
-        if os.path.isdir(LOG_BASE)
-        else []
-    )
 
-    if not user_log_dirs:
+def _read_logs_sync(user_id: str, day: Optional[str], offset: Optional[int], limit: Optional[int],
+                    tail: Optional[int], range_header: Optional[str], accept_gzip: bool):
+    # 날짜 디렉터리를 훑지 않고 로그 카탈로그에서 파일 목록을 찾는다.
+    catalog, target = _log_target(user_id)
+    days = catalog.days(target)
+    if not days:
         return None, "path_not_found"
-
-    latest_log_file = None
-    for user_log_dir in user_log_dirs:
-        log_files = sorted(
-            glob.glob(os.path.join(user_log_dir, "log*.log")),
-            key=os.path.getmtime,
-            reverse=True,
-        )
-        if log_files:
-            latest_log_file = log_files[0]
-            break
-
-    if not latest_log_file:
+    day = day or days[0]
+    files = catalog.files(target, day)
+    if not files:
         return None, "file_not_found"
 
-    with open(latest_log_file, "r", encoding="utf-8") as file:
-        return {
-            "content": file.read(),
-            "path": str(FilePath(latest_log_file).resolve()),
-        }, "success"
+    total = log_reader.day_size(files)
+    byte_range = log_reader.parse_range(range_header, total)
+    partial = byte_range is not None
+    if partial:
+        offset, limit = byte_range
+    if offset is not None:
+        # Range가 0바이트(bytes=5-3, bytes=-0)이거나 파일 끝을 넘으면 416. limit가 없을 때만 최대 크기로 읽는다.
+        if offset > total or (partial and (offset >= total or limit == 0)):
+            return {"size": total}, "range_not_satisfiable"
+        limit = LOG_RANGE_MAX_BYTES if limit is None else min(limit, LOG_RANGE_MAX_BYTES)
+        content = log_reader.read_range(files, offset, limit)
+    else:
+        lines = LOG_DEFAULT_TAIL_LINES if tail is None else tail
+        content, offset = log_reader.tail_lines(files, min(lines, LOG_TAIL_MAX_LINES))
+
+    older = [candidate for candidate in days if candidate < day]
+    headers = {
+        "X-Log-Path": str(FilePath(files[-1]["path"]).resolve()),
+        "X-Log-Day": day,
+        "X-Log-Size": str(total),
+        "X-Log-Offset": str(offset),
+        "X-Log-Next-Offset": str(offset + len(content)),
+        "Accept-Ranges": "bytes",
+        "Vary": "Accept-Encoding",
+    }
+    if older:
+        headers["X-Log-Prev-Day"] = older[0]
+    if partial:
+        headers["Content-Range"] = f"bytes {offset}-{offset + max(len(content), 1) - 1}/{total}"
+    elif accept_gzip and len(content) >= LOG_GZIP_MIN_BYTES:
+        content = gzip.compress(content, compresslevel=6)
+        headers["Content-Encoding"] = "gzip"
+    return {"content": content, "headers": headers, "partial": partial, "files": files}, "success"
+
+
+def _log_file_day(path: str) -> str:
+    # LOG_BASE/<날짜>/user/<id>/<파일>
+    return os.path.basename(os.path.dirname(os.path.dirname(os.path.dirname(path))))
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _follow_user_log(request: Request, user_id: str, content: bytes, files: list):
+    """처음에 tail을 보내고, 그 뒤로 활성 파일에 붙는 줄을 SSE로 보냅니다.
+
+    회전(같은 경로의 inode가 바뀜)되면 log1.log.1에 남은 부분을 끝까지 읽고 새 파일 처음부터,
+    날짜가 바뀌면 카탈로그의 최신 파일로 옮겨 간다. LOG_FOLLOW_MAX_SEC가 지나면 끊고,
+    브라우저 EventSource가 다시 붙으면 snapshot부터 새로 받는다.
+    최신 날짜가 오늘(KST)이 아니거나 이미 압축됐으면 더 붙을 줄이 없으므로 snapshot만 보내고 끝낸다.
+    """
+    loop = asyncio.get_running_loop()
+    catalog, target = _log_target(user_id)
+    path = files[-1]["path"]
+    identity = log_reader.file_identity(path)
+    position = files[-1]["size"]
+    pending = b""
+    yield _sse("snapshot", content.decode("utf-8", errors="replace"))
+    if files[-1]["compressed"] or _log_file_day(path) != datetime.now(KST).strftime("%Y%m%d"):
+        return
+
+    deadline = time.monotonic() + LOG_FOLLOW_MAX_SEC
+    last_sent = time.monotonic()
+    draining = False
+    while time.monotonic() < deadline and not await request.is_disconnected():
+        if not draining:
+            await asyncio.sleep(LOG_FOLLOW_POLL_SEC)
+        current = log_reader.file_identity(path)
+        chunk = b""
+        if identity and (current is None or current[0] != identity[0]):
+            # 회전 전 파일(log1.log.1)을 끝까지 읽은 뒤에야 새 파일 처음으로 넘어간다.
+            chunk = await loop.run_in_executor(None, log_reader.read_new_bytes, f"{path}.1", position, LOG_RANGE_MAX_BYTES)
+            position += len(chunk)
+            draining = len(chunk) == LOG_RANGE_MAX_BYTES
+            if not draining:
+                identity, position = current, 0
+        elif current and current[1] > position:
+            chunk = await loop.run_in_executor(None, log_reader.read_new_bytes, path, position, LOG_RANGE_MAX_BYTES)
+            position += len(chunk)
+        elif current and current[1] < position:
+            position = 0
+
+        if not chunk:
+            latest = await loop.run_in_executor(None, catalog.latest_file, target)
+            # 압축된 `.gz`는 따라 읽지 않는다 (새 날짜 파일은 압축되기 전이다).
+            if latest and latest != path and not latest.endswith(log_catalog.COMPRESSED_SUFFIX):
+                path, identity, position = latest, log_reader.file_identity(latest), 0
+                yield _sse("day", _log_file_day(latest))
+
+        pending += chunk
+        cut = pending.rfind(b"\n") + 1
+        if cut:
+            yield _sse("append", pending[:cut].decode("utf-8", errors="replace"))
+            pending = pending[cut:]
+            last_sent = time.monotonic()
+        elif time.monotonic() - last_sent >= LOG_FOLLOW_HEARTBEAT_SEC:
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
 
 
 @app.get("/api/admin/user/{user_id}/logs", dependencies=[Depends(get_current_admin)])
-async def get_user_logs(user_id: str):
-    import asyncio
-
+async def get_user_logs(
+    request: Request,
+    user_id: str,
+    day: Optional[str] = Query(None, pattern=r"^\d{8}$"),
+    offset: Optional[int] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+    tail: Optional[int] = Query(None, ge=0),
+    follow: bool = False,
+):
+    """기본은 최신 날짜의 마지막 LOG_DEFAULT_TAIL_LINES줄.
+
+    offset/limit 또는 Range 헤더로 그날 로그(회전된 파일을 이어 붙인 것)의 바이트 구간을 읽고,
+    X-Log-Next-Offset / X-Log-Prev-Day로 다음 구간과 이전 날짜를 찾아간다.
+    follow=true면 최신 날짜의 tail을 보낸 뒤 새로 붙는 줄을 SSE로 계속 보낸다.
+    """
     loop = asyncio.get_running_loop()
-    log_payload, result = await loop.run_in_executor(None, _get_logs_sync, user_id)
+    accept_gzip = not follow and "gzip" in request.headers.get("accept-encoding", "")
+    range_header = None if follow else request.headers.get("range")
+    if follow:
+        day = offset = None
+    log_payload, result = await loop.run_in_executor(
+        None, _read_logs_sync, user_id, day, offset, limit, tail, range_header, accept_gzip
+    )
 
     if result == "path_not_found":
         return JSONResponse(status_code=404, content={"message": "로그 파일 경로 없음"})
     if result == "file_not_found":
         return JSONResponse(status_code=404, content={"message": "사용자 로그 파일 없음"})
+    if result == "range_not_satisfiable":
+        return JSONResponse(
+            status_code=416,
+            content={"message": "요청한 로그 구간이 없습니다."},
+            headers={"Content-Range": f"bytes */{log_payload['size']}"},
+        )
 
-    return PlainTextResponse(
+    if follow:
+        return StreamingResponse(
+            _follow_user_log(request, user_id, log_payload["content"], log_payload["files"]),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return Response(
         content=log_payload["content"],
-        headers={"X-Log-Path": log_payload["path"]},
+        status_code=status.HTTP_206_PARTIAL_CONTENT if log_payload["partial"] else status.HTTP_200_OK,
+        media_type="text/plain; charset=utf-8",
+        headers=log_payload["headers"],
+    )
+
+
+def _log_index_sync(user_id: str):
+    catalog, target = _log_target(user_id)
+    result = []
+    for day in catalog.days(target):
+        files = catalog.files(target, day)
+        if files:
+            result.append({"day": day, "size": log_reader.day_size(files), "files": len(files)})
+    return result
+
+
+@app.get("/api/admin/user/{user_id}/logs/index", dependencies=[Depends(get_current_admin)])
+async def get_user_log_index(user_id: str):
+    loop = asyncio.get_running_loop()
+    return {"days": await loop.run_in_executor(None, _log_index_sync, user_id)}
+
+
+event_analytics = log_analytics.LogAnalytics(get_catalog())
+
+
+async def _warm_event_analytics():
+    # 처음 쌓는 ingest는 첫 질의 요청 안에서 하지 않고 시작할 때 LOG_ANALYTICS_REFRESH_MAX_BYTES씩 나눠 읽는다.
+    loop = asyncio.get_running_loop()
+    try:
+        while not event_analytics.complete:
+            await loop.run_in_executor(None, event_analytics.refresh)
+    except Exception as exc:
+        get_logger("system").warn("admin", f"Event analytics warm-up failed: {mask_sensitive_text(exc)}", event="event_analytics_warmup_failed")
+
+
+def _parse_event_filters(event: Optional[str], raw_filters: List[str]) -> dict:
+    filters = {"event": event} if event else {}
+    for item in raw_filters:
+        name, separator, value = item.partition(":")
+        if not separator or name not in log_analytics.DIMENSIONS:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 필터입니다: {item}")
+        filters[name] = value
+    return filters
+
+
+def _query_events_sync(**kwargs):
+    event_analytics.refresh_if_stale()
+    return event_analytics.query(**kwargs)
+
+
+@app.get("/api/admin/events/query", dependencies=[Depends(get_current_admin)])
+async def query_events(
+    event: Optional[str] = Query(None, min_length=1, max_length=64),
+    days: int = Query(7, ge=1, le=90),
+    start: Optional[float] = Query(None, ge=0),
+    end: Optional[float] = Query(None, ge=0),
+    groupBy: Optional[str] = Query(None, max_length=32),
+    metric: Optional[str] = Query(None, max_length=32),
+    agg: str = Query("count", max_length=8),
+    filter: List[str] = Query([], max_length=10),
+    limit: int = Query(50, ge=1, le=1000),
+):
+    """로그 이벤트 집계. 예: 과목별 멈춤 횟수 `event=playback_stalled&groupBy=course_id`,
+    전략별 재생 확인 시간 `event=playback_confirmed&groupBy=strategy&metric=wait_sec&agg=mean`.
+    """
+    if groupBy is not None and groupBy not in log_analytics.DIMENSIONS and groupBy not in log_analytics.TIME_BUCKETS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 groupBy입니다: {groupBy}")
+    if metric is not None and metric not in log_analytics.MEASURES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 metric입니다: {metric}")
+    if agg not in log_analytics.AGGREGATES or (agg != "count" and metric is None):
+        raise HTTPException(status_code=400, detail="agg는 count, sum, mean, min, max 중 하나이고 count가 아니면 metric이 필요합니다.")
+    filters = _parse_event_filters(event, filter)
+    start = start if start is not None else time.time() - days * 86400
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        None,
+        lambda: _query_events_sync(start=start, end=end, filters=filters, group_by=groupBy, metric=metric, agg=agg, limit=limit),
     )
+    result.update({"groupBy": groupBy, "metric": metric, "agg": agg, "filters": filters})
+    return result
+
+
+@app.get("/api/admin/events/dimensions/{name}", dependencies=[Depends(get_current_admin)])
+async def get_event_dimension_values(name: str, limit: int = Query(200, ge=1, le=2000)):
+    if name not in log_analytics.DIMENSIONS:
+        raise HTTPException(status_code=404, detail="알 수 없는 차원입니다.")
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, event_analytics.refresh_if_stale)
+    return {"name": name, "values": event_analytics.dimension_values(name, limit)}
+
+
+SWEEP_FAILURE_MESSAGE = "자동 수강 sweep 요청에 실패했습니다."
+
+
+async def _call_automation_api(method: str, path: str, failure_message: str, **kwargs):
+    try:
+        response = await automation_client.request(method, path, timeout=10.0, **kwargs)
+    except Exception as exc:
+        return JSONResponse(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            content={"detail": f"자동화 서버 호출 실패: {mask_sensitive_text(exc)}"},
+        )
+    if response.status_code not in (status.HTTP_200_OK, status.HTTP_202_ACCEPTED):
+        return JSONResponse(
+            status_code=response.status_code,
+            content={"detail": response.text or failure_message},
+        )
+    return response.json()
 
 
 @app.post("/api/admin/trigger-all", dependencies=[Depends(get_current_admin)])
 async def trigger_all_users():
+    # sweep은 자동화 서버에서 백그라운드로 돌고, 여기서는 id만 받아 바로 돌려준다.
+    payload = await _call_automation_api("POST", "/sweeps", SWEEP_FAILURE_MESSAGE, json={"reason": "admin"})
+    if isinstance(payload, JSONResponse):
+        return payload
+    if payload.get("merged"):
+        message = "이미 진행 중인 전체 자동 수강에 합쳤습니다."
+    else:
+        message = "모든 유저 자동 수강을 시작했습니다."
+    return {"success": True, "message": message, "sweep": payload}
+
+
+@app.get("/api/admin/sweeps", dependencies=[Depends(get_current_admin)])
+async def list_sweeps():
+    return await _call_automation_api("GET", "/sweeps", SWEEP_FAILURE_MESSAGE)
+
+
+@app.get("/api/admin/sweeps/{sweep_id}", dependencies=[Depends(get_current_admin)])
+async def get_sweep(sweep_id: str = Path(..., min_length=1, max_length=32, pattern=r"^[0-9a-f]+$")):
+    return await _call_automation_api("GET", f"/sweeps/{sweep_id}", SWEEP_FAILURE_MESSAGE)
+
+
+@app.post("/api/admin/sweeps/{sweep_id}/cancel", dependencies=[Depends(get_current_admin)])
+async def cancel_sweep(sweep_id: str = Path(..., min_length=1, max_length=32, pattern=r"^[0-9a-f]+$")):
+    return await _call_automation_api("POST", f"/sweeps/{sweep_id}/cancel", SWEEP_FAILURE_MESSAGE)
+
+
+@app.post("/api/admin/users/rerun", dependencies=[Depends(get_current_admin)])
+async def rerun_users(req: RerunRequest):
+    if req.userNums is None and req.status is None and req.createdSince is None:
+        raise HTTPException(status_code=400, detail="재실행할 유저 번호나 조건을 지정해주세요.")
+    payload = await _call_automation_api(
+        "POST",
+        "/reruns",
+        "선택한 유저 재실행 요청에 실패했습니다.",
+        json=req.model_dump(mode="json", exclude_none=True),
+    )
+    if isinstance(payload, JSONResponse):
+        return payload
+    queued = payload.get("counts", {}).get("queued", 0)
+    return {"success": True, "message": f"{queued}명의 자동 수강을 다시 등록했습니다.", **payload}
+
+
+@app.post("/api/admin/runs/{run_id}/verbose", dependencies=[Depends(get_current_admin)])
+async def set_run_verbose(req: PlaybackVerboseRequest, run_id: str = Path(..., min_length=1, max_length=64, pattern=r"^[A-Za-z0-9_.-]+$")):
+    return await _call_automation_api(
+        "POST",
+        f"/runs/{run_id}/verbose",
+        "재생 로그 상세 모드 변경에 실패했습니다.",
+        json=req.model_dump(),
+    )
+
+
+async def _relay_change_stream(upstream):
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{RECEIVE_SERVER_URL}/trigger-daily",
-                headers=_internal_api_headers(),
-                timeout=10.0,
-            )
-            if response.status_code == 200:
-                payload = response.json()
-                return {"success": True, "message": payload.get("message", "모든 유저 자동 수강을 시작했습니다.")}
-            return JSONResponse(
-                status_code=response.status_code,
-                content={"detail": response.text or "자동 수강 시작에 실패했습니다."},
-            )
+        async for chunk in upstream.aiter_raw():
+            yield chunk
+    except httpx.HTTPError as exc:
+        # 자동화 서버가 재시작하면 끊긴다. 브라우저 EventSource가 알아서 다시 붙는다.
+        get_logger("system").warn("admin", f"Change stream relay ended: {mask_sensitive_text(exc)}")
+    finally:
+        await upstream.aclose()
+
+
+@app.get("/api/admin/changes", dependencies=[Depends(get_current_admin)])
+async def stream_admin_changes(request: Request):
+    """대시보드용 변경 알림(SSE)을 자동화 서버에서 받아 그대로 넘깁니다."""
+    headers = {}
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id:
+        headers["Last-Event-ID"] = last_event_id[:64]
+    try:
+        upstream = await automation_client.send_stream(
+            "GET",
+            "/changes",
+            headers=headers,
+            timeout=httpx.Timeout(10.0, read=CHANGE_STREAM_READ_TIMEOUT_SEC),
+        )
+    except CircuitOpenError:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "자동화 서버가 잠시 응답하지 않습니다."},
+            headers={"Retry-After": str(automation_client.breaker.retry_after())},
+        )
     except Exception as exc:
         return JSONResponse(
             status_code=status.HTTP_502_BAD_GATEWAY,
             content={"detail": f"자동화 서버 호출 실패: {mask_sensitive_text(exc)}"},
         )
+    if upstream.status_code != status.HTTP_200_OK:
+        await upstream.aclose()
+        return JSONResponse(status_code=status.HTTP_502_BAD_GATEWAY, content={"detail": "변경 알림을 가져오지 못했습니다."})
+    return StreamingResponse(
+        _relay_change_stream(upstream),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,68 @@
+import base64
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import httpx
+from fastapi.testclient import TestClient
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+os.environ.setdefault("INTERNAL_API_TOKEN", "test-token")
+os.environ.setdefault("ADMIN_INITIAL_PASSWORD", "very-long-test-password")
+os.environ.setdefault("SESSION_SECRET_B64", base64.b64encode(b"0" * 32).decode("ascii"))
+
+import utils.database as db
+from utils.db_backends import SQLiteBackend
+
+# back.main은 import할 때 DB를 초기화하므로 그 전에 임시 DB로 돌린다.
+TEMP_DIR = tempfile.TemporaryDirectory()
+ORIGINAL_BACKEND = db.set_backend(SQLiteBackend(os.path.join(TEMP_DIR.name, "hanyang.db")))
+
+import back.main as back_main
+
+
+def tearDownModule():
+    db.set_backend(ORIGINAL_BACKEND)
+    TEMP_DIR.cleanup()
+
+
+class AdminChangeForwardTests(unittest.TestCase):
+    def setUp(self):
+        # 다른 테스트 모듈이 나중에 다른 임시 DB로 돌려 놓았을 수 있어서 테스트마다 스키마를 만든다.
+        self.orig_backend = db.set_backend(SQLiteBackend(os.path.join(TEMP_DIR.name, "changes.db")))
+        db.init_db()
+        self.forwarded = []
+        self.orig_transport = back_main.automation_client.transport
+        back_main.automation_client.transport = httpx.MockTransport(self.handler)
+        back_main.app.dependency_overrides[back_main.get_current_admin] = lambda: True
+
+    def tearDown(self):
+        back_main.automation_client.transport = self.orig_transport
+        back_main.app.dependency_overrides.pop(back_main.get_current_admin, None)
+        db.get_backend().close()
+        db.set_backend(self.orig_backend)
+
+    def handler(self, request):
+        if request.method == "POST" and request.url.path == "/changes":
+            self.forwarded.append((request.headers.get("X-Internal-Token"), json.loads(request.content)))
+        return httpx.Response(200, json={"success": True})
+
+    def test_admin_delete_is_forwarded_to_the_change_feed(self):
+        db.add_user("forward-user", "pw-1")
+        user_num = db.get_user_by_id("forward-user")[0]
+        with TestClient(back_main.app) as client:
+            response = client.delete(f"/api/admin/user/{user_num}")
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.forwarded,
+            [(back_main.INTERNAL_API_TOKEN, {"type": "user_deleted", "fields": {"userNum": user_num}})],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import base64
+import os
+import sys
+import tempfile
+import unittest
+
+from fastapi.testclient import TestClient
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+os.environ.setdefault("INTERNAL_API_TOKEN", "test-token")
+os.environ.setdefault("ADMIN_INITIAL_PASSWORD", "very-long-test-password")
+os.environ.setdefault("SESSION_SECRET_B64", base64.b64encode(b"0" * 32).decode("ascii"))
+
+import utils.database as db
+from utils.db_backends import SQLiteBackend
+from utils.metrics import CONTENT_TYPE
+
+# back.main은 import할 때 DB를 초기화하므로 그 전에 임시 DB로 돌린다.
+TEMP_DIR = tempfile.TemporaryDirectory()
+ORIGINAL_BACKEND = db.set_backend(SQLiteBackend(os.path.join(TEMP_DIR.name, "hanyang.db")))
+
+import back.main as back_main
+
+
+def tearDownModule():
+    db.set_backend(ORIGINAL_BACKEND)
+    TEMP_DIR.cleanup()
+
+
+class BackMetricsTests(unittest.TestCase):
+    def test_metrics_expose_upstream_calls_behind_internal_token(self):
+        with TestClient(back_main.app) as client:
+            self.assertEqual(client.get("/metrics").status_code, 403)
+            self.assertEqual(client.get("/metrics", headers={"X-Internal-Token": "wrong"}).status_code, 403)
+            response = client.get("/metrics", headers={"X-Internal-Token": back_main.INTERNAL_API_TOKEN})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], CONTENT_TYPE)
+        self.assertIn("# TYPE hanyang_upstream_request_seconds histogram", response.text)
+        self.assertIn("# TYPE hanyang_upstream_circuit_open gauge", response.text)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import base64
+import os
+import sys
+import tempfile
+import unittest
+
+import httpx
+from fastapi.testclient import TestClient
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+os.environ.setdefault("INTERNAL_API_TOKEN", "test-token")
+os.environ.setdefault("ADMIN_INITIAL_PASSWORD", "very-long-test-password")
+os.environ.setdefault("SESSION_SECRET_B64", base64.b64encode(b"0" * 32).decode("ascii"))
+
+import utils.database as db
+from utils.db_backends import SQLiteBackend
+
+# back.main은 import할 때 DB를 초기화하므로 그 전에 임시 DB로 돌린다.
+TEMP_DIR = tempfile.TemporaryDirectory()
+ORIGINAL_BACKEND = db.set_backend(SQLiteBackend(os.path.join(TEMP_DIR.name, "hanyang.db")))
+
+import back.main as back_main
+
+
+def tearDownModule():
+    db.set_backend(ORIGINAL_BACKEND)
+    TEMP_DIR.cleanup()
+
+
+class UserLoginJobTests(unittest.TestCase):
+    def setUp(self):
+        self.orig_transport = back_main.automation_client.transport
+        back_main._reset_account_rate_limit(back_main.user_login_limiter, "student")
+
+    def tearDown(self):
+        back_main.automation_client.transport = self.orig_transport
+
+    def login(self, response: httpx.Response):
+        back_main.automation_client.transport = httpx.MockTransport(lambda request: response)
+        with TestClient(back_main.app) as client:
+            return client.post("/api/user/login", json={"userId": "student", "password": "pw"})
+
+    def test_non_json_error_bodies_map_to_gateway_errors(self):
+        response = self.login(httpx.Response(500, text="Internal Server Error"))
+        self.assertEqual(response.status_code, 502)
+
+        response = self.login(httpx.Response(429, text="<html>slow down</html>", headers={"Retry-After": "7"}))
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers["Retry-After"], "7")
+        self.assertTrue(response.json()["message"])
+
+    def test_accepted_job_is_returned_with_location(self):
+        response = self.login(httpx.Response(202, json={"jobId": "job-0123456789abcdef", "status": "verifying"}))
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.headers["Location"], "/api/user/login/job-0123456789abcdef")
+
+    def poll(self, response: httpx.Response):
+        back_main.automation_client.transport = httpx.MockTransport(lambda request: response)
+        with TestClient(back_main.app) as client:
+            return client.get("/api/user/login/job-0123456789abcdef", params={"wait": 0})
+
+    def test_status_poll_maps_non_json_body_to_gateway_error(self):
+        response = self.poll(httpx.Response(200, text="<html>502 Bad Gateway</html>"))
+        self.assertEqual(response.status_code, 502)
+        self.assertTrue(response.json()["message"])
+
+        response = self.poll(httpx.Response(200, json={"status": "verifying", "version": 2}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "verifying", "version": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
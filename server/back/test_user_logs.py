@@ -0,0 +1,121 @@
+import asyncio
+import base64
+import gzip
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+os.environ.setdefault("INTERNAL_API_TOKEN", "test-token")
+os.environ.setdefault("ADMIN_INITIAL_PASSWORD", "very-long-test-password")
+os.environ.setdefault("SESSION_SECRET_B64", base64.b64encode(b"0" * 32).decode("ascii"))
+
+import utils.database as db
+import utils.logger as logger_module
+from utils.db_backends import SQLiteBackend
+
+# back.main은 import할 때 DB를 초기화하므로 그 전에 임시 DB로 돌린다.
+TEMP_DIR = tempfile.TemporaryDirectory()
+ORIGINAL_BACKEND = db.set_backend(SQLiteBackend(os.path.join(TEMP_DIR.name, "hanyang.db")))
+
+import back.main as back_main
+
+
+def tearDownModule():
+    db.set_backend(ORIGINAL_BACKEND)
+    TEMP_DIR.cleanup()
+
+
+class _ConnectedRequest:
+    async def is_disconnected(self):
+        return False
+
+
+class UserLogTests(unittest.TestCase):
+    def setUp(self):
+        self.log_base = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(logger_module, "LOG_BASE", self.log_base.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.log_base.cleanup)
+        # follow는 오늘(KST) 날짜만 따라가므로 오늘 디렉터리에 쓴다.
+        self.day = logger_module.datetime.now(logger_module.KST).strftime("%Y%m%d")
+        self.directory = os.path.join(self.log_base.name, self.day, "user", "student01")
+        os.makedirs(self.directory)
+        self.path = os.path.join(self.directory, "log1.log")
+        self.write(self.path, "line 0\nline 1\n")
+
+    def write(self, path, text, mode="w"):
+        with open(path, mode, encoding="utf-8") as handle:
+            handle.write(text)
+
+    def read(self, range_header=None, offset=None, limit=None):
+        return back_main._read_logs_sync("student01", None, offset, limit, None, range_header, False)
+
+    def test_empty_ranges_are_not_satisfiable(self):
+        for header in ("bytes=5-3", "bytes=-0"):
+            payload, result = self.read(header)
+            self.assertEqual(result, "range_not_satisfiable", header)
+            self.assertEqual(payload, {"size": 14})
+
+        payload, result = self.read("bytes=7-")
+        self.assertEqual(result, "success")
+        self.assertEqual(payload["content"], b"line 1\n")
+        self.assertEqual(payload["headers"]["Content-Range"], "bytes 7-13/14")
+
+    def test_limit_is_capped_but_absent_limit_reads_up_to_max(self):
+        with mock.patch.object(back_main, "LOG_RANGE_MAX_BYTES", 4):
+            self.assertEqual(self.read(offset=0, limit=2)[0]["content"], b"li")
+            self.assertEqual(self.read(offset=0, limit=100)[0]["content"], b"line")
+            self.assertEqual(self.read(offset=0)[0]["content"], b"line")
+
+    def test_follow_drains_rotated_file_before_switching(self):
+        payload, _ = self.read()
+
+        async def follow():
+            stream = back_main._follow_user_log(_ConnectedRequest(), "student01", payload["content"], payload["files"])
+            appended = ""
+            async for message in stream:
+                if message.startswith("event: snapshot"):
+                    # 회전: 활성 파일에 더 쓴 뒤 log1.log.1로 밀리고 새 log1.log가 생긴다.
+                    self.write(self.path, "line 2\nline 3\nline 4\n", "a")
+                    os.replace(self.path, self.path + ".1")
+                    self.write(self.path, "line 5\n")
+                elif message.startswith("event: append"):
+                    appended += json.loads(message.split("data: ", 1)[1])
+                    if "line 5" in appended:
+                        break
+            await stream.aclose()
+            return appended
+
+        with mock.patch.object(back_main, "LOG_RANGE_MAX_BYTES", 4), mock.patch.object(back_main, "LOG_FOLLOW_POLL_SEC", 0):
+            appended = asyncio.run(asyncio.wait_for(follow(), 5))
+        self.assertEqual(appended, "line 2\nline 3\nline 4\nline 5\n")
+
+    def test_follow_ends_after_snapshot_for_compressed_day(self):
+        # 보관 작업이 gzip으로 바꾼 지난 날짜가 최신이면 snapshot만 보내고 끝난다.
+        directory = os.path.join(self.log_base.name, "20000101", "user", "student02")
+        os.makedirs(directory)
+        with gzip.open(os.path.join(directory, "log1.log.gz"), "wb") as handle:
+            handle.write(b"old 0\nold 1\n")
+        payload, result = back_main._read_logs_sync("student02", None, None, None, None, None, False)
+        self.assertEqual(result, "success")
+        self.assertTrue(payload["files"][-1]["compressed"])
+
+        async def follow():
+            stream = back_main._follow_user_log(_ConnectedRequest(), "student02", payload["content"], payload["files"])
+            return [message async for message in stream]
+
+        with mock.patch.object(back_main, "LOG_FOLLOW_POLL_SEC", 0):
+            messages = asyncio.run(asyncio.wait_for(follow(), 5))
+        self.assertEqual(messages, [back_main._sse("snapshot", "old 0\nold 1\n")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+"""back/main.py 관리자 API 부하 벤치마크.
+
+합성 DB를 만든 뒤 여러 클라이언트가 동시에 관리자 API(유저 목록, 실행 기록, 진행 상황)를 부르고,
+그동안 writer 스레드가 자동화 서버처럼 learned_lecture를 계속 쓴다. DB를 읽지 않는 요청
+(`logs/index`, 기본 실행기 사용)의 지연도 같이 재서 DB 대기가 다른 요청을 막는지 본다.
+
+같은 부하를 두 번 돌린다.
+- dedicated: `utils/async_database`의 전용 DB 실행기 (DB_EXECUTOR_MAX_WORKERS)
+- shared: DB 호출도 이벤트 루프 기본 실행기에서 돌림 (전용 실행기 이전 동작)
+
+    cd server
+    python -m benchmarks.bench_back_endpoints --users 500 --lectures-per-user 50 --requests 2000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+# back/main.py가 import 시점에 읽는 값. 벤치마크용 임시 값을 쓴다.
+os.environ.setdefault("DB_ENCRYPTION_KEY_B64", base64.b64encode(os.urandom(32)).decode("utf-8"))
+os.environ.setdefault("INTERNAL_API_TOKEN", "bench-token")
+os.environ.setdefault("ADMIN_INITIAL_PASSWORD", "benchmark-admin-password")
+os.environ.setdefault("SESSION_SECRET_B64", base64.b64encode(os.urandom(32)).decode("utf-8"))
+os.environ.setdefault("LOG_CONSOLE", "false")
+
+import httpx  # noqa: E402
+
+import utils.async_database as adb  # noqa: E402
+import utils.database as db  # noqa: E402
+import utils.logger as logger_module  # noqa: E402
+from benchmarks.bench_database import _git_revision, _percentiles, seed  # noqa: E402
+from utils.db_backends import SQLiteBackend  # noqa: E402
+
+ENDPOINTS = {
+    "admin_users": "/api/admin/users",
+    "admin_runs": "/api/admin/runs?days=7&limit=100",
+    "admin_progress": "/api/admin/progress",
+    "logs_index": "/api/admin/user/bench0000000/logs/index",
+}
+# 대시보드가 여는 순서와 비슷한 비율
+WEIGHTS = {"admin_users": 1, "admin_runs": 3, "admin_progress": 6, "logs_index": 4}
+
+
+def _writer(nums: List[int], stop: threading.Event, worker: int, counts: List[int]) -> None:
+    index = 0
+    while not stop.is_set():
+        try:
+            db.add_learned_lecture(random.choice(nums), f"bench://back-writer{worker}/{index}")
+            counts[worker] += 1
+        except Exception:
+            pass
+        index += 1
+
+
+async def _drive(app, requests: int, concurrency: int) -> Dict[str, Any]:
+    names = [name for name, weight in WEIGHTS.items() for _ in range(weight)]
+    plan = [random.choice(names) for _ in range(requests)]
+    samples: Dict[str, List[float]] = {name: [] for name in ENDPOINTS}
+    errors: Dict[str, int] = {}
+    cursor = iter(plan)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://back") as client:
+
+        async def worker():
+            for name in cursor:
+                started = time.perf_counter()
+                response = await client.get(ENDPOINTS[name])
+                samples[name].append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors[name] = errors.get(name, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    result: Dict[str, Any] = {name: _percentiles(values) for name, values in samples.items()}
+    result["requests_per_sec"] = round(requests / wall, 2) if wall else 0.0
+    result["wall_sec"] = round(wall, 3)
+    result["errors"] = errors
+    return result
+
+
+def run_mode(app, mode: str, nums: List[int], args) -> Dict[str, Any]:
+    original_get_executor = adb.get_executor
+    if mode == "shared":
+        # run_in_executor(None, ...) → 이벤트 루프 기본 실행기
+        adb.get_executor = lambda: None
+    stop = threading.Event()
+    counts = [0] * args.writers
+    writers = [threading.Thread(target=_writer, args=(nums, stop, worker, counts), daemon=True) for worker in range(args.writers)]
+    for thread in writers:
+        thread.start()
+    try:
+        result = asyncio.run(_drive(app, args.requests, args.concurrency))
+    finally:
+        stop.set()
+        for thread in writers:
+            thread.join()
+        adb.get_executor = original_get_executor
+        adb.shutdown_executor(wait=True)
+    result["background_writes"] = sum(counts)
+    for name in ENDPOINTS:
+        print(f"[bench] {mode} {name}: p50 {result[name].get('p50_ms')} ms, p99 {result[name].get('p99_ms')} ms", flush=True)
+    print(f"[bench] {mode}: {result['requests_per_sec']} req/s, {result['background_writes']} background writes", flush=True)
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark back admin endpoints under concurrent load")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--lectures-per-user", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--writers", type=int, default=2, help="background add_learned_lecture threads")
+    parser.add_argument("--modes", default="dedicated,shared")
+    parser.add_argument("--output", default=os.path.join(SERVER_ROOT, "benchmarks", "results", "back_endpoints.json"))
+    parser.add_argument("--seed", type=int, default=1234)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    random.seed(args.seed)
+    with tempfile.TemporaryDirectory(prefix="hanyang-bench-back-") as temp_dir:
+        logger_module.LOG_BASE = os.path.join(temp_dir, "logs")
+        backend = SQLiteBackend(os.path.join(temp_dir, "hanyang.db"))
+        previous = db.set_backend(backend)
+        try:
+            seeded = seed(backend, args.users, args.lectures_per_user)
+            nums = [row[0] for row in db.get_all_users()]
+
+            import back.main as back_main
+
+            async def bench_admin():
+                return True
+
+            back_main.app.dependency_overrides[back_main.get_current_admin] = bench_admin
+            results: Dict[str, Any] = {
+                "benchmark": "back_endpoints",
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "git_revision": _git_revision(),
+                "python": platform.python_version(),
+                "db_executor_workers": adb.DB_EXECUTOR_MAX_WORKERS,
+                "users": args.users,
+                "lectures_per_user": args.lectures_per_user,
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "writers": args.writers,
+                "seed": seeded,
+                "modes": {mode: run_mode(back_main.app, mode, nums, args) for mode in args.modes.split(",") if mode},
+            }
+        finally:
+            db.set_backend(previous)
+            backend.close()
+            logger_module.flush_logs()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, ensure_ascii=False, indent=2)
+    print(f"[bench] results written to {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
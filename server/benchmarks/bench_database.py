@@ -0,0 +1,219 @@
+"""utils/database.py 벤치마크.
+
+합성 DB(기본 1k/10k/100k 유저, 유저당 수백 개 강의)를 만든 뒤
+유저 목록 조회, 동시 add_learned_lecture, get_learned_lectures, 상태 업데이트를 측정하고
+결과를 JSON 파일로 남긴다.
+
+    cd server
+    python -m benchmarks.bench_database --sizes 1000,10000 --output benchmarks/results/database.json
+"""
+
+import argparse
+import base64
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+# 벤치마크는 실제 비밀번호를 다루지 않으므로 키가 없으면 임시 키를 쓴다.
+os.environ.setdefault("DB_ENCRYPTION_KEY_B64", base64.b64encode(os.urandom(32)).decode("utf-8"))
+
+import utils.database as db  # noqa: E402
+from utils.db_backends import SQLiteBackend, StorageBackend  # noqa: E402
+
+SEED_BATCH_SIZE = 50_000
+STATUSES = ("active", "completed", "error")
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def pick(fraction: float) -> float:
+        index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+        return round(ordered[index] * 1000, 4)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 4),
+        "p50_ms": pick(0.50),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "max_ms": round(ordered[-1] * 1000, 4),
+    }
+
+
+def _timed_calls(func: Callable[..., Any], args_list: List[tuple]) -> List[float]:
+    samples = []
+    for args in args_list:
+        started = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def seed(backend: StorageBackend, users: int, lectures_per_user: int) -> Dict[str, Any]:
+    started = time.perf_counter()
+    backend.init_schema()
+    encrypted = db.encrypt_password("benchmark-password")
+    backend.executemany(
+        "INSERT INTO {user} (ID, PWD_Encrypted, Status) VALUES (?, ?, ?)",
+        ((f"bench{index:07d}", encrypted, STATUSES[index % len(STATUSES)]) for index in range(users)),
+    )
+    nums = [row[0] for row in backend.fetchall("SELECT NUM FROM {user} ORDER BY NUM")]
+    batch = []
+    for num in nums:
+        for lecture in range(lectures_per_user):
+            batch.append((num, f"https://learning.hanyang.ac.kr/courses/{lecture % 40}/modules/items/{num}{lecture:04d}"))
+        if len(batch) >= SEED_BATCH_SIZE:
+            backend.executemany("INSERT INTO Learned_Lecture (Account_ID, Lecture_ID) VALUES (?, ?)", batch)
+            batch = []
+    backend.executemany("INSERT INTO Learned_Lecture (Account_ID, Lecture_ID) VALUES (?, ?)", batch)
+    return {"seconds": round(time.perf_counter() - started, 3), "users": len(nums), "lectures": len(nums) * lectures_per_user}
+
+
+def bench_user_listing(repeats: int) -> Dict[str, Any]:
+    # back/main.py의 관리자 유저 목록과 같은 경로: 전체 유저 + 유저별 강의 조회
+    def list_users():
+        return [(row[0], row[1], row[3], row[4], db.get_learned_lectures(row[0])) for row in db.get_all_users()]
+
+    samples = _timed_calls(list_users, [()] * repeats)
+    return _percentiles(samples)
+
+
+def bench_get_learned_lectures(nums: List[int], samples: int) -> Dict[str, Any]:
+    picks = [(random.choice(nums),) for _ in range(samples)]
+    return _percentiles(_timed_calls(db.get_learned_lectures, picks))
+
+
+def bench_update_status(user_ids: List[str], samples: int) -> Dict[str, Any]:
+    picks = [(random.choice(user_ids), random.choice(STATUSES)) for _ in range(samples)]
+    return _percentiles(_timed_calls(db.update_user_status, picks))
+
+
+def bench_concurrent_add_learned(nums: List[int], writers: int, per_writer: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(writers)
+
+    def writer(worker: int):
+        local = []
+        barrier.wait()
+        for index in range(per_writer):
+            num = random.choice(nums)
+            started = time.perf_counter()
+            try:
+                db.add_learned_lecture(num, f"bench://writer{worker}/{index}")
+            except Exception as exc:
+                with lock:
+                    errors.append(type(exc).__name__)
+                continue
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=writer, args=(worker,)) for worker in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+    result = _percentiles(latencies)
+    result.update(
+        {
+            "writers": writers,
+            "per_writer": per_writer,
+            "wall_sec": round(wall, 4),
+            "ops_per_sec": round(len(latencies) / wall, 2) if wall else 0.0,
+            "errors": len(errors),
+        }
+    )
+    return result
+
+
+def run_size(backend: StorageBackend, users: int, args) -> Dict[str, Any]:
+    previous = db.set_backend(backend)
+    try:
+        seeded = seed(backend, users, args.lectures_per_user)
+        rows = db.get_all_users()
+        nums = [row[0] for row in rows]
+        user_ids = [row[1] for row in rows]
+        return {
+            "users": users,
+            "lectures_per_user": args.lectures_per_user,
+            "seed": seeded,
+            "user_listing": bench_user_listing(args.listing_repeats),
+            "get_learned_lectures": bench_get_learned_lectures(nums, args.samples),
+            "update_user_status": bench_update_status(user_ids, args.samples),
+            "add_learned_lecture_concurrent": bench_concurrent_add_learned(nums, args.writers, args.per_writer),
+        }
+    finally:
+        db.set_backend(previous)
+        backend.close()
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=SERVER_ROOT, text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark utils/database.py at production scale")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma separated user counts")
+    parser.add_argument("--lectures-per-user", type=int, default=200)
+    parser.add_argument("--samples", type=int, default=500, help="calls per single-operation benchmark")
+    parser.add_argument("--listing-repeats", type=int, default=3)
+    parser.add_argument("--writers", type=int, default=5, help="concurrent add_learned_lecture threads")
+    parser.add_argument("--per-writer", type=int, default=200)
+    parser.add_argument("--output", default=os.path.join(SERVER_ROOT, "benchmarks", "results", "database.json"))
+    parser.add_argument("--seed", type=int, default=1234)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    random.seed(args.seed)
+    sizes = [int(value) for value in args.sizes.split(",") if value.strip()]
+    results = {
+        "benchmark": "database",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "backend": "sqlite",
+        "runs": [],
+    }
+
+    with tempfile.TemporaryDirectory(prefix="hanyang-bench-") as temp_dir:
+        for users in sizes:
+            print(f"[bench] users={users} lectures_per_user={args.lectures_per_user}", flush=True)
+            run = run_size(SQLiteBackend(os.path.join(temp_dir, f"bench-{users}.db")), users, args)
+            results["runs"].append(run)
+            print(json.dumps({key: run[key] for key in ("users", "user_listing", "add_learned_lecture_concurrent")}), flush=True)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, ensure_ascii=False, indent=2)
+    print(f"[bench] results written to {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""utils/log_analytics.py 벤치마크.
+
+여러 주 분량의 재생 이벤트를 합성해 key=value 로그 줄 파싱 속도와, 시간 범위 + 차원 필터 +
+그룹 집계 질의 시간을 JSON으로 남긴다. numpy가 설치돼 있으면 배열 엔진, 없으면 파이썬 엔진으로 잰다.
+
+    cd server
+    python -m benchmarks.bench_log_analytics --days 28 --events-per-day 50000
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+os.environ.setdefault("LOG_CONSOLE", "false")
+
+from benchmarks.bench_database import _git_revision, _percentiles  # noqa: E402
+from utils import log_analytics  # noqa: E402
+from utils.log_analytics import EventStore, parse_text_line  # noqa: E402
+from utils.logger import render_fields  # noqa: E402
+
+EVENTS = ("playback_progressing", "playback_stalled", "playback_summary", "playback_confirmed", "lecture_skipped")
+STRATEGIES = ("front_clicked", "text_play_clicked", "play_control_clicked", "js_play_invoked")
+MARKERS = ("scheduled", "expired", "non_required")
+
+
+def synthetic_lines(days: int, per_day: int, users: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    start = time.time() - days * 86400
+    lines = []
+    for index in range(days * per_day):
+        ts = start + index * 86400 / per_day
+        event = rng.choice(EVENTS)
+        fields: Dict[str, Any] = {"event": event, "run_id": f"run-{index // 500}", "course_id": f"c{rng.randrange(40)}"}
+        if event == "playback_confirmed":
+            fields.update(strategy=rng.choice(STRATEGIES), wait_sec=round(rng.uniform(0.5, 3.0), 2))
+        elif event == "lecture_skipped":
+            fields["marker"] = rng.choice(MARKERS)
+        else:
+            fields["second"] = round(rng.uniform(0, 3600), 1)
+        stamp = datetime.fromtimestamp(ts, log_analytics.KST).strftime("%Y-%m-%d %H:%M:%S")
+        lines.append(f"[{stamp}][playback][INFO] {event}{render_fields(fields)}\t{rng.randrange(users)}")
+    return lines
+
+
+def time_queries(store: EventStore, days: int, repeats: int) -> Dict[str, Any]:
+    now = time.time()
+    queries = {
+        "stalls_per_course": dict(filters={"event": "playback_stalled"}, group_by="course_id"),
+        "confirm_wait_by_strategy": dict(filters={"event": "playback_confirmed"}, group_by="strategy", metric="wait_sec", agg="mean"),
+        "skips_by_marker_last_week": dict(start=now - 7 * 86400, filters={"event": "lecture_skipped"}, group_by="marker"),
+        "events_per_day": dict(start=now - days * 86400, group_by="day"),
+    }
+    results = {}
+    for name, kwargs in queries.items():
+        samples = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            store.query(**kwargs)
+            samples.append(time.perf_counter() - started)
+        results[name] = _percentiles(samples)
+        print(f"[bench] {name}: p50 {results[name]['p50_ms']} ms, p99 {results[name]['p99_ms']} ms", flush=True)
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark log event analytics")
+    parser.add_argument("--days", type=int, default=28)
+    parser.add_argument("--events-per-day", type=int, default=50000)
+    parser.add_argument("--users", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output", default=os.path.join(SERVER_ROOT, "benchmarks", "results", "log_analytics.json"))
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    lines = synthetic_lines(args.days, args.events_per_day, args.users)
+    store = EventStore()
+    minute_cache: Dict[str, float] = {}
+    started = time.perf_counter()
+    for line in lines:
+        text, _, user = line.rpartition("\t")
+        ts, subject, level, fields = parse_text_line(text, minute_cache)
+        store.append(ts, subject, level, user, fields)
+    ingest_sec = time.perf_counter() - started
+    print(f"[bench] ingested {len(lines)} lines in {ingest_sec:.2f} s ({len(lines) / ingest_sec:.0f} lines/s)", flush=True)
+
+    results: Dict[str, Any] = {
+        "benchmark": "log_analytics",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "engine": "numpy" if log_analytics.np is not None else "python",
+        "events": len(lines),
+        "ingest_lines_per_sec": round(len(lines) / ingest_sec),
+        "queries": time_queries(store, args.days, args.repeats),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, ensure_ascii=False, indent=2)
+    print(f"[bench] results written to {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
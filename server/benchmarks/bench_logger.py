@@ -0,0 +1,192 @@
+"""utils/logger.py 로그 호출 비용 벤치마크.
+
+재생 루프처럼 여러 스레드가 동시에 HanyangLogger.event를 부를 때, 호출한 스레드가
+돌아오기까지 걸리는 시간(producer 비용)을 기존 동기 방식(호출마다 날짜 문자열 계산,
+RotatingFileHandler/StreamHandler에 바로 쓰기)과 큐 + writer 스레드 방식으로 비교해 JSON으로 남긴다.
+
+    cd server
+    python -m benchmarks.bench_logger --threads 8 --per-thread 2000
+    python -m benchmarks.bench_logger --threads 8 --per-thread 200 --disk-latency-ms 2
+
+*_per_request 시나리오는 back처럼 호출마다 로거를 새로 얻고 run_id 컨텍스트를 붙인다.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Any, Callable, Dict, List, Optional
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+# 콘솔 출력은 벤치마크 결과를 가리므로 끈다. utils.logger를 import하기 전에 정해야 한다.
+os.environ.setdefault("LOG_CONSOLE", "false")
+
+import utils.logger as logger_module  # noqa: E402
+from benchmarks.bench_database import _git_revision, _percentiles  # noqa: E402
+from utils.logger import (  # noqa: E402
+    BACKUP_COUNT,
+    KST,
+    MAX_LOG_SIZE,
+    HanyangLogger,
+    flush_logs,
+    get_logger,
+    kst_time_converter,
+    render_fields,
+)
+
+
+class LegacyLogger:
+    """큐를 넣기 전 HanyangLogger와 같은 동작: 만들 때마다 handler를 다시 열고, 호출한 스레드에서 바로 포맷하고 쓴다."""
+
+    def __init__(self, log_type: str = 'system', user_id: Optional[str] = None, default_fields: Optional[Dict[str, Any]] = None):
+        self.log_type = log_type
+        self.user_id = user_id
+        self.default_fields = dict(default_fields or {})
+        self.logger = logging.getLogger(f"legacy_{log_type}_{user_id}")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self._setup_logger()
+
+    def _setup_logger(self):
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+        self.current_date = datetime.now(KST).strftime('%Y%m%d')
+        self.log_path = logger_module.get_log_path(self.log_type, self.user_id)
+        formatter = logging.Formatter(logger_module.LOG_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
+        formatter.converter = kst_time_converter
+        file_handler = RotatingFileHandler(self.log_path, maxBytes=MAX_LOG_SIZE, backupCount=BACKUP_COUNT, encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        self.logger.addHandler(file_handler)
+        console_handler = logging.StreamHandler(open(os.devnull, "w"))
+        console_handler.setFormatter(formatter)
+        self.logger.addHandler(console_handler)
+
+    def with_context(self, **fields):
+        return LegacyLogger(self.log_type, self.user_id, {**self.default_fields, **fields})
+
+    def log(self, level, subject, message, **fields):
+        current_date = datetime.now(KST).strftime('%Y%m%d')
+        if self.current_date != current_date:
+            self._setup_logger()
+        merged = self.default_fields.copy()
+        merged.update({key: value for key, value in fields.items() if value is not None})
+        rendered_message = f"{message}{render_fields(merged)}"
+        self.logger.log(logger_module.LOG_LEVELS.get(level, logging.INFO), rendered_message, extra={'subject': subject})
+
+    def event(self, subject, event, message="", level="INFO", **fields):
+        self.log(level, subject, message or event, event=event, **fields)
+
+
+def slow_disk(latency_sec: float) -> None:
+    """파일 flush마다 latency_sec만큼 멈추게 해서 느린 디스크를 흉내 낸다."""
+    original_flush = logging.StreamHandler.flush
+
+    def flush(handler):
+        original_flush(handler)
+        if latency_sec > 0 and hasattr(handler, "baseFilename"):
+            time.sleep(latency_sec)
+
+    logging.StreamHandler.flush = flush
+
+
+def drive(make_logger: Callable[[int], Any], threads: int, per_thread: int, per_request: bool = False) -> Dict[str, Any]:
+    """per_request면 back의 요청 처리처럼 호출마다 로거를 새로 얻고 컨텍스트를 붙인 뒤 한 줄 남긴다."""
+    dropped_before = logger_module.log_records_dropped.value()
+    latencies: List[List[float]] = [[] for _ in range(threads)]
+    loggers = [make_logger(index).with_context(run_id=f"run-{index}") for index in range(threads)]
+    barrier = threading.Barrier(threads)
+
+    def worker(index: int) -> None:
+        logger = loggers[index]
+        samples = latencies[index]
+        barrier.wait()
+        for tick in range(per_thread):
+            started = time.perf_counter()
+            if per_request:
+                logger = make_logger(index).with_context(run_id=f"run-{index}")
+            logger.event("automation", "playback_progress", media_second=tick, duration_sec=1800.0, lecture_title="테스트 강의")
+            samples.append(time.perf_counter() - started)
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    produce_wall = time.perf_counter() - started
+    flush_logs(timeout=60)
+    drain_wall = time.perf_counter() - started
+
+    result = _percentiles([sample for samples in latencies for sample in samples])
+    result.update(
+        {
+            "threads": threads,
+            "records": threads * per_thread,
+            "produce_wall_sec": round(produce_wall, 4),
+            "drain_wall_sec": round(drain_wall, 4),
+            "dropped": logger_module.log_records_dropped.value() - dropped_before,
+        }
+    )
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark producer-side logging cost")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--per-thread", type=int, default=2000)
+    parser.add_argument("--disk-latency-ms", type=float, default=0.0, help="simulated delay per file flush")
+    parser.add_argument("--output", default=os.path.join(SERVER_ROOT, "benchmarks", "results", "logger.json"))
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    results: Dict[str, Any] = {
+        "benchmark": "logger",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "queue_max_records": logger_module.LOG_QUEUE_MAX_RECORDS,
+        "queue_full_policy": logger_module.LOG_QUEUE_FULL_POLICY,
+        "disk_latency_ms": args.disk_latency_ms,
+        "runs": {},
+    }
+    slow_disk(args.disk_latency_ms / 1000)
+
+    with tempfile.TemporaryDirectory(prefix="hanyang-logs-") as log_base:
+        logger_module.LOG_BASE = log_base
+        scenarios = {
+            "sync": (lambda index: LegacyLogger("user", user_id=f"bench-sync-{index}"), False),
+            "queue": (lambda index: HanyangLogger("user", user_id=f"bench-queue-{index}"), False),
+            "sync_per_request": (lambda index: LegacyLogger("user", user_id=f"bench-sync-{index}"), True),
+            "registry_per_request": (lambda index: get_logger("user", user_id=f"bench-queue-{index}"), True),
+        }
+        for name, (make_logger, per_request) in scenarios.items():
+            run = drive(make_logger, args.threads, args.per_thread, per_request)
+            results["runs"][name] = run
+            print(
+                f"[bench] {name}: mean {run['mean_ms']} ms, p99 {run['p99_ms']} ms per call, drained in {run['drain_wall_sec']} s",
+                flush=True,
+            )
+        logger_module.shutdown_logging()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, ensure_ascii=False, indent=2)
+    print(f"[bench] results written to {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
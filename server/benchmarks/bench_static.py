@@ -0,0 +1,169 @@
+"""front/main.py 정적 파일 서빙 벤치마크.
+
+합성 SPA 빌드(index.html, 해시가 붙은 JS/CSS 번들, favicon)를 만든 뒤
+기존 방식(요청마다 os.path.exists + FileResponse, StaticFiles mount)과
+utils/static_assets 계층의 초당 요청 수와 전송 바이트를 비교해 JSON으로 남긴다.
+
+    cd server
+    python -m benchmarks.bench_static --requests 2000 --output benchmarks/results/static.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.staticfiles import StaticFiles
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+import front.main as front_main  # noqa: E402
+from benchmarks.bench_database import _git_revision, _percentiles  # noqa: E402
+from utils.static_assets import StaticSite, precompress  # noqa: E402
+
+PATHS = ("/", "/admin/dashboard", "/assets/index-3f9a1c2b.js", "/assets/index-8e7d6c5a.css", "/favicon.ico")
+
+
+def build_fake_dist(root: str) -> None:
+    rng = random.Random(7)
+    words = ["const", "function", "return", "React", "useState", "props", "className", "=>", "{", "}", "lecture", "admin"]
+    os.makedirs(os.path.join(root, "assets"))
+    with open(os.path.join(root, "index.html"), "w", encoding="utf-8") as handle:
+        handle.write(
+            "<!doctype html><html lang=\"ko\"><head><meta charset=\"UTF-8\"/><title>Hanyang</title>"
+            "<script type=\"module\" src=\"/assets/index-3f9a1c2b.js\"></script>"
+            "<link rel=\"stylesheet\" href=\"/assets/index-8e7d6c5a.css\"></head>"
+            "<body><div id=\"root\"></div></body></html>" + "<!-- padding -->" * 64
+        )
+    with open(os.path.join(root, "assets", "index-3f9a1c2b.js"), "w", encoding="utf-8") as handle:
+        handle.write(" ".join(rng.choice(words) for _ in range(60_000)))
+    with open(os.path.join(root, "assets", "index-8e7d6c5a.css"), "w", encoding="utf-8") as handle:
+        handle.write("".join(f".c{index}{{margin:{index % 9}px;color:#{index % 4096:03x}}}" for index in range(3000)))
+    with open(os.path.join(root, "favicon.ico"), "wb") as handle:
+        handle.write(bytes(rng.getrandbits(8) for _ in range(4286)))
+
+
+def legacy_app(spa_dist: str) -> FastAPI:
+    # 이 계층을 넣기 전 front/main.py의 라우트와 같은 동작
+    app = FastAPI()
+    assets_dist = os.path.join(spa_dist, "assets")
+    if os.path.exists(assets_dist):
+        app.mount("/assets", StaticFiles(directory=assets_dist), name="assets")
+
+    @app.get("/favicon.ico")
+    def favicon():
+        favicon_path = os.path.join(spa_dist, "favicon.ico")
+        if os.path.exists(favicon_path):
+            return FileResponse(favicon_path)
+        raise HTTPException(status_code=404, detail="Favicon not found")
+
+    @app.get("/", response_class=HTMLResponse)
+    @app.get("/admin/dashboard", response_class=HTMLResponse)
+    def serve_spa_routes():
+        index_path = os.path.join(spa_dist, "index.html")
+        if os.path.exists(index_path):
+            return FileResponse(index_path)
+        raise HTTPException(status_code=404, detail="index.html not found")
+
+    return app
+
+
+def current_app(spa_dist: str) -> FastAPI:
+    front_main.static_site = StaticSite(spa_dist).load()
+    return front_main.app
+
+
+async def drive(app: FastAPI, requests: int, concurrency: int, headers: Dict[str, str]) -> Dict[str, Any]:
+    transport = httpx.ASGITransport(app=app)
+    latencies: List[float] = []
+    transferred = 0
+    paths = [PATHS[index % len(PATHS)] for index in range(requests)]
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://front") as client:
+        queue = list(reversed(paths))
+
+        async def worker():
+            nonlocal transferred
+            while queue:
+                path = queue.pop()
+                started = time.perf_counter()
+                async with client.stream("GET", path, headers=headers) as response:
+                    # 전송량은 압축된 그대로 센다.
+                    size = sum([len(chunk) async for chunk in response.aiter_raw()])
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} -> {response.status_code}")
+                transferred += size
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    result = _percentiles(latencies)
+    result.update(
+        {
+            "requests": requests,
+            "concurrency": concurrency,
+            "wall_sec": round(wall, 4),
+            "requests_per_sec": round(requests / wall, 1) if wall else 0.0,
+            "bytes_per_request": round(transferred / requests, 1),
+        }
+    )
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark front static asset serving")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--output", default=os.path.join(SERVER_ROOT, "benchmarks", "results", "static.json"))
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    results: Dict[str, Any] = {
+        "benchmark": "static",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "paths": list(PATHS),
+        "runs": {},
+    }
+    scenarios = {
+        "identity": {"Accept-Encoding": "identity"},
+        "compressed": {"Accept-Encoding": "br, gzip"},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="hanyang-static-") as spa_dist:
+        build_fake_dist(spa_dist)
+        precompress(spa_dist)
+        apps = {"legacy": legacy_app(spa_dist), "static_assets": current_app(spa_dist)}
+        for app_name, app in apps.items():
+            for scenario, headers in scenarios.items():
+                key = f"{app_name}/{scenario}"
+                run = asyncio.run(drive(app, args.requests, args.concurrency, headers))
+                results["runs"][key] = run
+                print(f"[bench] {key}: {run['requests_per_sec']} req/s, {run['bytes_per_request']} B/req", flush=True)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, ensure_ascii=False, indent=2)
+    print(f"[bench] results written to {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+import os
+import shutil
+import tempfile
+
+# 테스트가 server/logs에 로그를 남기지 않도록 utils.logger를 import하기 전에 임시 디렉터리로 돌린다.
+_LOG_BASE = tempfile.mkdtemp(prefix="hanyang-test-logs-")
+os.environ.setdefault("LOG_BASE", _LOG_BASE)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    import utils.logger as logger_module
+
+    logger_module.shutdown_logging()
+    shutil.rmtree(_LOG_BASE, ignore_errors=True)
@@ -1,97 +1,163 @@
+import hmac
 import os
 import sys
-from fastapi import FastAPI, Request, HTTPException, Response
-from fastapi.responses import FileResponse, HTMLResponse
-from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Request, HTTPException, Response
+from fastapi.responses import HTMLResponse, StreamingResponse
 import httpx
 import json
 
 # sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from utils import metrics
+from utils.http_clients import CircuitOpenError, UpstreamClient
+from utils.static_assets import StaticSite
+
+BACKEND_URL = os.getenv("BACKEND_URL", "back:9000")
+# 로그인 확인은 작업 id + long-poll로 바뀌어서 요청 하나가 오래 걸리지 않는다.
+PROXY_TIMEOUT = httpx.Timeout(float(os.getenv("PROXY_TIMEOUT_SEC", "60")))
+# /metrics 스크래퍼용. 설정하지 않으면 /metrics는 항상 403이다 (front는 외부에 노출된다).
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN", "").strip()
+backend_client = UpstreamClient("back", f"http://{BACKEND_URL}", timeout=PROXY_TIMEOUT)
+
+FRONT_DIR = os.path.dirname(__file__)
+SPA_DIST = os.path.join(FRONT_DIR, 'web', 'dist', 'spa')
+PUBLIC_DIR = os.path.join(FRONT_DIR, 'web', 'client', 'public')
+# index.html과 작은 정적 파일은 시작할 때 메모리에 올려 두고 요청마다 디스크를 보지 않는다.
+static_site = StaticSite(SPA_DIST, fallback_dirs=[PUBLIC_DIR])
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    static_site.load()
+    await backend_client.start()
+    try:
+        yield
+    finally:
+        await backend_client.aclose()
+
+
 app = FastAPI(
     docs_url=None,
     redoc_url=None,
-    openapi_url=None
+    openapi_url=None,
+    lifespan=lifespan,
 )
 
-FRONT_DIR = os.path.dirname(__file__)
-SPA_DIST = os.path.join(FRONT_DIR, 'web', 'dist', 'spa')
-ASSETS_DIST = os.path.join(SPA_DIST, 'assets')
 
-if os.path.exists(ASSETS_DIST):
-    app.mount("/assets", StaticFiles(directory=ASSETS_DIST), name="assets")
+# RFC 9110 7.6.1: 프록시가 그대로 넘기면 안 되는 연결 단위 헤더
+HOP_BY_HOP_HEADERS = frozenset({
+    b"connection",
+    b"keep-alive",
+    b"proxy-authenticate",
+    b"proxy-authorization",
+    b"proxy-connection",
+    b"te",
+    b"trailer",
+    b"transfer-encoding",
+    b"upgrade",
+})
+PROXY_METHODS = ["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+
+
+def _forwardable_headers(raw_headers, drop=frozenset()):
+    # Connection 헤더에 나열된 이름도 hop-by-hop으로 취급한다.
+    connection_tokens = set()
+    for key, value in raw_headers:
+        if key.lower() == b"connection":
+            connection_tokens.update(token.strip().lower() for token in value.split(b","))
+    excluded = HOP_BY_HOP_HEADERS | connection_tokens | drop
+    return [(key, value) for key, value in raw_headers if key.lower() not in excluded]
+
+
+def _json_error(message, status_code, headers=None):
+    return Response(
+        content=json.dumps({"message": message}),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+async def _relay_body(upstream):
+    # 클라이언트가 중간에 끊어도 업스트림 연결이 풀로 돌아가도록 finally에서 닫는다.
+    try:
+        async for chunk in upstream.aiter_raw():
+            yield chunk
+    finally:
+        await upstream.aclose()
 
-BACKEND_URL = "back:9000"
-PROXY_TIMEOUT = httpx.Timeout(180.0)
 
-@app.api_route("/api/{path:path}", methods=["GET", "POST", "DELETE"])
+@app.api_route("/api/{path:path}", methods=PROXY_METHODS)
 async def proxy_api(request: Request, path: str):
-    url = f"http://{BACKEND_URL}/api/{path}"
-    headers = {key: value for key, value in request.headers.items() if key.lower() not in ('host', 'user-agent', 'content-length')}
+    url = httpx.URL(f"/api/{path}", query=request.url.query.encode("utf-8"))
+    headers = _forwardable_headers(request.headers.raw, drop=frozenset({b"host", b"user-agent"}))
+    has_body = "content-length" in request.headers or "transfer-encoding" in request.headers
 
     try:
-        async with httpx.AsyncClient(timeout=PROXY_TIMEOUT) as client:
-            if request.method == "GET":
-                response = await client.get(url, headers=headers)
-            elif request.method == "POST":
-                content_type = request.headers.get('content-type')
-                if content_type and 'application/json' in content_type:
-                    data = await request.json()
-                    response = await client.post(url, json=data, headers=headers)
-                else:
-                    response = await client.post(url, headers=headers)
-            elif request.method == "DELETE":
-                response = await client.delete(url, headers=headers)
-            else:
-                return Response(status_code=405)
-    except httpx.TimeoutException:
-        return Response(
-            content=json.dumps({"message": "계정 확인에 시간이 더 필요합니다. 잠시 후 다시 시도해주세요."}),
-            status_code=504,
-            media_type="application/json",
+        # 요청 본문은 파싱하지 않고 받은 그대로 흘려보낸다.
+        upstream = await backend_client.send_stream(
+            request.method,
+            url,
+            headers=headers,
+            content=request.stream() if has_body else None,
         )
-    except httpx.RequestError:
-        return Response(
-            content=json.dumps({"message": "백엔드 서버에 연결하지 못했습니다."}),
-            status_code=502,
-            media_type="application/json",
+    except CircuitOpenError:
+        return _json_error(
+            "백엔드 서버가 잠시 응답하지 않습니다. 잠시 후 다시 시도해주세요.",
+            503,
+            headers={"Retry-After": str(backend_client.breaker.retry_after())},
         )
+    except httpx.TimeoutException:
+        return _json_error("계정 확인에 시간이 더 필요합니다. 잠시 후 다시 시도해주세요.", 504)
+    except httpx.RequestError:
+        return _json_error("백엔드 서버에 연결하지 못했습니다.", 502)
+
+    # 압축된 본문도 풀지 않고 그대로 전달하므로 Content-Encoding/Length를 유지한다.
+    response = StreamingResponse(_relay_body(upstream), status_code=upstream.status_code)
+    response.raw_headers = _forwardable_headers(upstream.headers.raw)
+    return response
+
+
+def require_internal_request(request: Request):
+    received_token = request.headers.get("x-internal-token", "")
+    if not INTERNAL_API_TOKEN or not received_token or not hmac.compare_digest(received_token, INTERNAL_API_TOKEN):
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return True
+
+
+@app.get("/metrics", dependencies=[Depends(require_internal_request)])
+async def get_metrics():
+    """Prometheus 텍스트 형식의 메트릭(back 호출 지연/결과, 서킷 상태). X-Internal-Token이 있어야 한다."""
+    return Response(content=metrics.render_text(), media_type=metrics.CONTENT_TYPE)
+
 
-    response_headers = {key: value for key, value in response.headers.items() if key.lower() not in ('content-encoding', 'transfer-encoding')}
-    return Response(content=response.content, status_code=response.status_code, headers=response_headers)
+def _serve_static(request: Request, path: str):
+    response = static_site.respond(request, path)
+    if response is None:
+        raise HTTPException(status_code=404, detail=f"{path} not found")
+    return response
 
 
+@app.get("/assets/{path:path}")
+def assets(request: Request, path: str):
+    return _serve_static(request, f"assets/{path}")
 
 @app.get("/favicon.ico")
-def favicon():
-    favicon_path = os.path.join(SPA_DIST, "favicon.ico")
-    if os.path.exists(favicon_path):
-        return FileResponse(favicon_path)
-    raise HTTPException(status_code=404, detail="Favicon not found")
+def favicon(request: Request):
+    return _serve_static(request, "favicon.ico")
 
 @app.get("/robots.txt")
-def robots():
-    robots_path = os.path.join(SPA_DIST, "robots.txt")
-    if os.path.exists(robots_path):
-        return FileResponse(robots_path)
-    raise HTTPException(status_code=404, detail="robots.txt not found")
+def robots(request: Request):
+    return _serve_static(request, "robots.txt")
 
 @app.get("/placeholder.svg")
-def placeholder():
-    svg_path = os.path.join(SPA_DIST, "placeholder.svg")
-    if os.path.exists(svg_path):
-        return FileResponse(svg_path)
-    raise HTTPException(status_code=404, detail="placeholder.svg not found")
+def placeholder(request: Request):
+    return _serve_static(request, "placeholder.svg")
 
 @app.get("/hanyang_logo.png")
-def hanyang_logo():
-    logo_path = os.path.join(SPA_DIST, "hanyang_logo.png")
-    if os.path.exists(logo_path):
-        return FileResponse(logo_path)
-    logo_path = os.path.join(FRONT_DIR, 'web', 'client', 'public', 'hanyang_logo.png')
-    if os.path.exists(logo_path):
-        return FileResponse(logo_path)
-    raise HTTPException(status_code=404, detail="hanyang_logo.png not found")
+def hanyang_logo(request: Request):
+    return _serve_static(request, "hanyang_logo.png")
 
 @app.get("/", response_class=HTMLResponse)
 @app.get("/admin/login", response_class=HTMLResponse)
@@ -99,14 +165,8 @@ def hanyang_logo():
 @app.get("/admin/change-password", response_class=HTMLResponse)
 @app.get("/success", response_class=HTMLResponse)
 def serve_spa_routes(request: Request):
-    index_path = os.path.join(SPA_DIST, "index.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
-    raise HTTPException(status_code=404, detail="index.html not found")
+    return _serve_static(request, "index.html")
 
 @app.get("/{full_path:path}", response_class=HTMLResponse)
-def catch_all(full_path: str):
-    index_path = os.path.join(SPA_DIST, "index.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
-    raise HTTPException(status_code=404, detail="index.html not found")
+def catch_all(request: Request, full_path: str):
+    return _serve_static(request, "index.html")
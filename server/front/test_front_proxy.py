@@ -0,0 +1,97 @@
+import gzip
+import os
+import sys
+import unittest
+from unittest import mock
+
+import httpx
+from fastapi.testclient import TestClient
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+import front.main as front_main
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class FrontProxyTests(unittest.TestCase):
+    def setUp(self):
+        self.seen = []
+        self.orig_transport = front_main.backend_client.transport
+        front_main.backend_client.transport = httpx.MockTransport(self.handler)
+
+    def tearDown(self):
+        front_main.backend_client.transport = self.orig_transport
+
+    def handler(self, request):
+        self.seen.append(request)
+        if request.url.path.endswith("/logs"):
+            body = gzip.compress(b"line\n" * 1000)
+            return httpx.Response(
+                200,
+                headers=[
+                    ("Content-Encoding", "gzip"),
+                    ("Content-Type", "text/plain"),
+                    ("Connection", "close, X-Hop"),
+                    ("X-Hop", "1"),
+                    ("Set-Cookie", "a=1"),
+                    ("Set-Cookie", "b=2"),
+                ],
+                stream=ChunkedStream([body[:100], body[100:]]),
+            )
+        return httpx.Response(201, headers={"Content-Type": "application/json"}, stream=ChunkedStream([b'{"ok": true}']))
+
+    def test_raw_body_and_query_are_forwarded_without_hop_by_hop_headers(self):
+        raw = b'{"userId": "a",   "password": "b"}'
+        with TestClient(front_main.app) as client:
+            response = client.put(
+                "/api/user/login?x=1&y=2",
+                content=raw,
+                headers={"Content-Type": "application/json", "Proxy-Authorization": "secret", "X-Custom": "kept"},
+            )
+
+        self.assertEqual(response.status_code, 201)
+        request = self.seen[-1]
+        self.assertEqual(request.method, "PUT")
+        self.assertEqual(request.url.path, "/api/user/login")
+        self.assertEqual(request.url.query, b"x=1&y=2")
+        self.assertEqual(request.content, raw)
+        self.assertEqual(request.headers["x-custom"], "kept")
+        self.assertNotIn("proxy-authorization", request.headers)
+
+    def test_compressed_response_streams_through_untouched(self):
+        with TestClient(front_main.app) as client:
+            with client.stream("GET", "/api/admin/user/1/logs") as response:
+                raw = b"".join(response.iter_raw())
+                headers = response.headers
+
+        self.assertEqual(gzip.decompress(raw), b"line\n" * 1000)
+        self.assertEqual(headers["content-encoding"], "gzip")
+        self.assertEqual(headers.get_list("set-cookie"), ["a=1", "b=2"])
+        self.assertNotIn("x-hop", headers)
+        self.assertNotIn("connection", headers)
+
+
+class FrontMetricsTests(unittest.TestCase):
+    def test_metrics_require_configured_internal_token(self):
+        client = TestClient(front_main.app)
+        with mock.patch.object(front_main, "INTERNAL_API_TOKEN", ""):
+            self.assertEqual(client.get("/metrics", headers={"X-Internal-Token": ""}).status_code, 403)
+        with mock.patch.object(front_main, "INTERNAL_API_TOKEN", "front-token"):
+            self.assertEqual(client.get("/metrics", headers={"X-Internal-Token": "wrong"}).status_code, 403)
+            response = client.get("/metrics", headers={"X-Internal-Token": "front-token"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("# TYPE hanyang_upstream_requests_total counter", response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useCallback } from "react";
 import { useNavigate } from "react-router-dom";
 import { Users, CheckCircle, Clock, AlertTriangle, Trash2 } from "lucide-react";
 
@@ -10,6 +10,43 @@ interface User {
   courses: string[];
 }
 
+interface ChangeEvent {
+  type: string;
+  userId?: string;
+  userNum?: number;
+  status?: string;
+  lectureId?: string;
+  lane?: string;
+  queued?: number;
+  running?: number;
+  updates?: LectureProgress[];
+  cleared?: string[];
+}
+
+interface LectureProgress {
+  userId: string;
+  title: string;
+  percent: number | null;
+  etaSec: number | null;
+  heartbeatAt: number;
+}
+
+interface RunAnalytics {
+  days: number;
+  runs: { byOutcome: Record<string, number>; medianSec: number | null; p90Sec: number | null };
+  timeoutsByCourse: { courseId: string; timeouts: number; lectures: number; users: number }[];
+  sweeps: { sweepId: string; makespanSec: number | null; runs: number; running: number }[];
+}
+
+const LOG_TAIL_LINES = 500;
+const LOG_VIEW_MAX_CHARS = 500_000;
+
+const formatDuration = (seconds: number | null | undefined) => {
+  if (seconds === null || seconds === undefined) return "-";
+  const minutes = Math.round(seconds / 60);
+  return minutes >= 60 ? `${Math.floor(minutes / 60)}시간 ${minutes % 60}분` : `${minutes}분`;
+};
+
 export default function Dashboard() {
   const navigate = useNavigate();
   const [selectedUser, setSelectedUser] = useState<User | null>(null);
@@ -19,6 +56,9 @@ export default function Dashboard() {
   const [authChecked, setAuthChecked] = useState(false);
   const [auth, setAuth] = useState(false);
   const [users, setUsers] = useState<User[]>([]);
+  const [queue, setQueue] = useState<{ queued: number; running: number } | null>(null);
+  const [analytics, setAnalytics] = useState<RunAnalytics | null>(null);
+  const [progress, setProgress] = useState<Record<string, LectureProgress>>({});
 
   useEffect(() => {
     fetch("/api/admin/check-auth")
@@ -35,11 +75,7 @@ export default function Dashboard() {
       });
   }, [navigate]);
 
-  useEffect(() => {
-    if (!auth) {
-      return;
-    }
-
+  const loadUsers = useCallback(() => {
     fetch("/api/admin/users")
       .then(async (res) => {
         if (res.status === 401) {
@@ -56,7 +92,67 @@ export default function Dashboard() {
       })
       .then((data) => setUsers(data))
       .catch(() => setUsers([]));
-  }, [auth, navigate]);
+  }, [navigate]);
+
+  useEffect(() => {
+    if (!auth) {
+      return;
+    }
+
+    loadUsers();
+    fetch("/api/admin/analytics?days=7")
+      .then((res) => (res.ok ? res.json() : null))
+      .then((data) => setAnalytics(data))
+      .catch(() => setAnalytics(null));
+    fetch("/api/admin/progress")
+      .then((res) => (res.ok ? res.json() : []))
+      .then((data: LectureProgress[]) =>
+        setProgress(Object.fromEntries(data.map((item) => [item.userId, item]))),
+      )
+      .catch(() => setProgress({}));
+
+    // 목록을 다시 읽지 않고 자동화 서버의 변경분만 받아 반영한다.
+    const source = new EventSource("/api/admin/changes");
+    source.onmessage = (message) => {
+      const change = JSON.parse(message.data) as ChangeEvent;
+      if (change.type === "reset" || change.type === "user_added") {
+        loadUsers();
+      } else if (change.type === "user_status") {
+        setUsers((prev) =>
+          prev.map((user) =>
+            user.userId === change.userId ? { ...user, status: change.status as User["status"] } : user,
+          ),
+        );
+      } else if (change.type === "lecture_learned") {
+        setUsers((prev) =>
+          prev.map((user) =>
+            user.id === change.userNum && !user.courses.includes(change.lectureId as string)
+              ? { ...user, courses: [...user.courses, change.lectureId as string] }
+              : user,
+          ),
+        );
+      } else if (change.type === "user_deleted") {
+        setUsers((prev) =>
+          prev.filter((user) => user.userId !== change.userId && user.id !== change.userNum),
+        );
+      } else if (change.type === "lane" && change.lane === "automation") {
+        setQueue({ queued: change.queued ?? 0, running: change.running ?? 0 });
+      } else if (change.type === "progress") {
+        setProgress((prev) => {
+          const next = { ...prev };
+          (change.updates ?? []).forEach((item) => {
+            next[item.userId] = item;
+          });
+          (change.cleared ?? []).forEach((userId) => {
+            delete next[userId];
+          });
+          return next;
+        });
+      }
+    };
+
+    return () => source.close();
+  }, [auth, loadUsers]);
 
   // 로그아웃 핸들러
   const handleLogout = async () => {
@@ -84,6 +180,25 @@ export default function Dashboard() {
     navigate("/admin/change-password");
   };
 
+  // 로그 패널이 열려 있는 동안에는 새로 붙는 줄만 받아 이어 붙인다.
+  useEffect(() => {
+    if (!selectedUser || !showUserLogs) {
+      return;
+    }
+    const source = new EventSource(
+      `/api/admin/user/${selectedUser.userId}/logs?follow=true&tail=${LOG_TAIL_LINES}`,
+    );
+    source.addEventListener("snapshot", (message) => {
+      const text = JSON.parse((message as MessageEvent).data) as string;
+      setUserLog(text || "로그 내용이 비어 있습니다.");
+    });
+    source.addEventListener("append", (message) => {
+      const text = JSON.parse((message as MessageEvent).data) as string;
+      setUserLog((prev) => (prev + text).slice(-LOG_VIEW_MAX_CHARS));
+    });
+    return () => source.close();
+  }, [selectedUser, showUserLogs]);
+
   const selectUser = (user: User) => {
     if (selectedUser && selectedUser.id === user.id) {
       setSelectedUser(null);
@@ -102,7 +217,7 @@ export default function Dashboard() {
     setShowUserCourses(false);
     setUserLog("로그 불러오는 중...");
     try {
-      const res = await fetch(`/api/admin/user/${user.userId}/logs`);
+      const res = await fetch(`/api/admin/user/${user.userId}/logs?tail=${LOG_TAIL_LINES}`);
       if (res.ok) {
         const text = await res.text();
         setUserLog(text || "로그 내용이 비어 있습니다.");
@@ -151,6 +266,29 @@ export default function Dashboard() {
     }
   };
 
+  const handleRerunErrors = async () => {
+    if (!confirm("오류 상태인 유저만 자동 수강을 다시 시작하시겠습니까?")) {
+      return;
+    }
+    try {
+      const res = await fetch("/api/admin/users/rerun", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ status: "error" }),
+      });
+      if (res.ok) {
+        const result = await res.json();
+        alert(`성공: ${result.message}`);
+      } else {
+        const error = await res.json();
+        alert(`오류: ${error.detail || "알 수 없는 오류가 발생했습니다."}`);
+      }
+    } catch (error) {
+      console.error("Failed to rerun error users:", error);
+      alert("자동화 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.");
+    }
+  };
+
   const getStatusColor = (status: string) => {
     if (status === "active") return "#10B981";
     if (status === "completed") return "#3B82F6";
@@ -258,18 +396,67 @@ export default function Dashboard() {
           </div>
         </div>
 
+        {/* Run Analytics */}
+        {analytics && (
+          <div className="bg-white rounded-[12px] shadow-sm border border-[#E5E7EB] p-6 mb-8 max-sm:p-4">
+            <h2 className="text-[16px] font-semibold text-[#111827] mb-3">최근 {analytics.days}일 실행 통계</h2>
+            <div className="grid grid-cols-3 gap-6 text-[14px] text-[#374151] max-sm:grid-cols-1">
+              <div>
+                <p className="text-[#6B7280] mb-1">실행 시간 (중앙값 / p90)</p>
+                <p className="font-semibold">
+                  {formatDuration(analytics.runs.medianSec)} / {formatDuration(analytics.runs.p90Sec)}
+                </p>
+              </div>
+              <div>
+                <p className="text-[#6B7280] mb-1">최근 전체 실행 소요</p>
+                <p className="font-semibold">
+                  {analytics.sweeps.length > 0
+                    ? analytics.sweeps[0].running > 0
+                      ? `진행 중 (${analytics.sweeps[0].runs}명)`
+                      : `${formatDuration(analytics.sweeps[0].makespanSec)} (${analytics.sweeps[0].runs}명)`
+                    : "-"}
+                </p>
+              </div>
+              <div>
+                <p className="text-[#6B7280] mb-1">타임아웃이 잦은 과목</p>
+                <p className="font-semibold">
+                  {analytics.timeoutsByCourse.length > 0
+                    ? analytics.timeoutsByCourse
+                        .slice(0, 3)
+                        .map((course) => `${course.courseId} (${course.timeouts})`)
+                        .join(", ")
+                    : "없음"}
+                </p>
+              </div>
+            </div>
+          </div>
+        )}
+
         {/* User Management Table */}
         <div className="bg-white rounded-[12px] shadow-sm border border-[#E5E7EB]">
           <div className="flex justify-between items-center px-6 py-4 border-b border-[#E5E7EB] max-sm:px-4">
             <h2 className="text-[18px] font-semibold text-[#111827] max-sm:text-[16px]">
               유저 관리
+              {queue && (
+                <span className="ml-3 text-[13px] font-normal text-[#6B7280] max-sm:text-[11px]">
+                  실행 {queue.running} · 대기 {queue.queued}
+                </span>
+              )}
             </h2>
-            <button
-              onClick={handleTriggerAll}
-              className="px-4 py-2 bg-[#3B82F6] text-white rounded-[8px] hover:bg-[#2563EB] text-[14px] max-sm:px-2 max-sm:text-[12px]"
-            >
-              모든 유저 수강 시작
-            </button>
+            <div className="flex gap-2">
+              <button
+                onClick={handleRerunErrors}
+                className="px-4 py-2 bg-white text-[#EF4444] border border-[#EF4444] rounded-[8px] hover:bg-[#FEF2F2] text-[14px] max-sm:px-2 max-sm:text-[12px]"
+              >
+                오류 유저 재실행
+              </button>
+              <button
+                onClick={handleTriggerAll}
+                className="px-4 py-2 bg-[#3B82F6] text-white rounded-[8px] hover:bg-[#2563EB] text-[14px] max-sm:px-2 max-sm:text-[12px]"
+              >
+                모든 유저 수강 시작
+              </button>
+            </div>
           </div>
           <div className="overflow-x-auto">
             <table className="w-full">
@@ -314,6 +501,12 @@ export default function Dashboard() {
                       >
                         {getStatusText(user.status)}
                       </button>
+                      {progress[user.userId] && (
+                        <div className="mt-1 text-[12px] text-[#6B7280] truncate max-w-[240px]">
+                          {progress[user.userId].title} · {progress[user.userId].percent ?? 0}% · 남은{" "}
+                          {formatDuration(progress[user.userId].etaSec)}
+                        </div>
+                      )}
                     </td>
                     <td className="px-6 py-4 whitespace-nowrap text-[14px] font-medium max-sm:px-4">
                       <button
@@ -3,6 +3,37 @@ import { useNavigate } from "react-router-dom";
 import { Eye, EyeOff, FileText, X } from "lucide-react";
 import hanyangLogo from "../public/hanyang_logo.png";
 
+type LoginJob = {
+  jobId: string;
+  status: string;
+  message?: string;
+  version: number;
+  done: boolean;
+};
+
+const LOGIN_JOB_DEADLINE_MS = 5 * 60 * 1000;
+
+// 서버가 상태를 바꿀 때까지 기다렸다가 응답하는 long-poll을 끝날 때까지 반복한다.
+async function waitForLoginJob(job: LoginJob): Promise<LoginJob> {
+  const deadline = Date.now() + LOGIN_JOB_DEADLINE_MS;
+  let current = job;
+  while (!current.done && Date.now() < deadline) {
+    const res = await fetch(
+      `/api/user/login/${encodeURIComponent(current.jobId)}?version=${current.version}`,
+    );
+    const data = await res.json();
+    if (!res.ok) {
+      if (res.status === 502) {
+        await new Promise((resolve) => setTimeout(resolve, 2000));
+        continue;
+      }
+      return { ...current, status: "failed", message: data.message, done: true };
+    }
+    current = data;
+  }
+  return current;
+}
+
 export default function Index() {
   const [showPassword, setShowPassword] = useState(false);
   const [userId, setUserId] = useState("");
@@ -34,10 +65,17 @@ export default function Index() {
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({ userId, password }),
       });
-      if (res.ok) {
+      const data = await res.json();
+      if (res.status === 202) {
+        const job = await waitForLoginJob(data);
+        if (job.status === "succeeded") {
+          navigate("/success", { state: { userId } });
+        } else {
+          setError(job.done ? job.message || "로그인 실패" : "계정 확인이 지연되고 있습니다. 잠시 후 다시 시도해주세요.");
+        }
+      } else if (res.ok) {
         navigate("/success", { state: { userId } });
       } else {
-        const data = await res.json();
         setError(data.message || "로그인 실패");
       }
     } catch {
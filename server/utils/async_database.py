@@ -0,0 +1,114 @@
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import utils.database as db
+
+
+# 전용 DB 실행기: Starlette 공용 스레드풀과 분리해서 SQLite 잠금 대기가 다른 요청을 막지 않도록 한다.
+DB_EXECUTOR_MAX_WORKERS = max(1, int(os.getenv("DB_EXECUTOR_MAX_WORKERS", "4")))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_MAX_WORKERS, thread_name_prefix="db")
+        return _executor
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor:
+        executor.shutdown(wait=wait)
+
+
+async def run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """동기 DB 함수를 전용 실행기에서 실행하고 결과를 기다립니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+async def init_db():
+    return await run(db.init_db)
+
+
+async def add_user(user_id, plain_pwd, status="active"):
+    return await run(db.add_user, user_id, plain_pwd, status)
+
+
+async def update_user_pwd(user_id, plain_pwd):
+    return await run(db.update_user_pwd, user_id, plain_pwd)
+
+
+async def update_user_status(user_id, status):
+    return await run(db.update_user_status, user_id, status)
+
+
+async def get_user_by_id(user_id):
+    return await run(db.get_user_by_id, user_id)
+
+
+async def add_admin(admin_id, plain_pwd):
+    return await run(db.add_admin, admin_id, plain_pwd)
+
+
+async def update_admin_pwd(admin_id, plain_pwd):
+    return await run(db.update_admin_pwd, admin_id, plain_pwd)
+
+
+async def get_admin():
+    return await run(db.get_admin)
+
+
+async def verify_admin_password(stored_pwd, plain_pwd):
+    # PBKDF2 검증은 수십만 번 반복하므로 이벤트 루프에서 직접 돌리지 않는다.
+    return await run(db.verify_admin_password, stored_pwd, plain_pwd)
+
+
+async def add_learned_lecture(account_id, lecture_id):
+    return await run(db.add_learned_lecture, account_id, lecture_id)
+
+
+async def get_learned_lectures(account_id):
+    return await run(db.get_learned_lectures, account_id)
+
+
+async def delete_user(user_id):
+    return await run(db.delete_user, user_id)
+
+
+async def delete_user_by_num(user_num):
+    return await run(db.delete_user_by_num, user_num)
+
+
+async def delete_learned_lectures(account_id):
+    return await run(db.delete_learned_lectures, account_id)
+
+
+async def get_all_users():
+    return await run(db.get_all_users)
+
+
+async def find_users(nums=None, status=None, created_since=None, limit=None):
+    return await run(db.find_users, nums=nums, status=status, created_since=created_since, limit=limit)
+
+
+async def get_learned_lectures_for(account_ids):
+    return await run(db.get_learned_lectures_for, account_ids)
+
+
+async def get_progress(user_id):
+    return await run(db.get_progress, user_id)
+
+
+async def get_all_progress():
+    return await run(db.get_all_progress)
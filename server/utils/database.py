@@ -1,42 +1,16 @@
 import os
-import sqlite3
 from datetime import datetime
 import base64
 import hashlib
 import hmac
+import time
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad, unpad
 
+from utils.db_backends import SQLiteBackend, StorageBackend, get_backend as _get_backend, set_backend
 
-DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'hanyang.db')
 
-USER_TABLE = '''
-CREATE TABLE IF NOT EXISTS User (
-    NUM INTEGER PRIMARY KEY AUTOINCREMENT,
-    ID TEXT UNIQUE NOT NULL,
-    PWD_Encrypted TEXT NOT NULL,
-    Created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    Status TEXT NOT NULL
-);
-'''
-
-ADMIN_TABLE = '''
-CREATE TABLE IF NOT EXISTS Admin (
-    NUM INTEGER PRIMARY KEY,
-    ID TEXT UNIQUE NOT NULL,
-    PWD_Encrypted TEXT NOT NULL,
-    Modified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
-'''
-
-LEARNED_LECTURE_TABLE = '''
-CREATE TABLE IF NOT EXISTS Learned_Lecture (
-    Account_ID INTEGER NOT NULL,
-    Lecture_ID TEXT NOT NULL,
-    PRIMARY KEY (Account_ID, Lecture_ID),
-    FOREIGN KEY (Account_ID) REFERENCES User(NUM)
-);
-'''
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'hanyang.db')
 
 # AES 암호화/복호화 키 로딩: 우선순위 1) 환경변수(DB_ENCRYPTION_KEY_B64), 2) 파일 보관
 KEY_FILE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', '암호화 키.key')
@@ -164,19 +138,34 @@ def verify_admin_password(stored_pwd: str, plain_pwd: str) -> bool:
 def admin_password_needs_migration(stored_pwd: str) -> bool:
     return not is_admin_password_hashed(stored_pwd)
 
+# 변경 리스너: 자동화 서버가 대시보드 변경 알림을 받으려고 등록한다. (change_type, fields)
+_change_listeners = []
+
+def add_change_listener(listener):
+    _change_listeners.append(listener)
+
+def remove_change_listener(listener):
+    if listener in _change_listeners:
+        _change_listeners.remove(listener)
+
+def _notify_change(change_type, **fields):
+    for listener in list(_change_listeners):
+        try:
+            listener(change_type, fields)
+        except Exception:
+            # 알림 실패가 DB 쓰기를 실패로 만들면 안 된다.
+            pass
+
+def get_backend() -> StorageBackend:
+    """설정(DB_BACKEND)에 따라 선택된 저장소 구현체를 돌려준다."""
+    return _get_backend(DB_PATH)
+
+
 def get_conn():
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    # SQLite 동시성/신뢰성 향상 설정
-    try:
-        c = conn.cursor()
-        c.execute('PRAGMA journal_mode=WAL;')
-        c.execute('PRAGMA synchronous=NORMAL;')
-        c.execute('PRAGMA busy_timeout=5000;')  # ms
-        conn.commit()
-    except Exception:
-        pass
-    return conn
+    backend = get_backend()
+    if not isinstance(backend, SQLiteBackend):
+        raise RuntimeError(f"get_conn() is only available for the sqlite backend (current: {backend.name})")
+    return backend.connect()
 
 import secrets
 import string
@@ -187,129 +176,139 @@ def generate_random_password(length=12):
     return password
 
 def init_db():
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute(USER_TABLE)
-    c.execute(ADMIN_TABLE)
-    c.execute(LEARNED_LECTURE_TABLE)
-    conn.commit()
+    backend = get_backend()
+    backend.init_schema()
     # 어드민 계정이 없으면 생성
-    c.execute('SELECT * FROM Admin WHERE NUM = 1')
-    if not c.fetchone():
+    if not backend.get_admin():
         admin_password = os.getenv("ADMIN_INITIAL_PASSWORD", "").strip()
         if not admin_password or admin_password.lower() == "admin":
-            conn.close()
             raise ValueError(
                 "ADMIN_INITIAL_PASSWORD must be set to a non-default value before the first startup."
             )
         if len(admin_password) < 12:
-            conn.close()
             raise ValueError("ADMIN_INITIAL_PASSWORD must be at least 12 characters long.")
-        c.execute(
-            'INSERT INTO Admin (NUM, ID, PWD_Encrypted) VALUES (1, ?, ?)',
-            ('admin', hash_admin_password(admin_password)),
-        )
-        conn.commit()
-    conn.close()
+        backend.upsert_admin('admin', hash_admin_password(admin_password))
 
 def add_user(user_id, plain_pwd, status="active"):
-    pwd_encrypted = encrypt_password(plain_pwd)
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('INSERT INTO User (ID, PWD_Encrypted, Status) VALUES (?, ?, ?)', (user_id, pwd_encrypted, status))
-    conn.commit()
-    conn.close()
+    get_backend().add_user(user_id, encrypt_password(plain_pwd), status)
+    _notify_change("user_added", userId=user_id, status=status)
 
 def update_user_pwd(user_id, plain_pwd):
-    pwd_encrypted = encrypt_password(plain_pwd)
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('UPDATE User SET PWD_Encrypted = ? WHERE ID = ?', (pwd_encrypted, user_id))
-    conn.commit()
-    conn.close()
+    get_backend().update_user_pwd(user_id, encrypt_password(plain_pwd))
 
 def update_user_status(user_id, status):
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('UPDATE User SET Status = ? WHERE ID = ?', (status, user_id))
-    conn.commit()
-    conn.close()
+    get_backend().update_user_status(user_id, status)
+    _notify_change("user_status", userId=user_id, status=status)
 
 def get_user_by_id(user_id):
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('SELECT * FROM User WHERE ID = ?', (user_id,))
-    user = c.fetchone()
-    conn.close()
-    return user
+    return get_backend().get_user_by_id(user_id)
 
 def add_admin(admin_id, plain_pwd):
-    pwd_encrypted = hash_admin_password(plain_pwd)
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('INSERT OR REPLACE INTO Admin (NUM, ID, PWD_Encrypted) VALUES (1, ?, ?)', (admin_id, pwd_encrypted))
-    conn.commit()
-    conn.close()
+    get_backend().upsert_admin(admin_id, hash_admin_password(plain_pwd))
 
 def update_admin_pwd(admin_id, plain_pwd):
-    pwd_encrypted = hash_admin_password(plain_pwd)
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('UPDATE Admin SET PWD_Encrypted = ?, Modified_at = CURRENT_TIMESTAMP WHERE ID = ?', (pwd_encrypted, admin_id))
-    conn.commit()
-    conn.close()
+    get_backend().update_admin_pwd(admin_id, hash_admin_password(plain_pwd))
 
 def get_admin():
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('SELECT * FROM Admin WHERE NUM = 1')
-    admin = c.fetchone()
-    conn.close()
-    return admin
+    return get_backend().get_admin()
 
 def add_learned_lecture(account_id, lecture_id):
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('INSERT OR IGNORE INTO Learned_Lecture (Account_ID, Lecture_ID) VALUES (?, ?)', (account_id, lecture_id))
-    conn.commit()
-    conn.close()
+    get_backend().add_learned_lecture(account_id, lecture_id)
+    _notify_change("lecture_learned", userNum=account_id, lectureId=lecture_id)
 
 def get_learned_lectures(account_id):
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('SELECT Lecture_ID FROM Learned_Lecture WHERE Account_ID = ?', (account_id,))
-    lectures = c.fetchall()
-    conn.close()
-    return [row[0] for row in lectures]
+    return get_backend().get_learned_lectures(account_id)
 
 def delete_user(user_id):
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('DELETE FROM User WHERE ID = ?', (user_id,))
-    conn.commit()
-    conn.close()
+    get_backend().delete_user(user_id)
+    _notify_change("user_deleted", userId=user_id)
 
 def delete_user_by_num(user_num):
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('DELETE FROM User WHERE NUM = ?', (user_num,))
-    conn.commit()
-    conn.close()
+    get_backend().delete_user_by_num(user_num)
+    _notify_change("user_deleted", userNum=user_num)
 
 def delete_learned_lectures(account_id):
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('DELETE FROM Learned_Lecture WHERE Account_ID = ?', (account_id,))
-    conn.commit()
-    conn.close()
+    get_backend().delete_learned_lectures(account_id)
 
 def get_all_users():
-    conn = get_conn()
-    c = conn.cursor()
-    c.execute('SELECT * FROM User')
-    users = c.fetchall()
-    conn.close()
-    return users
+    return get_backend().get_all_users()
+
+def start_run(run_id, account_id, user_id, sweep_id=None, started_at=None):
+    get_backend().start_run(run_id, account_id, user_id, sweep_id, started_at if started_at is not None else time.time())
+
+def finish_run(run_id, outcome, elapsed_sec, learned_count=0, failure=None, finished_at=None):
+    get_backend().finish_run(
+        run_id, outcome, finished_at if finished_at is not None else time.time(), elapsed_sec, learned_count, failure
+    )
+
+def add_lecture_attempt(run_id, account_id, course_id, lecture_id, title, attempt, outcome, elapsed_sec, finished_at=None):
+    get_backend().add_lecture_attempt(
+        run_id, account_id, course_id, lecture_id, title, attempt, outcome, elapsed_sec,
+        finished_at if finished_at is not None else time.time(),
+    )
+
+def get_runs(since, user_id=None, limit=100):
+    return get_backend().get_runs(since, user_id=user_id, limit=limit)
+
+def get_run_summary(since):
+    """관리자 통계: 결과별 실행 수, 소요 시간 분위수, 과목별 타임아웃, sweep 소요 시간."""
+    backend = get_backend()
+    quantiles = backend.run_elapsed_quantiles(since, (0.5, 0.9))
+    return {
+        "since": since,
+        "runs": {
+            "byOutcome": backend.run_outcome_counts(since),
+            "medianSec": quantiles[0.5],
+            "p90Sec": quantiles[0.9],
+        },
+        "timeoutsByCourse": [
+            {"courseId": course_id, "timeouts": count, "lectures": lectures, "users": users}
+            for course_id, count, lectures, users in backend.lecture_outcomes_by_course(since, "timeout")
+        ],
+        "sweeps": [
+            {
+                "sweepId": sweep_id,
+                "startedAt": started_at,
+                "finishedAt": finished_at if not running else None,
+                "makespanSec": round(finished_at - started_at, 1) if finished_at and not running else None,
+                "runs": runs,
+                "running": running,
+            }
+            for sweep_id, started_at, finished_at, runs, running in backend.sweep_makespans(since)
+        ],
+    }
+
+def prune_runs(before):
+    return get_backend().prune_runs(before)
+
+_PROGRESS_KEYS = (
+    "userId", "runId", "courseId", "lectureId", "title", "mediaSecond",
+    "durationSec", "percent", "etaSec", "deadlineAt", "heartbeatAt",
+)
+
+def _progress_to_dict(row):
+    return dict(zip(_PROGRESS_KEYS, row)) if row else None
+
+def upsert_progress(rows):
+    get_backend().upsert_progress(rows)
+
+def delete_progress(user_ids):
+    get_backend().delete_progress(user_ids)
+
+def clear_progress():
+    return get_backend().clear_progress()
+
+def get_progress(user_id):
+    return _progress_to_dict(get_backend().get_progress(user_id))
+
+def get_all_progress():
+    return [_progress_to_dict(row) for row in get_backend().get_all_progress()]
+
+def find_users(nums=None, status=None, created_since=None, limit=None):
+    return get_backend().find_users(nums=nums, status=status, created_since=created_since, limit=limit)
+
+def get_learned_lectures_for(account_ids):
+    return get_backend().get_learned_lectures_for(account_ids)
 
 if __name__ == "__main__":
     init_db()
@@ -0,0 +1,542 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+
+# 저장소 선택: DB_BACKEND=sqlite(기본) | postgres
+DB_BACKEND = os.getenv("DB_BACKEND", "sqlite").strip().lower()
+DATABASE_URL = os.getenv("DATABASE_URL", "").strip()
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+
+SQLITE_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS User (
+        NUM INTEGER PRIMARY KEY AUTOINCREMENT,
+        ID TEXT UNIQUE NOT NULL,
+        PWD_Encrypted TEXT NOT NULL,
+        Created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        Status TEXT NOT NULL
+    );
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS Admin (
+        NUM INTEGER PRIMARY KEY,
+        ID TEXT UNIQUE NOT NULL,
+        PWD_Encrypted TEXT NOT NULL,
+        Modified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS Learned_Lecture (
+        Account_ID INTEGER NOT NULL,
+        Lecture_ID TEXT NOT NULL,
+        PRIMARY KEY (Account_ID, Lecture_ID),
+        FOREIGN KEY (Account_ID) REFERENCES User(NUM)
+    );
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS Run (
+        Run_ID TEXT PRIMARY KEY,
+        Account_ID INTEGER NOT NULL,
+        User_ID TEXT NOT NULL,
+        Sweep_ID TEXT,
+        Started_at REAL NOT NULL,
+        Finished_at REAL,
+        Elapsed_sec REAL,
+        Outcome TEXT NOT NULL,
+        Learned_count INTEGER NOT NULL DEFAULT 0,
+        Failure TEXT
+    );
+    ''',
+    'CREATE INDEX IF NOT EXISTS Run_Started_at ON Run (Started_at);',
+    'CREATE INDEX IF NOT EXISTS Run_Sweep_ID ON Run (Sweep_ID);',
+    '''
+    CREATE TABLE IF NOT EXISTS Lecture_Attempt (
+        Run_ID TEXT NOT NULL,
+        Account_ID INTEGER NOT NULL,
+        Course_ID TEXT NOT NULL,
+        Lecture_ID TEXT NOT NULL,
+        Title TEXT NOT NULL,
+        Attempt INTEGER NOT NULL,
+        Outcome TEXT NOT NULL,
+        Elapsed_sec REAL NOT NULL,
+        Finished_at REAL NOT NULL,
+        PRIMARY KEY (Run_ID, Lecture_ID, Attempt)
+    );
+    ''',
+    'CREATE INDEX IF NOT EXISTS Lecture_Attempt_Outcome ON Lecture_Attempt (Outcome, Finished_at);',
+    '''
+    CREATE TABLE IF NOT EXISTS Lecture_Progress (
+        User_ID TEXT PRIMARY KEY,
+        Run_ID TEXT NOT NULL,
+        Course_ID TEXT NOT NULL,
+        Lecture_ID TEXT NOT NULL,
+        Title TEXT NOT NULL,
+        Media_second REAL,
+        Duration_sec REAL,
+        Percent REAL,
+        Eta_sec REAL,
+        Deadline_at REAL,
+        Heartbeat_at REAL NOT NULL
+    );
+    ''',
+]
+
+# PostgreSQL에서 user는 예약어이므로 User 테이블만 따옴표로 감싼다.
+POSTGRES_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS "User" (
+        NUM INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+        ID TEXT UNIQUE NOT NULL,
+        PWD_Encrypted TEXT NOT NULL,
+        Created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        Status TEXT NOT NULL
+    );
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS Admin (
+        NUM INTEGER PRIMARY KEY,
+        ID TEXT UNIQUE NOT NULL,
+        PWD_Encrypted TEXT NOT NULL,
+        Modified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS Learned_Lecture (
+        Account_ID INTEGER NOT NULL,
+        Lecture_ID TEXT NOT NULL,
+        PRIMARY KEY (Account_ID, Lecture_ID)
+    );
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS Run (
+        Run_ID TEXT PRIMARY KEY,
+        Account_ID INTEGER NOT NULL,
+        User_ID TEXT NOT NULL,
+        Sweep_ID TEXT,
+        Started_at DOUBLE PRECISION NOT NULL,
+        Finished_at DOUBLE PRECISION,
+        Elapsed_sec DOUBLE PRECISION,
+        Outcome TEXT NOT NULL,
+        Learned_count INTEGER NOT NULL DEFAULT 0,
+        Failure TEXT
+    );
+    ''',
+    'CREATE INDEX IF NOT EXISTS Run_Started_at ON Run (Started_at);',
+    'CREATE INDEX IF NOT EXISTS Run_Sweep_ID ON Run (Sweep_ID);',
+    '''
+    CREATE TABLE IF NOT EXISTS Lecture_Attempt (
+        Run_ID TEXT NOT NULL,
+        Account_ID INTEGER NOT NULL,
+        Course_ID TEXT NOT NULL,
+        Lecture_ID TEXT NOT NULL,
+        Title TEXT NOT NULL,
+        Attempt INTEGER NOT NULL,
+        Outcome TEXT NOT NULL,
+        Elapsed_sec DOUBLE PRECISION NOT NULL,
+        Finished_at DOUBLE PRECISION NOT NULL,
+        PRIMARY KEY (Run_ID, Lecture_ID, Attempt)
+    );
+    ''',
+    'CREATE INDEX IF NOT EXISTS Lecture_Attempt_Outcome ON Lecture_Attempt (Outcome, Finished_at);',
+    '''
+    CREATE TABLE IF NOT EXISTS Lecture_Progress (
+        User_ID TEXT PRIMARY KEY,
+        Run_ID TEXT NOT NULL,
+        Course_ID TEXT NOT NULL,
+        Lecture_ID TEXT NOT NULL,
+        Title TEXT NOT NULL,
+        Media_second DOUBLE PRECISION,
+        Duration_sec DOUBLE PRECISION,
+        Percent DOUBLE PRECISION,
+        Eta_sec DOUBLE PRECISION,
+        Deadline_at DOUBLE PRECISION,
+        Heartbeat_at DOUBLE PRECISION NOT NULL
+    );
+    ''',
+]
+
+
+class StorageBackend:
+    """users / admin / learned lecture 저장소 인터페이스.
+
+    쿼리는 `?` 자리표시자와 `{user}` 테이블 이름으로 한 번만 작성하고,
+    각 구현체가 자기 드라이버 문법으로 바꿔 실행한다.
+    """
+
+    name = "base"
+    placeholder = "?"
+    user_table = "User"
+    schema: Sequence[str] = ()
+
+    @contextmanager
+    def connection(self):
+        raise NotImplementedError
+
+    def close(self) -> None:
+        return None
+
+    def _sql(self, query: str) -> str:
+        query = query.replace("{user}", self.user_table)
+        if self.placeholder != "?":
+            query = query.replace("?", self.placeholder)
+        return query
+
+    def execute(self, query: str, params: Sequence[Any] = ()) -> int:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._sql(query), tuple(params))
+            conn.commit()
+            return cursor.rowcount
+
+    def executemany(self, query: str, rows: Iterable[Sequence[Any]]) -> None:
+        rows = [tuple(row) for row in rows]
+        if not rows:
+            return
+        with self.connection() as conn:
+            conn.cursor().executemany(self._sql(query), rows)
+            conn.commit()
+
+    def fetchone(self, query: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._sql(query), tuple(params))
+            row = cursor.fetchone()
+            return tuple(row) if row is not None else None
+
+    def fetchall(self, query: str, params: Sequence[Any] = ()) -> List[tuple]:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._sql(query), tuple(params))
+            return [tuple(row) for row in cursor.fetchall()]
+
+    def _timestamp(self, value: datetime) -> Any:
+        # Created_at은 CURRENT_TIMESTAMP(UTC)로 채워진다. 비교 값도 UTC naive로 넘긴다.
+        return value
+
+    def init_schema(self) -> None:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for statement in self.schema:
+                cursor.execute(statement)
+            conn.commit()
+
+    # users
+    def add_user(self, user_id: str, pwd_encrypted: str, status: str) -> None:
+        self.execute('INSERT INTO {user} (ID, PWD_Encrypted, Status) VALUES (?, ?, ?)', (user_id, pwd_encrypted, status))
+
+    def update_user_pwd(self, user_id: str, pwd_encrypted: str) -> None:
+        self.execute('UPDATE {user} SET PWD_Encrypted = ? WHERE ID = ?', (pwd_encrypted, user_id))
+
+    def update_user_status(self, user_id: str, status: str) -> None:
+        self.execute('UPDATE {user} SET Status = ? WHERE ID = ?', (status, user_id))
+
+    def get_user_by_id(self, user_id: str) -> Optional[tuple]:
+        return self.fetchone('SELECT NUM, ID, PWD_Encrypted, Created_at, Status FROM {user} WHERE ID = ?', (user_id,))
+
+    def get_all_users(self) -> List[tuple]:
+        return self.fetchall('SELECT NUM, ID, PWD_Encrypted, Created_at, Status FROM {user} ORDER BY NUM')
+
+    def find_users(
+        self,
+        nums: Optional[Sequence[int]] = None,
+        status: Optional[str] = None,
+        created_since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[tuple]:
+        """조건을 모두 만족하는 유저를 쿼리 한 번으로 읽는다. 조건이 없으면 전체 유저."""
+        clauses, params = [], []
+        if nums is not None:
+            if not nums:
+                return []
+            clauses.append(f"NUM IN ({', '.join('?' for _ in nums)})")
+            params.extend(nums)
+        if status is not None:
+            clauses.append('Status = ?')
+            params.append(status)
+        if created_since is not None:
+            clauses.append('Created_at >= ?')
+            params.append(self._timestamp(created_since))
+        query = 'SELECT NUM, ID, PWD_Encrypted, Created_at, Status FROM {user}'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY NUM'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+        return self.fetchall(query, params)
+
+    def delete_user(self, user_id: str) -> None:
+        self.execute('DELETE FROM {user} WHERE ID = ?', (user_id,))
+
+    def delete_user_by_num(self, user_num: int) -> None:
+        self.execute('DELETE FROM {user} WHERE NUM = ?', (user_num,))
+
+    # admin
+    def get_admin(self) -> Optional[tuple]:
+        return self.fetchone('SELECT NUM, ID, PWD_Encrypted, Modified_at FROM Admin WHERE NUM = 1')
+
+    def upsert_admin(self, admin_id: str, pwd_encrypted: str) -> None:
+        self.execute(
+            'INSERT INTO Admin (NUM, ID, PWD_Encrypted) VALUES (1, ?, ?) '
+            'ON CONFLICT (NUM) DO UPDATE SET ID = excluded.ID, PWD_Encrypted = excluded.PWD_Encrypted, '
+            'Modified_at = CURRENT_TIMESTAMP',
+            (admin_id, pwd_encrypted),
+        )
+
+    def update_admin_pwd(self, admin_id: str, pwd_encrypted: str) -> None:
+        self.execute('UPDATE Admin SET PWD_Encrypted = ?, Modified_at = CURRENT_TIMESTAMP WHERE ID = ?', (pwd_encrypted, admin_id))
+
+    # learned lectures
+    def add_learned_lecture(self, account_id: int, lecture_id: str) -> None:
+        self.execute(
+            'INSERT INTO Learned_Lecture (Account_ID, Lecture_ID) VALUES (?, ?) ON CONFLICT DO NOTHING',
+            (account_id, lecture_id),
+        )
+
+    def get_learned_lectures(self, account_id: int) -> List[str]:
+        return [row[0] for row in self.fetchall('SELECT Lecture_ID FROM Learned_Lecture WHERE Account_ID = ?', (account_id,))]
+
+    def get_learned_lectures_for(self, account_ids: Sequence[int]) -> Dict[int, List[str]]:
+        lectures: Dict[int, List[str]] = {account_id: [] for account_id in account_ids}
+        if not lectures:
+            return lectures
+        rows = self.fetchall(
+            f"SELECT Account_ID, Lecture_ID FROM Learned_Lecture WHERE Account_ID IN ({', '.join('?' for _ in lectures)})",
+            list(lectures),
+        )
+        for account_id, lecture_id in rows:
+            lectures[account_id].append(lecture_id)
+        return lectures
+
+    def delete_learned_lectures(self, account_id: int) -> None:
+        self.execute('DELETE FROM Learned_Lecture WHERE Account_ID = ?', (account_id,))
+
+    # run history
+    def start_run(self, run_id: str, account_id: int, user_id: str, sweep_id: Optional[str], started_at: float) -> None:
+        self.execute(
+            'INSERT INTO Run (Run_ID, Account_ID, User_ID, Sweep_ID, Started_at, Outcome) VALUES (?, ?, ?, ?, ?, ?)',
+            (run_id, account_id, user_id, sweep_id, started_at, 'running'),
+        )
+
+    def finish_run(
+        self,
+        run_id: str,
+        outcome: str,
+        finished_at: float,
+        elapsed_sec: float,
+        learned_count: int,
+        failure: Optional[str] = None,
+    ) -> None:
+        self.execute(
+            'UPDATE Run SET Outcome = ?, Finished_at = ?, Elapsed_sec = ?, Learned_count = ?, Failure = ? WHERE Run_ID = ?',
+            (outcome, finished_at, elapsed_sec, learned_count, failure, run_id),
+        )
+
+    def add_lecture_attempt(
+        self,
+        run_id: str,
+        account_id: int,
+        course_id: str,
+        lecture_id: str,
+        title: str,
+        attempt: int,
+        outcome: str,
+        elapsed_sec: float,
+        finished_at: float,
+    ) -> None:
+        self.execute(
+            'INSERT INTO Lecture_Attempt (Run_ID, Account_ID, Course_ID, Lecture_ID, Title, Attempt, Outcome, Elapsed_sec, Finished_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT DO NOTHING',
+            (run_id, account_id, course_id, lecture_id, title, attempt, outcome, elapsed_sec, finished_at),
+        )
+
+    def get_runs(self, since: float, user_id: Optional[str] = None, limit: int = 100) -> List[tuple]:
+        query = (
+            'SELECT Run_ID, Account_ID, User_ID, Sweep_ID, Started_at, Finished_at, Elapsed_sec, Outcome, Learned_count, Failure '
+            'FROM Run WHERE Started_at >= ?'
+        )
+        params: List[Any] = [since]
+        if user_id is not None:
+            query += ' AND User_ID = ?'
+            params.append(user_id)
+        query += ' ORDER BY Started_at DESC LIMIT ?'
+        params.append(limit)
+        return self.fetchall(query, params)
+
+    def run_outcome_counts(self, since: float) -> Dict[str, int]:
+        rows = self.fetchall('SELECT Outcome, COUNT(*) FROM Run WHERE Started_at >= ? GROUP BY Outcome', (since,))
+        return {outcome: count for outcome, count in rows}
+
+    def run_elapsed_quantiles(self, since: float, quantiles: Sequence[float]) -> Dict[float, Optional[float]]:
+        """끝난 실행의 소요 시간 분위수. 정렬된 인덱스 위치에서 한 행씩만 읽는다."""
+        where = "FROM Run WHERE Started_at >= ? AND Elapsed_sec IS NOT NULL AND Outcome <> 'running'"
+        total = self.fetchone(f'SELECT COUNT(*) {where}', (since,))[0]
+        result: Dict[float, Optional[float]] = {}
+        for quantile in quantiles:
+            if not total:
+                result[quantile] = None
+                continue
+            offset = min(total - 1, int(quantile * (total - 1) + 0.5))
+            row = self.fetchone(f'SELECT Elapsed_sec {where} ORDER BY Elapsed_sec LIMIT 1 OFFSET ?', (since, offset))
+            result[quantile] = row[0] if row else None
+        return result
+
+    def lecture_outcomes_by_course(self, since: float, outcome: str, limit: int = 20) -> List[tuple]:
+        return self.fetchall(
+            'SELECT Course_ID, COUNT(*), COUNT(DISTINCT Lecture_ID), COUNT(DISTINCT Account_ID) FROM Lecture_Attempt '
+            'WHERE Outcome = ? AND Finished_at >= ? GROUP BY Course_ID ORDER BY COUNT(*) DESC, Course_ID LIMIT ?',
+            (outcome, since, limit),
+        )
+
+    def sweep_makespans(self, since: float, limit: int = 10) -> List[tuple]:
+        return self.fetchall(
+            "SELECT Sweep_ID, MIN(Started_at), MAX(Finished_at), COUNT(*), SUM(CASE WHEN Outcome = 'running' THEN 1 ELSE 0 END) "
+            'FROM Run WHERE Sweep_ID IS NOT NULL AND Started_at >= ? GROUP BY Sweep_ID ORDER BY MIN(Started_at) DESC LIMIT ?',
+            (since, limit),
+        )
+
+    # live lecture progress (실행 중인 유저당 한 행)
+    PROGRESS_COLUMNS = (
+        'User_ID, Run_ID, Course_ID, Lecture_ID, Title, Media_second, Duration_sec, Percent, Eta_sec, Deadline_at, Heartbeat_at'
+    )
+
+    def upsert_progress(self, rows: Iterable[Sequence[Any]]) -> None:
+        """유저별 최신 진행 상황을 한 번에 덮어쓴다. 행 순서는 PROGRESS_COLUMNS와 같다."""
+        updates = ', '.join(
+            f'{column.strip()} = excluded.{column.strip()}' for column in self.PROGRESS_COLUMNS.split(',')[1:]
+        )
+        self.executemany(
+            f'INSERT INTO Lecture_Progress ({self.PROGRESS_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) '
+            f'ON CONFLICT (User_ID) DO UPDATE SET {updates}',
+            rows,
+        )
+
+    def delete_progress(self, user_ids: Iterable[str]) -> None:
+        self.executemany('DELETE FROM Lecture_Progress WHERE User_ID = ?', [(user_id,) for user_id in user_ids])
+
+    def clear_progress(self) -> int:
+        return self.execute('DELETE FROM Lecture_Progress')
+
+    def get_progress(self, user_id: str) -> Optional[tuple]:
+        return self.fetchone(f'SELECT {self.PROGRESS_COLUMNS} FROM Lecture_Progress WHERE User_ID = ?', (user_id,))
+
+    def get_all_progress(self) -> List[tuple]:
+        return self.fetchall(f'SELECT {self.PROGRESS_COLUMNS} FROM Lecture_Progress ORDER BY User_ID')
+
+    def prune_runs(self, before: float) -> int:
+        self.execute('DELETE FROM Lecture_Attempt WHERE Finished_at < ?', (before,))
+        return self.execute("DELETE FROM Run WHERE Started_at < ? AND Outcome <> 'running'", (before,))
+
+
+class SQLiteBackend(StorageBackend):
+    name = "sqlite"
+    schema = SQLITE_SCHEMA
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _timestamp(self, value: datetime) -> Any:
+        # SQLite CURRENT_TIMESTAMP 문자열과 같은 형식이어야 문자열 비교가 맞는다.
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+
+    def connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        # SQLite 동시성/신뢰성 향상 설정
+        try:
+            c = conn.cursor()
+            # 새 파일에서만 적용된다. WAL 전환보다 먼저 지정해야 incremental vacuum이 가능하다.
+            c.execute('PRAGMA auto_vacuum=INCREMENTAL;')
+            c.execute('PRAGMA journal_mode=WAL;')
+            c.execute('PRAGMA synchronous=NORMAL;')
+            c.execute('PRAGMA busy_timeout=5000;')  # ms
+            conn.commit()
+        except Exception:
+            pass
+        return conn
+
+    @contextmanager
+    def connection(self):
+        conn = self.connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+class PostgresBackend(StorageBackend):
+    name = "postgres"
+    placeholder = "%s"
+    user_table = '"User"'
+    schema = POSTGRES_SCHEMA
+
+    def __init__(self, dsn: str, min_size: int = DB_POOL_MIN_SIZE, max_size: int = DB_POOL_MAX_SIZE):
+        if not dsn:
+            raise ValueError("DATABASE_URL must be set when DB_BACKEND=postgres.")
+        try:
+            from psycopg_pool import ConnectionPool
+        except ImportError as exc:
+            raise ValueError("DB_BACKEND=postgres requires the psycopg[pool] package.") from exc
+        self.dsn = dsn
+        self._pool = ConnectionPool(dsn, min_size=min_size, max_size=max(min_size, max_size), open=True)
+
+    @contextmanager
+    def connection(self):
+        with self._pool.connection() as conn:
+            yield conn
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+# 설정(백엔드 종류, 경로/DSN)별로 한 번만 만든다. set_backend로 정한 저장소가 있으면 그것이 우선이다.
+_backends: Dict[tuple, StorageBackend] = {}
+_override: Optional[StorageBackend] = None
+_backend_lock = threading.Lock()
+
+
+def _config_key(default_sqlite_path: str) -> tuple:
+    if DB_BACKEND == "sqlite":
+        return ("sqlite", os.path.abspath(default_sqlite_path))
+    return (DB_BACKEND, DATABASE_URL)
+
+
+def create_backend(default_sqlite_path: str) -> StorageBackend:
+    if DB_BACKEND == "sqlite":
+        return SQLiteBackend(default_sqlite_path)
+    if DB_BACKEND in {"postgres", "postgresql"}:
+        return PostgresBackend(DATABASE_URL)
+    raise ValueError(f"Unsupported DB_BACKEND: {DB_BACKEND}")
+
+
+def get_backend(default_sqlite_path: str) -> StorageBackend:
+    with _backend_lock:
+        if _override is not None:
+            return _override
+        key = _config_key(default_sqlite_path)
+        backend = _backends.get(key)
+        if backend is None:
+            backend = _backends[key] = create_backend(default_sqlite_path)
+        return backend
+
+
+def set_backend(backend: Optional[StorageBackend]) -> Optional[StorageBackend]:
+    """설정과 상관없이 쓸 저장소를 정하고 이전 값을 돌려준다. None이면 설정을 따른다. 테스트와 벤치마크용."""
+    global _override
+    with _backend_lock:
+        previous, _override = _override, backend
+        return previous
+
+
+def reset_backends() -> None:
+    """설정별로 만들어 둔 저장소를 모두 닫고 비운다. 다음 get_backend가 새로 만든다."""
+    with _backend_lock:
+        backends = list(_backends.values())
+        _backends.clear()
+    for backend in backends:
+        backend.close()
@@ -0,0 +1,193 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import utils.database as db
+from utils.db_backends import SQLiteBackend
+from utils.logger import KST
+from utils import metrics
+
+
+DB_MAINTENANCE_INTERVAL_MIN = int(os.getenv("DB_MAINTENANCE_INTERVAL_MIN", "30"))
+DB_INCREMENTAL_VACUUM_PAGES = int(os.getenv("DB_INCREMENTAL_VACUUM_PAGES", "1000"))
+DB_BACKUP_DIR = os.getenv("DB_BACKUP_DIR", "").strip() or os.path.join(os.path.dirname(db.DB_PATH), "backups")
+DB_BACKUP_KEEP = int(os.getenv("DB_BACKUP_KEEP", "7"))
+DB_BACKUP_HOUR = int(os.getenv("DB_BACKUP_HOUR", "4"))
+# 백업이 읽기 잠금을 얻을 때까지 기다리는 최대 시간
+DB_BACKUP_TIMEOUT_SEC = float(os.getenv("DB_BACKUP_TIMEOUT_SEC", "30"))
+# Run / Lecture_Attempt 보관 기간 (0이면 지우지 않음)
+RUN_HISTORY_KEEP_DAYS = int(os.getenv("RUN_HISTORY_KEEP_DAYS", "90"))
+
+AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+db_size_bytes = metrics.gauge("hanyang_db_size_bytes", "Size of the main SQLite database file")
+db_wal_size_bytes = metrics.gauge("hanyang_db_wal_size_bytes", "Size of the SQLite write-ahead log")
+db_freelist_pages = metrics.gauge("hanyang_db_freelist_pages", "Unused pages waiting for vacuum")
+db_maintenance_duration = metrics.histogram(
+    "hanyang_db_maintenance_duration_seconds",
+    "Duration of database maintenance tasks",
+    labelnames=("task",),
+)
+db_maintenance_failures = metrics.counter(
+    "hanyang_db_maintenance_failures_total",
+    "Database maintenance tasks that raised an error",
+    labelnames=("task",),
+)
+db_last_backup_timestamp = metrics.gauge("hanyang_db_last_backup_timestamp_seconds", "Unix time of the last successful backup")
+
+_maintenance_lock = threading.Lock()
+
+
+def _sqlite_backend() -> Optional[SQLiteBackend]:
+    backend = db.get_backend()
+    return backend if isinstance(backend, SQLiteBackend) else None
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def collect_db_sizes(backend: SQLiteBackend) -> Dict[str, int]:
+    sizes = {
+        "db_bytes": _file_size(backend.path),
+        "wal_bytes": _file_size(f"{backend.path}-wal"),
+    }
+    db_size_bytes.set(sizes["db_bytes"])
+    db_wal_size_bytes.set(sizes["wal_bytes"])
+    return sizes
+
+
+def _timed(task: str, report: Dict[str, Any], func, *args):
+    started = time.perf_counter()
+    try:
+        result = func(*args)
+    except Exception as exc:
+        db_maintenance_failures.inc(task=task)
+        report.setdefault("errors", {})[task] = str(exc)
+        return None
+    finally:
+        elapsed = time.perf_counter() - started
+        db_maintenance_duration.observe(elapsed, task=task)
+        report.setdefault("durations_sec", {})[task] = round(elapsed, 4)
+    return result
+
+
+def checkpoint_wal(conn: sqlite3.Connection) -> Dict[str, int]:
+    busy, log_frames, checkpointed = conn.execute("PRAGMA wal_checkpoint(TRUNCATE);").fetchone()
+    return {"busy": busy, "log_frames": log_frames, "checkpointed_frames": checkpointed}
+
+
+def analyze(conn: sqlite3.Connection) -> None:
+    conn.execute("ANALYZE;")
+    conn.commit()
+
+
+def incremental_vacuum(conn: sqlite3.Connection, pages: int = DB_INCREMENTAL_VACUUM_PAGES) -> Dict[str, Any]:
+    mode = AUTO_VACUUM_MODES.get(conn.execute("PRAGMA auto_vacuum;").fetchone()[0], "unknown")
+    before = conn.execute("PRAGMA freelist_count;").fetchone()[0]
+    if mode != "incremental":
+        # auto_vacuum 모드는 전체 VACUUM 이후에만 바뀌므로, 기존 파일은 여기서 건드리지 않는다.
+        db_freelist_pages.set(before)
+        return {"auto_vacuum": mode, "freed_pages": 0, "freelist_pages": before}
+    conn.execute(f"PRAGMA incremental_vacuum({max(0, int(pages))});").fetchall()
+    conn.commit()
+    after = conn.execute("PRAGMA freelist_count;").fetchone()[0]
+    db_freelist_pages.set(after)
+    return {"auto_vacuum": mode, "freed_pages": before - after, "freelist_pages": after}
+
+
+def run_maintenance() -> Dict[str, Any]:
+    """ANALYZE, incremental vacuum, WAL 체크포인트를 차례로 실행하고 결과를 돌려줍니다."""
+    backend = _sqlite_backend()
+    if backend is None:
+        return {"skipped": True, "reason": f"backend={db.get_backend().name}"}
+    if not _maintenance_lock.acquire(blocking=False):
+        return {"skipped": True, "reason": "maintenance_already_running"}
+
+    report: Dict[str, Any] = {"skipped": False}
+    try:
+        report["before"] = collect_db_sizes(backend)
+        conn = backend.connect()
+        try:
+            _timed("analyze", report, analyze, conn)
+            report["vacuum"] = _timed("incremental_vacuum", report, incremental_vacuum, conn)
+            # ANALYZE와 vacuum도 WAL에 기록되므로 체크포인트는 마지막에 한다.
+            report["checkpoint"] = _timed("wal_checkpoint", report, checkpoint_wal, conn)
+        finally:
+            conn.close()
+        report["after"] = collect_db_sizes(backend)
+        return report
+    finally:
+        _maintenance_lock.release()
+
+
+def prune_run_history(keep_days: int = RUN_HISTORY_KEEP_DAYS) -> Dict[str, Any]:
+    """보관 기간이 지난 실행 기록을 지웁니다. 저장소 종류와 상관없이 실행한다."""
+    if keep_days <= 0:
+        return {"skipped": True, "reason": "disabled"}
+    report: Dict[str, Any] = {"skipped": False, "keep_days": keep_days}
+    report["pruned_runs"] = _timed("prune_run_history", report, db.prune_runs, time.time() - keep_days * 86400)
+    return report
+
+
+def _prune_backups(backup_dir: str, keep: int) -> List[str]:
+    backups = sorted(
+        name for name in os.listdir(backup_dir) if name.startswith("hanyang-") and name.endswith(".db")
+    )
+    removed = []
+    for name in backups[: max(0, len(backups) - keep)]:
+        try:
+            os.remove(os.path.join(backup_dir, name))
+            removed.append(name)
+        except OSError:
+            continue
+    return removed
+
+
+def _copy_online(source_path: str, target_path: str) -> None:
+    source = sqlite3.connect(source_path, timeout=DB_BACKUP_TIMEOUT_SEC)
+    target = sqlite3.connect(target_path, timeout=DB_BACKUP_TIMEOUT_SEC)
+    try:
+        # 여러 단계로 나누면 다른 연결이 쓸 때마다 처음부터 다시 복사해서, 쓰기가 잦으면 끝나지 않는다.
+        # 한 단계(pages=-1)로 읽기 트랜잭션 하나 안에서 복사한다. WAL 모드라 그동안에도 쓰기는 진행된다.
+        source.backup(target, pages=-1)
+    finally:
+        target.close()
+        source.close()
+
+
+def backup_database(backup_dir: str = DB_BACKUP_DIR, keep: int = DB_BACKUP_KEEP) -> Dict[str, Any]:
+    """sqlite3 backup API로 온라인 스냅샷을 만들고 오래된 스냅샷을 정리합니다."""
+    backend = _sqlite_backend()
+    if backend is None:
+        return {"skipped": True, "reason": f"backend={db.get_backend().name}"}
+
+    os.makedirs(backup_dir, exist_ok=True)
+    timestamp = datetime.now(KST).strftime("%Y%m%d-%H%M%S")
+    target_path = os.path.join(backup_dir, f"hanyang-{timestamp}.db")
+    temp_path = f"{target_path}.partial"
+    report: Dict[str, Any] = {"skipped": False}
+    _timed("backup", report, _copy_online, backend.path, temp_path)
+    if "errors" in report:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return report
+
+    os.replace(temp_path, target_path)
+    db_last_backup_timestamp.set(time.time())
+    report.update(
+        {
+            "path": target_path,
+            "backup_bytes": _file_size(target_path),
+            "pruned": _prune_backups(backup_dir, keep),
+        }
+    )
+    return report
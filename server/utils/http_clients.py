@@ -0,0 +1,211 @@
+import importlib.util
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+
+from utils import metrics
+
+
+HTTP_CLIENT_MAX_CONNECTIONS = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "100"))
+HTTP_CLIENT_MAX_KEEPALIVE = int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE", "20"))
+HTTP_CLIENT_KEEPALIVE_EXPIRY_SEC = float(os.getenv("HTTP_CLIENT_KEEPALIVE_EXPIRY_SEC", "30"))
+# h2 패키지가 설치되어 있을 때만 실제로 켜진다.
+HTTP_CLIENT_HTTP2 = os.getenv("HTTP_CLIENT_HTTP2", "false").lower() in {"1", "true", "yes"}
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT_SEC = float(os.getenv("CIRCUIT_RESET_TIMEOUT_SEC", "30"))
+
+upstream_request_duration = metrics.histogram(
+    "hanyang_upstream_request_seconds",
+    "Latency of requests to internal upstream services",
+    labelnames=("upstream",),
+)
+upstream_requests = metrics.counter(
+    "hanyang_upstream_requests_total",
+    "Requests to internal upstream services by outcome",
+    labelnames=("upstream", "outcome"),
+)
+upstream_circuit_open = metrics.gauge(
+    "hanyang_upstream_circuit_open",
+    "1 while the circuit breaker for an upstream is open",
+    labelnames=("upstream",),
+)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """업스트림이 연속으로 실패해서 잠시 호출을 막고 있을 때 발생합니다."""
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_timeout_sec: float = CIRCUIT_RESET_TIMEOUT_SEC):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_sec = reset_timeout_sec
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                if now - self._opened_at < self.reset_timeout_sec:
+                    return False
+                self.state = self.HALF_OPEN
+            elif self.state == self.CLOSED:
+                return True
+            elif now - self._probe_started < self.reset_timeout_sec:
+                # 시험 요청의 결과가 나올 때까지 나머지는 막는다.
+                return False
+            # 대기 시간이 지나면 요청 하나만 시험 삼아 통과시킨다. 시험 요청이 취소돼 결과가 안 오면
+            # reset_timeout_sec 뒤에 다른 요청을 시험으로 보낸다.
+            self._probe_started = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probe_started = 0.0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_started = 0.0
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def retry_after(self) -> int:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return 0
+            if self.state == self.HALF_OPEN:
+                return 1
+            return max(1, int(self.reset_timeout_sec - (time.monotonic() - self._opened_at)))
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class UpstreamClient:
+    """내부 서비스 하나를 위한 keep-alive 커넥션 풀 + 서킷 브레이커."""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        timeout: float = 10.0,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = HTTP_CLIENT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_CLIENT_MAX_KEEPALIVE,
+        keepalive_expiry: float = HTTP_CLIENT_KEEPALIVE_EXPIRY_SEC,
+        http2: bool = HTTP_CLIENT_HTTP2,
+        breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        failure_statuses: Iterable[int] = (),
+    ):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and _http2_available()
+        self.breaker = breaker or CircuitBreaker()
+        # 기본으로는 연결 실패와 타임아웃만 장애로 센다. 응답 코드는 업스트림이 직접 만든 것일 수 있으므로
+        # (back이 automation 장애를 502로 돌려주는 경우 등) 장애로 셀 코드를 클라이언트마다 골라서 넣는다.
+        self.failure_statuses = frozenset(failure_statuses)
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                headers=self.headers,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
+            )
+        return self._client
+
+    async def start(self) -> None:
+        _ = self.client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _check_circuit(self) -> None:
+        if not self.breaker.allow():
+            upstream_requests.inc(upstream=self.name, outcome="circuit_open")
+            raise CircuitOpenError(f"{self.name} circuit is open; retry in {self.breaker.retry_after()}s")
+
+    def _record(self, started: float, outcome: str, failed: bool) -> None:
+        upstream_request_duration.observe(time.perf_counter() - started, upstream=self.name)
+        upstream_requests.inc(upstream=self.name, outcome=outcome)
+        if failed:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        upstream_circuit_open.set(1 if self.breaker.state == CircuitBreaker.OPEN else 0, upstream=self.name)
+
+    def _record_exception(self, started: float, exc: Exception) -> None:
+        if isinstance(exc, httpx.TimeoutException):
+            outcome = "timeout"
+        elif isinstance(exc, httpx.ConnectError):
+            outcome = "connect_error"
+        else:
+            outcome = "transport_error"
+        self._record(started, outcome, failed=True)
+
+    def _record_response(self, started: float, response: httpx.Response) -> None:
+        self._record(started, f"{response.status_code // 100}xx", failed=response.status_code in self.failure_statuses)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        self._check_circuit()
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.RequestError as exc:
+            self._record_exception(started, exc)
+            raise
+        self._record_response(started, response)
+        return response
+
+    async def send_stream(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """응답 헤더까지만 받고 돌려줍니다. 본문은 호출한 쪽이 읽은 뒤 aclose()해야 합니다."""
+        self._check_circuit()
+        request = self.client.build_request(method, url, **kwargs)
+        started = time.perf_counter()
+        try:
+            response = await self.client.send(request, stream=True)
+        except httpx.RequestError as exc:
+            self._record_exception(started, exc)
+            raise
+        self._record_response(started, response)
+        return response
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
@@ -0,0 +1,376 @@
+import json
+import math
+import os
+import re
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils import log_reader
+from utils.log_catalog import DEFAULT_LOG_NAME, LogCatalog
+from utils.logger import KST, LOG_JSONL_FILENAME
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 같은 질의를 파이썬 리스트로 계산한다.
+    np = None
+
+
+LOG_ANALYTICS_DAYS = int(os.getenv("LOG_ANALYTICS_DAYS", "28"))
+LOG_ANALYTICS_REFRESH_SEC = float(os.getenv("LOG_ANALYTICS_REFRESH_SEC", "30"))
+# refresh 한 번에 읽는 최대 바이트. 처음 쌓을 때 요청 하나가 며칠치 로그를 다 읽지 않게 나눈다.
+LOG_ANALYTICS_REFRESH_MAX_BYTES = int(os.getenv("LOG_ANALYTICS_REFRESH_MAX_BYTES", str(8 * 1024 * 1024)))
+READ_CHUNK_BYTES = 4 * 1024 * 1024
+KST_OFFSET_SEC = 9 * 3600
+
+# 열로 모아 두는 필드. 문자열은 사전 인코딩한 정수 코드로, 숫자는 float(없으면 NaN)로 둔다.
+# media 배열처럼 질의에 쓰지 않는 큰 필드는 버린다.
+DIMENSIONS = (
+    "event", "subject", "level", "user", "run_id", "course_id", "item_id", "lecture_title",
+    "stage", "strategy", "transition", "outcome", "reason", "marker", "source", "action", "phase",
+)
+MEASURES = ("second", "wait_sec", "elapsed_sec", "expected_duration_sec", "stalls", "rate", "suppressed", "ticks")
+TIME_BUCKETS = {"hour": 3600, "day": 86400}
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+_DAY_PATTERN = re.compile(r"^\d{8}$")
+_LINE_PATTERN = re.compile(r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}):(\d{2})\]\[([^\]]*)\]\[([A-Z]+)\] ")
+_VALUE = r'(?:"(?:[^"\\]|\\.)*"|\S*)'
+_FIELD_PATTERN = re.compile(r"(\w+)=(" + _VALUE + ")")
+_TAIL_PATTERN = re.compile(r"\w+=" + _VALUE + r"(?: \w+=" + _VALUE + r")*")
+
+
+def _unquote(value: str) -> Optional[str]:
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+    return None if value in ("", "-") else value
+
+
+def parse_text_line(line: str, minute_cache: Dict[str, float]) -> Optional[Tuple[float, str, str, Dict[str, Any]]]:
+    """`[시각][subject][LEVEL] message | key=value ...` 한 줄 → (ts, subject, level, fields). 형식이 다르면 None.
+
+    메시지에 ` | `가 들어 있을 수 있으니, 뒤쪽 전체가 key=value로 읽히는 첫 구분자를 필드 꼬리로 본다.
+    """
+    match = _LINE_PATTERN.match(line)
+    if not match:
+        return None
+    minute, second, subject, level = match.groups()
+    base = minute_cache.get(minute)
+    if base is None:
+        base = minute_cache[minute] = datetime.strptime(minute, "%Y-%m-%d %H:%M").replace(tzinfo=KST).timestamp()
+    rest = line[match.end():]
+    fields: Dict[str, Any] = {}
+    index = rest.find(" | ")
+    while index >= 0:
+        tail = rest[index + 3:]
+        if _TAIL_PATTERN.fullmatch(tail):
+            fields = {key: _unquote(value) for key, value in _FIELD_PATTERN.findall(tail)}
+            break
+        index = rest.find(" | ", index + 3)
+    return base + int(second), subject, level, fields
+
+
+def parse_json_line(line: str) -> Optional[Tuple[float, str, str, Dict[str, Any]]]:
+    """events.jsonl 한 줄 (utils.logger.event_json_line 스키마)."""
+    try:
+        payload = json.loads(line)
+        fields = dict(payload.get("fields") or {})
+        fields["event"] = payload.get("event")
+        fields["run_id"] = payload.get("run_id")
+        return float(payload["ts"]), payload.get("subject"), payload.get("level"), fields
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+class EventStore:
+    """이벤트를 열(column)별 배열로 모아 두고 시간 범위, 차원 필터, 그룹 집계를 계산합니다.
+
+    열은 처음부터 타입이 있는 `array`(차원 코드는 int, 숫자는 double)로 쌓는다. 차원은 사전 인코딩
+    (코드 0은 값 없음)하고, numpy가 있으면 질의 때 그 버퍼를 복사 없이 배열로 보고 마스크와 bincount로
+    계산한다. 없으면 같은 결과를 열을 돌며 계산한다.
+    """
+
+    def __init__(self):
+        self._codes_by_value: Dict[str, Dict[Optional[str], int]] = {name: {None: 0} for name in DIMENSIONS}
+        self._values: Dict[str, List[Optional[str]]] = {name: [None] for name in DIMENSIONS}
+        self._dimensions: Dict[str, array] = {name: array("i") for name in DIMENSIONS}
+        self._measures: Dict[str, array] = {name: array("d") for name in MEASURES}
+        self._ts = array("d")
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def append(self, ts: float, subject: Optional[str], level: Optional[str], user: Optional[str], fields: Dict[str, Any]) -> None:
+        row = dict(fields)
+        row.update({"subject": subject, "level": level, "user": user})
+        for name in DIMENSIONS:
+            value = row.get(name)
+            value = None if value is None else str(value)
+            codes = self._codes_by_value[name]
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(self._values[name])
+                self._values[name].append(value)
+            self._dimensions[name].append(code)
+        for name in MEASURES:
+            value = row.get(name)
+            try:
+                self._measures[name].append(float(value) if value is not None else math.nan)
+            except (TypeError, ValueError):
+                self._measures[name].append(math.nan)
+        self._ts.append(ts)
+
+    def values(self, dimension: str) -> List[str]:
+        return [value for value in self._values[dimension] if value is not None]
+
+    def _numpy_columns(self) -> Dict[str, Any]:
+        # array 버퍼를 그대로 보는 view다. view가 살아 있는 동안에는 array가 늘어날 수 없으므로
+        # 질의 안에서만 쓰고 버린다 (append와 query는 LogAnalytics의 lock으로 나뉜다).
+        columns = {"ts": self._ts, **self._dimensions, **self._measures}
+        return {
+            name: np.frombuffer(column, dtype=column.typecode) if len(column) else np.zeros(0, dtype=column.typecode)
+            for name, column in columns.items()
+        }
+
+    def query(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        filters: Optional[Dict[str, str]] = None,
+        group_by: Optional[str] = None,
+        metric: Optional[str] = None,
+        agg: str = "count",
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """filters는 차원 → 값. group_by는 차원 이름 또는 hour/day. agg가 count가 아니면 metric이 필요하다."""
+        codes = {}
+        for name, value in (filters or {}).items():
+            code = self._codes_by_value[name].get(value)
+            if code is None:
+                return {"matched": 0, "rows": []}
+            codes[name] = code
+        if np is not None:
+            keys, weights, matched = self._select_numpy(start, end, codes, group_by, metric)
+        else:
+            keys, weights, matched = self._select_python(start, end, codes, group_by, metric)
+
+        groups: Dict[int, List[float]] = {}
+        if np is not None and len(keys):
+            unique, inverse = np.unique(keys, return_inverse=True)
+            counts = np.bincount(inverse)
+            if weights is None:
+                stats = {"count": counts}
+            else:
+                valid = ~np.isnan(weights)
+                measured = np.bincount(inverse[valid], minlength=len(unique))
+                sums = np.bincount(inverse[valid], weights=weights[valid], minlength=len(unique))
+                mins = np.full(len(unique), np.inf)
+                maxs = np.full(len(unique), -np.inf)
+                np.minimum.at(mins, inverse[valid], weights[valid])
+                np.maximum.at(maxs, inverse[valid], weights[valid])
+                stats = {"count": counts, "measured": measured, "sum": sums, "min": mins, "max": maxs}
+            for position, key in enumerate(unique.tolist()):
+                groups[key] = [float(stats[name][position]) for name in ("count", "measured", "sum", "min", "max") if name in stats]
+        elif np is None:
+            for position, key in enumerate(keys):
+                group = groups.setdefault(key, [0, 0, 0.0, math.inf, -math.inf] if weights is not None else [0])
+                group[0] += 1
+                if weights is not None and not math.isnan(weights[position]):
+                    value = weights[position]
+                    group[1] += 1
+                    group[2] += value
+                    group[3] = min(group[3], value)
+                    group[4] = max(group[4], value)
+
+        rows = []
+        for key, group in groups.items():
+            row = {"key": self._label(group_by, key), "count": int(group[0])}
+            if weights is not None:
+                measured = group[1]
+                row["value"] = None if not measured else {
+                    "count": measured,
+                    "sum": group[2],
+                    "mean": group[2] / measured,
+                    "min": group[3],
+                    "max": group[4],
+                }[agg]
+            else:
+                row["value"] = int(group[0])
+            rows.append(row)
+        if group_by in TIME_BUCKETS:
+            rows.sort(key=lambda row: row["key"])
+        else:
+            rows.sort(key=lambda row: (row["value"] is None, -(row["value"] or 0), str(row["key"])))
+        return {"matched": int(matched), "rows": rows[:limit]}
+
+    @staticmethod
+    def _time_key(group_by: str, ts: float) -> int:
+        # KST 기준 시/일 경계로 자른다.
+        return int((ts + KST_OFFSET_SEC) // TIME_BUCKETS[group_by])
+
+    def _label(self, group_by: Optional[str], key: int):
+        if group_by is None:
+            return None
+        if group_by in TIME_BUCKETS:
+            moment = datetime.fromtimestamp(key * TIME_BUCKETS[group_by] - KST_OFFSET_SEC, KST)
+            return moment.strftime("%Y-%m-%d %H:00" if group_by == "hour" else "%Y-%m-%d")
+        return self._values[group_by][key]
+
+    def _select_numpy(self, start, end, codes, group_by, metric):
+        arrays = self._numpy_columns()
+        ts = arrays["ts"]
+        mask = np.ones(len(ts), dtype=bool)
+        if start is not None:
+            mask &= ts >= start
+        if end is not None:
+            mask &= ts < end
+        for name, code in codes.items():
+            mask &= arrays[name] == code
+        selected = np.flatnonzero(mask)
+        if group_by is None:
+            keys = np.zeros(len(selected), dtype=np.int64)
+        elif group_by in TIME_BUCKETS:
+            keys = ((ts[selected] + KST_OFFSET_SEC) // TIME_BUCKETS[group_by]).astype(np.int64)
+        else:
+            keys = arrays[group_by][selected]
+        weights = arrays[metric][selected] if metric else None
+        return keys, weights, len(selected)
+
+    def _select_python(self, start, end, codes, group_by, metric):
+        keys: List[int] = []
+        weights: Optional[List[float]] = [] if metric else None
+        columns = [(self._dimensions[name], code) for name, code in codes.items()]
+        group_column = self._dimensions[group_by] if group_by and group_by not in TIME_BUCKETS else None
+        measure = self._measures[metric] if metric else None
+        for index, ts in enumerate(self._ts):
+            if (start is not None and ts < start) or (end is not None and ts >= end):
+                continue
+            if any(column[index] != code for column, code in columns):
+                continue
+            if group_by is None:
+                keys.append(0)
+            elif group_column is None:
+                keys.append(self._time_key(group_by, ts))
+            else:
+                keys.append(group_column[index])
+            if weights is not None:
+                weights.append(measure[index])
+        return keys, weights, len(keys)
+
+
+class LogAnalytics:
+    """LOG_BASE의 로그를 읽어 EventStore에 쌓아 두고, 새로 붙은 부분만 이어서 읽습니다.
+
+    날짜·대상마다 events.jsonl이 있으면 그것을, 없으면 log1.log의 key=value 꼬리를 읽는다.
+    위치는 카탈로그의 "그날 로그를 이어 붙인 offset"으로 기억하므로 회전되거나 보관 작업이
+    gzip으로 압축해도 이미 읽은 줄을 다시 읽지 않는다.
+    refresh 한 번은 최근 날짜부터 max_bytes까지만 읽고, 다 못 읽었으면 complete가 False로 남는다.
+    back은 시작할 때 백그라운드에서 complete가 될 때까지 refresh를 이어 부른다.
+    """
+
+    def __init__(self, catalog: LogCatalog, days: int = LOG_ANALYTICS_DAYS):
+        self.catalog = catalog
+        self.days = days
+        self._lock = threading.Lock()
+        self._store = EventStore()
+        self._consumed: Dict[Tuple[str, str], Tuple[str, int]] = {}
+        self._oldest_day: Optional[str] = None
+        self.refreshed_at = 0.0
+        self.complete = False
+
+    def _day_targets(self, day: str) -> Iterable[str]:
+        day_dir = os.path.join(self.catalog.base_dir, day)
+        if os.path.isdir(os.path.join(day_dir, "system")):
+            yield "system"
+        user_dir = os.path.join(day_dir, "user")
+        if os.path.isdir(user_dir):
+            for name in sorted(os.listdir(user_dir)):
+                yield f"user/{name}"
+
+    def _ingest(self, target: str, day: str, budget: int) -> Tuple[int, int, bool]:
+        """(추가한 이벤트 수, 읽은 바이트, 끝까지 읽었는지)."""
+        key = (target, day)
+        name, consumed = self._consumed.get(key, (None, 0))
+        if name is None:
+            name = LOG_JSONL_FILENAME if self.catalog.files(target, day, LOG_JSONL_FILENAME) else DEFAULT_LOG_NAME
+        files = self.catalog.files(target, day, name)
+        total = log_reader.day_size(files)
+        user = target[len("user/"):] if target.startswith("user/") else None
+        minute_cache: Dict[str, float] = {}
+        added = read = 0
+        while consumed < total:
+            if read >= budget:
+                self._consumed[key] = (name, consumed)
+                return added, read, False
+            chunk = log_reader.read_range(files, consumed, min(READ_CHUNK_BYTES, total - consumed))
+            cut = chunk.rfind(b"\n") + 1
+            if not cut:
+                # 아직 줄바꿈이 안 붙은 마지막 줄은 다음 refresh에서 읽는다.
+                break
+            for line in chunk[:cut].decode("utf-8", errors="replace").splitlines():
+                parsed = parse_json_line(line) if name == LOG_JSONL_FILENAME else parse_text_line(line, minute_cache)
+                if parsed and parsed[3].get("event"):
+                    ts, subject, level, fields = parsed
+                    self._store.append(ts, subject, level, user, fields)
+                    added += 1
+            consumed += cut
+            read += cut
+        self._consumed[key] = (name, consumed)
+        return added, read, True
+
+    def refresh(self, now: Optional[float] = None, max_bytes: Optional[int] = None) -> int:
+        """보관 범위 안의 날짜를 최근 것부터 훑어 새 줄을 읽고, 추가한 이벤트 수를 돌려줍니다."""
+        now = time.time() if now is None else now
+        budget = LOG_ANALYTICS_REFRESH_MAX_BYTES if max_bytes is None else max_bytes
+        cutoff = (datetime.fromtimestamp(now, KST) - timedelta(days=self.days)).strftime("%Y%m%d")
+        base_dir = self.catalog.base_dir
+        days = sorted(
+            day for day in (os.listdir(base_dir) if os.path.isdir(base_dir) else [])
+            if _DAY_PATTERN.match(day) and day >= cutoff
+        )
+        with self._lock:
+            if self._oldest_day is not None and self._oldest_day < cutoff:
+                # 범위를 벗어난 날짜가 생기면 하루에 한 번 정도 통째로 다시 읽는다.
+                self._store = EventStore()
+                self._consumed = {}
+            added = 0
+            complete = True
+            for day in reversed(days):
+                for target in self._day_targets(day):
+                    count, read, done = self._ingest(target, day, budget)
+                    added += count
+                    budget -= read
+                    if not done:
+                        complete = False
+                        break
+                if not complete:
+                    break
+            self._oldest_day = days[0] if days else None
+            self.refreshed_at = now
+            self.complete = complete
+            return added
+
+    def refresh_if_stale(self, max_age_sec: float = LOG_ANALYTICS_REFRESH_SEC) -> None:
+        # 아직 다 쌓지 못했으면 요청마다 max_bytes만큼 더 읽는다.
+        if not self.complete or time.time() - self.refreshed_at >= max_age_sec:
+            self.refresh()
+
+    def query(self, **kwargs) -> Dict[str, Any]:
+        with self._lock:
+            started = time.perf_counter()
+            result = self._store.query(**kwargs)
+            result.update(
+                {
+                    "events": len(self._store),
+                    "complete": self.complete,
+                    "engine": "numpy" if np is not None else "python",
+                    "tookMs": round((time.perf_counter() - started) * 1000, 2),
+                }
+            )
+            return result
+
+    def dimension_values(self, dimension: str, limit: int = 200) -> List[str]:
+        with self._lock:
+            return sorted(self._store.values(dimension))[:limit]
@@ -0,0 +1,286 @@
+import fcntl
+import json
+import os
+import re
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+CATALOG_DIRNAME = "_catalog"
+DEFAULT_LOG_NAME = "log1.log"
+LOG_SUFFIXES = (".log", ".jsonl")
+COMPRESSED_SUFFIX = ".gz"
+_DAY_PATTERN = re.compile(r"^\d{8}$")
+
+
+def _sanitize(value: str) -> str:
+    # utils.logger.sanitize_filename과 같은 규칙 (logger가 이 모듈을 import하므로 따로 둔다)
+    return re.sub(r'[^a-zA-Z0-9_.-]', '', value)
+
+
+def locate(path: str) -> Optional[Tuple[str, int, bool]]:
+    """로그 파일 → (실제 경로, 압축 전 크기, 압축 여부). 보관 작업이 gzip으로 바꿨으면 `.gz`를 찾는다."""
+    try:
+        return path, os.path.getsize(path), False
+    except OSError:
+        pass
+    compressed = path + COMPRESSED_SUFFIX
+    try:
+        with open(compressed, "rb") as handle:
+            # gzip 끝 4바이트(ISIZE)가 압축 전 크기다. 로그 파일은 4GB보다 훨씬 작다.
+            handle.seek(-4, os.SEEK_END)
+            return compressed, struct.unpack("<I", handle.read(4))[0], True
+    except (OSError, struct.error):
+        return None
+
+
+class LogCatalog:
+    """로그 파일 목록을 `LOG_BASE/_catalog/<대상>.jsonl`에 남겨서 디렉터리를 훑지 않고 찾게 합니다.
+
+    대상은 `user/<id>` 또는 `system`이다. writer는 파일을 열거나 회전할 때만 한 줄을 덧붙이고
+    (O_APPEND라서 back과 automation 프로세스가 같이 써도 줄이 섞이지 않는다),
+    읽는 쪽은 그 줄들을 접어서 대상 → 날짜 → 파일(이름, 크기, 시작 offset)을 만든다.
+    읽은 위치를 기억해 두고 새로 붙은 줄만 접으며, 회전이나 보관 작업의 삭제 때는
+    접은 결과를 snapshot 한 벌로 다시 써서 파일이 계속 자라지 않게 한다.
+    카탈로그 파일이 없거나 깨졌으면 디스크를 한 번 훑어 다시 만든다.
+    """
+
+    def __init__(self, base_dir: str, backup_count: int = 10):
+        self.base_dir = base_dir
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        # 대상 → (카탈로그 첫 줄, 접은 위치, 접은 결과)
+        self._cache: Dict[str, Tuple[bytes, int, Dict[str, Dict[str, List[int]]]]] = {}
+
+    @property
+    def catalog_dir(self) -> str:
+        return os.path.join(self.base_dir, CATALOG_DIRNAME)
+
+    def _catalog_path(self, target: str) -> str:
+        return os.path.join(self.catalog_dir, target.replace("/", "__") + ".jsonl")
+
+    def _split(self, path: str) -> Optional[Tuple[str, str, str]]:
+        """로그 파일 경로 → (대상, 날짜, 파일 이름). LOG_BASE 밖이면 None."""
+        relative = os.path.relpath(os.path.abspath(path), os.path.abspath(self.base_dir))
+        parts = relative.split(os.sep)
+        if len(parts) < 3 or not _DAY_PATTERN.match(parts[0]):
+            return None
+        return "/".join(parts[1:-1]), parts[0], parts[-1]
+
+    def _append(self, target: str, entry: Dict[str, Any]) -> None:
+        os.makedirs(self.catalog_dir, exist_ok=True)
+        path = self._catalog_path(target)
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        while True:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                # compact()는 LOCK_EX를 잡고 파일을 바꿔 끼운다. 잠금을 얻은 뒤 연 파일이
+                # 이미 밀려난 것이면 새 파일로 다시 연다.
+                fcntl.flock(fd, fcntl.LOCK_SH)
+                try:
+                    current = os.stat(path).st_ino
+                except FileNotFoundError:
+                    continue
+                if os.fstat(fd).st_ino == current:
+                    os.write(fd, line.encode("utf-8"))
+                    return
+            finally:
+                os.close(fd)
+
+    # writer 쪽
+    def record_open(self, path: str) -> None:
+        located = self._split(path)
+        if located:
+            target, day, name = located
+            if not os.path.exists(self._catalog_path(target)):
+                # 카탈로그 이전부터 있던 날짜도 목록에 들어가도록 처음 한 번은 디스크에서 만든다.
+                self.rebuild(target)
+            self._append(target, {"op": "open", "day": day, "name": name, "ts": round(time.time(), 3)})
+
+    def record_rotate(self, path: str, size: int) -> None:
+        located = self._split(path)
+        if located:
+            target, day, name = located
+            self._append(target, {"op": "rotate", "day": day, "name": name, "size": size, "ts": round(time.time(), 3)})
+            self.compact(target)
+
+    def record_drop(self, target: str, day: str) -> None:
+        """보관 작업이 그날 로그를 지웠을 때 목록에서 뺀다."""
+        if os.path.exists(self._catalog_path(target)):
+            self._append(target, {"op": "drop", "day": day, "ts": round(time.time(), 3)})
+            self.compact(target)
+
+    def compact(self, target: str) -> None:
+        """쌓인 줄을 접은 결과 snapshot 한 벌로 바꿔 씁니다."""
+        path = self._catalog_path(target)
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            return
+        try:
+            # 잠금을 잡은 동안에는 다른 프로세스가 덧붙이지 못하므로 접은 결과가 파일 내용 전부다.
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            if os.fstat(fd).st_ino != os.stat(path).st_ino:
+                return
+            self._write_snapshot(target, self._load(target))
+        except FileNotFoundError:
+            return
+        finally:
+            os.close(fd)
+
+    # 읽는 쪽
+    @staticmethod
+    def target_for_user(user_id: str) -> str:
+        return f"user/{_sanitize(user_id)}"
+
+    def _fold(self, lines, days: Dict[str, Dict[str, List[int]]]) -> None:
+        # days[day][name] = 회전된 파일 크기 목록 (index 0이 name.1). 목록은 고치지 않고 새로 만든다.
+        for line in lines:
+            entry = json.loads(line)
+            if entry["op"] == "header":
+                continue
+            if entry["op"] == "drop":
+                days.pop(entry["day"], None)
+                continue
+            files = days.setdefault(entry["day"], {})
+            rotated = files.setdefault(entry["name"], [])
+            if entry["op"] == "rotate":
+                files[entry["name"]] = ([int(entry["size"])] + rotated)[: self.backup_count]
+            elif entry["op"] == "snapshot":
+                files[entry["name"]] = [int(size) for size in entry["rotated"]][: self.backup_count]
+
+    def _load(self, target: str) -> Dict[str, Dict[str, List[int]]]:
+        path = self._catalog_path(target)
+        with self._lock:
+            cached = self._cache.get(target)
+        try:
+            with open(path, "rb") as handle:
+                size = os.fstat(handle.fileno()).st_size
+                # snapshot을 쓸 때마다 첫 줄에 새 id를 넣으므로 첫 줄이 같으면 같은 파일이다.
+                # (inode는 바꿔 끼운 뒤 다시 쓰일 수 있어서 기준으로 삼지 않는다)
+                header = handle.readline()
+                if cached and cached[0] == header and cached[1] <= size:
+                    # 같은 파일이면 지난번 위치부터 새 줄만 접는다. 날짜별 dict만 얕게 복사해서
+                    # 이미 돌려준 결과를 읽는 쪽이 도중에 바뀐 값을 보지 않게 한다.
+                    if cached[1] == size:
+                        return cached[2]
+                    position = cached[1]
+                    days = {day: dict(files) for day, files in cached[2].items()}
+                else:
+                    position = 0
+                    days = {}
+                handle.seek(position)
+                data = handle.read(size - position)
+                # 덧붙이는 중인 마지막 줄은 다음 번에 접는다.
+                data = data[: data.rfind(b"\n") + 1]
+                self._fold(data.decode("utf-8").splitlines(), days)
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return self.rebuild(target)
+        with self._lock:
+            self._cache[target] = (header, position + len(data), days)
+        return days
+
+    def rebuild(self, target: str) -> Dict[str, Dict[str, List[int]]]:
+        """디스크를 훑어 대상의 카탈로그를 새로 씁니다. 카탈로그가 없을 때의 느린 경로."""
+        days: Dict[str, Dict[str, List[int]]] = {}
+        if os.path.isdir(self.base_dir):
+            for day in os.listdir(self.base_dir):
+                directory = os.path.join(self.base_dir, day, *target.split("/"))
+                if not _DAY_PATTERN.match(day) or not os.path.isdir(directory):
+                    continue
+                files: Dict[str, List[int]] = {}
+                for name in os.listdir(directory):
+                    # 회전된 파일(.1, .2 …)은 원래 이름 아래로 모은다. 실패 덤프 같은 다른 파일은 넣지 않는다.
+                    if name.endswith(COMPRESSED_SUFFIX):
+                        name = name[: -len(COMPRESSED_SUFFIX)]
+                    if not name.endswith(LOG_SUFFIXES) or name in files:
+                        continue
+                    rotated = []
+                    for index in range(1, self.backup_count + 1):
+                        found = locate(os.path.join(directory, f"{name}.{index}"))
+                        if found is None:
+                            break
+                        rotated.append(found[1])
+                    files[name] = rotated
+                if files:
+                    days[day] = files
+
+        self._write_snapshot(target, days)
+        return days
+
+    def _write_snapshot(self, target: str, days: Dict[str, Dict[str, List[int]]]) -> None:
+        os.makedirs(self.catalog_dir, exist_ok=True)
+        path = self._catalog_path(target)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        header = (json.dumps({"op": "header", "id": os.urandom(8).hex()}) + "\n").encode("utf-8")
+        lines = [header]
+        for day, files in sorted(days.items()):
+            for name, rotated in sorted(files.items()):
+                lines.append((json.dumps({"op": "snapshot", "day": day, "name": name, "rotated": rotated}) + "\n").encode("utf-8"))
+        data = b"".join(lines)
+        with open(temp_path, "wb") as handle:
+            handle.write(data)
+        os.replace(temp_path, path)
+        with self._lock:
+            self._cache[target] = (header, len(data), days)
+
+    def days(self, target: str) -> List[str]:
+        """로그가 있는 날짜, 최신순."""
+        return sorted(self._load(target), reverse=True)
+
+    def files(self, target: str, day: str, name: str = DEFAULT_LOG_NAME) -> List[Dict[str, Any]]:
+        """그날의 파일을 오래된 것부터. offset은 그날 로그 전체를 이어 붙였을 때의 시작 위치다.
+
+        gzip으로 압축된 날짜는 path가 `.gz`이고 compressed가 True다. size는 항상 압축 전 크기다.
+        """
+        rotated = self._load(target).get(day, {}).get(name)
+        if rotated is None:
+            return []
+        directory = os.path.join(self.base_dir, day, *target.split("/"))
+        result = []
+        offset = 0
+        # 회전된 파일 크기는 카탈로그 값을 쓰고, 활성 파일만 실제 크기를 본다.
+        entries = [(f"{name}.{index + 1}", size) for index, size in reversed(list(enumerate(rotated)))]
+        entries.append((name, None))
+        for file_name, recorded in entries:
+            found = locate(os.path.join(directory, file_name))
+            if found is None:
+                continue
+            path, size, compressed = found
+            size = size if recorded is None else recorded
+            result.append({"name": file_name, "path": path, "size": size, "offset": offset, "compressed": compressed})
+            offset += size
+        return result
+
+    def latest_file(self, target: str, name: str = DEFAULT_LOG_NAME) -> Optional[str]:
+        for day in self.days(target):
+            files = self.files(target, day, name)
+            if files:
+                return files[-1]["path"]
+        return None
+
+    def rebuild_all(self) -> int:
+        """디스크에 있는 모든 대상의 카탈로그를 다시 만들고 대상 수를 돌려줍니다."""
+        targets = set()
+        if os.path.isdir(self.base_dir):
+            for day in os.listdir(self.base_dir):
+                day_dir = os.path.join(self.base_dir, day)
+                if not _DAY_PATTERN.match(day) or not os.path.isdir(day_dir):
+                    continue
+                if os.path.isdir(os.path.join(day_dir, "system")):
+                    targets.add("system")
+                user_dir = os.path.join(day_dir, "user")
+                if os.path.isdir(user_dir):
+                    targets.update(f"user/{name}" for name in os.listdir(user_dir))
+        for target in targets:
+            self.rebuild(target)
+        return len(targets)
+
+
+if __name__ == "__main__":
+    import sys
+
+    base_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
+    print(f"[log-catalog] rebuilt {LogCatalog(base_dir).rebuild_all()} catalogs under {base_dir}")
@@ -0,0 +1,100 @@
+import gzip
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+TAIL_CHUNK_BYTES = 64 * 1024
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def day_size(files: List[Dict[str, Any]]) -> int:
+    return files[-1]["offset"] + files[-1]["size"] if files else 0
+
+
+def _open(entry: Dict[str, Any]):
+    # 보관 작업이 압축한 날짜도 같은 offset으로 읽는다. gzip seek는 앞에서부터 풀어 가므로 닫힌 날짜에만 쓰인다.
+    return gzip.open(entry["path"], "rb") if entry.get("compressed") else open(entry["path"], "rb")
+
+
+def read_range(files: List[Dict[str, Any]], offset: int, limit: int) -> bytes:
+    """그날 파일들을 이어 붙인 것으로 보고 [offset, offset + limit) 바이트를 읽습니다.
+
+    files는 LogCatalog.files()의 결과(오래된 것부터, offset/size 포함)다.
+    """
+    end = offset + limit
+    chunks = []
+    for entry in files:
+        start, stop = entry["offset"], entry["offset"] + entry["size"]
+        if stop <= offset or start >= end:
+            continue
+        with _open(entry) as handle:
+            handle.seek(max(offset - start, 0))
+            chunks.append(handle.read(min(stop, end) - max(offset, start)))
+    return b"".join(chunks)
+
+
+def tail_lines(files: List[Dict[str, Any]], lines: int) -> Tuple[bytes, int]:
+    """마지막 lines줄과 그 시작 offset. 최신 파일 끝에서부터 거꾸로 읽어 필요한 만큼만 읽는다."""
+    if lines <= 0 or not files:
+        return b"", day_size(files)
+    chunks: List[bytes] = []
+    newlines = 0
+    for entry in reversed(files):
+        position = entry["size"]
+        with _open(entry) as handle:
+            while position > 0:
+                # 압축 파일은 거꾸로 seek할 수 없으니 한 번에 푼다.
+                step = position if entry.get("compressed") else min(TAIL_CHUNK_BYTES, position)
+                position -= step
+                handle.seek(position)
+                chunk = handle.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+                # 끝의 줄바꿈까지 세므로 lines줄의 시작을 알려면 줄바꿈이 하나 더 필요하다.
+                if newlines > lines:
+                    return _last_lines(b"".join(reversed(chunks)), lines, entry["offset"] + position)
+    return _last_lines(b"".join(reversed(chunks)), lines, 0)
+
+
+def _last_lines(data: bytes, lines: int, start_offset: int) -> Tuple[bytes, int]:
+    cut = len(data) - 1 if data.endswith(b"\n") else len(data)
+    for _ in range(lines):
+        cut = data.rfind(b"\n", 0, cut)
+        if cut < 0:
+            return data, start_offset
+    return data[cut + 1:], start_offset + cut + 1
+
+
+def parse_range(header: Optional[str], total: int) -> Optional[Tuple[int, int]]:
+    """`Range: bytes=a-b` 하나만 지원한다. (offset, limit) 또는 형식이 맞지 않으면 None."""
+    if not header:
+        return None
+    match = _RANGE_PATTERN.match(header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        length = min(int(last), total)
+        return total - length, length
+    start = int(first)
+    stop = min(int(last), total - 1) if last else total - 1
+    return start, max(stop - start + 1, 0)
+
+
+def read_new_bytes(path: str, position: int, limit: int) -> bytes:
+    try:
+        with open(path, "rb") as handle:
+            handle.seek(position)
+            return handle.read(limit)
+    except OSError:
+        return b""
+
+
+def file_identity(path: str) -> Optional[Tuple[int, int]]:
+    """(inode, size). 회전되면 같은 경로의 inode가 바뀐다."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size
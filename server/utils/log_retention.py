@@ -0,0 +1,216 @@
+import gzip
+import os
+import re
+import shutil
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils import metrics
+from utils.log_catalog import COMPRESSED_SUFFIX, LogCatalog
+import utils.logger as log_module
+
+
+LOG_RETENTION_INTERVAL_MIN = int(os.getenv("LOG_RETENTION_INTERVAL_MIN", "60"))
+# 오늘로부터 며칠 지난 날짜를 gzip으로 압축할지 (0이면 압축하지 않음)
+LOG_COMPRESS_AFTER_DAYS = int(os.getenv("LOG_COMPRESS_AFTER_DAYS", "1"))
+# 마지막 수정 후 이만큼 지난 파일만 압축한다. 자정 직후 늦게 도착한 레코드를 기다린다.
+LOG_COMPRESS_MIN_IDLE_SEC = float(os.getenv("LOG_COMPRESS_MIN_IDLE_SEC", "3600"))
+# 날짜 디렉터리 보관 기간 (0이면 지우지 않음)
+LOG_RETENTION_DAYS = int(os.getenv("LOG_RETENTION_DAYS", "30"))
+# 유저 하나 / 전체 로그 용량 상한 (0이면 제한 없음). 넘으면 오래된 날짜부터 지운다.
+LOG_USER_MAX_BYTES = int(os.getenv("LOG_USER_MAX_BYTES", str(200 * 1024 * 1024)))
+LOG_TOTAL_MAX_BYTES = int(os.getenv("LOG_TOTAL_MAX_BYTES", str(5 * 1024 * 1024 * 1024)))
+
+_DAY_PATTERN = re.compile(r"^\d{8}$")
+
+log_disk_bytes = metrics.gauge("hanyang_log_disk_bytes", "Bytes used by log day directories", labelnames=("kind",))
+log_disk_days = metrics.gauge("hanyang_log_disk_days", "Day directories kept under LOG_BASE")
+log_disk_user_max_bytes = metrics.gauge("hanyang_log_disk_user_max_bytes", "Bytes used by the largest user's logs")
+log_retention_removed_bytes = metrics.counter(
+    "hanyang_log_retention_removed_bytes_total",
+    "Log bytes deleted by the retention job",
+    labelnames=("reason",),
+)
+log_compressed_saved_bytes = metrics.counter("hanyang_log_compressed_saved_bytes_total", "Bytes saved by gzipping closed days")
+log_retention_duration = metrics.histogram("hanyang_log_retention_duration_seconds", "Duration of the log retention job")
+
+_retention_lock = threading.Lock()
+
+
+def _targets(day_dir: str) -> List[str]:
+    """날짜 디렉터리 안의 카탈로그 대상 (`system`, `user/<id>`)."""
+    targets = []
+    if os.path.isdir(os.path.join(day_dir, "system")):
+        targets.append("system")
+    user_dir = os.path.join(day_dir, "user")
+    if os.path.isdir(user_dir):
+        targets.extend(f"user/{name}" for name in sorted(os.listdir(user_dir)))
+    return targets
+
+
+def _tree_size(path: str) -> int:
+    total = 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+def _gzip_file(path: str) -> int:
+    """path를 path.gz로 바꾸고 줄어든 바이트 수를 돌려줍니다."""
+    compressed = path + COMPRESSED_SUFFIX
+    temp_path = f"{compressed}.{os.getpid()}.tmp"
+    with open(path, "rb") as source, gzip.open(temp_path, "wb", compresslevel=6) as target:
+        shutil.copyfileobj(source, target, 1024 * 1024)
+    original = os.path.getsize(path)
+    shutil.copystat(path, temp_path)
+    os.replace(temp_path, compressed)
+    os.remove(path)
+    return original - os.path.getsize(compressed)
+
+
+def compress_day(day_dir: str, idle_before: float) -> Tuple[int, int]:
+    """닫힌 날짜의 로그와 실패 덤프를 gzip으로 압축합니다. (압축한 파일 수, 줄어든 바이트)"""
+    files, saved = 0, 0
+    for root, _, names in os.walk(day_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            if name.endswith((COMPRESSED_SUFFIX, ".tmp")):
+                continue
+            try:
+                if os.path.getmtime(path) > idle_before:
+                    continue
+                saved += _gzip_file(path)
+                files += 1
+            except OSError:
+                continue
+    return files, saved
+
+
+def _drop(catalog, base_dir: str, day: str, target: Optional[str] = None) -> int:
+    """그날 전체(target이 None) 또는 대상 하나를 지우고 카탈로그에서 뺀다. 지운 바이트를 돌려줍니다."""
+    day_dir = os.path.join(base_dir, day)
+    targets = [target] if target else _targets(day_dir)
+    path = os.path.join(day_dir, *target.split("/")) if target else day_dir
+    size = _tree_size(path)
+    shutil.rmtree(path, ignore_errors=True)
+    # 유저 하나만 지웠으면 비어 버린 user/, 날짜 디렉터리도 치운다.
+    parent = os.path.dirname(path)
+    while target and parent != base_dir:
+        try:
+            os.rmdir(parent)
+        except OSError:
+            break
+        parent = os.path.dirname(parent)
+    for name in targets:
+        catalog.record_drop(name, day)
+    return size
+
+
+def run_retention(
+    base_dir: Optional[str] = None,
+    now: Optional[float] = None,
+    keep_days: int = LOG_RETENTION_DAYS,
+    compress_after_days: int = LOG_COMPRESS_AFTER_DAYS,
+    user_max_bytes: int = LOG_USER_MAX_BYTES,
+    total_max_bytes: int = LOG_TOTAL_MAX_BYTES,
+) -> Dict[str, Any]:
+    """로그 보관 정책을 적용합니다: 기간이 지난 날짜 삭제 → 닫힌 날짜 압축 → 유저별 / 전체 용량 상한.
+
+    오늘 날짜는 지우거나 압축하지 않는다. 지운 날짜는 카탈로그에 drop으로 남겨
+    관리자 로그 조회가 디렉터리를 다시 훑지 않아도 목록에서 빠지게 한다.
+    """
+    base_dir = base_dir or log_module.LOG_BASE
+    if not os.path.isdir(base_dir):
+        return {"skipped": True, "reason": "no_log_base"}
+    if not _retention_lock.acquire(blocking=False):
+        return {"skipped": True, "reason": "retention_already_running"}
+
+    started = time.perf_counter()
+    now = time.time() if now is None else now
+    today = datetime.fromtimestamp(now, log_module.KST)
+    today_key = today.strftime("%Y%m%d")
+    catalog = log_module.get_catalog() if base_dir == log_module.LOG_BASE else LogCatalog(base_dir, log_module.BACKUP_COUNT)
+    report: Dict[str, Any] = {"skipped": False, "removed": {}, "compressed_files": 0, "saved_bytes": 0}
+
+    def removed(reason: str, size: int) -> None:
+        report["removed"][reason] = report["removed"].get(reason, 0) + size
+        log_retention_removed_bytes.inc(size, reason=reason)
+
+    try:
+        days = sorted(day for day in os.listdir(base_dir) if _DAY_PATTERN.match(day) and os.path.isdir(os.path.join(base_dir, day)))
+
+        if keep_days > 0:
+            cutoff = (today - timedelta(days=keep_days)).strftime("%Y%m%d")
+            for day in [day for day in days if day < cutoff]:
+                removed("age", _drop(catalog, base_dir, day))
+                days.remove(day)
+
+        if compress_after_days > 0:
+            cutoff = (today - timedelta(days=compress_after_days - 1)).strftime("%Y%m%d")
+            for day in days:
+                if day < cutoff:
+                    files, saved = compress_day(os.path.join(base_dir, day), now - LOG_COMPRESS_MIN_IDLE_SEC)
+                    report["compressed_files"] += files
+                    report["saved_bytes"] += saved
+            log_compressed_saved_bytes.inc(report["saved_bytes"])
+
+        # usage[day][target] = 바이트. 지울 순서를 정하려고 한 번만 훑는다.
+        usage: Dict[str, Dict[str, int]] = {}
+        for day in days:
+            day_dir = os.path.join(base_dir, day)
+            usage[day] = {target: _tree_size(os.path.join(day_dir, *target.split("/"))) for target in _targets(day_dir)}
+
+        per_user: Dict[str, int] = {}
+        for targets in usage.values():
+            for target, size in targets.items():
+                if target.startswith("user/"):
+                    per_user[target] = per_user.get(target, 0) + size
+        if user_max_bytes > 0:
+            for target, total in per_user.items():
+                for day in days:
+                    if total <= user_max_bytes or day == today_key:
+                        break
+                    size = usage[day].pop(target, None)
+                    if size is None:
+                        continue
+                    removed("user_quota", _drop(catalog, base_dir, day, target))
+                    total -= size
+                per_user[target] = total
+
+        days = [day for day in days if os.path.isdir(os.path.join(base_dir, day))]
+        total_bytes = sum(sum(targets.values()) for targets in usage.values())
+        if total_max_bytes > 0:
+            for day in list(days):
+                if total_bytes <= total_max_bytes or day == today_key:
+                    break
+                total_bytes -= sum(usage.pop(day, {}).values())
+                removed("total_quota", _drop(catalog, base_dir, day))
+                days.remove(day)
+
+        by_kind = {"system": 0, "user": 0}
+        for targets in usage.values():
+            for target, size in targets.items():
+                by_kind["system" if target == "system" else "user"] += size
+        for kind, size in by_kind.items():
+            log_disk_bytes.set(size, kind=kind)
+        log_disk_days.set(len(days))
+        log_disk_user_max_bytes.set(max(per_user.values(), default=0))
+        report.update({"days": len(days), "disk_bytes": sum(by_kind.values()), "user_max_bytes": max(per_user.values(), default=0)})
+        return report
+    finally:
+        elapsed = time.perf_counter() - started
+        log_retention_duration.observe(elapsed)
+        report["duration_sec"] = round(elapsed, 4)
+        _retention_lock.release()
+
+
+if __name__ == "__main__":
+    import sys
+
+    print(f"[log-retention] {run_retention(sys.argv[1] if len(sys.argv) > 1 else None)}")
@@ -1,11 +1,25 @@
 import os
+import atexit
+import json
 import logging
+import queue
+import threading
 import time
 import uuid
-from datetime import datetime
+import weakref
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-from typing import Any, Dict, Optional
-from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from utils import metrics
+from utils.log_catalog import LogCatalog
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 쓴다.
+    orjson = None
 
 # 서울 시간대
 KST = ZoneInfo('Asia/Seoul')
@@ -15,7 +29,7 @@ def kst_time_converter(seconds: Optional[float] = None) -> time.struct_time:
         seconds = time.time()
     return datetime.fromtimestamp(seconds, KST).timetuple()
 
-LOG_BASE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
+LOG_BASE = os.getenv("LOG_BASE") or os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
 
 # 로그 종류
 LOG_LEVELS = {
@@ -28,6 +42,27 @@ LOG_LEVELS = {
 MAX_LOG_SIZE = 5 * 1024 * 1024  # 5MB
 BACKUP_COUNT = 10  # log1~log10까지 유지
 
+# 로그는 호출한 스레드에서 큐에 넣기만 하고, 파일/콘솔 쓰기는 writer 스레드 하나가 모아서 한다.
+LOG_QUEUE_MAX_RECORDS = int(os.getenv("LOG_QUEUE_MAX_RECORDS", "10000"))
+LOG_QUEUE_FULL_POLICY = os.getenv("LOG_QUEUE_FULL_POLICY", "drop").strip().lower()  # drop | block
+LOG_QUEUE_BLOCK_TIMEOUT_SEC = float(os.getenv("LOG_QUEUE_BLOCK_TIMEOUT_SEC", "1"))
+LOG_BATCH_MAX_RECORDS = int(os.getenv("LOG_BATCH_MAX_RECORDS", "500"))
+LOG_MAX_OPEN_FILES = int(os.getenv("LOG_MAX_OPEN_FILES", "128"))
+LOG_CONSOLE = os.getenv("LOG_CONSOLE", "true").lower() not in {"0", "false", "no"}
+LOG_FORMAT = '[%(asctime)s][%(subject)s][%(levelname)s] %(message)s'
+# 사람이 읽는 로그 옆에 같은 레코드를 JSON Lines(events.jsonl)로도 남긴다. 분석/재생용.
+LOG_JSONL_ENABLED = os.getenv("LOG_JSONL_ENABLED", "false").lower() in {"1", "true", "yes"}
+LOG_JSONL_FILENAME = "events.jsonl"
+LOG_JSONL_MAX_BYTES = int(os.getenv("LOG_JSONL_MAX_BYTES", str(MAX_LOG_SIZE)))
+
+log_records_dropped = metrics.counter("hanyang_log_records_dropped_total", "Log records dropped because the log queue was full")
+log_queue_depth = metrics.gauge("hanyang_log_queue_depth", "Log records waiting for the writer thread")
+log_batch_size = metrics.histogram(
+    "hanyang_log_batch_records",
+    "Log records written per writer batch",
+    buckets=(1, 5, 10, 50, 100, 250, 500, 1000),
+)
+
 import re
 
 def sanitize_filename(filename):
@@ -49,63 +84,405 @@ def get_log_path(log_type: str = 'system', user_id: Optional[str] = None):
     os.makedirs(path, exist_ok=True)
     return os.path.join(path, f'log1.log')
 
-class HanyangLogger:
-    def __init__(self, log_type: str = 'system', user_id: Optional[str] = None, default_fields: Optional[Dict[str, Any]] = None):
-        self.log_type = log_type
-        self.user_id = user_id
-        self.current_date = None
-        self.logger = logging.getLogger(f'{log_type}_{user_id or "system"}')
-        self.logger.setLevel(logging.DEBUG)
-        self.file_handler = None
-        self.default_fields = default_fields.copy() if default_fields else {}
-        self._setup_logger()
-
-    def _setup_logger(self):
-        """로거 설정을 초기화하거나 업데이트합니다."""
-        self.close()
-        
-        self.logger.propagate = False
-        
-        # 현재 날짜 확인
-        current_date = datetime.now(KST).strftime('%Y%m%d')
-        
-        # 날짜가 바뀌었거나 처음 설정하는 경우
-        if self.current_date != current_date:
-            self.current_date = current_date
-            self.log_path = get_log_path(self.log_type, self.user_id)
-            
-            # File handler
-            self.file_handler = RotatingFileHandler(
-                self.log_path, maxBytes=MAX_LOG_SIZE, backupCount=BACKUP_COUNT, encoding='utf-8'
-            )
-            formatter = logging.Formatter('[%(asctime)s][%(subject)s][%(levelname)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            # 로거의 asctime을 KST로 강제
-            formatter.converter = kst_time_converter
-            self.file_handler.setFormatter(formatter)
-            self.logger.addHandler(self.file_handler)
-            
-            # Console handler
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+def _stringify_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.3f}".rstrip("0").rstrip(".")
+    if isinstance(value, (list, tuple, set)):
+        return "[" + ",".join(_stringify_value(item) for item in value) + "]"
+    text = str(value).replace("\n", "\\n").strip()
+    if not text:
+        return "-"
+    if any(char.isspace() for char in text) or "|" in text or "=" in text:
+        escaped = text.replace('"', '\\"')
+        return f'"{escaped}"'
+    return text
 
-    def close(self):
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
+
+def render_static_fields(fields: Dict[str, Any]) -> str:
+    """바뀌지 않는 컨텍스트 필드(run_id 등)를 이름순 `key=value` 문자열로 한 번만 만들어 둔다."""
+    return " ".join(f"{key}={_stringify_value(fields[key])}" for key in sorted(fields) if fields[key] is not None)
+
+
+def render_fields(fields: Dict[str, Any], static: str = "") -> str:
+    """` | event=... key=value` 꼬리. event를 맨 앞에, 그다음 컨텍스트 필드, 나머지는 이름순으로 둔다."""
+    parts = []
+    event = fields.get("event")
+    if event is not None:
+        parts.append(f"event={_stringify_value(event)}")
+    if static:
+        parts.append(static)
+    for key in sorted(fields):
+        value = fields[key]
+        if key != "event" and value is not None:
+            parts.append(f"{key}={_stringify_value(value)}")
+    return " | " + " ".join(parts) if parts else ""
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+if orjson is not None:
+    def dumps_json_line(payload: Dict[str, Any]) -> str:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+else:
+    def dumps_json_line(payload: Dict[str, Any]) -> str:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+
+
+def event_json_line(record: logging.LogRecord, context: Dict[str, Any], fields: Dict[str, Any]) -> str:
+    """JSONL 한 줄. 스키마: ts, level, subject, event, run_id, message, fields."""
+    merged = {key: value for key, value in context.items() if value is not None}
+    merged.update((key, value) for key, value in fields.items() if value is not None)
+    event = merged.pop("event", None)
+    run_id = merged.pop("run_id", None)
+    return dumps_json_line(
+        {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "subject": getattr(record, "subject", None),
+            "event": event,
+            "run_id": run_id,
+            "message": record.msg,
+            "fields": merged,
+        }
+    )
+
+
+def next_kst_midnight(now: Optional[float] = None) -> float:
+    """다음 KST 자정의 epoch 초. 날짜가 바뀌었는지는 이 값과 time.time()만 비교한다."""
+    current = datetime.fromtimestamp(time.time() if now is None else now, KST)
+    midnight = datetime(current.year, current.month, current.day, tzinfo=KST) + timedelta(days=1)
+    return midnight.timestamp()
+
+
+class _DeferredFlushMixin:
+    # StreamHandler.emit이 레코드마다 부르는 flush를 건너뛰고, writer가 배치 끝에 한 번만 flush한다.
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+
+class _BatchedRotatingFileHandler(_DeferredFlushMixin, RotatingFileHandler):
+    catalog: Optional[LogCatalog] = None
+
+    def doRollover(self):
+        size = self.stream.tell() if self.stream else 0
+        super().doRollover()
+        if self.catalog is not None:
             try:
-                handler.flush()
-            except Exception:
+                self.catalog.record_rotate(self.baseFilename, size)
+            except OSError:
+                pass
+
+
+class _BatchedStreamHandler(_DeferredFlushMixin, logging.StreamHandler):
+    pass
+
+
+class _JsonLineFormatter(logging.Formatter):
+    # writer가 미리 직렬화해 둔 줄을 그대로 쓴다.
+    def format(self, record):
+        return record.hanyang_json
+
+
+class BoundedQueueHandler(QueueHandler):
+    """큐가 가득 차면 정책에 따라 버리거나(drop) 잠깐 기다린다(block).
+
+    drop 정책이어도 ERROR 이상은 LOG_QUEUE_BLOCK_TIMEOUT_SEC까지 기다려 본다.
+    """
+
+    def __init__(self, log_queue: "queue.Queue", policy: str = "drop", block_timeout_sec: float = 1.0):
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout_sec = block_timeout_sec
+
+    def prepare(self, record):
+        # 포맷은 writer 스레드가 한다. 큐를 쓰는 handler가 하나뿐이라 복사도 필요 없다.
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.policy == "block" or record.levelno >= logging.ERROR:
+            try:
+                self.queue.put(record, timeout=self.block_timeout_sec)
+                return
+            except queue.Full:
                 pass
+        log_records_dropped.inc()
+
+
+def _log_day(path: str) -> Optional[str]:
+    """LOG_BASE/<YYYYMMDD>/... 경로의 날짜. LOG_BASE 밖이거나 날짜 디렉터리가 아니면 None."""
+    try:
+        relative = os.path.relpath(path, LOG_BASE)
+    except ValueError:
+        return None
+    day = relative.split(os.sep, 1)[0]
+    return day if len(day) == 8 and day.isdigit() else None
+
+
+class BatchingQueueListener(QueueListener):
+    """큐에서 레코드를 한 번에 여러 개 꺼내 파일별로 쓰고 배치마다 한 번 flush합니다.
+
+    파일 handler는 경로별로 열어 두되 LOG_MAX_OPEN_FILES를 넘으면 오래 안 쓴 것부터 닫는다.
+    KST 날짜가 바뀌면 지난 날짜 디렉터리의 파일은 바로 닫아서 보관 정책이 압축/삭제한 공간이 실제로 비워지게 한다.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue",
+        batch_max: int = 500,
+        max_open_files: int = 128,
+        console: bool = True,
+        jsonl: bool = False,
+        catalog: Optional[LogCatalog] = None,
+    ):
+        super().__init__(log_queue)
+        self.catalog = catalog
+        self.jsonl = jsonl
+        self.json_formatter = _JsonLineFormatter()
+        self.batch_max = max(1, batch_max)
+        self.max_open_files = max(1, max_open_files)
+        self.formatter = logging.Formatter(LOG_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
+        # 로거의 asctime을 KST로 강제
+        self.formatter.converter = kst_time_converter
+        self.console = _BatchedStreamHandler() if console else None
+        if self.console:
+            self.console.setFormatter(self.formatter)
+        self._files: "OrderedDict[str, _BatchedRotatingFileHandler]" = OrderedDict()
+        self._rollover_at = next_kst_midnight()
+
+    def _file_handler(self, path: str, json_lines: bool = False) -> "_BatchedRotatingFileHandler":
+        handler = self._files.get(path)
+        if handler is not None:
+            self._files.move_to_end(path)
+            return handler
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        max_bytes = LOG_JSONL_MAX_BYTES if json_lines else MAX_LOG_SIZE
+        handler = _BatchedRotatingFileHandler(path, maxBytes=max_bytes, backupCount=BACKUP_COUNT, encoding='utf-8')
+        handler.setFormatter(self.json_formatter if json_lines else self.formatter)
+        handler.catalog = self.catalog
+        if self.catalog is not None:
             try:
+                self.catalog.record_open(handler.baseFilename)
+            except OSError:
+                pass
+        self._files[path] = handler
+        while len(self._files) > self.max_open_files:
+            _, oldest = self._files.popitem(last=False)
+            oldest.flush_batch()
+            oldest.close()
+        return handler
+
+    def close_past_days(self) -> None:
+        """오늘(KST) 이전 날짜 디렉터리에 있는 파일 handler를 닫는다."""
+        today = datetime.now(KST).strftime('%Y%m%d')
+        self._rollover_at = next_kst_midnight()
+        for path in list(self._files):
+            day = _log_day(path)
+            if day is not None and day < today:
+                handler = self._files.pop(path)
+                handler.flush_batch()
                 handler.close()
+
+    def write_batch(self, records: List[logging.LogRecord]) -> None:
+        if time.time() >= self._rollover_at:
+            self.close_past_days()
+        touched = set()
+        for record in records:
+            fields = record.__dict__.pop("hanyang_fields", None) or {}
+            static = record.__dict__.pop("hanyang_static", "")
+            context = record.__dict__.pop("hanyang_context", None) or {}
+            path = getattr(record, "log_path", None)
+            if self.jsonl and path:
+                record.hanyang_json = event_json_line(record, context, fields)
+            if fields or static:
+                record.msg = f"{record.msg}{render_fields(fields, static)}"
+            if path:
+                targets = [(path, False)]
+                if self.jsonl:
+                    targets.append((os.path.join(os.path.dirname(path), LOG_JSONL_FILENAME), True))
+                for target_path, json_lines in targets:
+                    try:
+                        handler = self._file_handler(target_path, json_lines)
+                    except OSError:
+                        continue
+                    handler.handle(record)
+                    touched.add(handler)
+            if self.console:
+                self.console.handle(record)
+        for handler in touched:
+            handler.flush_batch()
+        if self.console:
+            self.console.flush_batch()
+        log_batch_size.observe(len(records))
+
+    def _monitor(self):
+        log_queue = self.queue
+        while True:
+            try:
+                batch = [log_queue.get(timeout=max(1.0, self._rollover_at - time.time()))]
+            except queue.Empty:
+                # 자정 뒤로 로그가 없어도 지난 날짜 파일은 보관 정책이 돌기 전에 닫아 둔다.
+                self.close_past_days()
+                continue
+            while len(batch) < self.batch_max:
+                try:
+                    batch.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(record is self._sentinel for record in batch)
+            try:
+                self.write_batch([record for record in batch if record is not self._sentinel])
             except Exception:
+                # 쓰기 실패로 writer 스레드가 죽으면 큐가 차서 모든 로그가 버려진다.
                 pass
+            log_queue_depth.set(log_queue.qsize())
+            for _ in batch:
+                log_queue.task_done()
+            if stop:
+                return
+
+    def close_files(self) -> None:
+        for handler in self._files.values():
+            handler.flush_batch()
+            handler.close()
+        self._files.clear()
+
+
+_pipeline_lock = threading.Lock()
+_queue_handler: Optional[BoundedQueueHandler] = None
+_listener: Optional[BatchingQueueListener] = None
+
+
+_catalog: Optional[LogCatalog] = None
+
+
+def get_catalog() -> LogCatalog:
+    """LOG_BASE의 로그 파일 카탈로그. writer와 관리자 로그 조회가 같이 쓴다."""
+    global _catalog
+    if _catalog is None or _catalog.base_dir != LOG_BASE:
+        _catalog = LogCatalog(LOG_BASE, BACKUP_COUNT)
+    return _catalog
+
+
+def get_queue_handler() -> BoundedQueueHandler:
+    """프로세스 공용 로그 큐 handler. 처음 부를 때 writer 스레드를 띄운다."""
+    global _queue_handler, _listener
+    with _pipeline_lock:
+        if _queue_handler is None:
+            log_queue: "queue.Queue" = queue.Queue(maxsize=max(1, LOG_QUEUE_MAX_RECORDS))
+            _listener = BatchingQueueListener(
+                log_queue, LOG_BATCH_MAX_RECORDS, LOG_MAX_OPEN_FILES, LOG_CONSOLE, LOG_JSONL_ENABLED, get_catalog()
+            )
+            _listener.start()
+            _queue_handler = BoundedQueueHandler(log_queue, LOG_QUEUE_FULL_POLICY, LOG_QUEUE_BLOCK_TIMEOUT_SEC)
+            atexit.register(shutdown_logging)
+        return _queue_handler
+
+
+def flush_logs(timeout: float = 5.0) -> bool:
+    """지금까지 큐에 들어간 로그가 다 쓰일 때까지 기다린다. 시간 안에 끝나면 True."""
+    handler = _queue_handler
+    if handler is None:
+        return True
+    log_queue = handler.queue
+    with log_queue.all_tasks_done:
+        return log_queue.all_tasks_done.wait_for(lambda: log_queue.unfinished_tasks == 0, timeout)
+
+
+def shutdown_logging() -> None:
+    """남은 로그를 다 쓰고 writer 스레드를 멈춘다. 프로세스 종료 시 atexit으로 불린다."""
+    global _queue_handler, _listener
+    with _pipeline_lock:
+        listener, _listener = _listener, None
+        _queue_handler = None
+    if listener is not None:
+        listener.stop()
+        listener.close_files()
+
+
+class _LogTarget:
+    """(log_type, user_id)마다 하나. 같은 대상의 로거 인스턴스들이 logging 로거와 로그 경로를 함께 쓴다."""
+
+    def __init__(self, log_type: str, user_id: Optional[str]):
+        self.log_type = log_type
+        self.user_id = user_id
+        # logging.getLogger로 만들면 logging 모듈이 이름별로 영원히 들고 있다. 대상이 없어질 때 같이 없어지도록 직접 만든다.
+        self.logger = logging.Logger(f'{log_type}_{user_id or "system"}', logging.DEBUG)
+        self.logger.propagate = False
+        self.logger.addHandler(get_queue_handler())
+        self.refresh()
+
+    def refresh(self) -> None:
+        self.current_date = datetime.now(KST).strftime('%Y%m%d')
+        self.rollover_at = next_kst_midnight()
+        self.log_path = get_log_path(self.log_type, self.user_id)
+
+
+_targets_lock = threading.Lock()
+# 대상은 그것을 쓰는 로거 인스턴스가 있는 동안만 남는다. 크기는 get_logger의 LRU와 살아 있는 로거 수를 따라간다.
+_targets: "weakref.WeakValueDictionary[tuple, _LogTarget]" = weakref.WeakValueDictionary()
+
+
+def _get_target(log_type: str, user_id: Optional[str]) -> _LogTarget:
+    key = (log_type, user_id)
+    target = _targets.get(key)
+    if target is None:
+        with _targets_lock:
+            target = _targets.get(key)
+            if target is None:
+                target = _targets[key] = _LogTarget(log_type, user_id)
+    return target
+
+
+class HanyangLogger:
+    """로그 대상(_LogTarget)과 컨텍스트 필드를 묶은 가벼운 핸들.
+
+    만들 때 파일을 열지 않으므로 요청마다 만들어도 되지만, 자주 쓰는 곳은 get_logger로 재사용한다.
+    """
+
+    def __init__(self, log_type: str = 'system', user_id: Optional[str] = None, default_fields: Optional[Dict[str, Any]] = None):
+        self.log_type = log_type
+        self.user_id = user_id
+        self._target = _get_target(log_type, user_id)
+        self.default_fields = {key: value for key, value in (default_fields or {}).items() if value is not None}
+        self._default_keys = frozenset(self.default_fields)
+        self._static_fields = render_static_fields(self.default_fields)
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._target.logger
+
+    @property
+    def log_path(self) -> str:
+        return self._target.log_path
+
+    @property
+    def current_date(self) -> str:
+        return self._target.current_date
+
+    def close(self):
+        # 파일은 writer 스레드가 경로별로 관리하므로 인스턴스가 닫을 것은 없다.
+        pass
 
     def _check_date_change(self):
-        """날짜가 바뀌었는지 확인하고 필요시 로거를 재설정합니다."""
-        current_date = datetime.now(KST).strftime('%Y%m%d')
-        if self.current_date != current_date:
-            self._setup_logger()
+        """날짜가 바뀌었는지 확인하고 필요시 로그 경로를 다시 정합니다."""
+        if time.time() >= self._target.rollover_at:
+            self._target.refresh()
 
     @staticmethod
     def new_run_id(prefix: str = "run") -> str:
@@ -117,47 +494,38 @@ class HanyangLogger:
         merged.update({key: value for key, value in fields.items() if value is not None})
         return HanyangLogger(self.log_type, self.user_id, default_fields=merged)
 
-    def _stringify_value(self, value: Any) -> str:
-        if isinstance(value, bool):
-            return "true" if value else "false"
-        if value is None:
-            return "-"
-        if isinstance(value, float):
-            return f"{value:.3f}".rstrip("0").rstrip(".")
-        if isinstance(value, (list, tuple, set)):
-            return "[" + ",".join(self._stringify_value(item) for item in value) + "]"
-        text = str(value).replace("\n", "\\n").strip()
-        if not text:
-            return "-"
-        if any(char.isspace() for char in text) or "|" in text or "=" in text:
-            escaped = text.replace('"', '\\"')
-            return f'"{escaped}"'
-        return text
-
-    def _format_fields(self, fields: Dict[str, Any]) -> str:
+    def _split_fields(self, fields: Dict[str, Any]):
+        # 컨텍스트 필드를 덮어쓰는 호출만 합쳐서 다시 렌더링한다.
+        if self._default_keys.isdisjoint(fields):
+            return fields, self._static_fields, self.default_fields
         merged = self.default_fields.copy()
         merged.update({key: value for key, value in fields.items() if value is not None})
-        if not merged:
-            return ""
-        ordered = []
-        if "event" in merged:
-            ordered.append(("event", merged.pop("event")))
-        for key in sorted(merged.keys()):
-            ordered.append((key, merged[key]))
-        return " | " + " ".join(f"{key}={self._stringify_value(value)}" for key, value in ordered)
+        return merged, "", {}
+
+    def _format_fields(self, fields: Dict[str, Any]) -> str:
+        dynamic, static, _ = self._split_fields(fields)
+        return render_fields(dynamic, static)
 
     def log(self, level, subject, message, **fields):
         self._check_date_change()  # 날짜 변경 확인
-        extra = {'subject': subject}
+        # 필드 문자열은 writer 스레드에서 만든다. 호출한 스레드는 dict와 미리 만든 컨텍스트 문자열만 넘긴다.
+        dynamic, static, context = self._split_fields(fields)
+        extra = {
+            'subject': subject,
+            'log_path': self._target.log_path,
+            'hanyang_fields': dynamic,
+            'hanyang_static': static,
+            'hanyang_context': context,
+        }
         if level not in LOG_LEVELS:
             level = 'INFO'
-        rendered_message = f"{message}{self._format_fields(fields)}"
-        self.logger.log(LOG_LEVELS[level], rendered_message, extra=extra)
+        logger = self._target.logger
+        # logger.log는 호출 위치를 찾느라 스택을 거슬러 올라간다. 포맷에 쓰지 않으므로 바로 레코드를 만든다.
+        record = logger.makeRecord(logger.name, LOG_LEVELS[level], "(hanyang)", 0, message, None, None, extra=extra)
+        logger.handle(record)
 
     def event(self, subject, event, message="", level="INFO", **fields):
-        payload = {"event": event}
-        payload.update(fields)
-        self.log(level, subject, message or event, **payload)
+        self.log(level, subject, message or event, event=event, **fields)
 
     def info(self, subject, message, **fields):
         self.log('INFO', subject, message, **fields)
@@ -171,11 +539,26 @@ class HanyangLogger:
     def debug(self, subject, message, **fields):
         self.log('DEBUG', subject, message, **fields)
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
+LOGGER_REGISTRY_MAX = int(os.getenv("LOGGER_REGISTRY_MAX", "4096"))
+_registry_lock = threading.Lock()
+_registry: "OrderedDict[tuple, HanyangLogger]" = OrderedDict()
+
+
+def get_logger(log_type: str = 'system', user_id: Optional[str] = None) -> HanyangLogger:
+    """컨텍스트 필드가 없는 기본 로거를 프로세스 안에서 재사용한다. 필드가 필요하면 with_context로 붙인다."""
+    key = (log_type, user_id)
+    with _registry_lock:
+        logger = _registry.get(key)
+        if logger is not None:
+            _registry.move_to_end(key)
+            return logger
+    logger = HanyangLogger(log_type, user_id)
+    with _registry_lock:
+        logger = _registry.setdefault(key, logger)
+        while len(_registry) > LOGGER_REGISTRY_MAX:
+            _registry.popitem(last=False)
+    return logger
+
 
 # 사용 예시:
 # logger = HanyangLogger('system')
@@ -0,0 +1,192 @@
+"""SPA 빌드 결과물을 메모리에서 서빙하는 정적 파일 계층.
+
+작은 파일은 시작할 때 한 번 읽어 두고, 빌드 단계에서 만든 .br/.gz 변형을
+Accept-Encoding에 맞춰 골라 준다. 해시가 붙은 /assets/* 는 immutable로 캐시한다.
+
+빌드 단계에서 압축본 만들기:
+
+    python -m utils.static_assets web/dist/spa
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip 변형만 만든다.
+    brotli = None
+
+
+STATIC_MAX_INLINE_BYTES = int(os.getenv("STATIC_MAX_INLINE_BYTES", str(512 * 1024)))
+STATIC_MIN_COMPRESS_BYTES = 1024
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+COMPRESSIBLE_SUFFIXES = (".html", ".js", ".mjs", ".css", ".svg", ".json", ".txt", ".xml", ".map", ".ico", ".webmanifest")
+# 서버가 고르는 순서. 같은 q 값이면 brotli를 먼저 준다.
+ENCODINGS: Tuple[Tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+VARIANT_SUFFIXES = tuple(suffix for _, suffix in ENCODINGS)
+
+
+def _etag(body: bytes, encoding: Optional[str] = None) -> str:
+    digest = hashlib.sha256(body).hexdigest()[:20]
+    return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+
+def _accepted_encodings(header: str) -> Dict[str, float]:
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token] = quality
+    return accepted
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+class StaticAsset:
+    def __init__(self, path: str, cache_control: str):
+        self.path = path
+        self.cache_control = cache_control
+        self.media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        self.size = os.path.getsize(path)
+        self.inline = self.size <= STATIC_MAX_INLINE_BYTES
+        self.body: Optional[bytes] = None
+        # encoding -> (본문 또는 None, 디스크 경로, etag)
+        self.variants: Dict[str, Tuple[Optional[bytes], str, str]] = {}
+        with open(path, "rb") as handle:
+            raw = handle.read()
+        self.etag = _etag(raw)
+        if self.inline:
+            self.body = raw
+        for encoding, suffix in ENCODINGS:
+            variant_path = path + suffix
+            if not os.path.isfile(variant_path):
+                continue
+            with open(variant_path, "rb") as handle:
+                variant = handle.read()
+            self.variants[encoding] = (variant if self.inline else None, variant_path, _etag(raw, encoding))
+
+    def choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        if not self.variants or not accept_encoding:
+            return None
+        accepted = _accepted_encodings(accept_encoding)
+        best, best_quality = None, 0.0
+        for encoding, _ in ENCODINGS:
+            quality = accepted.get(encoding, accepted.get("*", 0.0))
+            if encoding in self.variants and quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def respond(self, request: Request) -> Response:
+        encoding = self.choose_encoding(request.headers.get("accept-encoding", ""))
+        if encoding:
+            body, path, etag = self.variants[encoding]
+        else:
+            body, path, etag = self.body, self.path, self.etag
+        headers = {"Cache-Control": self.cache_control, "ETag": etag}
+        if self.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            headers["Content-Encoding"] = encoding
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        if body is not None:
+            return Response(content=body, media_type=self.media_type, headers=headers)
+        # 큰 파일은 메모리에 올리지 않고 디스크에서 흘려보낸다.
+        return FileResponse(path, media_type=self.media_type, headers=headers)
+
+
+class StaticSite:
+    """빌드 디렉터리 하나를 URL 경로별 StaticAsset으로 색인합니다."""
+
+    def __init__(self, root: str, immutable_prefix: str = "assets/", fallback_dirs: Optional[List[str]] = None):
+        self.root = root
+        self.immutable_prefix = immutable_prefix
+        self.fallback_dirs = fallback_dirs or []
+        self.assets: Dict[str, StaticAsset] = {}
+
+    def load(self) -> "StaticSite":
+        assets: Dict[str, StaticAsset] = {}
+        # 빌드 결과물이 우선이고, 없는 파일만 fallback 디렉터리에서 채운다.
+        for directory in [self.root, *self.fallback_dirs]:
+            if not os.path.isdir(directory):
+                continue
+            for base, _, files in os.walk(directory):
+                for name in files:
+                    if name.endswith(VARIANT_SUFFIXES):
+                        continue
+                    full_path = os.path.join(base, name)
+                    key = os.path.relpath(full_path, directory).replace(os.sep, "/")
+                    if key in assets:
+                        continue
+                    immutable = directory == self.root and key.startswith(self.immutable_prefix)
+                    assets[key] = StaticAsset(full_path, IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL)
+        self.assets = assets
+        return self
+
+    def get(self, path: str) -> Optional[StaticAsset]:
+        return self.assets.get(path.lstrip("/"))
+
+    def respond(self, request: Request, path: str) -> Optional[Response]:
+        asset = self.get(path)
+        return asset.respond(request) if asset else None
+
+    def memory_bytes(self) -> int:
+        total = 0
+        for asset in self.assets.values():
+            total += len(asset.body or b"")
+            total += sum(len(body or b"") for body, _, _ in asset.variants.values())
+        return total
+
+
+def precompress(root: str, min_bytes: int = STATIC_MIN_COMPRESS_BYTES) -> List[str]:
+    """root 아래 텍스트 파일마다 .gz(와 brotli가 있으면 .br) 변형을 만듭니다."""
+    written = []
+    for base, _, files in os.walk(root):
+        for name in files:
+            if not name.endswith(COMPRESSIBLE_SUFFIXES):
+                continue
+            path = os.path.join(base, name)
+            with open(path, "rb") as handle:
+                raw = handle.read()
+            if len(raw) < min_bytes:
+                continue
+            candidates = [(".gz", gzip.compress(raw, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                candidates.append((".br", brotli.compress(raw, quality=11)))
+            for suffix, compressed in candidates:
+                # 압축해도 거의 줄지 않으면 변형을 두지 않는다.
+                if len(compressed) >= len(raw) * 0.95:
+                    continue
+                with open(path + suffix, "wb") as handle:
+                    handle.write(compressed)
+                written.append(path + suffix)
+    return written
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else "."
+    variants = precompress(target)
+    print(f"[static] {len(variants)} precompressed variants written under {target} (brotli={'on' if brotli else 'off'})")
@@ -0,0 +1,57 @@
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+import utils.async_database as adb
+import utils.database as db
+from utils.db_backends import SQLiteBackend
+
+
+class AsyncDatabaseTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.orig_backend = db.set_backend(SQLiteBackend(os.path.join(self.temp_dir.name, "hanyang.db")))
+        self.orig_admin_password = os.environ.get("ADMIN_INITIAL_PASSWORD")
+        os.environ["ADMIN_INITIAL_PASSWORD"] = "test-admin-password"
+
+    def tearDown(self):
+        adb.shutdown_executor(wait=True)
+        db.set_backend(self.orig_backend)
+        if self.orig_admin_password is None:
+            os.environ.pop("ADMIN_INITIAL_PASSWORD", None)
+        else:
+            os.environ["ADMIN_INITIAL_PASSWORD"] = self.orig_admin_password
+        self.temp_dir.cleanup()
+
+    def test_round_trip_mirrors_sync_api(self):
+        async def scenario():
+            await adb.init_db()
+            await adb.add_user("student", "pw")
+            await adb.add_learned_lecture(1, "https://lecture/1")
+            await adb.update_user_status("student", "completed")
+            user = await adb.get_user_by_id("student")
+            lectures = await adb.get_learned_lectures(user[0])
+            return user, lectures
+
+        user, lectures = asyncio.run(scenario())
+        self.assertEqual(user[1], "student")
+        self.assertEqual(user[4], "completed")
+        self.assertEqual(lectures, ["https://lecture/1"])
+
+    def test_calls_run_on_dedicated_executor(self):
+        async def scenario():
+            return await adb.run(lambda: threading.current_thread().name)
+
+        thread_name = asyncio.run(scenario())
+        self.assertTrue(thread_name.startswith("db"))
+
+
+if __name__ == "__main__":
+    unittest.main()
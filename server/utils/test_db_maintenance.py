@@ -0,0 +1,98 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+import utils.database as db
+from utils import db_maintenance
+from utils.db_backends import SQLiteBackend
+
+
+class DbMaintenanceTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.backend = SQLiteBackend(os.path.join(self.temp_dir.name, "hanyang.db"))
+        self.orig_backend = db.set_backend(self.backend)
+        self.backend.init_schema()
+        self.backend.executemany(
+            "INSERT INTO User (ID, PWD_Encrypted, Status) VALUES (?, ?, ?)",
+            [(f"user{index}", "x" * 200, "active") for index in range(500)],
+        )
+        self.backend.execute("DELETE FROM User WHERE NUM > 250")
+
+    def tearDown(self):
+        db.set_backend(self.orig_backend)
+        self.temp_dir.cleanup()
+
+    def test_maintenance_truncates_wal_and_vacuums(self):
+        # 다른 연결이 열려 있는 동안에도 체크포인트가 끝까지 진행되어야 한다.
+        reader = self.backend.connect()
+        try:
+            report = db_maintenance.run_maintenance()
+        finally:
+            reader.close()
+
+        self.assertFalse(report["skipped"])
+        self.assertNotIn("errors", report)
+        self.assertEqual(report["after"]["wal_bytes"], 0)
+        self.assertEqual(report["vacuum"]["auto_vacuum"], "incremental")
+        self.assertGreater(report["vacuum"]["freed_pages"], 0)
+        self.assertIn("analyze", report["durations_sec"])
+        self.assertEqual(db_maintenance.db_wal_size_bytes.value(), 0)
+        self.assertGreaterEqual(db_maintenance.db_maintenance_duration.count(task="wal_checkpoint"), 1)
+
+    def test_backup_is_consistent_and_pruned(self):
+        backup_dir = os.path.join(self.temp_dir.name, "backups")
+        os.makedirs(backup_dir)
+        for index in range(3):
+            open(os.path.join(backup_dir, f"hanyang-2000010{index}-000000.db"), "w").close()
+
+        report = db_maintenance.backup_database(backup_dir, keep=2)
+
+        self.assertFalse(report["skipped"])
+        self.assertTrue(os.path.exists(report["path"]))
+        self.assertEqual(len(report["pruned"]), 2)
+        self.assertEqual(len(os.listdir(backup_dir)), 2)
+        with sqlite3.connect(report["path"]) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM User").fetchone()[0], 250)
+
+    def test_backup_finishes_while_another_connection_keeps_writing(self):
+        # 다른 연결이 계속 쓰는 동안에도 스냅샷은 끝나고 일관돼야 한다.
+        self.backend.executemany(
+            "INSERT INTO User (ID, PWD_Encrypted, Status) VALUES (?, ?, ?)",
+            [(f"bulk{index}", "x" * 4000, "active") for index in range(1000)],
+        )
+        stop = threading.Event()
+
+        def writer():
+            conn = self.backend.connect()
+            try:
+                index = 0
+                while not stop.is_set():
+                    conn.execute("UPDATE User SET Status = ? WHERE NUM = 1", (f"status{index}",))
+                    conn.commit()
+                    index += 1
+            finally:
+                conn.close()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            report = db_maintenance.backup_database(os.path.join(self.temp_dir.name, "backups"), keep=1)
+        finally:
+            stop.set()
+            thread.join()
+
+        self.assertNotIn("errors", report)
+        with sqlite3.connect(report["path"]) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM User").fetchone()[0], 1250)
+
+
+if __name__ == "__main__":
+    unittest.main()
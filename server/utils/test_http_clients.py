@@ -0,0 +1,148 @@
+import asyncio
+import os
+import sys
+import unittest
+
+import httpx
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from utils import http_clients
+from utils.http_clients import CircuitBreaker, CircuitOpenError, UpstreamClient
+
+
+class UpstreamClientTests(unittest.TestCase):
+    def test_reuses_one_pooled_client_and_records_metrics(self):
+        seen = []
+
+        def handler(request):
+            seen.append((request.url.path, request.headers.get("X-Internal-Token")))
+            return httpx.Response(200, json={"ok": True})
+
+        upstream = UpstreamClient(
+            "test-ok",
+            "http://automation:7000/",
+            headers={"X-Internal-Token": "token"},
+            transport=httpx.MockTransport(handler),
+        )
+
+        async def scenario():
+            await upstream.start()
+            first = upstream.client
+            for _ in range(3):
+                response = await upstream.post("/verify-login", json={})
+                self.assertEqual(response.status_code, 200)
+            self.assertIs(upstream.client, first)
+            await upstream.aclose()
+
+        asyncio.run(scenario())
+        self.assertEqual(seen, [("/verify-login", "token")] * 3)
+        self.assertEqual(http_clients.upstream_requests.value(upstream="test-ok", outcome="2xx"), 3)
+        self.assertEqual(http_clients.upstream_request_duration.count(upstream="test-ok"), 3)
+
+    def test_circuit_opens_after_failures_and_recovers(self):
+        state = {"fail": True}
+
+        def handler(request):
+            if state["fail"]:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200)
+
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_sec=0.05)
+        upstream = UpstreamClient("test-breaker", "http://back:9000", breaker=breaker, transport=httpx.MockTransport(handler))
+
+        async def scenario():
+            for _ in range(2):
+                with self.assertRaises(httpx.ConnectError):
+                    await upstream.get("/api/health")
+            with self.assertRaises(CircuitOpenError):
+                await upstream.get("/api/health")
+            self.assertEqual(http_clients.upstream_circuit_open.value(upstream="test-breaker"), 1)
+
+            await asyncio.sleep(0.06)
+            state["fail"] = False
+            response = await upstream.get("/api/health")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+            await upstream.aclose()
+
+        asyncio.run(scenario())
+        self.assertEqual(http_clients.upstream_requests.value(upstream="test-breaker", outcome="circuit_open"), 1)
+
+    def test_half_open_lets_one_probe_through_at_a_time(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.02)
+            return httpx.Response(200)
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_sec=0.05)
+        upstream = UpstreamClient("test-probe", "http://back:9000", breaker=breaker, transport=httpx.MockTransport(handler))
+        breaker.record_failure()
+
+        async def scenario():
+            await asyncio.sleep(0.06)
+            results = await asyncio.gather(*(upstream.get("/api/health") for _ in range(10)), return_exceptions=True)
+            await upstream.aclose()
+            return results
+
+        results = asyncio.run(scenario())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sum(isinstance(result, httpx.Response) for result in results), 1)
+        self.assertEqual(sum(isinstance(result, CircuitOpenError) for result in results), 9)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_load_shedding_503_does_not_trip_breaker(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        upstream = UpstreamClient(
+            "test-shed",
+            "http://automation:7000",
+            breaker=breaker,
+            transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+        )
+
+        async def scenario():
+            await upstream.post("/verify-login")
+            await upstream.post("/verify-login")
+            await upstream.aclose()
+
+        asyncio.run(scenario())
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_upstream_error_statuses_trip_only_when_opted_in(self):
+        statuses = iter([500, 502, 500, 502])
+        proxy = UpstreamClient(
+            "test-proxy",
+            "http://back:9000",
+            breaker=CircuitBreaker(failure_threshold=1),
+            transport=httpx.MockTransport(lambda request: httpx.Response(next(statuses))),
+        )
+        strict = UpstreamClient(
+            "test-strict",
+            "http://automation:7000",
+            breaker=CircuitBreaker(failure_threshold=1),
+            transport=httpx.MockTransport(lambda request: httpx.Response(502)),
+            failure_statuses={502},
+        )
+
+        async def scenario():
+            # back이 직접 만든 500/502는 통과시키는 프록시의 서킷을 열지 않는다.
+            for _ in range(4):
+                await proxy.get("/api/admin/users")
+            await strict.get("/sweeps")
+            with self.assertRaises(CircuitOpenError):
+                await strict.get("/sweeps")
+            await proxy.aclose()
+            await strict.aclose()
+
+        asyncio.run(scenario())
+        self.assertEqual(proxy.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(http_clients.upstream_requests.value(upstream="test-proxy", outcome="5xx"), 4)
+        self.assertEqual(strict.breaker.state, CircuitBreaker.OPEN)
+
+
+if __name__ == "__main__":
+    unittest.main()
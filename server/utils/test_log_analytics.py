@@ -0,0 +1,128 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from utils import log_analytics
+from utils.log_analytics import EventStore, LogAnalytics, parse_text_line
+from utils.log_catalog import LogCatalog
+from utils.logger import KST
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=KST).timestamp()
+
+
+def text_line(clock, level, subject, message, tail):
+    return f"[2026-10-{clock}][{subject}][{level}] {message} | {tail}\n"
+
+
+class LogLineParsingTests(unittest.TestCase):
+    def test_key_value_tail_is_parsed(self):
+        line = '[2026-10-19 09:30:15][playback][INFO] a | b message | event=playback_confirmed run_id=run-1 stage=front_clicked:"#x" lecture_title="1주차 | 강의" wait_sec=1.5 player_time=-'
+        ts, subject, level, fields = parse_text_line(line, {})
+        self.assertEqual(ts, datetime(2026, 10, 19, 9, 30, 15, tzinfo=KST).timestamp())
+        self.assertEqual((subject, level), ("playback", "INFO"))
+        self.assertEqual(fields["event"], "playback_confirmed")
+        self.assertEqual(fields["lecture_title"], "1주차 | 강의")
+        self.assertEqual(fields["wait_sec"], "1.5")
+        self.assertIsNone(fields["player_time"])
+
+    def test_plain_line_has_no_fields(self):
+        self.assertEqual(parse_text_line("[2026-10-19 09:30:15][server][INFO] started", {})[3], {})
+        self.assertIsNone(parse_text_line("Traceback (most recent call last):", {}))
+
+
+class EventStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.store = EventStore()
+        for index in range(10):
+            course = "c1" if index < 6 else "c2"
+            self.store.append(NOW + index * 3600, "playback", "INFO", "u1", {"event": "playback_stalled", "course_id": course, "second": index})
+        for wait, strategy in ((1.0, "front_clicked"), (3.0, "front_clicked"), (2.0, "js_play_invoked")):
+            self.store.append(NOW, "playback", "INFO", "u2", {"event": "playback_confirmed", "strategy": strategy, "wait_sec": wait})
+
+    def test_group_count_with_filters_and_time_range(self):
+        result = self.store.query(filters={"event": "playback_stalled"}, group_by="course_id")
+        self.assertEqual(result["matched"], 10)
+        self.assertEqual([(row["key"], row["value"]) for row in result["rows"]], [("c1", 6), ("c2", 4)])
+        result = self.store.query(start=NOW + 3600, end=NOW + 5 * 3600, filters={"event": "playback_stalled"}, group_by="course_id")
+        self.assertEqual([(row["key"], row["value"]) for row in result["rows"]], [("c1", 4)])
+        self.assertEqual(self.store.query(filters={"event": "missing"}), {"matched": 0, "rows": []})
+        # 질의 뒤에 붙은 행도 다음 질의에 들어간다.
+        self.store.append(NOW, "playback", "INFO", "u3", {"event": "playback_stalled", "course_id": "c3"})
+        self.assertEqual(self.store.query(filters={"event": "playback_stalled"})["matched"], 11)
+
+    def test_metric_aggregates_and_time_buckets(self):
+        result = self.store.query(filters={"event": "playback_confirmed"}, group_by="strategy", metric="wait_sec", agg="mean")
+        self.assertEqual([(row["key"], row["value"]) for row in result["rows"]], [("front_clicked", 2.0), ("js_play_invoked", 2.0)])
+        result = self.store.query(filters={"user": "u1"}, metric="second", agg="max")
+        self.assertEqual(result["rows"], [{"key": None, "count": 10, "value": 9.0}])
+        result = self.store.query(filters={"event": "playback_stalled"}, group_by="day")
+        self.assertEqual([(row["key"], row["value"]) for row in result["rows"]], [("2026-10-19", 10)])
+
+    def test_columns_are_typed_arrays(self):
+        self.assertEqual(self.store._ts.typecode, "d")
+        self.assertEqual(self.store._dimensions["course_id"].typecode, "i")
+        self.assertEqual(self.store._measures["wait_sec"].tolist()[-3:], [1.0, 3.0, 2.0])
+        # 질의가 만든 view가 남아 있지 않아야 다음 append가 배열을 늘릴 수 있다.
+        self.store.query(filters={"event": "playback_confirmed"}, group_by="strategy", metric="wait_sec", agg="sum")
+        self.store.append(NOW, "playback", "INFO", "u4", {"event": "playback_confirmed", "wait_sec": 4.0})
+        self.assertEqual(len(self.store), 14)
+
+
+class LogAnalyticsTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        self.analytics = LogAnalytics(LogCatalog(self.base, backup_count=3), days=7)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def append(self, day, user, name, text):
+        path = os.path.join(self.base, day, "user", user, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write(text)
+
+    def test_incremental_ingest_of_text_and_jsonl_logs(self):
+        self.append("20261018", "u1", "log1.log", text_line("18 10:00:00", "WARN", "lecture", "skipped", "event=lecture_skipped run_id=r1 marker=scheduled"))
+        self.append("20261019", "u2", "events.jsonl", json.dumps({"ts": NOW, "level": "INFO", "subject": "lecture", "event": "lecture_skipped", "run_id": "r2", "message": "skipped", "fields": {"marker": "expired"}}) + "\n")
+        self.append("20261001", "u1", "log1.log", text_line("01 10:00:00", "INFO", "lecture", "old", "event=lecture_skipped marker=old"))
+
+        self.assertEqual(self.analytics.refresh(now=NOW), 2)
+        # 아직 줄바꿈이 붙지 않은 줄은 다음 refresh까지 미룬다.
+        self.append("20261018", "u1", "log1.log", text_line("18 11:00:00", "WARN", "lecture", "skipped", "event=lecture_skipped marker=scheduled").rstrip("\n"))
+        self.assertEqual(self.analytics.refresh(now=NOW), 0)
+        self.append("20261018", "u1", "log1.log", "\n")
+        self.assertEqual(self.analytics.refresh(now=NOW), 1)
+
+        result = self.analytics.query(filters={"event": "lecture_skipped"}, group_by="marker")
+        self.assertEqual([(row["key"], row["value"]) for row in result["rows"]], [("scheduled", 2), ("expired", 1)])
+        self.assertEqual(result["engine"], "numpy" if log_analytics.np is not None else "python")
+        self.assertEqual(self.analytics.dimension_values("user"), ["u1", "u2"])
+
+    def test_refresh_reads_recent_days_first_within_byte_budget(self):
+        line = text_line("17 10:00:00", "INFO", "lecture", "done", "event=lecture_completed marker=m")
+        for day in ("20261017", "20261018", "20261019"):
+            self.append(day, "u1", "log1.log", line * 3)
+
+        self.assertEqual(self.analytics.refresh(now=NOW, max_bytes=len(line) * 4), 6)
+        self.assertFalse(self.analytics.complete)
+        # 최근 이틀을 먼저 읽고, 가장 오래된 날짜는 다음 refresh에서 읽는다.
+        consumed = {day: offset for (_, day), (_, offset) in self.analytics._consumed.items()}
+        self.assertEqual(consumed, {"20261017": 0, "20261018": len(line) * 3, "20261019": len(line) * 3})
+        self.assertEqual(self.analytics.query()["complete"], False)
+
+        self.assertEqual(self.analytics.refresh(now=NOW, max_bytes=len(line) * 4), 3)
+        self.assertTrue(self.analytics.complete)
+        self.assertEqual(self.analytics.query(filters={"event": "lecture_completed"})["matched"], 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
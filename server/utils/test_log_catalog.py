@@ -0,0 +1,110 @@
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from utils.log_catalog import LogCatalog
+from utils.logger import _BatchedRotatingFileHandler
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+
+
+class LogCatalogTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        self.catalog = LogCatalog(self.base, backup_count=3)
+        self.target = self.catalog.target_for_user("student01")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def user_path(self, day, name="log1.log"):
+        return os.path.join(self.base, day, "user", "student01", name)
+
+    def test_rebuild_picks_up_existing_days_on_first_open(self):
+        write(self.user_path("20261017"), "old\n")
+        write(self.user_path("20261017", "log1.log.1"), "older!\n")
+        write(self.user_path("20261017", "failure.html"), "<html>")
+        write(self.user_path("20261019"), "")
+        self.catalog.record_open(self.user_path("20261019"))
+
+        self.assertEqual(self.catalog.days(self.target), ["20261019", "20261017"])
+        files = self.catalog.files(self.target, "20261017")
+        self.assertEqual([(entry["name"], entry["size"], entry["offset"]) for entry in files], [("log1.log.1", 7, 0), ("log1.log", 4, 7)])
+        self.assertEqual(self.catalog.latest_file(self.target), self.user_path("20261019"))
+
+    def test_rotation_from_writer_is_recorded(self):
+        path = self.user_path("20261019")
+        os.makedirs(os.path.dirname(path))
+        handler = _BatchedRotatingFileHandler(path, maxBytes=40, backupCount=3, encoding="utf-8")
+        handler.catalog = self.catalog
+        self.catalog.record_open(path)
+        for index in range(8):
+            handler.handle(logging.LogRecord("test", logging.INFO, "", 0, f"line {index} " + "x" * 10, None, None))
+        handler.flush_batch()
+        handler.close()
+
+        files = self.catalog.files(self.target, "20261019")
+        self.assertEqual([entry["name"] for entry in files], ["log1.log.3", "log1.log.2", "log1.log.1", "log1.log"])
+        for entry in files:
+            self.assertEqual(entry["size"], os.path.getsize(entry["path"]))
+
+    def test_new_lines_are_folded_without_rereading_history(self):
+        self.catalog.record_open(self.user_path("20261018"))
+        self.assertEqual(self.catalog.days(self.target), ["20261018"])
+        catalog_path = self.catalog._catalog_path(self.target)
+        folded_at = os.path.getsize(catalog_path)
+
+        # 이미 접은 부분을 깨뜨려도 새 줄만 읽으므로 결과가 그대로 이어진다.
+        with open(catalog_path, "r+b") as handle:
+            handle.seek(folded_at - 2)
+            handle.write(b"#")
+        self.catalog.record_open(self.user_path("20261019"))
+        self.assertEqual(self.catalog.days(self.target), ["20261019", "20261018"])
+        self.assertEqual(self.catalog._cache[self.target][1], os.path.getsize(catalog_path))
+
+        # 다른 인스턴스(다른 프로세스)는 처음부터 접으므로 깨진 줄을 보고 다시 만든다.
+        self.assertEqual(LogCatalog(self.base, backup_count=3).days(self.target), [])
+
+    def test_drop_and_rotate_compact_the_catalog(self):
+        path = self.user_path("20261019")
+        for day in ("20261016", "20261017", "20261018"):
+            for _ in range(5):
+                self.catalog.record_open(self.user_path(day))
+        self.catalog.record_rotate(path, 10)
+        self.catalog.record_rotate(path, 20)
+        self.catalog.record_drop(self.target, "20261016")
+
+        with open(self.catalog._catalog_path(self.target), encoding="utf-8") as handle:
+            ops = [json.loads(line)["op"] for line in handle]
+        self.assertEqual(ops, ["header", "snapshot", "snapshot", "snapshot"])
+        self.assertEqual(self.catalog.days(self.target), ["20261019", "20261018", "20261017"])
+
+        other = LogCatalog(self.base, backup_count=3)
+        self.assertEqual(other.days(self.target), ["20261019", "20261018", "20261017"])
+        self.assertEqual(other._load(self.target)["20261019"]["log1.log"], [20, 10])
+
+        # 압축 뒤에 덧붙인 줄도 양쪽에서 이어서 접힌다.
+        other.record_open(self.user_path("20261020"))
+        self.assertEqual(self.catalog.days(self.target)[0], "20261020")
+
+    def test_corrupt_catalog_is_rebuilt(self):
+        write(self.user_path("20261018"), "hello\n")
+        write(os.path.join(self.base, "_catalog", "user__student01.jsonl"), "{broken\n")
+        self.assertEqual(self.catalog.days(self.target), ["20261018"])
+        self.assertEqual(self.catalog.days(self.catalog.target_for_user("nobody")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import sys
+import tempfile
+import unittest
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from utils import log_reader
+from utils.log_catalog import LogCatalog
+
+
+class LogReaderTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.catalog = LogCatalog(self.temp_dir.name, backup_count=3)
+        self.target = self.catalog.target_for_user("student01")
+        directory = os.path.join(self.temp_dir.name, "20261019", "user", "student01")
+        os.makedirs(directory)
+        # 회전된 파일이 먼저(오래된 줄), 활성 파일이 뒤.
+        self.parts = {"log1.log.2": "line 0\nline 1\n", "log1.log.1": "line 2\nline 3\n", "log1.log": "line 4\nline 5\n"}
+        for name, text in self.parts.items():
+            with open(os.path.join(directory, name), "w", encoding="utf-8") as handle:
+                handle.write(text)
+        self.files = self.catalog.files(self.target, "20261019")
+        self.whole = "".join(self.parts.values()).encode()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_read_range_spans_rotated_files(self):
+        self.assertEqual(log_reader.day_size(self.files), len(self.whole))
+        self.assertEqual(log_reader.read_range(self.files, 10, 12), self.whole[10:22])
+        self.assertEqual(log_reader.read_range(self.files, len(self.whole), 10), b"")
+
+    def test_tail_lines_scans_backwards_across_files(self):
+        original = log_reader.TAIL_CHUNK_BYTES
+        log_reader.TAIL_CHUNK_BYTES = 5
+        try:
+            content, offset = log_reader.tail_lines(self.files, 3)
+        finally:
+            log_reader.TAIL_CHUNK_BYTES = original
+        self.assertEqual(content, b"line 3\nline 4\nline 5\n")
+        self.assertEqual(self.whole[offset:], content)
+        self.assertEqual(log_reader.tail_lines(self.files, 100), (self.whole, 0))
+        self.assertEqual(log_reader.tail_lines(self.files, 0), (b"", len(self.whole)))
+
+    def test_parse_range(self):
+        self.assertEqual(log_reader.parse_range("bytes=0-9", 42), (0, 10))
+        self.assertEqual(log_reader.parse_range("bytes=40-", 42), (40, 2))
+        self.assertEqual(log_reader.parse_range("bytes=-5", 42), (37, 5))
+        self.assertEqual(log_reader.parse_range("bytes=30-100", 42), (30, 12))
+        self.assertIsNone(log_reader.parse_range("bytes=-", 42))
+        self.assertIsNone(log_reader.parse_range("bytes=0-1,5-6", 42))
+        self.assertIsNone(log_reader.parse_range(None, 42))
+
+
+if __name__ == "__main__":
+    unittest.main()
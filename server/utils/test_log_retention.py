@@ -0,0 +1,96 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from utils import log_reader, log_retention
+from utils.log_catalog import LogCatalog
+from utils.logger import KST
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=KST).timestamp()
+
+
+class LogRetentionTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        self.catalog = LogCatalog(self.base, backup_count=3)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, day, target, name, text, age_sec=7200):
+        path = os.path.join(self.base, day, *target.split("/"), name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.utime(path, (NOW - age_sec, NOW - age_sec))
+        return path
+
+    def run_retention(self, **kwargs):
+        options = {"keep_days": 30, "compress_after_days": 1, "user_max_bytes": 0, "total_max_bytes": 0}
+        options.update(kwargs)
+        return log_retention.run_retention(self.base, now=NOW, **options)
+
+    def test_closed_days_are_gzipped_and_still_readable(self):
+        self.write("20261018", "user/student01", "log1.log.1", "old line\n" * 50)
+        self.write("20261018", "user/student01", "log1.log", "new line\n" * 50)
+        self.write("20261018", "user/student01", "failure_dumps/dump.attendance.html", "<html>" * 100)
+        self.write("20261019", "user/student01", "log1.log", "today\n")
+        target = self.catalog.target_for_user("student01")
+        before = log_reader.read_range(self.catalog.files(target, "20261018"), 0, 10_000)
+
+        report = self.run_retention()
+
+        self.assertEqual(report["compressed_files"], 3)
+        self.assertGreater(report["saved_bytes"], 0)
+        self.assertTrue(os.path.exists(os.path.join(self.base, "20261019", "user", "student01", "log1.log")))
+        files = self.catalog.files(target, "20261018")
+        self.assertTrue(all(entry["compressed"] for entry in files))
+        self.assertEqual(log_reader.read_range(files, 0, 10_000), before)
+        self.assertEqual(log_reader.tail_lines(files, 2)[0], b"new line\nnew line\n")
+        # 카탈로그를 디스크에서 다시 만들어도 압축된 파일을 같은 이름으로 찾는다.
+        self.catalog.rebuild(target)
+        self.assertEqual([entry["name"] for entry in self.catalog.files(target, "20261018")], ["log1.log.1", "log1.log"])
+
+    def test_recently_written_files_are_not_compressed(self):
+        self.write("20261018", "system", "log1.log", "late record\n", age_sec=60)
+        self.assertEqual(self.run_retention()["compressed_files"], 0)
+
+    def test_old_days_and_user_quota_are_dropped_from_catalog(self):
+        self.write("20260901", "user/student01", "log1.log", "x" * 100)
+        self.write("20261017", "user/student01", "log1.log", "y" * 300)
+        self.write("20261018", "user/student01", "log1.log", "z" * 300)
+        self.write("20261018", "user/student02", "log1.log", "w" * 10)
+        self.write("20261019", "user/student01", "log1.log", "today")
+        target = self.catalog.target_for_user("student01")
+        self.catalog.record_open(os.path.join(self.base, "20261019", "user", "student01", "log1.log"))
+        self.assertEqual(self.catalog.days(target), ["20261019", "20261018", "20261017", "20260901"])
+
+        report = self.run_retention(compress_after_days=0, user_max_bytes=400)
+
+        self.assertEqual(report["removed"], {"age": 100, "user_quota": 300})
+        self.assertEqual(self.catalog.days(target), ["20261019", "20261018"])
+        self.assertTrue(os.path.exists(os.path.join(self.base, "20261018", "user", "student02", "log1.log")))
+        self.assertEqual(log_retention.log_disk_days.value(), 2)
+
+    def test_total_quota_keeps_today(self):
+        self.write("20261017", "system", "log1.log", "a" * 500)
+        self.write("20261018", "system", "log1.log", "b" * 500)
+        self.write("20261019", "system", "log1.log", "c" * 500)
+
+        report = self.run_retention(compress_after_days=0, total_max_bytes=600)
+
+        self.assertEqual(report["removed"], {"total_quota": 1000})
+        self.assertEqual([name for name in os.listdir(self.base) if name != "_catalog"], ["20261019"])
+        self.assertEqual(log_retention.log_disk_bytes.value(kind="system"), 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
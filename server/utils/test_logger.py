@@ -0,0 +1,171 @@
+import gc
+import json
+import logging
+import os
+import queue
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+import utils.logger as logger_module
+from utils.logger import BatchingQueueListener, BoundedQueueHandler, HanyangLogger, flush_logs, get_logger
+
+
+class LoggerFormattingTests(unittest.TestCase):
+    def test_format_fields_orders_event_first(self):
+        logger = HanyangLogger("system", user_id="logger-test", default_fields={"run_id": "run-123"})
+        rendered = logger._format_fields({"event": "lecture_completed", "lecture_title": "테스트 강의", "elapsed_sec": 42})
+        self.assertTrue(rendered.startswith(' | event=lecture_completed'))
+        self.assertIn('run_id=run-123', rendered)
+        self.assertIn('lecture_title="테스트 강의"', rendered)
+        self.assertIn('elapsed_sec=42', rendered)
+        logger.close()
+
+    def test_with_context_merges_default_fields(self):
+        logger = HanyangLogger("system", user_id="logger-test", default_fields={"run_id": "run-123"})
+        scoped = logger.with_context(lecture_title="강의 A")
+        rendered = scoped._format_fields({"event": "playback_stalled"})
+        self.assertIn('run_id=run-123', rendered)
+        self.assertIn('lecture_title="강의 A"', rendered)
+        self.assertIn('event=playback_stalled', rendered)
+        scoped.close()
+        logger.close()
+
+
+class LoggingPipelineTests(unittest.TestCase):
+    def test_records_are_written_by_writer_thread(self):
+        with tempfile.TemporaryDirectory() as log_base, mock.patch.object(logger_module, "LOG_BASE", log_base):
+            logger = HanyangLogger("user", user_id="pipeline-test")
+            for index in range(50):
+                logger.event("automation", "playback_tick", media_second=index)
+            self.assertTrue(flush_logs(timeout=5))
+            with open(logger.log_path, encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+            self.assertEqual(len(lines), 50)
+            self.assertIn("[automation][INFO] playback_tick | event=playback_tick media_second=49", lines[-1])
+            logger_module._listener.close_files()
+
+    def test_full_queue_drops_info_but_waits_for_errors(self):
+        log_queue = queue.Queue(maxsize=1)
+        handler = BoundedQueueHandler(log_queue, policy="drop", block_timeout_sec=0.01)
+        dropped = logger_module.log_records_dropped.value()
+        record = logging.LogRecord("test", logging.INFO, "", 0, "first", None, None)
+        handler.emit(record)
+        handler.emit(logging.LogRecord("test", logging.INFO, "", 0, "second", None, None))
+        handler.emit(logging.LogRecord("test", logging.ERROR, "", 0, "third", None, None))
+        self.assertEqual(log_queue.get_nowait(), record)
+        self.assertEqual(logger_module.log_records_dropped.value(), dropped + 2)
+
+    def test_writer_batches_records_per_file(self):
+        with tempfile.TemporaryDirectory() as log_base:
+            listener = BatchingQueueListener(queue.Queue(), max_open_files=1, console=False)
+            records = []
+            for name in ("a", "b", "a"):
+                record = logging.LogRecord("test", logging.INFO, "", 0, f"to {name}", None, None)
+                record.subject = "test"
+                record.log_path = os.path.join(log_base, name, "log1.log")
+                records.append(record)
+            listener.write_batch(records)
+            listener.close_files()
+            with open(os.path.join(log_base, "a", "log1.log"), encoding="utf-8") as handle:
+                self.assertEqual(handle.read().count("to a"), 2)
+
+    def test_day_rollover_closes_past_day_files(self):
+        with tempfile.TemporaryDirectory() as log_base, mock.patch.object(logger_module, "LOG_BASE", log_base):
+            listener = BatchingQueueListener(queue.Queue(), console=False)
+            today = logger_module.datetime.now(logger_module.KST).strftime('%Y%m%d')
+
+            def record_for(day):
+                record = logging.LogRecord("test", logging.INFO, "", 0, f"on {day}", None, None)
+                record.subject = "test"
+                record.log_path = os.path.join(log_base, day, "system", "log1.log")
+                return record
+
+            listener.write_batch([record_for("20000101"), record_for(today)])
+            past = listener._files[os.path.join(log_base, "20000101", "system", "log1.log")]
+            listener._rollover_at = 0
+            listener.write_batch([record_for(today)])
+            self.assertIsNone(past.stream)
+            self.assertEqual(list(listener._files), [os.path.join(log_base, today, "system", "log1.log")])
+            self.assertGreater(listener._rollover_at, time.time())
+            listener.close_files()
+
+    def test_jsonl_sink_writes_stable_schema_next_to_text_log(self):
+        with tempfile.TemporaryDirectory() as log_base:
+            listener = BatchingQueueListener(queue.Queue(), console=False, jsonl=True)
+            logger = HanyangLogger("user", user_id="jsonl-test", default_fields={"run_id": "run-1", "user_num": 7})
+            record = logging.LogRecord("test", logging.WARNING, "", 0, "stalled", None, None)
+            record.subject = "automation"
+            record.log_path = os.path.join(log_base, "user", "log1.log")
+            record.hanyang_fields, record.hanyang_static, record.hanyang_context = logger._split_fields(
+                {"event": "playback_stalled", "media": [1.5, 2], "lecture_title": "강의 A"}
+            )
+            listener.write_batch([record])
+            listener.close_files()
+
+            with open(os.path.join(log_base, "user", "events.jsonl"), encoding="utf-8") as handle:
+                payload = json.loads(handle.read().strip())
+            with open(record.log_path, encoding="utf-8") as handle:
+                self.assertIn("stalled | event=playback_stalled run_id=run-1", handle.read())
+        self.assertEqual(
+            payload,
+            {
+                "ts": round(record.created, 3),
+                "level": "WARNING",
+                "subject": "automation",
+                "event": "playback_stalled",
+                "run_id": "run-1",
+                "message": "stalled",
+                "fields": {"user_num": 7, "media": [1.5, 2], "lecture_title": "강의 A"},
+            },
+        )
+
+    def test_date_change_uses_cached_midnight(self):
+        logger = HanyangLogger("system", user_id="logger-test")
+        self.assertGreater(logger._target.rollover_at, time.time())
+        logger._target.rollover_at = 0
+        logger._check_date_change()
+        self.assertGreater(logger._target.rollover_at, time.time())
+
+
+class LoggerRegistryTests(unittest.TestCase):
+    def test_get_logger_reuses_instance_and_target(self):
+        logger = get_logger("user", user_id="registry-test")
+        self.assertIs(get_logger("user", user_id="registry-test"), logger)
+        scoped = logger.with_context(run_id="run-1")
+        self.assertIs(scoped._target, logger._target)
+        self.assertIs(HanyangLogger("user", user_id="registry-test")._target, logger._target)
+
+    def test_targets_are_released_with_their_loggers(self):
+        logger = HanyangLogger("user", user_id="target-release-test")
+        self.assertIn(("user", "target-release-test"), logger_module._targets)
+        del logger
+        gc.collect()
+        self.assertNotIn(("user", "target-release-test"), logger_module._targets)
+
+        with mock.patch.object(logger_module, "LOGGER_REGISTRY_MAX", 1):
+            get_logger("user", user_id="target-evicted-test")
+            get_logger("user", user_id="target-kept-test")
+        gc.collect()
+        self.assertNotIn(("user", "target-evicted-test"), logger_module._targets)
+        self.assertIn(("user", "target-kept-test"), logger_module._targets)
+
+    def test_static_context_is_rendered_once_and_can_be_overridden(self):
+        logger = HanyangLogger("system", user_id="logger-test", default_fields={"run_id": "run-1", "user_num": 3})
+        self.assertEqual(logger._static_fields, "run_id=run-1 user_num=3")
+        self.assertEqual(
+            logger._format_fields({"event": "tick", "media_second": 5}),
+            " | event=tick run_id=run-1 user_num=3 media_second=5",
+        )
+        # 컨텍스트 키를 덮어쓰면 호출 값이 이긴다.
+        self.assertEqual(logger._format_fields({"run_id": "run-2"}), " | run_id=run-2 user_num=3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import os
+import sys
+import unittest
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from utils.metrics import MetricsRegistry, render_text
+
+
+class RenderTextTests(unittest.TestCase):
+    def test_counters_gauges_and_histograms(self):
+        registry = MetricsRegistry()
+        registry.counter("demo_requests_total", "Requests", labelnames=("path",)).inc(2, path='/a"b')
+        registry.gauge("demo_idle", "Idle gauge")
+        histogram = registry.histogram("demo_seconds", "Durations", labelnames=("phase",), buckets=(1, 5))
+        histogram.observe(0.5, phase="login")
+        histogram.observe(3, phase="login")
+        histogram.observe(10, phase="login")
+
+        lines = render_text(registry).splitlines()
+
+        self.assertIn("# TYPE demo_requests_total counter", lines)
+        self.assertIn('demo_requests_total{path="/a\\"b"} 2.0', lines)
+        # 라벨 없는 메트릭은 값이 없어도 0으로 나온다.
+        self.assertIn("demo_idle 0.0", lines)
+        self.assertIn('demo_seconds_bucket{phase="login",le="1.0"} 1.0', lines)
+        self.assertIn('demo_seconds_bucket{phase="login",le="5.0"} 2.0', lines)
+        self.assertIn('demo_seconds_bucket{phase="login",le="+Inf"} 3.0', lines)
+        self.assertIn('demo_seconds_sum{phase="login"} 13.5', lines)
+        self.assertIn('demo_seconds_count{phase="login"} 3.0', lines)
+        self.assertLess(lines.index("# TYPE demo_idle gauge"), lines.index("# TYPE demo_requests_total counter"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import gzip
+import os
+import sys
+import tempfile
+import unittest
+
+from fastapi.testclient import TestClient
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+import front.main as front_main
+from utils import static_assets
+from utils.static_assets import StaticSite, precompress
+
+
+class StaticAssetsTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dist = os.path.join(self.temp_dir.name, "spa")
+        self.public = os.path.join(self.temp_dir.name, "public")
+        os.makedirs(os.path.join(self.dist, "assets"))
+        os.makedirs(self.public)
+        self.index = b"<!doctype html><div id=root></div>" + b"<!-- pad -->" * 200
+        self.bundle = b"console.log('hanyang');" * 500
+        self._write(self.dist, "index.html", self.index)
+        self._write(self.dist, "assets/index-abc123.js", self.bundle)
+        self._write(self.public, "hanyang_logo.png", b"\x89PNG-logo")
+        self.written = precompress(self.dist)
+
+        self.orig_site = front_main.static_site
+        front_main.static_site = StaticSite(self.dist, fallback_dirs=[self.public])
+        # lifespan에서 load()가 다시 불리므로 여기서는 객체만 바꿔 둔다.
+        self.client = TestClient(front_main.app)
+        self.client.__enter__()
+
+    def tearDown(self):
+        self.client.__exit__(None, None, None)
+        front_main.static_site = self.orig_site
+        self.temp_dir.cleanup()
+
+    def _write(self, root, name, body):
+        with open(os.path.join(root, name), "wb") as handle:
+            handle.write(body)
+
+    def test_precompress_writes_variants(self):
+        names = sorted(os.path.basename(path) for path in self.written)
+        expected = ["index-abc123.js.gz", "index.html.gz"]
+        if static_assets.brotli is not None:
+            expected = ["index-abc123.js.br", "index-abc123.js.gz", "index.html.br", "index.html.gz"]
+        self.assertEqual(names, expected)
+
+    def test_hashed_assets_are_immutable_and_negotiated(self):
+        response = self.client.get("/assets/index-abc123.js", headers={"Accept-Encoding": "gzip;q=1, br;q=0"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["cache-control"], static_assets.IMMUTABLE_CACHE_CONTROL)
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertEqual(response.content, self.bundle)
+
+        plain = self.client.get("/assets/index-abc123.js", headers={"Accept-Encoding": "identity"})
+        self.assertNotIn("content-encoding", plain.headers)
+        self.assertNotEqual(plain.headers["etag"], response.headers["etag"])
+
+        cached = self.client.get(
+            "/assets/index-abc123.js",
+            headers={"Accept-Encoding": "gzip;q=1, br;q=0", "If-None-Match": response.headers["etag"]},
+        )
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+
+    def test_spa_routes_serve_index_from_memory(self):
+        # 시작 후 디스크에서 파일이 사라져도 메모리에서 응답해야 한다.
+        os.remove(os.path.join(self.dist, "index.html"))
+        for path in ("/", "/admin/dashboard", "/some/client/route"):
+            response = self.client.get(path, headers={"Accept-Encoding": "identity"})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content, self.index)
+            self.assertEqual(response.headers["cache-control"], "no-cache")
+
+        logo = self.client.get("/hanyang_logo.png")
+        self.assertEqual(logo.content, b"\x89PNG-logo")
+        self.assertEqual(self.client.get("/robots.txt").status_code, 404)
+        self.assertEqual(self.client.get("/assets/missing.js").status_code, 404)
+
+    def test_large_files_stay_on_disk(self):
+        asset = front_main.static_site.get("assets/index-abc123.js")
+        self.assertIsNotNone(asset.body)
+        orig_limit = static_assets.STATIC_MAX_INLINE_BYTES
+        static_assets.STATIC_MAX_INLINE_BYTES = 100
+        try:
+            site = StaticSite(self.dist).load()
+        finally:
+            static_assets.STATIC_MAX_INLINE_BYTES = orig_limit
+        asset = site.get("assets/index-abc123.js")
+        self.assertIsNone(asset.body)
+        self.assertEqual(gzip.decompress(open(asset.variants["gzip"][1], "rb").read()), self.bundle)
+
+
+if __name__ == "__main__":
+    unittest.main()
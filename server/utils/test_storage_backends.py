@@ -0,0 +1,188 @@
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+SERVER_ROOT = os.path.dirname(os.path.dirname(__file__))
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
+
+from utils import db_backends
+from utils.db_backends import PostgresBackend, SQLiteBackend
+
+TEST_POSTGRES_DSN = os.getenv("TEST_POSTGRES_DSN", "").strip()
+
+
+class StorageBackendConformance:
+    """모든 저장소 구현체가 통과해야 하는 공통 동작."""
+
+    def make_backend(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.backend = self.make_backend()
+        self.backend.init_schema()
+
+    def tearDown(self):
+        self.backend.close()
+
+    def test_user_round_trip(self):
+        self.backend.add_user("student", "enc-1", "active")
+        self.backend.update_user_pwd("student", "enc-2")
+        self.backend.update_user_status("student", "completed")
+        user = self.backend.get_user_by_id("student")
+        self.assertEqual(user[1], "student")
+        self.assertEqual(user[2], "enc-2")
+        self.assertEqual(user[4], "completed")
+        self.assertIsNone(self.backend.get_user_by_id("missing"))
+
+    def test_get_all_users_orders_by_num(self):
+        self.backend.add_user("a", "enc", "active")
+        self.backend.add_user("b", "enc", "error")
+        users = self.backend.get_all_users()
+        self.assertEqual([row[1] for row in users], ["a", "b"])
+        self.assertLess(users[0][0], users[1][0])
+
+    def test_find_users_combines_filters_in_one_query(self):
+        for user_id, status in (("a", "active"), ("b", "error"), ("c", "error"), ("d", "completed")):
+            self.backend.add_user(user_id, "enc", status)
+        nums = {row[1]: row[0] for row in self.backend.get_all_users()}
+
+        self.assertEqual([row[1] for row in self.backend.find_users(status="error")], ["b", "c"])
+        self.assertEqual([row[1] for row in self.backend.find_users(nums=[nums["a"], nums["c"]], status="error")], ["c"])
+        self.assertEqual([row[1] for row in self.backend.find_users(status="error", limit=1)], ["b"])
+        self.assertEqual(self.backend.find_users(nums=[]), [])
+        self.assertEqual(len(self.backend.find_users(created_since=datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=1))), 4)
+        self.assertEqual(self.backend.find_users(created_since=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)), [])
+
+    def test_learned_lectures_for_many_accounts(self):
+        self.backend.add_user("a", "enc", "active")
+        self.backend.add_user("b", "enc", "active")
+        num_a, num_b = (row[0] for row in self.backend.get_all_users())
+        self.backend.add_learned_lecture(num_a, "https://lecture/1")
+        self.backend.add_learned_lecture(num_a, "https://lecture/2")
+        lectures = self.backend.get_learned_lectures_for([num_a, num_b])
+        self.assertEqual(sorted(lectures[num_a]), ["https://lecture/1", "https://lecture/2"])
+        self.assertEqual(lectures[num_b], [])
+        self.assertEqual(self.backend.get_learned_lectures_for([]), {})
+
+    def test_run_history_aggregates(self):
+        for index, elapsed in enumerate((10, 20, 30, 40)):
+            run_id = f"run-{index}"
+            self.backend.start_run(run_id, index + 1, f"u{index}", "sweep-1", 1000 + index)
+            self.backend.finish_run(run_id, "completed" if index else "lecture_failed", 1000 + index + elapsed, elapsed, 2)
+        self.backend.start_run("run-live", 9, "u9", "sweep-2", 2000)
+        self.backend.add_lecture_attempt("run-0", 1, "course-a", "https://a/1", "A1", 1, "timeout", 3600, 1500)
+        self.backend.add_lecture_attempt("run-0", 1, "course-a", "https://a/1", "A1", 2, "timeout", 3600, 1600)
+        self.backend.add_lecture_attempt("run-1", 2, "course-b", "https://b/1", "B1", 1, "completed", 60, 1500)
+
+        self.assertEqual(self.backend.run_outcome_counts(0), {"completed": 3, "lecture_failed": 1, "running": 1})
+        self.assertEqual(self.backend.run_elapsed_quantiles(0, (0.5,)), {0.5: 30})
+        self.assertEqual(self.backend.lecture_outcomes_by_course(0, "timeout"), [("course-a", 2, 1, 1)])
+        makespans = {row[0]: row for row in self.backend.sweep_makespans(0)}
+        self.assertEqual(makespans["sweep-1"][1:4], (1000, 1043, 4))
+        self.assertEqual(makespans["sweep-2"][4], 1)
+        self.assertEqual([row[0] for row in self.backend.get_runs(1002)], ["run-live", "run-3", "run-2"])
+
+        self.backend.prune_runs(1550)
+        self.assertEqual(self.backend.lecture_outcomes_by_course(0, "timeout"), [("course-a", 1, 1, 1)])
+        self.assertEqual(sorted(row[0] for row in self.backend.get_runs(0)), ["run-live"])
+
+    def test_progress_upsert_keeps_one_row_per_user(self):
+        row = ["u1", "run-1", "course-a", "https://a/1", "A1", 10.0, 600.0, 1.7, 590.0, 5000.0, 1000.0]
+        self.backend.upsert_progress([row, ["u2", "run-2", "course-b", "https://b/1", "B1", None, 300.0, None, None, 4000.0, 1000.0]])
+        row[5], row[7], row[10] = 300.0, 50.0, 1300.0
+        self.backend.upsert_progress([row])
+
+        self.assertEqual(self.backend.get_progress("u1")[5:], (300.0, 600.0, 50.0, 590.0, 5000.0, 1300.0))
+        self.assertEqual([progress[0] for progress in self.backend.get_all_progress()], ["u1", "u2"])
+        self.backend.delete_progress(["u1"])
+        self.assertIsNone(self.backend.get_progress("u1"))
+        self.assertEqual(self.backend.clear_progress(), 1)
+        self.assertEqual(self.backend.get_all_progress(), [])
+
+    def test_delete_user_by_id_and_num(self):
+        self.backend.add_user("a", "enc", "active")
+        self.backend.add_user("b", "enc", "active")
+        self.backend.delete_user("a")
+        user_b = self.backend.get_user_by_id("b")
+        self.backend.delete_user_by_num(user_b[0])
+        self.assertEqual(self.backend.get_all_users(), [])
+
+    def test_admin_upsert_and_update(self):
+        self.assertIsNone(self.backend.get_admin())
+        self.backend.upsert_admin("admin", "hash-1")
+        self.backend.upsert_admin("root", "hash-2")
+        self.backend.update_admin_pwd("root", "hash-3")
+        admin = self.backend.get_admin()
+        self.assertEqual(admin[:3], (1, "root", "hash-3"))
+
+    def test_learned_lectures_ignore_duplicates(self):
+        self.backend.add_user("a", "enc", "active")
+        num = self.backend.get_user_by_id("a")[0]
+        self.backend.add_learned_lecture(num, "https://lecture/1")
+        self.backend.add_learned_lecture(num, "https://lecture/1")
+        self.backend.add_learned_lecture(num, "https://lecture/2")
+        self.assertEqual(sorted(self.backend.get_learned_lectures(num)), ["https://lecture/1", "https://lecture/2"])
+        self.backend.delete_learned_lectures(num)
+        self.assertEqual(self.backend.get_learned_lectures(num), [])
+
+
+class SQLiteBackendTests(StorageBackendConformance, unittest.TestCase):
+    def make_backend(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        return SQLiteBackend(os.path.join(self.temp_dir.name, "hanyang.db"))
+
+
+@unittest.skipUnless(TEST_POSTGRES_DSN, "TEST_POSTGRES_DSN not set")
+class PostgresBackendTests(StorageBackendConformance, unittest.TestCase):
+    def make_backend(self):
+        # 테스트마다 별도 스키마를 써서 서로의 데이터가 섞이지 않게 한다.
+        schema = f"hanyang_test_{uuid.uuid4().hex[:8]}"
+        bootstrap = PostgresBackend(TEST_POSTGRES_DSN, min_size=1, max_size=1)
+        bootstrap.execute(f"CREATE SCHEMA {schema}")
+        bootstrap.close()
+
+        def drop_schema():
+            cleanup = PostgresBackend(TEST_POSTGRES_DSN, min_size=1, max_size=1)
+            cleanup.execute(f"DROP SCHEMA {schema} CASCADE")
+            cleanup.close()
+
+        self.addCleanup(drop_schema)
+        separator = "&" if "?" in TEST_POSTGRES_DSN else "?"
+        return PostgresBackend(f"{TEST_POSTGRES_DSN}{separator}options=-csearch_path%3D{schema}", min_size=1, max_size=2)
+
+
+class BackendSelectionTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        patcher = mock.patch.object(db_backends, "DB_BACKEND", "sqlite")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        previous = db_backends.set_backend(None)
+        self.addCleanup(db_backends.set_backend, previous)
+        self.addCleanup(db_backends.reset_backends)
+
+    def test_backend_follows_the_configured_path(self):
+        first_path = os.path.join(self.temp_dir.name, "first.db")
+        second_path = os.path.join(self.temp_dir.name, "second.db")
+        first = db_backends.get_backend(first_path)
+        self.assertIs(db_backends.get_backend(first_path), first)
+        second = db_backends.get_backend(second_path)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.path, second_path)
+
+        override = SQLiteBackend(os.path.join(self.temp_dir.name, "override.db"))
+        db_backends.set_backend(override)
+        self.assertIs(db_backends.get_backend(first_path), override)
+        db_backends.set_backend(None)
+        self.assertIs(db_backends.get_backend(first_path), first)
+
+
+if __name__ == "__main__":
+    unittest.main()